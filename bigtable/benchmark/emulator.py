@@ -0,0 +1,297 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests of the Bigtable client against the Bigtable emulator.
+
+Every scenario creates a table in the emulator, then measures:
+
+* the write throughput of a
+  :class:`~google.cloud.bigtable.batcher.MutationsBatcher` loading ``--rows``
+  rows,
+* the scan throughput of :meth:`~google.cloud.bigtable.table.Table.read_rows`
+  over the whole table,
+* the latency of ``--point-reads``
+  :meth:`~google.cloud.bigtable.table.Table.read_row` calls on random keys,
+
+and deletes the table. One scenario is run for each combination of the
+``--value-size`` and ``--cells-per-row`` values, and one JSON report is
+printed per scenario.
+
+The emulator must be running, and ``BIGTABLE_EMULATOR_HOST`` set:
+
+  $ gcloud beta emulators bigtable start &
+  $ $(gcloud beta emulators bigtable env-init)
+  $ python bigtable/benchmark/emulator.py --rows 10000 \
+    --value-size 10 1000 --cells-per-row 1 10
+"""
+
+from __future__ import division
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import time
+import uuid
+
+from google.auth.credentials import AnonymousCredentials
+
+from google.cloud.bigtable import __version__
+from google.cloud.bigtable import metrics
+from google.cloud.bigtable.batcher import FLUSH_COUNT
+from google.cloud.bigtable.batcher import MAX_IN_FLIGHT_RPCS
+from google.cloud.bigtable.batcher import MAX_ROW_BYTES
+from google.cloud.bigtable.client import Client
+from google.cloud.bigtable.column_family import MaxVersionsGCRule
+from google.cloud.environment_vars import BIGTABLE_EMULATOR
+
+
+PROJECT_ID = "benchmark"
+INSTANCE_ID = "benchmark"
+COLUMN_FAMILY_ID = "cf"
+PERCENTILES = (50, 90, 99)
+
+
+def parse_options():
+    """Parses options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--value-size", type=int, nargs="+", default=[100])
+    parser.add_argument("--cells-per-row", type=int, nargs="+", default=[1])
+    parser.add_argument("--point-reads", type=int, default=1000)
+    parser.add_argument("--flush-count", type=int, default=FLUSH_COUNT)
+    parser.add_argument("--max-row-bytes", type=int, default=MAX_ROW_BYTES)
+    parser.add_argument("--max-in-flight", type=int, default=MAX_IN_FLIGHT_RPCS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", help="(Optional) File to append the JSON reports to."
+    )
+    parser.add_argument(
+        "--baseline",
+        help="(Optional) File of JSON reports of a previous run to compare with.",
+    )
+    return parser.parse_args()
+
+
+def row_key(index):
+    """Returns the key of the row of ``index``."""
+    return b"row%010d" % (index,)
+
+
+def summarize(latencies):
+    """Summarizes latencies (in seconds) as milliseconds percentiles."""
+    latencies = sorted(latencies)
+    summary = {"count": len(latencies)}
+    if not latencies:
+        return summary
+    summary["mean_ms"] = 1000 * sum(latencies) / len(latencies)
+    for percent in PERCENTILES:
+        index = min(len(latencies) - 1, len(latencies) * percent // 100)
+        summary["p{}_ms".format(percent)] = 1000 * latencies[index]
+    summary["max_ms"] = 1000 * latencies[-1]
+    return summary
+
+
+def throughput(num_rows, num_cells, num_bytes, seconds):
+    """Returns the rates of a bulk operation."""
+    return {
+        "seconds": seconds,
+        "rows_per_sec": num_rows / seconds,
+        "cells_per_sec": num_cells / seconds,
+        "mb_per_sec": num_bytes / seconds / 1e6,
+    }
+
+
+def write_rows(table, options, value_size, cells_per_row):
+    """Loads ``options.rows`` rows with a :class:`MutationsBatcher`."""
+    value = b"x" * value_size
+    qualifiers = [b"col%d" % (index,) for index in range(cells_per_row)]
+    failures = []
+    batcher = table.mutations_batcher(
+        flush_count=options.flush_count,
+        max_row_bytes=options.max_row_bytes,
+        max_in_flight=options.max_in_flight,
+        failure_callback=lambda row, status: failures.append(status.code),
+    )
+
+    start = time.time()
+    for index in range(options.rows):
+        row = table.row(row_key(index))
+        for qualifier in qualifiers:
+            row.set_cell(COLUMN_FAMILY_ID, qualifier, value)
+        batcher.mutate(row)
+    batcher.close()
+    duration = time.time() - start
+
+    report = throughput(
+        options.rows,
+        options.rows * cells_per_row,
+        options.rows * cells_per_row * value_size,
+        duration,
+    )
+    report["failed_rows"] = len(failures)
+    return report
+
+
+def scan_rows(table, options, value_size, cells_per_row):
+    """Reads the whole table with a single :meth:`Table.read_rows` call."""
+    num_rows = 0
+    num_cells = 0
+    start = time.time()
+    for row in table.read_rows():
+        num_rows += 1
+        num_cells += len(row.cells[COLUMN_FAMILY_ID])
+    duration = time.time() - start
+
+    report = throughput(num_rows, num_cells, num_cells * value_size, duration)
+    report["complete"] = num_rows == options.rows
+    return report
+
+
+def point_reads(table, options):
+    """Reads ``options.point_reads`` random rows with :meth:`Table.read_row`."""
+    rng = random.Random(options.seed)
+    latencies = []
+    missing = 0
+    for _ in range(options.point_reads):
+        key = row_key(rng.randrange(options.rows))
+        start = time.time()
+        row = table.read_row(key)
+        latencies.append(time.time() - start)
+        if row is None:
+            missing += 1
+
+    report = summarize(latencies)
+    report["missing_rows"] = missing
+    return report
+
+
+def scenario_key(report):
+    """Returns the parameters identifying the scenario of a report."""
+    return (
+        report["rows"],
+        report["value_size"],
+        report["cells_per_row"],
+        report["batcher"]["flush_count"],
+        report["batcher"]["max_row_bytes"],
+        report["batcher"]["max_in_flight"],
+    )
+
+
+def load_baseline(filename):
+    """Loads the reports of a previous run, by scenario.
+
+    When a scenario was run several times, the last report is kept.
+    """
+    baseline = {}
+    with open(filename) as reports_file:
+        for line in reports_file:
+            if line.strip():
+                report = json.loads(line)
+                baseline[scenario_key(report)] = report
+    return baseline
+
+
+def compare(report, baseline_report):
+    """Returns the ratios of the results of a report to its baseline.
+
+    Ratios above 1 are improvements for throughputs, and regressions for
+    latencies.
+    """
+    comparison = {"baseline_client_version": baseline_report["client_version"]}
+    for operation in ("write", "scan"):
+        comparison[operation + "_rows_per_sec"] = (
+            report[operation]["rows_per_sec"]
+            / baseline_report[operation]["rows_per_sec"]
+        )
+    for percent in PERCENTILES:
+        name = "p{}_ms".format(percent)
+        comparison["point_read_" + name] = (
+            report["point_read_latency"][name]
+            / baseline_report["point_read_latency"][name]
+        )
+    return comparison
+
+
+def run_scenario(instance, options, value_size, cells_per_row):
+    """Writes, scans and reads a new table.
+
+    Returns:
+        dict: The report for the scenario.
+    """
+    recorder = metrics.InMemoryMetrics()
+    table = instance.table("benchmark-" + uuid.uuid4().hex[:8], metrics=recorder)
+    table.create(column_families={COLUMN_FAMILY_ID: MaxVersionsGCRule(1)})
+    try:
+        report = {
+            "client_version": __version__,
+            "python_version": platform.python_version(),
+            "timestamp": time.time(),
+            "rows": options.rows,
+            "value_size": value_size,
+            "cells_per_row": cells_per_row,
+            "batcher": {
+                "flush_count": options.flush_count,
+                "max_row_bytes": options.max_row_bytes,
+                "max_in_flight": options.max_in_flight,
+            },
+        }
+        report["write"] = write_rows(table, options, value_size, cells_per_row)
+        report["scan"] = scan_rows(table, options, value_size, cells_per_row)
+        report["point_read_latency"] = point_reads(table, options)
+        report["client_metrics"] = recorder.snapshot()
+    finally:
+        table.delete()
+    return report
+
+
+def main():
+    options = parse_options()
+    if os.getenv(BIGTABLE_EMULATOR) is None:
+        sys.stderr.write(
+            "{} is not set, start the Bigtable emulator first.\n".format(
+                BIGTABLE_EMULATOR
+            )
+        )
+        sys.exit(1)
+
+    client = Client(project=PROJECT_ID, credentials=AnonymousCredentials(), admin=True)
+    instance = client.instance(INSTANCE_ID)
+    baseline = load_baseline(options.baseline) if options.baseline else {}
+
+    output = open(options.output, "a") if options.output else None
+    try:
+        for value_size, cells_per_row in itertools.product(
+            options.value_size, options.cells_per_row
+        ):
+            report = run_scenario(instance, options, value_size, cells_per_row)
+            baseline_report = baseline.get(scenario_key(report))
+            if baseline_report is not None:
+                report["vs_baseline"] = compare(report, baseline_report)
+            line = json.dumps(report, sort_keys=True) + "\n"
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            if output is not None:
+                output.write(line)
+                output.flush()
+    finally:
+        if output is not None:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Throughput benchmark for building MutateRows requests.
+
+Compares the two ways of building the ``MutateRows`` requests of a bulk
+write, without any network I/O:
+
+* ``direct_rows``: one :class:`~google.cloud.bigtable.row.DirectRow` per row,
+  filled with ``set_cell`` and sized with ``get_mutations_size``, as done by
+  :class:`~google.cloud.bigtable.batcher.MutationsBatcher` and
+  :meth:`~google.cloud.bigtable.table.Table.mutate_rows`.
+* ``columns``: the column-oriented requests of
+  :meth:`~google.cloud.bigtable.table.Table.mutate_columns`.
+
+Both build the same requests, which is checked before timing them.
+
+Usage:
+
+  $ python bigtable/benchmark/mutate_rows.py --rows 100000 --columns 5 \
+    --value-size 20
+"""
+
+from __future__ import division
+
+import argparse
+import json
+import sys
+import time
+
+from google.cloud.bigtable.batcher import MAX_ROW_BYTES
+from google.cloud.bigtable.row import DirectRow
+from google.cloud.bigtable.table import _MAX_BULK_MUTATIONS
+from google.cloud.bigtable.table import _mutate_columns_requests
+from google.cloud.bigtable.table import _mutate_rows_request
+
+
+TABLE_NAME = "projects/project/instances/instance/tables/table"
+
+
+def parse_options():
+    """Parses options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--columns", type=int, default=5)
+    parser.add_argument("--value-size", type=int, default=20)
+    parser.add_argument("--max-request-bytes", type=int, default=MAX_ROW_BYTES)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def make_data(options):
+    """Builds the row keys and the values of each column."""
+    row_keys = [b"row%08d" % (row_index,) for row_index in range(options.rows)]
+    columns = {}
+    for column_index in range(options.columns):
+        value = (b"%d" % (column_index,) * options.value_size)[: options.value_size]
+        columns[("cf", b"col%d" % (column_index,))] = [value] * options.rows
+    return row_keys, columns
+
+
+def direct_rows_requests(row_keys, columns, max_request_bytes):
+    """Builds the requests from :class:`DirectRow` instances.
+
+    Rows are batched under the same limits as :func:`_mutate_columns_requests`.
+
+    Returns:
+        List[~google.cloud.bigtable_v2.proto.bigtable_pb2.MutateRowsRequest]:
+            The requests.
+    """
+    columns = list(columns.items())
+    requests = []
+    rows = []
+    request_bytes = 0
+    request_mutations = 0
+    for index, row_key in enumerate(row_keys):
+        row = DirectRow(row_key)
+        for (column_family_id, column), values in columns:
+            row.set_cell(column_family_id, column, values[index])
+        row_bytes = row.get_mutations_size()
+        if rows and (
+            request_bytes + row_bytes > max_request_bytes
+            or request_mutations + len(columns) > _MAX_BULK_MUTATIONS
+        ):
+            requests.append(_mutate_rows_request(TABLE_NAME, rows))
+            rows = []
+            request_bytes = 0
+            request_mutations = 0
+        rows.append(row)
+        request_bytes += row_bytes
+        request_mutations += len(columns)
+    if rows:
+        requests.append(_mutate_rows_request(TABLE_NAME, rows))
+    return requests
+
+
+def columns_requests(row_keys, columns, max_request_bytes):
+    """Builds the requests from column-oriented data.
+
+    Returns:
+        List[~google.cloud.bigtable_v2.proto.bigtable_pb2.MutateRowsRequest]:
+            The requests.
+    """
+    return [
+        request_pb
+        for request_pb, _ in _mutate_columns_requests(
+            TABLE_NAME, row_keys, columns, max_request_bytes=max_request_bytes
+        )
+    ]
+
+
+def best_duration(build, row_keys, columns, options):
+    """Gets the best duration of ``options.repeat`` runs of ``build``."""
+    durations = []
+    for _ in range(options.repeat):
+        start = time.time()
+        build(row_keys, columns, options.max_request_bytes)
+        durations.append(time.time() - start)
+    return min(durations)
+
+
+def main():
+    options = parse_options()
+    row_keys, columns = make_data(options)
+
+    expected = direct_rows_requests(row_keys, columns, options.max_request_bytes)
+    actual = columns_requests(row_keys, columns, options.max_request_bytes)
+    if actual != expected:
+        sys.stderr.write("The column-oriented requests differ from DirectRow's.\n")
+        sys.exit(1)
+
+    num_cells = options.rows * options.columns
+    report = {
+        "rows": options.rows,
+        "cells": num_cells,
+        "value_size": options.value_size,
+        "requests": len(expected),
+    }
+    for name, build in (
+        ("direct_rows", direct_rows_requests),
+        ("columns", columns_requests),
+    ):
+        best = best_duration(build, row_keys, columns, options)
+        report[name] = {
+            "best_seconds": best,
+            "rows_per_sec": options.rows / best,
+            "cells_per_sec": num_cells / best,
+        }
+    report["speedup"] = (
+        report["direct_rows"]["best_seconds"] / report["columns"]["best_seconds"]
+    )
+    json.dump(report, sys.stdout, sort_keys=True)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
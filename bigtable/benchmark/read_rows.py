@@ -0,0 +1,212 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Conformance and throughput benchmark for merging ReadRows chunks.
+
+The conformance check replays every case of the read-rows acceptance tests
+(``tests/unit/read-rows-acceptance-test.json``) through
+:class:`~google.cloud.bigtable.row_data.PartialRowsData` and compares the
+merged cells with the expected results. The throughput benchmark then merges
+a synthetic stream of chunks, without any network I/O.
+
+Usage:
+
+  $ python bigtable/benchmark/read_rows.py --rows 20000 --cells-per-row 10 \
+    --value-size 100 --split 2
+"""
+
+from __future__ import division
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from google.protobuf import text_format
+
+from google.cloud._helpers import _bytes_to_unicode
+from google.cloud.bigtable.row_data import InvalidChunk
+from google.cloud.bigtable.row_data import PartialRowsData
+from google.cloud.bigtable_v2.proto import bigtable_pb2
+
+
+ACCEPTANCE_TESTS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "tests",
+    "unit",
+    "read-rows-acceptance-test.json",
+)
+
+
+def parse_options():
+    """Parses options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--cells-per-row", type=int, default=10)
+    parser.add_argument("--value-size", type=int, default=100)
+    parser.add_argument(
+        "--split", type=int, default=1, help="Number of chunks per cell value."
+    )
+    parser.add_argument("--chunks-per-response", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--acceptance-tests", default=ACCEPTANCE_TESTS)
+    return parser.parse_args()
+
+
+class _Response(object):
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.last_scanned_row_key = b""
+
+
+def merge(responses):
+    """Merges the chunks of ``responses`` into rows.
+
+    Returns:
+        List[~google.cloud.bigtable.row_data.PartialRowData]: The rows.
+    """
+    rows_data = PartialRowsData(lambda request: iter(responses), request=None)
+    return list(rows_data)
+
+
+def flatten(rows):
+    """Flattens rows in the format of the acceptance tests results."""
+    for row in rows:
+        for family_name, family in row.cells.items():
+            for qualifier, column in family.items():
+                for cell in column:
+                    yield {
+                        u"rk": _bytes_to_unicode(row.row_key),
+                        u"fm": family_name,
+                        u"qual": _bytes_to_unicode(qualifier),
+                        u"ts": cell.timestamp_micros,
+                        u"value": _bytes_to_unicode(cell.value),
+                        u"label": u" ".join(cell.labels),
+                        u"error": False,
+                    }
+
+
+def _sort_key(result):
+    return result["rk"], result["fm"], result["qual"]
+
+
+def check_conformance(filename):
+    """Replays the acceptance tests.
+
+    Returns:
+        List[str]: The names of the failed tests.
+    """
+    with open(filename) as json_file:
+        tests = json.load(json_file)["tests"]
+
+    failures = []
+    for test in tests:
+        chunks = [
+            text_format.Merge(text, bigtable_pb2.ReadRowsResponse.CellChunk())
+            for text in test["chunks"]
+        ]
+        results = test["results"] or []
+        expect_error = any(result["error"] for result in results)
+        expected = sorted(
+            (result for result in results if not result["error"]), key=_sort_key
+        )
+
+        rows = []
+        rows_data = PartialRowsData(
+            lambda request: iter([_Response(chunks)]), request=None
+        )
+        try:
+            for row in rows_data:
+                rows.append(row)
+            raised = False
+        except (InvalidChunk, ValueError):
+            raised = True
+
+        if raised != expect_error or sorted(flatten(rows), key=_sort_key) != expected:
+            failures.append(test["name"])
+    return failures
+
+
+def make_responses(options):
+    """Builds a synthetic stream of responses.
+
+    Each row has ``cells_per_row`` cells in a single family, each cell having
+    its own qualifier. The first chunk of a row carries all the keys, the
+    following cells only carry their qualifier, as the service does.
+    """
+    CellChunk = bigtable_pb2.ReadRowsResponse.CellChunk
+    value = b"x" * options.value_size
+    part_size = -(-options.value_size // options.split)
+    parts = [value[i : i + part_size] for i in range(0, len(value), part_size)]
+    parts = parts or [b""]
+
+    chunks = []
+    for row_index in range(options.rows):
+        for cell_index in range(options.cells_per_row):
+            for part_index, part in enumerate(parts):
+                chunk = CellChunk(value=part)
+                if part_index == 0:
+                    chunk.qualifier.value = b"q%d" % (cell_index,)
+                    chunk.timestamp_micros = 1000
+                    if cell_index == 0:
+                        chunk.row_key = b"row%08d" % (row_index,)
+                        chunk.family_name.value = u"cf"
+                if part_index < len(parts) - 1:
+                    chunk.value_size = options.value_size
+                chunks.append(chunk)
+        chunks[-1].commit_row = True
+
+    step = options.chunks_per_response
+    return [_Response(chunks[i : i + step]) for i in range(0, len(chunks), step)]
+
+
+def main():
+    options = parse_options()
+
+    failures = check_conformance(options.acceptance_tests)
+    if failures:
+        sys.stderr.write("Conformance failures: {}\n".format(", ".join(failures)))
+        sys.exit(1)
+
+    responses = make_responses(options)
+    num_chunks = sum(len(response.chunks) for response in responses)
+    num_cells = options.rows * options.cells_per_row
+
+    durations = []
+    for _ in range(options.repeat):
+        start = time.time()
+        rows = merge(responses)
+        durations.append(time.time() - start)
+        assert len(rows) == options.rows
+
+    best = min(durations)
+    report = {
+        "rows": options.rows,
+        "cells": num_cells,
+        "chunks": num_chunks,
+        "value_size": options.value_size,
+        "split": options.split,
+        "best_seconds": best,
+        "rows_per_sec": options.rows / best,
+        "cells_per_sec": num_cells / best,
+        "chunks_per_sec": num_chunks / best,
+    }
+    json.dump(report, sys.stdout, sort_keys=True)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
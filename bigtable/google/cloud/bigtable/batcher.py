@@ -14,10 +14,23 @@
 
 """User friendly container for Google Cloud Bigtable MutationBatcher."""
 
+import logging
+import threading
+import time
+
+from concurrent import futures
+
+from google.cloud.bigtable import metrics as metrics_module
+
+
+_LOGGER = logging.getLogger(__name__)
+_FLUSHER_WORKER_NAME = "Thread-MutationsBatcherFlusher"
 
 FLUSH_COUNT = 1000
 MAX_MUTATIONS = 100000
 MAX_ROW_BYTES = 5242880  # 5MB
+MAX_IN_FLIGHT_RPCS = 10
+MAX_IN_FLIGHT_BYTES = 20 * MAX_ROW_BYTES  # 100MB
 
 
 class MaxMutationsError(ValueError):
@@ -32,15 +45,20 @@ class MutationsBatcher(object):
     Bigtable. Batching mutations is more efficient than sending individual
     request.
 
+    Batches are sent in the background by a pool of up to ``max_in_flight``
+    concurrent ``MutateRows`` RPCs. :meth:`mutate` only blocks when the
+    limits on in-flight RPCs or bytes are reached, while :meth:`flush` and
+    :meth:`close` wait for every batch sent so far to complete. Since several
+    batches may be in flight at once, mutations of the same row sent in
+    different batches may be applied out of order; use ``max_in_flight=1`` if
+    the order matters.
+
     This class is not suited for usage in systems where each mutation
     needs to guaranteed to be sent, since calling mutate may only result in an
     in-memory change. In a case of a system crash, any DirectRows remaining in
     memory will not necessarily be sent to the service, even after the
     completion of the mutate() method.
 
-    TODO: Performance would dramatically improve if this class had the
-    capability of asynchronous, parallel RPCs.
-
     :type table: class
     :param table: class:`~google.cloud.bigtable.table.Table`.
 
@@ -54,19 +72,80 @@ class MutationsBatcher(object):
     flush. If it reaches the max number of row mutations size it calls
     finish_batch() to mutate the current row batch. Default is MAX_ROW_BYTES
     (5 MB).
+
+    :type flush_interval: float
+    :param flush_interval: (Optional) Seconds after which the current batch
+    is sent even if it has not reached any of the size limits. By default,
+    batches are only sent when full or on an explicit call to flush().
+
+    :type max_in_flight: int
+    :param max_in_flight: (Optional) Max number of concurrent ``MutateRows``
+    RPCs. Default is MAX_IN_FLIGHT_RPCS (10).
+
+    :type max_in_flight_bytes: int
+    :param max_in_flight_bytes: (Optional) Max size of the row mutations
+    being sent. When sending the next batch would exceed it, mutate() blocks
+    until earlier batches complete. Default is MAX_IN_FLIGHT_BYTES (100 MB).
+
+    :type failure_callback: callable
+    :param failure_callback: (Optional) Called with the
+    :class:`~google.cloud.bigtable.row.DirectRow` and its
+    :class:`~google.rpc.status_pb2.Status` for every row which could not be
+    mutated, once retries are exhausted. Called from a background thread.
+
+    :type metrics: :class:`~google.cloud.bigtable.metrics.MetricsRecorder`
+    :param metrics: (Optional) Recorder of the number of rows waiting to be
+    sent, of the RPCs and bytes in flight, and of the time mutate() is
+    blocked by the in-flight limits.
     """
 
-    def __init__(self, table, flush_count=FLUSH_COUNT, max_row_bytes=MAX_ROW_BYTES):
+    def __init__(
+        self,
+        table,
+        flush_count=FLUSH_COUNT,
+        max_row_bytes=MAX_ROW_BYTES,
+        flush_interval=None,
+        max_in_flight=MAX_IN_FLIGHT_RPCS,
+        max_in_flight_bytes=MAX_IN_FLIGHT_BYTES,
+        failure_callback=None,
+        metrics=None,
+    ):
         self.rows = []
         self.total_mutation_count = 0
         self.total_size = 0
         self.table = table
         self.flush_count = flush_count
         self.max_row_bytes = max_row_bytes
+        self.flush_interval = flush_interval
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_bytes = max_in_flight_bytes
+        self.failure_callback = failure_callback
+        self.metrics = metrics
+
+        self._condition = threading.Condition()
+        self._in_flight_count = 0
+        self._in_flight_bytes = 0
+        self._errors = []
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_in_flight)
+
+        self._stop_event = threading.Event()
+        self._flusher = None
+        if flush_interval:
+            self._flusher = threading.Thread(
+                name=_FLUSHER_WORKER_NAME, target=self._flush_periodically
+            )
+            self._flusher.daemon = True
+            self._flusher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def mutate(self, row):
         """ Add a row to the batch. If the current batch meets one of the size
-        limits, the batch is sent synchronously.
+        limits, the batch is sent in the background.
 
         Example:
             >>> # Batcher for max row bytes
@@ -83,13 +162,8 @@ class MutationsBatcher(object):
         :type row: class
         :param row: class:`~google.cloud.bigtable.row.DirectRow`.
 
-        :raises: One of the following:
-                 * :exc:`~.table._BigtableRetryableError` if any
-                   row returned a transient error.
-                 * :exc:`RuntimeError` if the number of responses doesn't
-                   match the number of rows that were retried
-                 * :exc:`.batcher.MaxMutationsError` if any row exceeds max
-                   mutations count.
+        :raises: :exc:`.batcher.MaxMutationsError` if any row exceeds max
+                 mutations count.
         """
         mutation_count = len(row._get_mutations())
         if mutation_count > MAX_MUTATIONS:
@@ -99,19 +173,28 @@ class MutationsBatcher(object):
                 )
             )
 
-        if (self.total_mutation_count + mutation_count) >= MAX_MUTATIONS:
-            self.flush()
+        with self._condition:
+            if (self.total_mutation_count + mutation_count) >= MAX_MUTATIONS:
+                self._send_batch()
 
-        self.rows.append(row)
-        self.total_mutation_count += mutation_count
-        self.total_size += row.get_mutations_size()
+            self.rows.append(row)
+            self.total_mutation_count += mutation_count
+            self.total_size += row.get_mutations_size()
 
-        if self.total_size >= self.max_row_bytes or len(self.rows) >= self.flush_count:
-            self.flush()
+            if (
+                self.total_size >= self.max_row_bytes
+                or len(self.rows) >= self.flush_count
+            ):
+                self._send_batch()
+
+            if self.metrics is not None:
+                self.metrics.set_gauge(
+                    metrics_module.BATCHER_PENDING_ROWS, len(self.rows)
+                )
 
     def mutate_rows(self, rows):
         """ Add a row to the batch. If the current batch meets one of the size
-        limits, the batch is sent synchronously.
+        limits, the batch is sent in the background.
 
         Example:
             >>> # Batcher for flush count
@@ -131,21 +214,110 @@ class MutationsBatcher(object):
         :type rows: list:[`~google.cloud.bigtable.row.DirectRow`]
         :param rows: list:[`~google.cloud.bigtable.row.DirectRow`].
 
-        :raises: One of the following:
-                 * :exc:`~.table._BigtableRetryableError` if any
-                   row returned a transient error.
-                 * :exc:`RuntimeError` if the number of responses doesn't
-                   match the number of rows that were retried
-                 * :exc:`.batcher.MaxMutationsError` if any row exceeds max
-                   mutations count.
+        :raises: :exc:`.batcher.MaxMutationsError` if any row exceeds max
+                 mutations count.
         """
         for row in rows:
             self.mutate(row)
 
+    def _send_batch(self):
+        """Send the current batch in the background.
+
+        Must be called with ``_condition`` held. Blocks while the limits on
+        in-flight RPCs or bytes are reached; a batch is always sent when no
+        other batch is in flight, whatever its size.
+        """
+        if not self.rows:
+            return
+
+        rows, size = self.rows, self.total_size
+        self.rows = []
+        self.total_mutation_count = 0
+        self.total_size = 0
+
+        metrics = self.metrics
+        if metrics is not None:
+            start_time = time.time()
+        while self._in_flight_count and (
+            self._in_flight_count >= self.max_in_flight
+            or self._in_flight_bytes + size > self.max_in_flight_bytes
+        ):
+            self._condition.wait()
+
+        self._in_flight_count += 1
+        self._in_flight_bytes += size
+        if metrics is not None:
+            metrics.record_latency(
+                metrics_module.BATCHER_BLOCKED_LATENCY, time.time() - start_time
+            )
+            metrics.set_gauge(metrics_module.BATCHER_PENDING_ROWS, 0)
+            self._record_in_flight()
+        self._executor.submit(self._mutate_batch, rows, size)
+
+    def _record_in_flight(self):
+        """Record the RPCs and bytes in flight, with ``_condition`` held."""
+        self.metrics.set_gauge(
+            metrics_module.BATCHER_IN_FLIGHT_RPCS, self._in_flight_count
+        )
+        self.metrics.set_gauge(
+            metrics_module.BATCHER_IN_FLIGHT_BYTES, self._in_flight_bytes
+        )
+
+    def _mutate_batch(self, rows, size):
+        """Mutate a batch of rows, reporting the rows which failed."""
+        try:
+            statuses = self.table.mutate_rows(rows)
+            if self.failure_callback is not None:
+                for row, status in zip(rows, statuses):
+                    if status.code != 0:
+                        self.failure_callback(row, status)
+        except Exception as exc:
+            _LOGGER.debug("Error while mutating a batch of %d rows.", len(rows))
+            with self._condition:
+                self._errors.append(exc)
+        finally:
+            with self._condition:
+                self._in_flight_count -= 1
+                self._in_flight_bytes -= size
+                if self.metrics is not None:
+                    self._record_in_flight()
+                self._condition.notify_all()
+
+    def _flush_periodically(self):
+        while not self._stop_event.wait(self.flush_interval):
+            with self._condition:
+                self._send_batch()
+
+        _LOGGER.debug("%s exiting.", _FLUSHER_WORKER_NAME)
+
     def flush(self):
-        """ Sends the current. batch to Cloud Bigtable. """
-        if len(self.rows) != 0:
-            self.table.mutate_rows(self.rows)
-            self.total_mutation_count = 0
-            self.total_size = 0
-            self.rows = []
+        """ Sends the current. batch to Cloud Bigtable and waits for all the
+        batches in flight to complete.
+
+        :raises: The first exception raised by ``mutate_rows`` since the
+                 previous call to flush(), for instance
+                 :exc:`RuntimeError` if the number of responses doesn't
+                 match the number of rows that were retried.
+        """
+        with self._condition:
+            self._send_batch()
+            while self._in_flight_count:
+                self._condition.wait()
+            errors, self._errors = self._errors, []
+
+        if errors:
+            raise errors[0]
+
+    def close(self):
+        """ Flushes the remaining rows and releases the background threads.
+
+        The batcher must not be used after it is closed.
+        """
+        self._stop_event.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
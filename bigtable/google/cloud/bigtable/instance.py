@@ -538,7 +538,7 @@ class Instance(object):
         clusters = [Cluster.from_pb(cluster, self) for cluster in resp.clusters]
         return clusters, resp.failed_locations
 
-    def table(self, table_id, mutation_timeout=None, app_profile_id=None):
+    def table(self, table_id, mutation_timeout=None, app_profile_id=None, metrics=None):
         """Factory to create a table associated with this instance.
 
         For example:
@@ -553,6 +553,10 @@ class Instance(object):
         :type app_profile_id: str
         :param app_profile_id: (Optional) The unique name of the AppProfile.
 
+        :type metrics: :class:`~google.cloud.bigtable.metrics.MetricsRecorder`
+        :param metrics: (Optional) Recorder of the client-side metrics of the
+                        data operations on the table.
+
         :rtype: :class:`Table <google.cloud.bigtable.table.Table>`
         :returns: The table owned by this instance.
         """
@@ -561,6 +565,7 @@ class Instance(object):
             self,
             app_profile_id=app_profile_id,
             mutation_timeout=mutation_timeout,
+            metrics=metrics,
         )
 
     def list_tables(self):
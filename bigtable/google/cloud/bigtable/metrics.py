@@ -0,0 +1,333 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side metrics of Google Cloud Bigtable data operations.
+
+A :class:`MetricsRecorder` passed to a
+:class:`~google.cloud.bigtable.table.Table` records the latency, retries
+and volume of its ``ReadRows`` and ``MutateRows`` operations, and the
+queue depths of its
+:class:`~google.cloud.bigtable.batcher.MutationsBatcher` instances.
+
+For example:
+
+.. code-block:: python
+
+    from google.cloud.bigtable.metrics import InMemoryMetrics
+
+    metrics = InMemoryMetrics()
+    table = instance.table("my-table", metrics=metrics)
+    for row in table.read_rows():
+        ...
+    print(metrics.snapshot())
+"""
+
+import bisect
+import threading
+
+try:
+    from opencensus.stats import aggregation as aggregation_module
+    from opencensus.stats import measure as measure_module
+    from opencensus.stats import stats as stats_module
+    from opencensus.stats import view as view_module
+    from opencensus.tags import tag_key as tag_key_module
+    from opencensus.tags import tag_map as tag_map_module
+    from opencensus.tags import tag_value as tag_value_module
+except ImportError:  # pragma: NO COVER
+    stats_module = None
+
+
+_NO_OPENCENSUS_ERROR = (
+    "The opencensus library is not installed, please install "
+    "opencensus to use the OpenCensusMetrics recorder."
+)
+
+# Latencies, in seconds.
+READ_ROWS_LATENCY = "read_rows/latency"
+READ_ROWS_FIRST_RESPONSE_LATENCY = "read_rows/first_response_latency"
+MUTATE_ROWS_LATENCY = "mutate_rows/latency"
+BATCHER_BLOCKED_LATENCY = "batcher/blocked_latency"
+
+# Counters.
+READ_ROWS_ROWS = "read_rows/rows"
+READ_ROWS_CELLS = "read_rows/cells"
+READ_ROWS_BYTES = "read_rows/bytes"
+READ_ROWS_RETRIES = "read_rows/retries"
+MUTATE_ROWS_ROWS = "mutate_rows/rows"
+MUTATE_ROWS_BYTES = "mutate_rows/bytes"
+MUTATE_ROWS_FAILED_ROWS = "mutate_rows/failed_rows"
+MUTATE_ROWS_RETRIES = "mutate_rows/retries"
+
+# Gauges.
+BATCHER_PENDING_ROWS = "batcher/pending_rows"
+BATCHER_IN_FLIGHT_RPCS = "batcher/in_flight_rpcs"
+BATCHER_IN_FLIGHT_BYTES = "batcher/in_flight_bytes"
+
+# Upper bounds (in milliseconds) of the buckets of latency histograms,
+# growing by 25% from 0.1ms to about 2 minutes.
+LATENCY_BUCKETS_MS = tuple(0.1 * 1.25 ** index for index in range(64))
+
+
+class MetricsRecorder(object):
+    """Interface of the recorders of client-side metrics.
+
+    Every method does nothing: subclasses override the ones they need. The
+    methods may be called concurrently from several threads.
+    """
+
+    def record_latency(self, name, seconds):
+        """Record the latency of an operation.
+
+        :type name: str
+        :param name: The name of the metric, e.g. :data:`READ_ROWS_LATENCY`.
+
+        :type seconds: float
+        :param seconds: The latency, in seconds.
+        """
+
+    def increment(self, name, value=1):
+        """Add to a counter.
+
+        :type name: str
+        :param name: The name of the metric, e.g. :data:`READ_ROWS_ROWS`.
+
+        :type value: int
+        :param value: The value added to the counter.
+        """
+
+    def set_gauge(self, name, value):
+        """Record the current value of a gauge.
+
+        :type name: str
+        :param name: The name of the metric, e.g.
+                     :data:`BATCHER_PENDING_ROWS`.
+
+        :type value: int
+        :param value: The current value.
+        """
+
+
+class _LatencyHistogram(object):
+    """A histogram of latencies, with buckets of :data:`LATENCY_BUCKETS_MS`."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, milliseconds):
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        self.count += 1
+        self.sum += milliseconds
+        if self.min is None or milliseconds < self.min:
+            self.min = milliseconds
+        if self.max is None or milliseconds > self.max:
+            self.max = milliseconds
+
+    def percentile(self, percent):
+        """Return the upper bound of the bucket holding a percentile.
+
+        :type percent: float
+        :param percent: The percentile, between 0 and 100.
+
+        :rtype: float
+        :returns: The latency in milliseconds, capped by the largest latency
+                  recorded.
+        """
+        target = max(1, self.count * percent / 100.0)
+        total = 0
+        for index, count in enumerate(self.buckets[:-1]):
+            total += count
+            if total >= target:
+                return min(LATENCY_BUCKETS_MS[index], self.max)
+        return self.max
+
+    def to_dict(self):
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean_ms": self.sum / self.count,
+            "min_ms": self.min,
+            "max_ms": self.max,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+        }
+
+
+class InMemoryMetrics(MetricsRecorder):
+    """A recorder keeping the metrics in memory.
+
+    Latencies are kept in histograms, so that memory use does not grow with
+    the number of operations.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Discard all the recorded metrics."""
+        with self._lock:
+            self._latencies = {}
+            self._counters = {}
+            self._gauges = {}
+
+    def record_latency(self, name, seconds):
+        with self._lock:
+            histogram = self._latencies.get(name)
+            if histogram is None:
+                histogram = self._latencies[name] = _LatencyHistogram()
+            histogram.add(seconds * 1000.0)
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name, value):
+        with self._lock:
+            _, maximum = self._gauges.get(name, (value, value))
+            self._gauges[name] = (value, max(value, maximum))
+
+    def snapshot(self):
+        """Return the metrics recorded so far.
+
+        :rtype: dict
+        :returns: ``latencies`` maps the name of each latency metric to a
+                  summary of its histogram (count, mean, min, max and
+                  percentiles, in milliseconds). ``counters`` maps names to
+                  values. ``gauges`` maps names to their ``current`` and
+                  ``max`` values.
+        """
+        with self._lock:
+            return {
+                "latencies": {
+                    name: histogram.to_dict()
+                    for name, histogram in self._latencies.items()
+                },
+                "counters": dict(self._counters),
+                "gauges": {
+                    name: {"current": current, "max": maximum}
+                    for name, (current, maximum) in self._gauges.items()
+                },
+            }
+
+
+class OpenCensusMetrics(MetricsRecorder):
+    """A recorder forwarding the metrics to OpenCensus stats.
+
+    A view is registered for each metric the first time it is recorded:
+    a distribution (in milliseconds) for latencies, a sum for counters and
+    the last value for gauges. Exporters registered with the OpenCensus view
+    manager then export them.
+
+    :type prefix: str
+    :param prefix: (Optional) Prefix of the names of the measures and views.
+
+    :type tags: dict
+    :param tags: (Optional) Tags (e.g. the table name) attached to every
+                 measurement.
+
+    :type view_manager: :class:`opencensus.stats.view_manager.ViewManager`
+    :param view_manager: (Optional) The view manager to register views with.
+                         Defaults to the global OpenCensus view manager.
+
+    :type stats_recorder:
+        :class:`opencensus.stats.stats_recorder.StatsRecorder`
+    :param stats_recorder: (Optional) The recorder of the measurements.
+                           Defaults to the global OpenCensus stats recorder.
+
+    :raises: :class:`ValueError <exceptions.ValueError>` if the
+             ``opencensus`` library is not installed.
+    """
+
+    def __init__(
+        self,
+        prefix="cloud.google.com/bigtable/client/",
+        tags=None,
+        view_manager=None,
+        stats_recorder=None,
+    ):
+        if stats_module is None:
+            raise ValueError(_NO_OPENCENSUS_ERROR)
+        if view_manager is None:
+            view_manager = stats_module.stats.view_manager
+        if stats_recorder is None:
+            stats_recorder = stats_module.stats.stats_recorder
+
+        self.prefix = prefix
+        self._view_manager = view_manager
+        self._stats_recorder = stats_recorder
+        self._tag_map = tag_map_module.TagMap()
+        self._tag_keys = []
+        for key, value in sorted((tags or {}).items()):
+            tag_key = tag_key_module.TagKey(key)
+            self._tag_map.insert(tag_key, tag_value_module.TagValue(value))
+            self._tag_keys.append(tag_key)
+        self._measures = {}
+        self._lock = threading.Lock()
+
+    def _measure(self, name, measure_class, unit, aggregation):
+        """Return the measure of a metric, registering its view if needed."""
+        measure = self._measures.get(name)
+        if measure is not None:
+            return measure
+
+        with self._lock:
+            measure = self._measures.get(name)
+            if measure is None:
+                full_name = self.prefix + name
+                measure = measure_class(full_name, name, unit)
+                self._view_manager.register_view(
+                    view_module.View(
+                        full_name, name, self._tag_keys, measure, aggregation
+                    )
+                )
+                self._measures[name] = measure
+        return measure
+
+    def _record(self, measure, value):
+        measurement_map = self._stats_recorder.new_measurement_map()
+        if isinstance(measure, measure_module.MeasureFloat):
+            measurement_map.measure_float_put(measure, value)
+        else:
+            measurement_map.measure_int_put(measure, value)
+        measurement_map.record(self._tag_map)
+
+    def record_latency(self, name, seconds):
+        measure = self._measure(
+            name,
+            measure_module.MeasureFloat,
+            "ms",
+            aggregation_module.DistributionAggregation(list(LATENCY_BUCKETS_MS)),
+        )
+        self._record(measure, seconds * 1000.0)
+
+    def increment(self, name, value=1):
+        measure = self._measure(
+            name, measure_module.MeasureInt, "1", aggregation_module.SumAggregation()
+        )
+        self._record(measure, value)
+
+    def set_gauge(self, name, value):
+        measure = self._measure(
+            name,
+            measure_module.MeasureInt,
+            "1",
+            aggregation_module.LastValueAggregation(),
+        )
+        self._record(measure, value)
@@ -15,18 +15,33 @@
 """Container for Google Cloud Bigtable Cells and Streaming Row Contents."""
 
 
-import copy
+import bisect
+import time
+
 import six
 
 import grpc
 
 from google.api_core import exceptions
 from google.api_core import retry
+from google.cloud._helpers import _bytes_to_unicode
 from google.cloud._helpers import _datetime_from_microseconds
 from google.cloud._helpers import _to_bytes
+from google.cloud.bigtable import metrics as metrics_module
 from google.cloud.bigtable_v2.proto import bigtable_pb2 as data_messages_v2_pb2
+from google.cloud.bigtable.row_set import _merge_row_ranges
 from google.cloud.bigtable_v2.proto import data_pb2 as data_v2_pb2
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 _MISSING_COLUMN_FAMILY = "Column family {} is not among the cells stored in this row."
 _MISSING_COLUMN = (
     "Column {} is not among the cells stored in this row in the " "column family {}."
@@ -35,6 +50,15 @@ _MISSING_INDEX = (
     "Index {!r} is not valid for the cells stored in this row for column {} "
     "in the column family {}. There are {} such cells."
 )
+_NO_PANDAS_ERROR = (
+    "The pandas library is not installed, please install "
+    "pandas to use the to_dataframe() function."
+)
+_NO_PYARROW_ERROR = (
+    "The pyarrow library is not installed, please install "
+    "pyarrow to use the to_arrow() function."
+)
+_ARROW_BATCH_SIZE = 1000
 
 
 class Cell(object):
@@ -50,6 +74,8 @@ class Cell(object):
     :param labels: (Optional) List of strings. Labels applied to the cell.
     """
 
+    __slots__ = ("value", "timestamp_micros", "labels")
+
     def __init__(self, value, timestamp_micros, labels=None):
         self.value = value
         self.timestamp_micros = timestamp_micros
@@ -113,6 +139,15 @@ class PartialCellData(object):
     :param value: The (accumulated) value of the (partial) cell.
     """
 
+    __slots__ = (
+        "row_key",
+        "family_name",
+        "qualifier",
+        "timestamp_micros",
+        "labels",
+        "value",
+    )
+
     def __init__(
         self, row_key, family_name, qualifier, timestamp_micros, labels=(), value=b""
     ):
@@ -165,9 +200,9 @@ class PartialRowData(object):
         """
         result = {}
         for column_family_id, columns in six.iteritems(self._cells):
+            prefix = _to_bytes(column_family_id) + b":"
             for column_qual, cells in six.iteritems(columns):
-                key = _to_bytes(column_family_id) + b":" + _to_bytes(column_qual)
-                result[key] = cells
+                result[prefix + _to_bytes(column_qual)] = cells
         return result
 
     @property
@@ -296,6 +331,10 @@ class InvalidChunk(RuntimeError):
     """Exception raised to to invalid chunk data from back-end."""
 
 
+class InvalidRetryRequest(RuntimeError):
+    """Exception raised when retry request is invalid."""
+
+
 def _retry_read_rows_exception(exc):
     if isinstance(exc, grpc.RpcError):
         exc = exceptions.from_grpc_error(exc)
@@ -338,6 +377,11 @@ class PartialRowsData(object):
                   :meth:`~google.api_core.retry.Retry.with_delay` method
                   or the
                   :meth:`~google.api_core.retry.Retry.with_deadline` method.
+
+    :type metrics: :class:`~google.cloud.bigtable.metrics.MetricsRecorder`
+    :param metrics: (Optional) Recorder of the latency (until the stream is
+                    fully consumed), first-response latency, retries, and
+                    rows, cells and bytes received.
     """
 
     NEW_ROW = "New row"  # No cells yet complete for row
@@ -354,7 +398,14 @@ class PartialRowsData(object):
         STATE_CELL_IN_PROGRESS: CELL_IN_PROGRESS,
     }
 
-    def __init__(self, read_method, request, retry=DEFAULT_RETRY_READ_ROWS):
+    def __init__(
+        self, read_method, request, retry=DEFAULT_RETRY_READ_ROWS, metrics=None
+    ):
+        self._metrics = metrics
+        self._start_time = None
+        self._first_response_time = None
+        if metrics is not None:
+            self._start_time = time.time()
         # Counter for rows returned to the user
         self._counter = 0
         # In-progress row, unset until first response, after commit/reset
@@ -371,6 +422,7 @@ class PartialRowsData(object):
         self.read_method = read_method
         self.request = request
         self.retry = retry
+        self._request_manager = None
         self.response_iterator = read_method(request)
 
         self.rows = {}
@@ -405,20 +457,154 @@ class PartialRowsData(object):
         for row in self:
             self.rows[row.row_key] = row
 
+    def to_arrow_batches(
+        self,
+        columns=None,
+        decoders=None,
+        types=None,
+        versions=False,
+        batch_size=_ARROW_BATCH_SIZE,
+    ):
+        """Stream the rows as :class:`pyarrow.RecordBatch` objects.
+
+        Rows are converted into column arrays as they are read, and are
+        released once added to a batch, so that the whole result is never
+        held in memory as Python objects.
+
+        With ``versions`` unset, each record is a row: the ``row_key``
+        column is followed by one column per item of ``columns``, named
+        ``"family:qualifier"`` and holding the value of the latest cell.
+        With ``versions`` set, each record is a cell, with the ``row_key``,
+        ``family``, ``qualifier``, ``timestamp`` and ``value`` columns.
+
+        For example, to decode 64-bit big-endian counters:
+
+        .. code:: python
+
+            import struct
+
+            def decode_int64(value):
+                return struct.unpack(">q", value)[0]
+
+            table = rows.to_arrow(
+                columns=[("stats", b"views")],
+                decoders={("stats", b"views"): decode_int64},
+            )
+
+        :type columns: list
+        :param columns: The ``(column_family_id, column)`` pairs to convert.
+                        Required unless ``versions`` is set, in which case
+                        all the columns are converted by default.
+
+        :type decoders: dict
+        :param decoders: (Optional) Callables converting the bytes of a cell
+                         value, by ``(column_family_id, column)``. Values of
+                         columns without a decoder are kept as bytes.
+
+        :type types: dict
+        :param types: (Optional) The :class:`pyarrow.DataType` of the decoded
+                      values, by ``(column_family_id, column)``. Types not
+                      given are inferred from the first batch with a value
+                      in the column: the batches before it have the ``null``
+                      type for that column. When ``versions`` is set, all
+                      the decoded values must share the same type.
+
+        :type versions: bool
+        :param versions: (Optional) Whether to return one record per cell
+                         rather than the latest cell of each column.
+
+        :type batch_size: int
+        :param batch_size: (Optional) The maximum number of records per
+                           batch.
+
+        :rtype: iterator
+        :returns: The :class:`pyarrow.RecordBatch` objects. At least one,
+                  possibly empty, batch is returned.
+        :raises: :class:`ValueError <exceptions.ValueError>` if the
+                 :mod:`pyarrow` library cannot be imported, or if
+                 ``columns`` is not set and ``versions`` is not set.
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+        if columns is None and not versions:
+            raise ValueError("The columns must be set unless versions is set.")
+
+        builder = _ArrowBatchBuilder(columns, decoders, types, versions)
+        return self._build_arrow_batches(builder, batch_size)
+
+    def _build_arrow_batches(self, builder, batch_size):
+        """Helper for :meth:`to_arrow_batches`."""
+        empty = True
+        for row in self:
+            builder.add_row(row)
+            if builder.num_records >= batch_size:
+                empty = False
+                yield builder.build()
+
+        if builder.num_records or empty:
+            yield builder.build()
+
+    def to_arrow(self, columns=None, decoders=None, types=None, versions=False):
+        """Read all the rows into a :class:`pyarrow.Table`.
+
+        See :meth:`to_arrow_batches` for the description of the arguments
+        and of the columns.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: The rows, as a table.
+        :raises: :class:`ValueError <exceptions.ValueError>` if the
+                 :mod:`pyarrow` library cannot be imported.
+        """
+        batches = self.to_arrow_batches(
+            columns=columns, decoders=decoders, types=types, versions=versions
+        )
+        return pyarrow.Table.from_batches(_unify_arrow_batches(list(batches)))
+
+    def to_dataframe(self, columns=None, decoders=None, types=None, versions=False):
+        """Read all the rows into a :class:`pandas.DataFrame`.
+
+        See :meth:`to_arrow_batches` for the description of the arguments
+        and of the columns.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: The rows, as a data frame.
+        :raises: :class:`ValueError <exceptions.ValueError>` if the
+                 :mod:`pandas` or :mod:`pyarrow` libraries cannot be
+                 imported.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+        table = self.to_arrow(
+            columns=columns, decoders=decoders, types=types, versions=versions
+        )
+        return table.to_pandas()
+
     def _create_retry_request(self):
         """Helper for :meth:`__iter__`."""
-        req_manager = _ReadRowsRequestManager(
-            self.request, self.last_scanned_row_key, self._counter
-        )
+        # The manager is kept across retries, so that the row set of the
+        # request is only sorted and merged once.
+        req_manager = self._request_manager
+        if req_manager is None:
+            req_manager = self._request_manager = _ReadRowsRequestManager(
+                self.request, self.last_scanned_row_key, self._counter
+            )
+        else:
+            req_manager.last_scanned_key = self.last_scanned_row_key
+            req_manager.rows_read_so_far = self._counter
         return req_manager.build_updated_request()
 
     def _on_error(self, exc):
         """Helper for :meth:`__iter__`."""
+        if self._metrics is not None:
+            self._metrics.increment(metrics_module.READ_ROWS_RETRIES)
         # restart the read scan from AFTER the last successfully read row
         retry_request = self.request
         if self.last_scanned_row_key:
             retry_request = self._create_retry_request()
 
+        # The new stream starts over the row which was partially read.
+        self._row = self._cell = self._previous_cell = None
+        self._state = self.STATE_NEW_ROW
         self.response_iterator = self.read_method(retry_request)
 
     def _read_next(self):
@@ -436,6 +622,7 @@ class PartialRowsData(object):
         Parse the response and its chunks into a new/existing row in
         :attr:`_rows`. Rows are returned in order by row key.
         """
+        metrics = self._metrics
         while True:
             try:
                 response = self._read_next_response()
@@ -443,81 +630,170 @@ class PartialRowsData(object):
                 if self.state != self.NEW_ROW:
                     raise ValueError("The row remains partial / is not committed.")
                 break
+            except InvalidRetryRequest:
+                # All the requested rows were read before the error.
+                break
+
+            if metrics is not None:
+                self._record_response(response)
+                rows_before = self._counter
+
+            for row in self._process_chunks(response.chunks):
+                self.last_scanned_row_key = row.row_key
+                self._counter += 1
+                yield row
 
-            for chunk in response.chunks:
-                self._process_chunk(chunk)
-                if chunk.commit_row:
-                    self.last_scanned_row_key = self._previous_row.row_key
-                    self._counter += 1
-                    yield self._previous_row
+            if metrics is not None:
+                metrics.increment(
+                    metrics_module.READ_ROWS_ROWS, self._counter - rows_before
+                )
 
             resp_last_key = response.last_scanned_row_key
             if resp_last_key and resp_last_key > self.last_scanned_row_key:
                 self.last_scanned_row_key = resp_last_key
 
-    def _process_chunk(self, chunk):
-        if chunk.reset_row:
-            self._validate_chunk_reset_row(chunk)
-            self._row = None
-            self._cell = self._previous_cell = None
-            self._state = self.STATE_NEW_ROW
-            return
-
-        self._update_cell(chunk)
-
-        if self._row is None:
-            if (
-                self._previous_row is not None
-                and self._cell.row_key <= self._previous_row.row_key
-            ):
-                raise InvalidChunk()
-            self._row = PartialRowData(self._cell.row_key)
+        if metrics is not None:
+            metrics.record_latency(
+                metrics_module.READ_ROWS_LATENCY, time.time() - self._start_time
+            )
 
-        if chunk.value_size == 0:
-            self._state = self.STATE_ROW_IN_PROGRESS
-            self._save_current_cell()
-        else:
-            self._state = self.STATE_CELL_IN_PROGRESS
-
-        if chunk.commit_row:
-            if chunk.value_size > 0:
-                raise InvalidChunk()
-
-            self._previous_row = self._row
-            self._row = None
-            self._previous_cell = None
-            self._state = self.STATE_NEW_ROW
-
-    def _update_cell(self, chunk):
-        if self._cell is None:
-            qualifier = None
-            if chunk.HasField("qualifier"):
-                qualifier = chunk.qualifier.value
-            family = None
-            if chunk.HasField("family_name"):
-                family = chunk.family_name.value
-
-            self._cell = PartialCellData(
-                chunk.row_key,
-                family,
-                qualifier,
-                chunk.timestamp_micros,
-                chunk.labels,
-                chunk.value,
+    def _record_response(self, response):
+        """Record the metrics of a response, before merging its chunks."""
+        metrics = self._metrics
+        if self._first_response_time is None:
+            self._first_response_time = time.time()
+            metrics.record_latency(
+                metrics_module.READ_ROWS_FIRST_RESPONSE_LATENCY,
+                self._first_response_time - self._start_time,
             )
-            self._copy_from_previous(self._cell)
-            self._validate_cell_data_new_cell()
-        else:
-            self._cell.append_value(chunk.value)
 
-    def _validate_cell_data_new_cell(self):
+        num_cells = num_bytes = 0
+        for chunk in response.chunks:
+            num_bytes += len(chunk.value)
+            # The last chunk of each cell has no ``value_size``.
+            if not chunk.value_size and not chunk.reset_row:
+                num_cells += 1
+        metrics.increment(metrics_module.READ_ROWS_CELLS, num_cells)
+        metrics.increment(metrics_module.READ_ROWS_BYTES, num_bytes)
+
+    def _process_chunks(self, chunks):
+        """Merge the chunks of a response into rows.
+
+        The state of the merge is kept in local variables while the chunks
+        are processed, and stored back on ``self`` when a row is committed
+        and once all the chunks are processed. Cells which are not split
+        across chunks are stored directly as :class:`Cell`, without an
+        intermediate :class:`PartialCellData`.
+
+        :type chunks: list
+        :param chunks: The ``CellChunk`` messages of a ``ReadRowsResponse``.
+
+        :rtype: iterator
+        :returns: The :class:`PartialRowData` committed by the chunks.
+        :raises: :exc:`InvalidChunk` if the chunks are not valid.
+        """
+        state = self._state
+        row = self._row
+        # In-progress cell, only set while a value is split across chunks.
         cell = self._cell
-        if not cell.row_key or not cell.family_name or cell.qualifier is None:
-            raise InvalidChunk()
+        # Keys of the last cell started in the row, inherited by the next one.
+        previous = self._previous_cell
+        if previous is None:
+            row_key = family = qualifier = None
+        else:
+            row_key = previous.row_key
+            family = previous.family_name
+            qualifier = previous.qualifier
+        previous_row_key = None
+        if self._previous_row is not None:
+            previous_row_key = self._previous_row.row_key
+        # The list of cells of the last column written to, in the current row.
+        column = None
+
+        for chunk in chunks:
+            if chunk.reset_row:
+                self._state = state
+                self._validate_chunk_reset_row(chunk)
+                row = cell = column = None
+                row_key = family = qualifier = None
+                state = self.STATE_NEW_ROW
+                continue
 
-        prev = self._previous_cell
-        if prev and prev.row_key != cell.row_key:
-            raise InvalidChunk()
+            value_size = chunk.value_size
+            if cell is not None:
+                cell.append_value(chunk.value)
+            else:
+                new_family = new_qualifier = None
+                if chunk.HasField("family_name"):
+                    new_family = chunk.family_name.value
+                if chunk.HasField("qualifier"):
+                    new_qualifier = chunk.qualifier.value
+                new_row_key = chunk.row_key
+                if not new_row_key and row_key is not None:
+                    new_row_key = row_key
+                    if not new_family:
+                        new_family = family
+                        # NOTE: ``qualifier`` **can** be empty string.
+                        if new_qualifier is None:
+                            new_qualifier = qualifier
+                if not new_row_key or not new_family or new_qualifier is None:
+                    raise InvalidChunk()
+                if row_key is not None and row_key != new_row_key:
+                    raise InvalidChunk()
+                if new_family != family or new_qualifier != qualifier:
+                    column = None
+                row_key, family, qualifier = new_row_key, new_family, new_qualifier
+
+                if value_size:
+                    cell = PartialCellData(
+                        row_key,
+                        family,
+                        qualifier,
+                        chunk.timestamp_micros,
+                        chunk.labels,
+                        chunk.value,
+                    )
+
+            if row is None:
+                if previous_row_key is not None and row_key <= previous_row_key:
+                    raise InvalidChunk()
+                row = PartialRowData(row_key)
+
+            if value_size:
+                state = self.STATE_CELL_IN_PROGRESS
+            else:
+                state = self.STATE_ROW_IN_PROGRESS
+                if column is None:
+                    column = row._cells.setdefault(family, {}).setdefault(qualifier, [])
+                if cell is None:
+                    labels = chunk.labels
+                    column.append(
+                        Cell(chunk.value, chunk.timestamp_micros, labels or None)
+                    )
+                else:
+                    column.append(
+                        Cell(cell.value, cell.timestamp_micros, cell.labels or None)
+                    )
+                    cell = None
+
+            if chunk.commit_row:
+                if value_size:
+                    raise InvalidChunk()
+
+                previous_row_key = row_key
+                self._previous_row = row
+                self._row = self._cell = self._previous_cell = None
+                self._state = state = self.STATE_NEW_ROW
+                committed, row, column = row, None, None
+                row_key = family = qualifier = None
+                yield committed
+
+        self._row = row
+        self._cell = cell
+        self._previous_cell = None
+        if row_key is not None:
+            self._previous_cell = PartialCellData(row_key, family, qualifier, 0)
+        self._state = state
 
     def _validate_chunk_reset_row(self, chunk):
         # No reset for new row
@@ -533,26 +809,176 @@ class PartialRowsData(object):
         _raise_if(chunk.value)
         _raise_if(chunk.commit_row)
 
-    def _save_current_cell(self):
-        """Helper for :meth:`consume_next`."""
-        row, cell = self._row, self._cell
-        family = row._cells.setdefault(cell.family_name, {})
-        qualified = family.setdefault(cell.qualifier, [])
-        complete = Cell.from_pb(cell)
-        qualified.append(complete)
-        self._cell, self._previous_cell = None, cell
-
-    def _copy_from_previous(self, cell):
-        """Helper for :meth:`consume_next`."""
-        previous = self._previous_cell
-        if previous is not None:
-            if not cell.row_key:
-                cell.row_key = previous.row_key
-                if not cell.family_name:
-                    cell.family_name = previous.family_name
-                    # NOTE: ``cell.qualifier`` **can** be empty string.
-                    if cell.qualifier is None:
-                        cell.qualifier = previous.qualifier
+
+class _ArrowBatchBuilder(object):
+    """Accumulate rows into column arrays for :meth:`to_arrow_batches`.
+
+    :type columns: list
+    :param columns: The ``(column_family_id, column)`` pairs to convert, or
+                    None to convert all the columns.
+
+    :type decoders: dict
+    :param decoders: Callables converting cell values, by column.
+
+    :type types: dict
+    :param types: The :class:`pyarrow.DataType` of decoded values, by column.
+
+    :type versions: bool
+    :param versions: Whether to build one record per cell.
+    """
+
+    def __init__(self, columns, decoders, types, versions):
+        self._decoders = {
+            (family, _to_bytes(qualifier)): decoder
+            for (family, qualifier), decoder in six.iteritems(decoders or {})
+        }
+        self._types = {
+            (family, _to_bytes(qualifier)): type_
+            for (family, qualifier), type_ in six.iteritems(types or {})
+        }
+        self._versions = versions
+        self._columns = None
+        if columns is not None:
+            self._columns = [
+                (family, _to_bytes(qualifier)) for family, qualifier in columns
+            ]
+
+        self._row_keys = []
+        if versions:
+            self._families = []
+            self._qualifiers = []
+            self._timestamps = []
+            self._values = []
+            self._wanted = None
+            if self._columns is not None:
+                self._wanted = set(self._columns)
+            self._value_type = None
+            if not self._decoders:
+                self._value_type = pyarrow.binary()
+            elif len(set(self._types.values())) == 1:
+                self._value_type = next(iter(self._types.values()))
+        else:
+            self._values = [[] for _ in self._columns]
+            self._column_types = [
+                self._types.get(column)
+                or (None if column in self._decoders else pyarrow.binary())
+                for column in self._columns
+            ]
+            self._names = [u"row_key"] + [
+                u"{}:{}".format(family, _bytes_to_unicode(qualifier))
+                for family, qualifier in self._columns
+            ]
+
+    @property
+    def num_records(self):
+        """int: The number of records added since the last batch."""
+        return len(self._row_keys)
+
+    def add_row(self, row):
+        """Add the cells of a row.
+
+        :type row: :class:`PartialRowData`
+        :param row: The row to add.
+        """
+        if self._versions:
+            self._add_cells(row)
+            return
+
+        cells = row._cells
+        self._row_keys.append(row.row_key)
+        for (family, qualifier), values in zip(self._columns, self._values):
+            column = cells.get(family, {}).get(qualifier)
+            if not column:
+                values.append(None)
+                continue
+            value = column[0].value
+            decoder = self._decoders.get((family, qualifier))
+            if decoder is not None:
+                value = decoder(value)
+            values.append(value)
+
+    def _add_cells(self, row):
+        """Helper for :meth:`add_row`, adding one record per cell."""
+        row_key = row.row_key
+        wanted = self._wanted
+        for family, columns in six.iteritems(row._cells):
+            for qualifier, cells in six.iteritems(columns):
+                if wanted is not None and (family, qualifier) not in wanted:
+                    continue
+                decoder = self._decoders.get((family, qualifier))
+                for cell in cells:
+                    self._row_keys.append(row_key)
+                    self._families.append(family)
+                    self._qualifiers.append(qualifier)
+                    self._timestamps.append(cell.timestamp_micros)
+                    if decoder is None:
+                        self._values.append(cell.value)
+                    else:
+                        self._values.append(decoder(cell.value))
+
+    def build(self):
+        """Build a batch from the records added since the last batch.
+
+        :rtype: :class:`pyarrow.RecordBatch`
+        :returns: The batch.
+        """
+        row_keys = pyarrow.array(self._row_keys, type=pyarrow.binary())
+        self._row_keys = []
+
+        if self._versions:
+            values = pyarrow.array(self._values, type=self._value_type)
+            if values.null_count < len(values):
+                # Keep the inferred type for the following batches.
+                self._value_type = values.type
+            arrays = [
+                row_keys,
+                pyarrow.array(self._families, type=pyarrow.string()),
+                pyarrow.array(self._qualifiers, type=pyarrow.binary()),
+                pyarrow.array(self._timestamps, type=pyarrow.timestamp("us", tz="UTC")),
+                values,
+            ]
+            names = [u"row_key", u"family", u"qualifier", u"timestamp", u"value"]
+            self._families = []
+            self._qualifiers = []
+            self._timestamps = []
+            self._values = []
+            return pyarrow.RecordBatch.from_arrays(arrays, names)
+
+        arrays = [row_keys]
+        for index, values in enumerate(self._values):
+            array = pyarrow.array(values, type=self._column_types[index])
+            if array.null_count < len(array):
+                # Keep the inferred type for the following batches.
+                self._column_types[index] = array.type
+            arrays.append(array)
+        self._values = [[] for _ in self._columns]
+        return pyarrow.RecordBatch.from_arrays(arrays, self._names)
+
+
+def _unify_arrow_batches(batches):
+    """Give the same schema to batches from :meth:`to_arrow_batches`.
+
+    The columns of the batches built before the type of a column is
+    inferred only hold nulls, and are replaced by null arrays of that type.
+
+    :type batches: list
+    :param batches: The :class:`pyarrow.RecordBatch` objects.
+
+    :rtype: list
+    :returns: The batches, with the types of the last one.
+    """
+    last = batches[-1]
+    unified = []
+    for batch in batches:
+        arrays = []
+        for index in range(batch.num_columns):
+            array = batch.column(index)
+            type_ = last.column(index).type
+            if array.type != type_:
+                array = pyarrow.array([None] * len(array), type=type_)
+            arrays.append(array)
+        unified.append(pyarrow.RecordBatch.from_arrays(arrays, last.schema.names))
+    return unified
 
 
 class _ReadRowsRequestManager(object):
@@ -576,9 +1002,17 @@ class _ReadRowsRequestManager(object):
         self.message = message
         self.last_scanned_key = last_scanned_key
         self.rows_read_so_far = rows_read_so_far
+        # Sorted row keys and merged row ranges of ``message``, computed on
+        # the first retry and reused by the following ones.
+        self._row_keys = None
+        self._row_ranges = None
+        self._end_keys = None
 
     def build_updated_request(self):
         """ Updates the given message request as per last scanned key
+
+        :raises: :exc:`InvalidRetryRequest` if all the requested rows were
+                 already read.
         """
         r_kwargs = {
             "table_name": self.message.table_name,
@@ -599,6 +1033,9 @@ class _ReadRowsRequestManager(object):
         else:
             row_keys = self._filter_rows_keys()
             row_ranges = self._filter_row_ranges()
+            if not row_keys and not row_ranges:
+                # An empty row set would read the whole table.
+                raise InvalidRetryRequest
             r_kwargs["rows"] = data_v2_pb2.RowSet(
                 row_keys=row_keys, row_ranges=row_ranges
             )
@@ -606,40 +1043,40 @@ class _ReadRowsRequestManager(object):
 
     def _filter_rows_keys(self):
         """ Helper for :meth:`build_updated_request`"""
-        return [
-            row_key
-            for row_key in self.message.rows.row_keys
-            if row_key > self.last_scanned_key
-        ]
+        if self._row_keys is None:
+            # Sorted once, then each retry only bisects.
+            self._row_keys = sorted(set(self.message.rows.row_keys))
+        start = bisect.bisect_right(self._row_keys, self.last_scanned_key)
+        return self._row_keys[start:]
 
     def _filter_row_ranges(self):
         """ Helper for :meth:`build_updated_request`"""
-        new_row_ranges = []
-
-        for row_range in self.message.rows.row_ranges:
-            # if current end_key (open or closed) is set, return its value,
-            # if not, set to empty string ('').
-            # NOTE: Empty string in end_key means "end of table"
-            end_key = self._end_key_set(row_range)
-            # if end_key is already read, skip to the next row_range
-            if end_key and self._key_already_read(end_key):
-                continue
-
-            # if current start_key (open or closed) is set, return its value,
-            # if not, then set to empty string ('')
-            # NOTE: Empty string in start_key means "beginning of table"
-            start_key = self._start_key_set(row_range)
-
-            # if start_key was already read or doesn't exist,
-            # create a row_range with last_scanned_key as start_key_open
-            # to be passed to retry request
-            retry_row_range = row_range
-            if self._key_already_read(start_key):
-                retry_row_range = copy.deepcopy(row_range)
-                retry_row_range.start_key_closed = _to_bytes("")
-                retry_row_range.start_key_open = self.last_scanned_key
-
-            new_row_ranges.append(retry_row_range)
+        if self._row_ranges is None:
+            # Merged once into sorted, non-overlapping ranges: their end keys
+            # are sorted too, and only the last one can be unbounded.
+            self._row_ranges = _merge_row_ranges(self.message.rows.row_ranges)
+            self._end_keys = [
+                self._end_key_set(row_range)
+                for row_range in self._row_ranges
+                if self._end_key_set(row_range)
+            ]
+
+        # Skip the ranges whose end key was already read.
+        index = bisect.bisect_right(self._end_keys, self.last_scanned_key)
+        new_row_ranges = self._row_ranges[index:]
+        if not new_row_ranges:
+            return []
+
+        # Only the first remaining range can start before the last scanned
+        # key, since the ranges do not overlap. Resume it from that key.
+        first = new_row_ranges[0]
+        if self._key_already_read(self._start_key_set(first)):
+            retry_row_range = data_v2_pb2.RowRange(start_key_open=self.last_scanned_key)
+            if first.end_key_open:
+                retry_row_range.end_key_open = first.end_key_open
+            elif first.end_key_closed:
+                retry_row_range.end_key_closed = first.end_key_closed
+            new_row_ranges = [retry_row_range] + new_row_ranges[1:]
 
         return new_row_ranges
 
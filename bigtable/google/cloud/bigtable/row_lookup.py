@@ -0,0 +1,295 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""User friendly container for Google Cloud Bigtable RowLookupBatcher."""
+
+import collections
+import logging
+import threading
+import time
+
+from concurrent import futures
+
+from google.cloud._helpers import _to_bytes
+from google.cloud.bigtable.row_data import DEFAULT_RETRY_READ_ROWS
+
+
+_LOGGER = logging.getLogger(__name__)
+_DISPATCHER_WORKER_NAME = "Thread-RowLookupBatcherDispatcher"
+
+MAX_BATCH_SIZE = 100
+MAX_BATCH_LATENCY = 0.005  # 5ms
+MAX_IN_FLIGHT_READS = 10
+
+
+class _RowCache(object):
+    """A least recently used cache of rows, with an optional time to live.
+
+    Missing rows are cached too, as :data:`None`.
+
+    :type max_size: int
+    :param max_size: The maximum number of rows in the cache.
+
+    :type ttl: float
+    :param ttl: (Optional) Seconds after which a cached row expires. By
+                default, rows only leave the cache when evicted.
+    """
+
+    def __init__(self, max_size, ttl=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, row_key):
+        """Look up a row.
+
+        :type row_key: bytes
+        :param row_key: The key of the row.
+
+        :rtype: tuple
+        :returns: ``(True, row)`` on a hit, ``(False, None)`` on a miss.
+        """
+        with self._lock:
+            entry = self._entries.pop(row_key, None)
+            if entry is None:
+                return False, None
+            row, expires = entry
+            if expires is not None and expires <= time.time():
+                return False, None
+            self._entries[row_key] = entry
+            return True, row
+
+    def put(self, row_key, row):
+        """Add a row, evicting the least recently used one if needed."""
+        expires = None
+        if self.ttl is not None:
+            expires = time.time() + self.ttl
+        with self._lock:
+            self._entries.pop(row_key, None)
+            self._entries[row_key] = (row, expires)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, row_key):
+        """Remove a row from the cache."""
+        with self._lock:
+            self._entries.pop(row_key, None)
+
+    def clear(self):
+        """Remove all the rows from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+class RowLookupBatcher(object):
+    """ A RowLookupBatcher serves point lookups from many threads. Lookups
+    of single rows made within ``max_latency`` seconds of each other are
+    coalesced into a single ``ReadRows`` request for the set of their keys,
+    and the rows returned are dispatched to the future of each lookup.
+    Concurrent lookups of the same key share a single future.
+
+    Rows can also be kept in a client-side cache, for hot keys. The cache is
+    not invalidated when rows are mutated; use ``cache_ttl`` to bound the
+    staleness of cached rows, or :meth:`invalidate`. Cached rows are shared
+    between lookups and must not be modified.
+
+    :type table: class
+    :param table: class:`~google.cloud.bigtable.table.Table`.
+
+    :type filter_: :class:`.RowFilter`
+    :param filter_: (Optional) The filter to apply to the contents of the
+                    rows. If unset, returns entire rows.
+
+    :type max_batch_size: int
+    :param max_batch_size: (Optional) Max number of keys per ``ReadRows``
+    request. Default is MAX_BATCH_SIZE (100 keys).
+
+    :type max_latency: float
+    :param max_latency: (Optional) Max seconds a lookup waits for other
+    lookups to share its request. Default is MAX_BATCH_LATENCY (5 ms).
+
+    :type max_in_flight: int
+    :param max_in_flight: (Optional) Max number of concurrent ``ReadRows``
+    requests. Default is MAX_IN_FLIGHT_READS (10).
+
+    :type cache_size: int
+    :param cache_size: (Optional) Max number of rows kept in the cache. By
+    default, rows are not cached.
+
+    :type cache_ttl: float
+    :param cache_ttl: (Optional) Seconds after which cached rows expire. By
+    default, cached rows only expire when evicted.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: (Optional) Retry delay and deadline arguments of each
+    ``ReadRows`` request. Defaults to :attr:`DEFAULT_RETRY_READ_ROWS`.
+    """
+
+    def __init__(
+        self,
+        table,
+        filter_=None,
+        max_batch_size=MAX_BATCH_SIZE,
+        max_latency=MAX_BATCH_LATENCY,
+        max_in_flight=MAX_IN_FLIGHT_READS,
+        cache_size=0,
+        cache_ttl=None,
+        retry=DEFAULT_RETRY_READ_ROWS,
+    ):
+        self.table = table
+        self.filter_ = filter_
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.retry = retry
+
+        self._cache = None
+        if cache_size:
+            self._cache = _RowCache(cache_size, ttl=cache_ttl)
+
+        self._condition = threading.Condition()
+        self._pending = collections.OrderedDict()
+        self._batch_started = None
+        self._closed = False
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_in_flight)
+
+        self._dispatcher = threading.Thread(
+            name=_DISPATCHER_WORKER_NAME, target=self._dispatch
+        )
+        self._dispatcher.daemon = True
+        self._dispatcher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def lookup(self, row_key):
+        """ Look up a single row, without blocking.
+
+        Example:
+            >>> batcher = table.row_lookup_batcher(cache_size=10000)
+            >>>
+            >>> future = batcher.lookup(b'row_key')
+            >>> row = future.result()
+
+        :type row_key: bytes
+        :param row_key: The key of the row to read.
+
+        :rtype: :class:`concurrent.futures.Future`
+        :returns: A future resolving to the :class:`.PartialRowData` of the
+                  row, or :data:`None` if the row does not exist.
+        :raises: :class:`ValueError <exceptions.ValueError>` if the batcher
+                 is closed.
+        """
+        row_key = _to_bytes(row_key)
+        if self._cache is not None:
+            hit, row = self._cache.get(row_key)
+            if hit:
+                future = futures.Future()
+                future.set_result(row)
+                return future
+
+        with self._condition:
+            if self._closed:
+                raise ValueError("Cannot look up rows with a closed batcher.")
+            future = self._pending.get(row_key)
+            if future is None:
+                future = self._pending[row_key] = futures.Future()
+                if len(self._pending) == 1:
+                    self._batch_started = time.time()
+                self._condition.notify()
+            return future
+
+    def read_row(self, row_key, timeout=None):
+        """ Read a single row, blocking until it is returned.
+
+        :type row_key: bytes
+        :param row_key: The key of the row to read.
+
+        :type timeout: float
+        :param timeout: (Optional) Max seconds to wait for the row.
+
+        :rtype: :class:`.PartialRowData`, :data:`NoneType <types.NoneType>`
+        :returns: The contents of the row, or :data:`None` if the row does
+                  not exist.
+        """
+        return self.lookup(row_key).result(timeout=timeout)
+
+    def invalidate(self, row_key):
+        """ Remove a row from the cache, for instance after mutating it.
+
+        :type row_key: bytes
+        :param row_key: The key of the row.
+        """
+        if self._cache is not None:
+            self._cache.invalidate(_to_bytes(row_key))
+
+    def _dispatch(self):
+        """Send the pending lookups, once the batch is full or old enough."""
+        with self._condition:
+            while True:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    break
+
+                deadline = self._batch_started + self.max_latency
+                while len(self._pending) < self.max_batch_size and not self._closed:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch = []
+                while self._pending and len(batch) < self.max_batch_size:
+                    batch.append(self._pending.popitem(last=False))
+                if self._pending:
+                    self._batch_started = time.time()
+                self._executor.submit(self._read_batch, batch)
+
+        _LOGGER.debug("%s exiting.", _DISPATCHER_WORKER_NAME)
+
+    def _read_batch(self, batch):
+        """Read a batch of rows and resolve the futures of their lookups."""
+        row_keys = [row_key for row_key, _ in batch]
+        try:
+            rows = self.table.read_rows_bulk(
+                row_keys, filter_=self.filter_, retry=self.retry
+            )
+        except Exception as exc:
+            _LOGGER.debug("Error while reading a batch of %d rows.", len(batch))
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+
+        for (row_key, future), row in zip(batch, rows):
+            if self._cache is not None:
+                self._cache.put(row_key, row)
+            future.set_result(row)
+
+    def close(self):
+        """ Sends the pending lookups and releases the background threads.
+
+        The batcher must not be used after it is closed.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._dispatcher.join()
+        self._executor.shutdown()
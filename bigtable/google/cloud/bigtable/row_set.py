@@ -16,6 +16,7 @@
 
 
 from google.cloud._helpers import _to_bytes
+from google.cloud.bigtable_v2.proto import data_pb2 as data_v2_pb2
 
 
 class RowSet(object):
@@ -94,15 +95,27 @@ class RowSet(object):
     def _update_message_request(self, message):
         """Add row keys and row range to given request message
 
+        Row keys are sorted and deduplicated, and overlapping or adjacent
+        row ranges are merged, so that requests (and the requests resuming
+        them after an error) are as small as possible.
+
         :type message: class:`data_messages_v2_pb2.ReadRowsRequest`
         :param message: The ``ReadRowsRequest`` protobuf
         """
-        for each in self.row_keys:
-            message.rows.row_keys.append(_to_bytes(each))
-
-        for each in self.row_ranges:
-            r_kwrags = each.get_range_kwargs()
-            message.rows.row_ranges.add(**r_kwrags)
+        row_keys = sorted(set(_to_bytes(each) for each in self.row_keys))
+        if row_keys:
+            message.rows.row_keys.extend(row_keys)
+
+        row_ranges = [
+            data_v2_pb2.RowRange(**each.get_range_kwargs()) for each in self.row_ranges
+        ]
+        merged = _merge_row_ranges(row_ranges)
+        if not merged and not row_keys:
+            # Only empty ranges: keep them, an empty row set would read the
+            # whole table.
+            merged = row_ranges
+        if merged:
+            message.rows.row_ranges.extend(merged)
 
 
 class RowRange(object):
@@ -172,3 +185,79 @@ class RowRange(object):
                 end_key_key = "end_key_closed"
             range_kwargs[end_key_key] = _to_bytes(self.end_key)
         return range_kwargs
+
+
+# Bounds of row ranges are compared as ``(key, flag)`` tuples. For start
+# bounds, the flag is 0 when the key is included, so that a closed start
+# sorts before an open start on the same key. For end bounds, the flag is 1
+# when the key is included. An unbounded end is represented by None.
+
+
+def _start_bound(row_range):
+    """Return the start bound of a ``RowRange`` protobuf."""
+    if row_range.HasField("start_key_open"):
+        return row_range.start_key_open, 1
+    return row_range.start_key_closed, 0
+
+
+def _end_bound(row_range):
+    """Return the end bound of a ``RowRange`` protobuf, or None."""
+    if row_range.end_key_open:
+        return row_range.end_key_open, 0
+    if row_range.end_key_closed:
+        return row_range.end_key_closed, 1
+    return None
+
+
+def _make_row_range(start, end):
+    """Build a ``RowRange`` protobuf from its bounds."""
+    row_range = data_v2_pb2.RowRange()
+    key, flag = start
+    if flag:
+        row_range.start_key_open = key
+    elif key:
+        row_range.start_key_closed = key
+    if end is not None:
+        key, flag = end
+        if flag:
+            row_range.end_key_closed = key
+        else:
+            row_range.end_key_open = key
+    return row_range
+
+
+def _merge_row_ranges(row_ranges):
+    """Sort row ranges, merging the overlapping or adjacent ones.
+
+    :type row_ranges: list
+    :param row_ranges: ``RowRange`` protobufs.
+
+    :rtype: list
+    :returns: Non-overlapping ``RowRange`` protobufs, sorted by key.
+    """
+    bounds = sorted(
+        ((_start_bound(row_range), _end_bound(row_range)) for row_range in row_ranges),
+        key=lambda bound: bound[0],
+    )
+
+    merged = []
+    for start, end in bounds:
+        if end is not None and (
+            end[0] < start[0] or (end[0] == start[0] and (start[1] or not end[1]))
+        ):
+            # Empty range.
+            continue
+        if merged:
+            previous_start, previous_end = merged[-1]
+            if previous_end is None:
+                break
+            # The ranges only leave a gap when both exclude the same key.
+            if start[0] < previous_end[0] or (
+                start[0] == previous_end[0] and (previous_end[1] or not start[1])
+            ):
+                if end is None or end > previous_end:
+                    merged[-1] = (previous_start, end)
+                continue
+        merged.append((start, end))
+
+    return [_make_row_range(start, end) for start, end in merged]
@@ -15,7 +15,14 @@
 """User-friendly container for Google Cloud Bigtable Table."""
 
 
+import bisect
+import threading
+import time
+
+from concurrent import futures
 from grpc import StatusCode
+import six
+from six.moves import queue
 
 from google.api_core import timeout
 from google.api_core.exceptions import RetryError
@@ -23,16 +30,23 @@ from google.api_core.exceptions import NotFound
 from google.api_core.retry import if_exception_type
 from google.api_core.retry import Retry
 from google.api_core.gapic_v1.method import wrap_method
+from google.cloud._helpers import _microseconds_from_datetime
 from google.cloud._helpers import _to_bytes
+from google.cloud.bigtable import metrics as metrics_module
 from google.cloud.bigtable.column_family import _gc_rule_from_pb
 from google.cloud.bigtable.column_family import ColumnFamily
 from google.cloud.bigtable.batcher import MutationsBatcher
 from google.cloud.bigtable.batcher import FLUSH_COUNT, MAX_ROW_BYTES
+from google.cloud.bigtable.batcher import MAX_IN_FLIGHT_BYTES, MAX_IN_FLIGHT_RPCS
 from google.cloud.bigtable.row import AppendRow
 from google.cloud.bigtable.row import ConditionalRow
 from google.cloud.bigtable.row import DirectRow
+from google.cloud.bigtable.row import _PACK_I64
 from google.cloud.bigtable.row_data import PartialRowsData
 from google.cloud.bigtable.row_data import DEFAULT_RETRY_READ_ROWS
+from google.cloud.bigtable.row_lookup import RowLookupBatcher
+from google.cloud.bigtable.row_lookup import MAX_BATCH_SIZE, MAX_BATCH_LATENCY
+from google.cloud.bigtable.row_lookup import MAX_IN_FLIGHT_READS
 from google.cloud.bigtable.row_set import RowSet
 from google.cloud.bigtable.row_set import RowRange
 from google.cloud.bigtable import enums
@@ -48,6 +62,14 @@ from google.cloud.bigtable_admin_v2.proto import (
 #  google.bigtable.v2#google.bigtable.v2.MutateRowRequest)
 _MAX_BULK_MUTATIONS = 100000
 VIEW_NAME_ONLY = enums.Table.View.NAME_ONLY
+# Defaults of :meth:`Table.read_rows_parallel`.
+_MAX_READ_WORKERS = 8
+_READ_BUFFER_SIZE = 1000
+# Maximum number of row keys read by a single stream of
+# :meth:`Table.read_rows_parallel`.
+_MAX_SHARD_ROW_KEYS = 10000
+# Marks the end of a shard in the queues of :meth:`Table.read_rows_parallel`.
+_SHARD_DONE = object()
 
 
 class _BigtableRetryableError(Exception):
@@ -99,13 +121,26 @@ class Table(object):
 
     :type app_profile_id: str
     :param app_profile_id: (Optional) The unique name of the AppProfile.
+
+    :type metrics: :class:`~google.cloud.bigtable.metrics.MetricsRecorder`
+    :param metrics: (Optional) Recorder of the client-side metrics of the
+                    ``ReadRows`` and ``MutateRows`` operations on the table,
+                    and of its mutations batchers.
     """
 
-    def __init__(self, table_id, instance, mutation_timeout=None, app_profile_id=None):
+    def __init__(
+        self,
+        table_id,
+        instance,
+        mutation_timeout=None,
+        app_profile_id=None,
+        metrics=None,
+    ):
         self.table_id = table_id
         self._instance = instance
         self._app_profile_id = app_profile_id
         self.mutation_timeout = mutation_timeout
+        self._metrics = metrics
 
     @property
     def name(self):
@@ -362,6 +397,90 @@ class Table(object):
             raise ValueError("More than one row was returned.")
         return row
 
+    def read_rows_bulk(self, row_keys, filter_=None, retry=DEFAULT_RETRY_READ_ROWS):
+        """Read several rows by key, with a single ``ReadRows`` request.
+
+        :type row_keys: list
+        :param row_keys: The keys (bytes) of the rows to read.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        rows. If unset, returns entire rows.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry:
+            (Optional) Retry delay and deadline arguments. Defaults to
+            :attr:`DEFAULT_RETRY_READ_ROWS`.
+
+        :rtype: list
+        :returns: The :class:`.PartialRowData` of each key, in the order of
+                  ``row_keys``, or :data:`None` for the rows which do not
+                  exist.
+        """
+        row_keys = [_to_bytes(row_key) for row_key in row_keys]
+        rows = dict.fromkeys(row_keys)
+        if rows:
+            row_set = RowSet()
+            for row_key in rows:
+                row_set.add_row_key(row_key)
+            for row in self.read_rows(filter_=filter_, row_set=row_set, retry=retry):
+                rows[row.row_key] = row
+        return [rows[row_key] for row_key in row_keys]
+
+    def row_lookup_batcher(
+        self,
+        filter_=None,
+        max_batch_size=MAX_BATCH_SIZE,
+        max_latency=MAX_BATCH_LATENCY,
+        max_in_flight=MAX_IN_FLIGHT_READS,
+        cache_size=0,
+        cache_ttl=None,
+        retry=DEFAULT_RETRY_READ_ROWS,
+    ):
+        """Factory to create a row lookup batcher associated with this table.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        rows. If unset, returns entire rows.
+
+        :type max_batch_size: int
+        :param max_batch_size: (Optional) Max number of keys per ``ReadRows``
+                request. Default is MAX_BATCH_SIZE (100 keys).
+
+        :type max_latency: float
+        :param max_latency: (Optional) Max seconds a lookup waits for other
+                lookups to share its request. Default is MAX_BATCH_LATENCY
+                (5 ms).
+
+        :type max_in_flight: int
+        :param max_in_flight: (Optional) Max number of concurrent
+                ``ReadRows`` requests. Default is MAX_IN_FLIGHT_READS (10).
+
+        :type cache_size: int
+        :param cache_size: (Optional) Max number of rows kept in a
+                client-side cache. By default, rows are not cached.
+
+        :type cache_ttl: float
+        :param cache_ttl: (Optional) Seconds after which cached rows expire.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) Retry delay and deadline arguments of each
+                ``ReadRows`` request.
+
+        :rtype: :class:`~google.cloud.bigtable.row_lookup.RowLookupBatcher`
+        :returns: A batcher coalescing concurrent point lookups.
+        """
+        return RowLookupBatcher(
+            self,
+            filter_=filter_,
+            max_batch_size=max_batch_size,
+            max_latency=max_latency,
+            max_in_flight=max_in_flight,
+            cache_size=cache_size,
+            cache_ttl=cache_ttl,
+            retry=retry,
+        )
+
     def read_rows(
         self,
         start_key=None,
@@ -431,7 +550,124 @@ class Table(object):
             row_set=row_set,
         )
         data_client = self._instance._client.table_data_client
-        return PartialRowsData(data_client.transport.read_rows, request_pb, retry)
+        return PartialRowsData(
+            data_client.transport.read_rows, request_pb, retry, metrics=self._metrics
+        )
+
+    def read_rows_parallel(
+        self,
+        row_set=None,
+        filter_=None,
+        max_workers=_MAX_READ_WORKERS,
+        ordered=False,
+        buffer_size=_READ_BUFFER_SIZE,
+        retry=DEFAULT_RETRY_READ_ROWS,
+    ):
+        """Read rows from this table with several concurrent streams.
+
+        The requested rows are split into shards at the row keys returned by
+        :meth:`sample_row_keys`, which delimit the tablets of the table, and
+        each shard is read by its own ``ReadRows`` stream. Shards holding many
+        explicit row keys are split further. Each stream is
+        retried and resumed independently after transient errors.
+
+        For example:
+
+        .. code:: python
+
+            for row in table.read_rows_parallel(max_workers=16):
+                process(row)
+
+        :type row_set: :class:`row_set.RowSet`
+        :param row_set: (Optional) The row set containing multiple row keys and
+                        row_ranges. If unset, reads the entire table.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        specified row(s). If unset, reads every column in
+                        each row.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of concurrent
+                            streams.
+
+        :type ordered: bool
+        :param ordered: (Optional) Whether rows should be returned in key
+                        order. By default rows are returned as soon as they
+                        are read, in an arbitrary order.
+
+        :type buffer_size: int
+        :param buffer_size: (Optional) The maximum number of rows read ahead
+                            of the consumer. When ``ordered`` is set, the
+                            limit applies to each shard.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry:
+            (Optional) Retry delay and deadline arguments, applied to each
+            stream. Defaults to :attr:`DEFAULT_RETRY_READ_ROWS`.
+
+        :rtype: iterator
+        :returns: An iterator of :class:`.PartialRowData`.
+        """
+        boundaries = [
+            _to_bytes(response.row_key)
+            for response in self.sample_row_keys()
+            if response.row_key
+        ]
+        if row_set is not None and len(row_set.row_keys) > _MAX_SHARD_ROW_KEYS:
+            # Also split large sets of row keys, so that they are read by
+            # several streams with requests of bounded size.
+            row_keys = sorted(set(_to_bytes(key) for key in row_set.row_keys))
+            row_key_boundaries = row_keys[_MAX_SHARD_ROW_KEYS::_MAX_SHARD_ROW_KEYS]
+            boundaries = sorted(set(boundaries).union(row_key_boundaries))
+        shards = _shard_row_set(row_set, boundaries)
+        if not shards:
+            return
+
+        stop_event = threading.Event()
+        if ordered:
+            queues = [queue.Queue(maxsize=buffer_size) for _ in shards]
+        else:
+            queues = [queue.Queue(maxsize=buffer_size)] * len(shards)
+
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            # Shards are submitted in key order, so that the executor always
+            # reads the shard the ordered consumer is waiting on.
+            for shard, shard_queue in zip(shards, queues):
+                executor.submit(
+                    self._read_shard, shard, filter_, retry, shard_queue, stop_event
+                )
+
+            if ordered:
+                # Shards are disjoint and sorted: reading them one after the
+                # other merges them in key order.
+                for shard_queue in queues:
+                    for row in _drain_shards(shard_queue, 1):
+                        yield row
+            else:
+                for row in _drain_shards(queues[0], len(shards)):
+                    yield row
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=False)
+
+    def _read_shard(self, row_set, filter_, retry, rows_queue, stop_event):
+        """Helper for :meth:`read_rows_parallel`.
+
+        Puts the rows of one shard in ``rows_queue``, followed by either
+        ``_SHARD_DONE`` or the exception which ended the read.
+        """
+        try:
+            rows = self.read_rows(filter_=filter_, row_set=row_set, retry=retry)
+            for row in rows:
+                if not _put_until_stopped(rows_queue, row, stop_event):
+                    rows.cancel()
+                    return
+            item = _SHARD_DONE
+        except Exception as exc:
+            item = exc
+        _put_until_stopped(rows_queue, item, stop_event)
 
     def yield_rows(self, **kwargs):
         """Read rows from this table.
@@ -504,14 +740,138 @@ class Table(object):
                   corresponding to success or failure of each row mutation
                   sent. These will be in the same order as the `rows`.
         """
+        metrics = self._metrics
+        if metrics is not None:
+            start_time = time.time()
+            rows = list(rows)
+            # Mutations of successful rows are cleared by the worker.
+            num_bytes = sum(row.get_mutations_size() for row in rows)
+
         retryable_mutate_rows = _RetryableMutateRowsWorker(
             self._instance._client,
             self.name,
             rows,
             app_profile_id=self._app_profile_id,
             timeout=self.mutation_timeout,
+            metrics=metrics,
+        )
+        statuses = retryable_mutate_rows(retry=retry)
+
+        if metrics is not None:
+            metrics.record_latency(
+                metrics_module.MUTATE_ROWS_LATENCY, time.time() - start_time
+            )
+            metrics.increment(metrics_module.MUTATE_ROWS_ROWS, len(rows))
+            metrics.increment(metrics_module.MUTATE_ROWS_BYTES, num_bytes)
+            metrics.increment(
+                metrics_module.MUTATE_ROWS_FAILED_ROWS,
+                sum(1 for status in statuses if status is None or status.code != 0),
+            )
+        return statuses
+
+    def mutate_columns(
+        self,
+        row_keys,
+        columns,
+        timestamp=None,
+        retry=DEFAULT_RETRY,
+        max_request_bytes=MAX_ROW_BYTES,
+    ):
+        """Sets cells of many rows in bulk, from column-oriented data.
+
+        This is a faster alternative to building one :class:`.DirectRow` per
+        row and calling :meth:`mutate_rows` with them: the entries of the
+        ``MutateRows`` requests are built directly from ``columns``, without
+        intermediate protobuf mutations or row objects, and the size of each
+        request is accounted for while it is built.
+
+        For example, to set two columns of three rows:
+
+        .. code:: python
+
+            table.mutate_columns(
+                [b"row-1", b"row-2", b"row-3"],
+                {
+                    ("fam", b"col1"): [b"a", b"b", b"c"],
+                    ("fam", b"col2"): [1, 2, 3],
+                },
+            )
+
+        The rows are sent in as many ``MutateRows`` requests as needed to keep
+        each request under ``max_request_bytes`` and 100,000 mutations.
+        Requests are sent one after the other, and each of them is retried as
+        in :meth:`mutate_rows`.
+
+        :type row_keys: list
+        :param row_keys: The keys (bytes) of the rows to mutate.
+
+        :type columns: dict
+        :param columns: Mapping of ``(column_family_id, column)`` tuples to
+                        the values to set in that column, one per row key and
+                        in the same order as ``row_keys``. Values are bytes,
+                        or integers interpreted as 64-bit big-endian signed
+                        integers (8 bytes), as in
+                        :meth:`.DirectRow.set_cell`.
+
+        :type timestamp: :class:`datetime.datetime`
+        :param timestamp: (Optional) The timestamp of all the cells. Defaults
+                          to the Bigtable server time.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry:
+            (Optional) Retry delay and deadline arguments. Defaults to
+            :attr:`DEFAULT_RETRY`.
+
+        :type max_request_bytes: int
+        :param max_request_bytes: (Optional) Max size of the mutations of a
+                                  single ``MutateRows`` request. Default is
+                                  MAX_ROW_BYTES (5 MB).
+
+        :rtype: list
+        :returns: A list of response statuses (`google.rpc.status_pb2.Status`)
+                  corresponding to success or failure of each row mutation
+                  sent. These will be in the same order as the `row_keys`.
+        :raises: :class:`ValueError <exceptions.ValueError>` if a column does
+                 not have one value per row key, or
+                 :exc:`~.table.TooManyMutationsError` if the mutations of a
+                 single row are more than 100,000.
+        """
+        metrics = self._metrics
+        if metrics is not None:
+            start_time = time.time()
+            num_bytes = 0
+
+        statuses = []
+        requests = _mutate_columns_requests(
+            self.name,
+            row_keys,
+            columns,
+            timestamp=timestamp,
+            app_profile_id=self._app_profile_id,
+            max_request_bytes=max_request_bytes,
         )
-        return retryable_mutate_rows(retry=retry)
+        for request_pb, request_bytes in requests:
+            retryable_mutate_entries = _RetryableMutateEntriesWorker(
+                self._instance._client,
+                request_pb,
+                timeout=self.mutation_timeout,
+                metrics=metrics,
+            )
+            statuses.extend(retryable_mutate_entries(retry=retry))
+            if metrics is not None:
+                num_bytes += request_bytes
+
+        if metrics is not None:
+            metrics.record_latency(
+                metrics_module.MUTATE_ROWS_LATENCY, time.time() - start_time
+            )
+            metrics.increment(metrics_module.MUTATE_ROWS_ROWS, len(statuses))
+            metrics.increment(metrics_module.MUTATE_ROWS_BYTES, num_bytes)
+            metrics.increment(
+                metrics_module.MUTATE_ROWS_FAILED_ROWS,
+                sum(1 for status in statuses if status is None or status.code != 0),
+            )
+        return statuses
 
     def sample_row_keys(self):
         """Read a sample of row keys in the table.
@@ -621,7 +981,15 @@ class Table(object):
                 self.name, row_key_prefix=_to_bytes(row_key_prefix)
             )
 
-    def mutations_batcher(self, flush_count=FLUSH_COUNT, max_row_bytes=MAX_ROW_BYTES):
+    def mutations_batcher(
+        self,
+        flush_count=FLUSH_COUNT,
+        max_row_bytes=MAX_ROW_BYTES,
+        flush_interval=None,
+        max_in_flight=MAX_IN_FLIGHT_RPCS,
+        max_in_flight_bytes=MAX_IN_FLIGHT_BYTES,
+        failure_callback=None,
+    ):
         """Factory to create a mutation batcher associated with this instance.
 
         For example:
@@ -644,8 +1012,38 @@ class Table(object):
                 flush. If it reaches the max number of row mutations size it
                 calls finish_batch() to mutate the current row batch.
                 Default is MAX_ROW_BYTES (5 MB).
+
+        :type flush_interval: float
+        :param flush_interval: (Optional) Seconds after which the current
+                batch is sent even if it has not reached any of the size
+                limits.
+
+        :type max_in_flight: int
+        :param max_in_flight: (Optional) Max number of concurrent
+                ``MutateRows`` RPCs. Default is MAX_IN_FLIGHT_RPCS (10).
+
+        :type max_in_flight_bytes: int
+        :param max_in_flight_bytes: (Optional) Max size of the row mutations
+                being sent before mutate() blocks. Default is
+                MAX_IN_FLIGHT_BYTES (100 MB).
+
+        :type failure_callback: callable
+        :param failure_callback: (Optional) Called with each row which could
+                not be mutated and its ``google.rpc.status_pb2.Status``.
+
+        :rtype: :class:`~google.cloud.bigtable.batcher.MutationsBatcher`
+        :returns: A batcher sending mutations in the background.
         """
-        return MutationsBatcher(self, flush_count, max_row_bytes)
+        return MutationsBatcher(
+            self,
+            flush_count,
+            max_row_bytes,
+            flush_interval=flush_interval,
+            max_in_flight=max_in_flight,
+            max_in_flight_bytes=max_in_flight_bytes,
+            failure_callback=failure_callback,
+            metrics=self._metrics,
+        )
 
 
 class _RetryableMutateRowsWorker(object):
@@ -664,13 +1062,17 @@ class _RetryableMutateRowsWorker(object):
     )
     # pylint: enable=unsubscriptable-object
 
-    def __init__(self, client, table_name, rows, app_profile_id=None, timeout=None):
+    def __init__(
+        self, client, table_name, rows, app_profile_id=None, timeout=None, metrics=None
+    ):
         self.client = client
         self.table_name = table_name
         self.rows = rows
         self.app_profile_id = app_profile_id
         self.responses_statuses = [None] * len(self.rows)
         self.timeout = timeout
+        self.metrics = metrics
+        self._attempts = 0
 
     def __call__(self, retry=DEFAULT_RETRY):
         """Attempt to mutate all rows and retry rows with transient errors.
@@ -729,9 +1131,11 @@ class _RetryableMutateRowsWorker(object):
             # All mutations are either successful or non-retryable now.
             return self.responses_statuses
 
-        mutate_rows_request = _mutate_rows_request(
-            self.table_name, retryable_rows, app_profile_id=self.app_profile_id
-        )
+        self._attempts += 1
+        if self._attempts > 1 and self.metrics is not None:
+            self.metrics.increment(metrics_module.MUTATE_ROWS_RETRIES)
+
+        mutate_rows_request = self._mutate_rows_request(retryable_rows)
         data_client = self.client.table_data_client
         inner_api_calls = data_client._inner_api_calls
         if "mutate_rows" not in inner_api_calls:
@@ -761,7 +1165,7 @@ class _RetryableMutateRowsWorker(object):
                 if self._is_retryable(entry.status):
                     num_retryable_responses += 1
                 if entry.status.code == 0:
-                    self.rows[index].clear()
+                    self._clear_row(index)
 
         if len(retryable_rows) != num_responses:
             raise RuntimeError(
@@ -776,6 +1180,72 @@ class _RetryableMutateRowsWorker(object):
 
         return self.responses_statuses
 
+    def _mutate_rows_request(self, retryable_rows):
+        """Creates the request to mutate the rows eligible for retry.
+
+        :type retryable_rows: list
+        :param retryable_rows: The rows to mutate.
+
+        :rtype: :class:`data_messages_v2_pb2.MutateRowsRequest`
+        :returns: The ``MutateRowsRequest`` protobuf for ``retryable_rows``.
+        """
+        return _mutate_rows_request(
+            self.table_name, retryable_rows, app_profile_id=self.app_profile_id
+        )
+
+    def _clear_row(self, index):
+        """Clears the mutations of a row which was mutated successfully.
+
+        :type index: int
+        :param index: The index of the row in ``rows``.
+        """
+        self.rows[index].clear()
+
+
+class _RetryableMutateEntriesWorker(_RetryableMutateRowsWorker):
+    """A retrying worker sending the entries of a prebuilt request.
+
+    The "rows" of this worker are the entries of ``request_pb``. The first
+    attempt sends ``request_pb`` as is, and later attempts copy the entries
+    which are eligible for retry into a new request.
+
+    :type client: :class:`~google.cloud.bigtable.client.Client`
+    :param client: The client of the table.
+
+    :type request_pb: :class:`data_messages_v2_pb2.MutateRowsRequest`
+    :param request_pb: The request to send.
+
+    :type timeout: float
+    :param timeout: (Optional) The timeout of the mutations, in seconds.
+
+    :type metrics: :class:`~google.cloud.bigtable.metrics.MetricsRecorder`
+    :param metrics: (Optional) Recorder of the retries.
+    """
+
+    def __init__(self, client, request_pb, timeout=None, metrics=None):
+        super(_RetryableMutateEntriesWorker, self).__init__(
+            client,
+            request_pb.table_name,
+            request_pb.entries,
+            app_profile_id=request_pb.app_profile_id,
+            timeout=timeout,
+            metrics=metrics,
+        )
+        self._request_pb = request_pb
+
+    def _mutate_rows_request(self, retryable_rows):
+        if len(retryable_rows) == len(self.rows):
+            return self._request_pb
+        request_pb = data_messages_v2_pb2.MutateRowsRequest(
+            table_name=self.table_name, app_profile_id=self.app_profile_id
+        )
+        request_pb.entries.extend(retryable_rows)
+        return request_pb
+
+    def _clear_row(self, index):
+        # The entries belong to the request, there is nothing to clear.
+        pass
+
 
 class ClusterState(object):
     """Representation of a Cluster State.
@@ -925,6 +1395,116 @@ def _create_row_request(
     return message
 
 
+def _shard_row_set(row_set, boundaries):
+    """Split a row set at the given row keys.
+
+    :type row_set: :class:`row_set.RowSet`
+    :param row_set: The row set to split. If unset or empty, the entire
+                    table is split.
+
+    :type boundaries: list
+    :param boundaries: Sorted row keys (bytes) at which to split. Each key
+                       starts a new shard.
+
+    :rtype: list
+    :returns: The non-empty :class:`row_set.RowSet` shards, in key order.
+    """
+    starts = [None] + boundaries
+    ends = boundaries + [None]
+    shards = [RowSet() for _ in starts]
+
+    if row_set is None or not (row_set.row_keys or row_set.row_ranges):
+        for shard, start, end in zip(shards, starts, ends):
+            shard.add_row_range(RowRange(start, end))
+        return shards
+
+    for row_key in row_set.row_keys:
+        row_key = _to_bytes(row_key)
+        shards[bisect.bisect_right(boundaries, row_key)].add_row_key(row_key)
+
+    for row_range in row_set.row_ranges:
+        first, last = 0, len(boundaries)
+        if row_range.start_key:
+            first = bisect.bisect_right(boundaries, _to_bytes(row_range.start_key))
+        if row_range.end_key:
+            last = bisect.bisect_right(boundaries, _to_bytes(row_range.end_key))
+        for index in range(first, last + 1):
+            piece = _intersect_row_range(row_range, starts[index], ends[index])
+            if piece is not None:
+                shards[index].add_row_range(piece)
+
+    return [shard for shard in shards if shard.row_keys or shard.row_ranges]
+
+
+def _intersect_row_range(row_range, start, end):
+    """Restrict a row range to the shard ``[start, end)``.
+
+    :type row_range: :class:`row_set.RowRange`
+    :param row_range: The row range to restrict.
+
+    :type start: bytes
+    :param start: The first key of the shard, or None at the start of the
+                  table.
+
+    :type end: bytes
+    :param end: The key following the shard, or None at the end of the table.
+
+    :rtype: :class:`row_set.RowRange`
+    :returns: The intersection, or None if it is empty.
+    """
+    start_key, start_inclusive = None, True
+    if row_range.start_key:
+        start_key = _to_bytes(row_range.start_key)
+        start_inclusive = row_range.start_inclusive
+    if start is not None and (start_key is None or start_key < start):
+        start_key, start_inclusive = start, True
+
+    end_key, end_inclusive = None, False
+    if row_range.end_key:
+        end_key = _to_bytes(row_range.end_key)
+        end_inclusive = row_range.end_inclusive
+    if end is not None and (end_key is None or end_key >= end):
+        end_key, end_inclusive = end, False
+
+    if start_key is not None and end_key is not None:
+        if start_key > end_key:
+            return None
+        if start_key == end_key and not (start_inclusive and end_inclusive):
+            return None
+
+    return RowRange(start_key, end_key, start_inclusive, end_inclusive)
+
+
+def _put_until_stopped(items_queue, item, stop_event):
+    """Put an item in a bounded queue unless ``stop_event`` is set first.
+
+    :rtype: bool
+    :returns: True if the item was put in the queue.
+    """
+    while not stop_event.is_set():
+        try:
+            items_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _drain_shards(rows_queue, num_shards):
+    """Yield the rows put in a queue until ``num_shards`` shards are done.
+
+    :raises: The exception which ended the read of a shard, if any.
+    """
+    while num_shards:
+        item = rows_queue.get()
+        if item is _SHARD_DONE:
+            num_shards -= 1
+        elif isinstance(item, Exception):
+            raise item
+        else:
+            yield item
+
+
 def _mutate_rows_request(table_name, rows, app_profile_id=None):
     """Creates a request to mutate rows in a table.
 
@@ -959,6 +1539,164 @@ def _mutate_rows_request(table_name, rows, app_profile_id=None):
     return request_pb
 
 
+def _mutate_columns_requests(
+    table_name,
+    row_keys,
+    columns,
+    timestamp=None,
+    app_profile_id=None,
+    max_request_bytes=MAX_ROW_BYTES,
+):
+    """Creates the requests setting cells of rows from column-oriented data.
+
+    The ``SetCell`` mutations are added in place to the entries of the
+    requests, and their size is computed from the sizes of their fields
+    rather than with ``ByteSize()``. A new request is started whenever the
+    next row would take the current one over ``max_request_bytes`` or
+    100,000 mutations.
+
+    :type table_name: str
+    :param table_name: The name of the table to write to.
+
+    :type row_keys: list
+    :param row_keys: The keys (bytes) of the rows to mutate.
+
+    :type columns: dict
+    :param columns: Mapping of ``(column_family_id, column)`` tuples to the
+                    values of the column, one per row key.
+
+    :type timestamp: :class:`datetime.datetime`
+    :param timestamp: (Optional) The timestamp of all the cells.
+
+    :type: app_profile_id: str
+    :param app_profile_id: (Optional) The unique name of the AppProfile.
+
+    :type max_request_bytes: int
+    :param max_request_bytes: (Optional) Max size of the mutations of a
+                              request.
+
+    :rtype: iterator
+    :returns: ``(request_pb, num_bytes)`` tuples of each
+              ``MutateRowsRequest`` protobuf and the total size of its
+              mutations, as given by :meth:`.DirectRow.get_mutations_size`.
+    :raises: :class:`ValueError <exceptions.ValueError>` if a column does not
+             have one value per row key, or
+             :exc:`~.table.TooManyMutationsError` if the mutations of a
+             single row are more than 100,000.
+    """
+    if timestamp is None:
+        # Use -1 for current Bigtable server time.
+        timestamp_micros = -1
+    else:
+        timestamp_micros = _microseconds_from_datetime(timestamp)
+        # Truncate to millisecond granularity.
+        timestamp_micros -= timestamp_micros % 1000
+
+    row_keys = [_to_bytes(row_key) for row_key in row_keys]
+    num_rows = len(row_keys)
+    cell_columns = []
+    for (column_family_id, column), values in columns.items():
+        values = list(values)
+        if len(values) != num_rows:
+            raise ValueError(
+                "Column %r has %d values for %d row keys"
+                % ((column_family_id, column), len(values), num_rows)
+            )
+        column = _to_bytes(column)
+        # Size of the fields of the ``SetCell`` other than its value.
+        cell_size = _bytes_field_size(_to_bytes(column_family_id))
+        cell_size += _bytes_field_size(column)
+        if timestamp_micros:
+            cell_size += 1 + _varint_size(timestamp_micros)
+        cell_columns.append((column_family_id, column, values, cell_size))
+
+    mutations_per_row = len(cell_columns)
+    if mutations_per_row > _MAX_BULK_MUTATIONS:
+        raise TooManyMutationsError(
+            "Maximum number of mutations is %s" % (_MAX_BULK_MUTATIONS,)
+        )
+    if not mutations_per_row:
+        return
+
+    request_pb = data_messages_v2_pb2.MutateRowsRequest(
+        table_name=table_name, app_profile_id=app_profile_id
+    )
+    entries = request_pb.entries
+    request_mutations = 0
+    request_bytes = 0
+    for index, row_key in enumerate(row_keys):
+        values = []
+        row_bytes = 0
+        for _, _, column_values, cell_size in cell_columns:
+            value = column_values[index]
+            if isinstance(value, six.integer_types):
+                value = _PACK_I64(value)
+            value = _to_bytes(value)
+            cell_size += _bytes_field_size(value)
+            # The ``Mutation`` wraps the ``SetCell`` in its field 1.
+            row_bytes += 1 + _varint_size(cell_size) + cell_size
+            values.append(value)
+
+        if request_mutations and (
+            request_bytes + row_bytes > max_request_bytes
+            or request_mutations + mutations_per_row > _MAX_BULK_MUTATIONS
+        ):
+            yield request_pb, request_bytes
+            request_pb = data_messages_v2_pb2.MutateRowsRequest(
+                table_name=table_name, app_profile_id=app_profile_id
+            )
+            entries = request_pb.entries
+            request_mutations = 0
+            request_bytes = 0
+
+        mutations = entries.add(row_key=row_key).mutations
+        for (column_family_id, column, _, _), value in zip(cell_columns, values):
+            set_cell = mutations.add().set_cell
+            set_cell.family_name = column_family_id
+            set_cell.column_qualifier = column
+            set_cell.timestamp_micros = timestamp_micros
+            set_cell.value = value
+        request_mutations += mutations_per_row
+        request_bytes += row_bytes
+
+    if request_mutations:
+        yield request_pb, request_bytes
+
+
+def _varint_size(value):
+    """Gets the size of the protobuf varint encoding of an integer.
+
+    :type value: int
+    :param value: The integer. Negative values take ten bytes, as ``int64``
+                  fields.
+
+    :rtype: int
+    :returns: The number of bytes of the encoding.
+    """
+    if value < 0:
+        return 10
+    size = 1
+    while value > 0x7F:
+        value >>= 7
+        size += 1
+    return size
+
+
+def _bytes_field_size(value):
+    """Gets the encoded size of a protobuf bytes / string field.
+
+    :type value: bytes
+    :param value: The value of the field, with a field number below 16.
+
+    :rtype: int
+    :returns: The number of bytes of the tag, length and value, or 0 for an
+              empty value, which is not encoded.
+    """
+    if not value:
+        return 0
+    return 1 + _varint_size(len(value)) + len(value)
+
+
 def _check_row_table_name(table_name, row):
     """Checks that a row belongs to a table.
 
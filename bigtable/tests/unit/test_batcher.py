@@ -112,6 +112,7 @@ class TestMutationsBatcher(unittest.TestCase):
         mutation_batcher.mutate(row_1)
         mutation_batcher.mutate(row_2)
         mutation_batcher.mutate(row_3)
+        mutation_batcher.flush()
 
         self.assertEqual(table.mutation_calls, 1)
 
@@ -159,6 +160,124 @@ class TestMutationsBatcher(unittest.TestCase):
         row.set_cell("cf1", b"c3", max_value)
 
         mutation_batcher.mutate(row)
+        mutation_batcher.flush()
+
+        self.assertEqual(table.mutation_calls, 1)
+
+    def test_mutate_rows_in_several_batches(self):
+        table = _Table(self.TABLE_NAME)
+        mutation_batcher = MutationsBatcher(table=table, flush_count=2)
+
+        rows = [DirectRow(row_key=b"row_key_%d" % (i,)) for i in range(5)]
+        mutation_batcher.mutate_rows(rows)
+        mutation_batcher.flush()
+
+        self.assertEqual(table.mutation_calls, 3)
+        self.assertEqual(
+            sorted(row.row_key for row in table.mutated_rows),
+            [row.row_key for row in rows],
+        )
+
+    def test_max_in_flight(self):
+        import threading
+
+        table = _Table(self.TABLE_NAME, blocked=True)
+        mutation_batcher = MutationsBatcher(table=table, flush_count=1, max_in_flight=2)
+
+        mutation_batcher.mutate(DirectRow(row_key=b"row_key_1"))
+        mutation_batcher.mutate(DirectRow(row_key=b"row_key_2"))
+
+        # The third batch waits for one of the first two to complete.
+        third = threading.Thread(
+            target=mutation_batcher.mutate, args=(DirectRow(row_key=b"row_key_3"),)
+        )
+        third.start()
+        third.join(0.1)
+        self.assertTrue(third.is_alive())
+        self.assertEqual(mutation_batcher._in_flight_count, 2)
+
+        table.unblock()
+        third.join()
+        mutation_batcher.close()
+
+        self.assertEqual(table.mutation_calls, 3)
+        self.assertEqual(mutation_batcher._in_flight_count, 0)
+        self.assertEqual(mutation_batcher._in_flight_bytes, 0)
+
+    def test_max_in_flight_bytes(self):
+        import threading
+
+        table = _Table(self.TABLE_NAME, blocked=True)
+        mutation_batcher = MutationsBatcher(
+            table=table, flush_count=1, max_in_flight_bytes=10
+        )
+
+        row_1 = DirectRow(row_key=b"row_key_1")
+        row_1.set_cell("cf1", b"c1", b"x" * 20)
+        row_2 = DirectRow(row_key=b"row_key_2")
+        row_2.set_cell("cf1", b"c1", b"x")
+
+        # A batch larger than the limit is sent when nothing is in flight.
+        mutation_batcher.mutate(row_1)
+        self.assertEqual(mutation_batcher._in_flight_count, 1)
+
+        second = threading.Thread(target=mutation_batcher.mutate, args=(row_2,))
+        second.start()
+        second.join(0.1)
+        self.assertTrue(second.is_alive())
+
+        table.unblock()
+        second.join()
+        mutation_batcher.flush()
+
+        self.assertEqual(table.mutation_calls, 2)
+
+    def test_flush_interval(self):
+        import threading
+
+        table = _Table(self.TABLE_NAME)
+        table.mutated = threading.Event()
+        mutation_batcher = MutationsBatcher(table=table, flush_interval=0.01)
+
+        mutation_batcher.mutate(DirectRow(row_key=b"row_key"))
+
+        self.assertTrue(table.mutated.wait(5))
+        mutation_batcher.close()
+        self.assertEqual(table.mutation_calls, 1)
+        self.assertIsNone(mutation_batcher._flusher)
+
+    def test_failure_callback(self):
+        from google.rpc import code_pb2
+
+        table = _Table(self.TABLE_NAME, codes=[code_pb2.OK, code_pb2.NOT_FOUND])
+        callback = mock.Mock(spec=())
+        mutation_batcher = MutationsBatcher(table=table, failure_callback=callback)
+
+        row_1 = DirectRow(row_key=b"row_key_1")
+        row_2 = DirectRow(row_key=b"row_key_2")
+        mutation_batcher.mutate_rows([row_1, row_2])
+        mutation_batcher.flush()
+
+        callback.assert_called_once_with(row_2, mock.ANY)
+        self.assertEqual(callback.call_args[0][1].code, code_pb2.NOT_FOUND)
+
+    def test_flush_raises_error(self):
+        table = _Table(self.TABLE_NAME, error=RuntimeError("Unexpected"))
+        mutation_batcher = MutationsBatcher(table=table)
+
+        mutation_batcher.mutate(DirectRow(row_key=b"row_key"))
+
+        with self.assertRaises(RuntimeError):
+            mutation_batcher.flush()
+
+        # The error is only raised once.
+        mutation_batcher.flush()
+
+    def test_context_manager(self):
+        table = _Table(self.TABLE_NAME)
+
+        with MutationsBatcher(table=table) as mutation_batcher:
+            mutation_batcher.mutate(DirectRow(row_key=b"row_key"))
 
         self.assertEqual(table.mutation_calls, 1)
 
@@ -168,12 +287,62 @@ class _Instance(object):
         self._client = client
 
 
+class TestMutationsBatcherMetrics(unittest.TestCase):
+    TABLE_NAME = "/tables/table-id"
+
+    def test_metrics(self):
+        from google.cloud.bigtable import metrics
+
+        recorder = metrics.InMemoryMetrics()
+        table = _Table(self.TABLE_NAME)
+        mutation_batcher = MutationsBatcher(
+            table=table, flush_count=2, metrics=recorder
+        )
+
+        for index in range(3):
+            row = DirectRow(row_key=("row_key_%d" % (index,)).encode("ascii"))
+            row.set_cell("cf1", b"c1", 1)
+            mutation_batcher.mutate(row)
+        mutation_batcher.flush()
+
+        snapshot = recorder.snapshot()
+        gauges = snapshot["gauges"]
+        self.assertEqual(gauges[metrics.BATCHER_PENDING_ROWS], {"current": 0, "max": 1})
+        self.assertEqual(gauges[metrics.BATCHER_IN_FLIGHT_RPCS]["current"], 0)
+        self.assertGreaterEqual(gauges[metrics.BATCHER_IN_FLIGHT_RPCS]["max"], 1)
+        self.assertEqual(gauges[metrics.BATCHER_IN_FLIGHT_BYTES]["current"], 0)
+        self.assertEqual(
+            snapshot["latencies"][metrics.BATCHER_BLOCKED_LATENCY]["count"], 2
+        )
+
+
 class _Table(object):
-    def __init__(self, name, client=None):
+    def __init__(self, name, client=None, blocked=False, codes=None, error=None):
+        import threading
+
         self.name = name
         self._instance = _Instance(client)
         self.mutation_calls = 0
+        self.mutated_rows = []
+        self.mutated = None
+        self._codes = codes
+        self._error = error
+        self._unblocked = threading.Event()
+        if not blocked:
+            self._unblocked.set()
+
+    def unblock(self):
+        self._unblocked.set()
 
     def mutate_rows(self, rows):
+        from google.rpc import status_pb2
+
+        self._unblocked.wait()
         self.mutation_calls += 1
-        return rows
+        self.mutated_rows.extend(rows)
+        if self.mutated is not None:
+            self.mutated.set()
+        if self._error is not None:
+            raise self._error
+        codes = self._codes or [0] * len(rows)
+        return [status_pb2.Status(code=code) for code in codes]
@@ -0,0 +1,171 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+import mock
+
+try:
+    from opencensus.stats import stats as stats_module
+except ImportError:  # pragma: NO COVER
+    stats_module = None
+
+
+class TestMetricsRecorder(unittest.TestCase):
+    def test_methods_do_nothing(self):
+        from google.cloud.bigtable.metrics import MetricsRecorder
+
+        recorder = MetricsRecorder()
+        self.assertIsNone(recorder.record_latency("latency", 0.5))
+        self.assertIsNone(recorder.increment("counter"))
+        self.assertIsNone(recorder.set_gauge("gauge", 3))
+
+
+class Test_LatencyHistogram(unittest.TestCase):
+    @staticmethod
+    def _make_one():
+        from google.cloud.bigtable.metrics import _LatencyHistogram
+
+        return _LatencyHistogram()
+
+    def test_empty(self):
+        histogram = self._make_one()
+        self.assertEqual(histogram.to_dict(), {"count": 0})
+
+    def test_percentiles(self):
+        from google.cloud.bigtable.metrics import LATENCY_BUCKETS_MS
+
+        histogram = self._make_one()
+        for _ in range(90):
+            histogram.add(1.0)
+        for _ in range(10):
+            histogram.add(100.0)
+
+        upper_bound = LATENCY_BUCKETS_MS[
+            [index for index, bound in enumerate(LATENCY_BUCKETS_MS) if bound >= 1.0][0]
+        ]
+        summary = histogram.to_dict()
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["mean_ms"], 10.9)
+        self.assertEqual(summary["min_ms"], 1.0)
+        self.assertEqual(summary["max_ms"], 100.0)
+        self.assertEqual(summary["p50_ms"], upper_bound)
+        self.assertEqual(summary["p90_ms"], upper_bound)
+        self.assertEqual(summary["p99_ms"], 100.0)
+
+    def test_overflow(self):
+        histogram = self._make_one()
+        histogram.add(1e9)
+        self.assertEqual(histogram.percentile(50), 1e9)
+
+
+class TestInMemoryMetrics(unittest.TestCase):
+    @staticmethod
+    def _make_one():
+        from google.cloud.bigtable.metrics import InMemoryMetrics
+
+        return InMemoryMetrics()
+
+    def test_snapshot(self):
+        metrics = self._make_one()
+        metrics.record_latency("latency", 0.002)
+        metrics.record_latency("latency", 0.004)
+        metrics.increment("counter")
+        metrics.increment("counter", 4)
+        metrics.set_gauge("gauge", 5)
+        metrics.set_gauge("gauge", 2)
+
+        snapshot = metrics.snapshot()
+
+        self.assertEqual(snapshot["counters"], {"counter": 5})
+        self.assertEqual(snapshot["gauges"], {"gauge": {"current": 2, "max": 5}})
+        latency = snapshot["latencies"]["latency"]
+        self.assertEqual(latency["count"], 2)
+        self.assertAlmostEqual(latency["mean_ms"], 3.0)
+        self.assertAlmostEqual(latency["max_ms"], 4.0)
+
+    def test_reset(self):
+        metrics = self._make_one()
+        metrics.record_latency("latency", 0.002)
+        metrics.increment("counter")
+        metrics.set_gauge("gauge", 5)
+
+        metrics.reset()
+
+        self.assertEqual(
+            metrics.snapshot(), {"latencies": {}, "counters": {}, "gauges": {}}
+        )
+
+
+@unittest.skipIf(stats_module is None, "Requires `opencensus`")
+class TestOpenCensusMetrics(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.metrics import OpenCensusMetrics
+
+        return OpenCensusMetrics
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_constructor_defaults(self):
+        metrics = self._make_one()
+
+        self.assertIs(metrics._view_manager, stats_module.stats.view_manager)
+        self.assertIs(metrics._stats_recorder, stats_module.stats.stats_recorder)
+
+    def test_constructor_missing_opencensus(self):
+        with mock.patch("google.cloud.bigtable.metrics.stats_module", new=None):
+            with self.assertRaises(ValueError):
+                self._make_one()
+
+    def test_record(self):
+        from opencensus.stats import aggregation
+
+        view_manager = mock.Mock(spec=["register_view"])
+        stats_recorder = mock.Mock(spec=["new_measurement_map"])
+        measurement_map = stats_recorder.new_measurement_map.return_value
+        metrics = self._make_one(
+            prefix="bigtable/",
+            tags={"table": "my-table"},
+            view_manager=view_manager,
+            stats_recorder=stats_recorder,
+        )
+
+        metrics.record_latency("latency", 0.5)
+        metrics.record_latency("latency", 0.25)
+        metrics.increment("counter", 3)
+        metrics.set_gauge("gauge", 7)
+
+        views = [call[0][0] for call in view_manager.register_view.call_args_list]
+        self.assertEqual(
+            [view.name for view in views],
+            ["bigtable/latency", "bigtable/counter", "bigtable/gauge"],
+        )
+        self.assertEqual([view.columns for view in views], [["table"]] * 3)
+        self.assertIsInstance(views[0].aggregation, aggregation.DistributionAggregation)
+        self.assertIsInstance(views[1].aggregation, aggregation.SumAggregation)
+        self.assertIsInstance(views[2].aggregation, aggregation.LastValueAggregation)
+
+        latency_measure = views[0].measure
+        measurement_map.measure_float_put.assert_has_calls(
+            [mock.call(latency_measure, 500.0), mock.call(latency_measure, 250.0)]
+        )
+        measurement_map.measure_int_put.assert_has_calls(
+            [mock.call(views[1].measure, 3), mock.call(views[2].measure, 7)]
+        )
+        self.assertEqual(measurement_map.record.call_count, 4)
+        tag_map = measurement_map.record.call_args[0][0]
+        self.assertEqual(dict(tag_map.map), {"table": "my-table"})
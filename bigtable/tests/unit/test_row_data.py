@@ -16,6 +16,15 @@
 import unittest
 import mock
 
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pyarrow = None
+
 from google.api_core.exceptions import DeadlineExceeded
 from ._testing import _make_credentials
 from google.cloud.bigtable.row_set import RowRange
@@ -532,68 +541,40 @@ class TestPartialRowsData(unittest.TestCase):
 
     # 'consume_next' tested via 'TestPartialRowsData_JSON_acceptance_tests'
 
-    def test__copy_from_previous_unset(self):
-        client = _Client()
-        client._data_stub = mock.MagicMock()
-        request = object()
-        yrd = self._make_one(client._data_stub.ReadRows, request)
-        cell = _PartialCellData()
-        yrd._copy_from_previous(cell)
-        self.assertEqual(cell.row_key, b"")
-        self.assertEqual(cell.family_name, u"")
-        self.assertIsNone(cell.qualifier)
-        self.assertEqual(cell.timestamp_micros, 0)
-        self.assertEqual(cell.labels, [])
-
-    def test__copy_from_previous_blank(self):
-        ROW_KEY = "RK"
-        FAMILY_NAME = u"A"
-        QUALIFIER = b"C"
-        TIMESTAMP_MICROS = 100
-        LABELS = ["L1", "L2"]
+    def test__process_chunks_inherits_keys_across_responses(self):
         client = _Client()
         client._data_stub = mock.MagicMock()
         request = object()
         yrd = self._make_one(client._data_stub.ReadRows, request)
-        cell = _PartialCellData(
-            row_key=ROW_KEY,
-            family_name=FAMILY_NAME,
-            qualifier=QUALIFIER,
-            timestamp_micros=TIMESTAMP_MICROS,
-            labels=LABELS,
+
+        chunk1 = _ReadRowsResponseCellChunkPB(
+            row_key=self.ROW_KEY,
+            family_name=self.FAMILY_NAME,
+            qualifier=self.QUALIFIER,
+            timestamp_micros=self.TIMESTAMP_MICROS,
+            value=self.VALUE,
         )
-        yrd._previous_cell = _PartialCellData()
-        yrd._copy_from_previous(cell)
-        self.assertEqual(cell.row_key, ROW_KEY)
-        self.assertEqual(cell.family_name, FAMILY_NAME)
-        self.assertEqual(cell.qualifier, QUALIFIER)
-        self.assertEqual(cell.timestamp_micros, TIMESTAMP_MICROS)
-        self.assertEqual(cell.labels, LABELS)
+        self.assertEqual(list(yrd._process_chunks([chunk1])), [])
+        self.assertEqual(yrd.state, yrd.ROW_IN_PROGRESS)
+        self.assertEqual(yrd._previous_cell.row_key, self.ROW_KEY)
 
-    def test__copy_from_previous_filled(self):
-        ROW_KEY = "RK"
-        FAMILY_NAME = u"A"
-        QUALIFIER = b"C"
-        TIMESTAMP_MICROS = 100
-        LABELS = ["L1", "L2"]
-        client = _Client()
-        client._data_stub = mock.MagicMock()
-        request = object()
-        yrd = self._make_one(client._data_stub.ReadRows, request)
-        yrd._previous_cell = _PartialCellData(
-            row_key=ROW_KEY,
-            family_name=FAMILY_NAME,
-            qualifier=QUALIFIER,
-            timestamp_micros=TIMESTAMP_MICROS,
-            labels=LABELS,
+        chunk2 = _ReadRowsResponseCellChunkPB(
+            timestamp_micros=self.TIMESTAMP_MICROS + 1,
+            value=self.VALUE + b"1",
+            commit_row=True,
+        )
+        (row,) = yrd._process_chunks([chunk2])
+
+        self.assertEqual(row.row_key, self.ROW_KEY)
+        self.assertEqual(
+            list(row.cell_values(self.FAMILY_NAME, self.QUALIFIER)),
+            [
+                (self.VALUE, self.TIMESTAMP_MICROS),
+                (self.VALUE + b"1", self.TIMESTAMP_MICROS + 1),
+            ],
         )
-        cell = _PartialCellData()
-        yrd._copy_from_previous(cell)
-        self.assertEqual(cell.row_key, ROW_KEY)
-        self.assertEqual(cell.family_name, FAMILY_NAME)
-        self.assertEqual(cell.qualifier, QUALIFIER)
-        self.assertEqual(cell.timestamp_micros, 0)
-        self.assertEqual(cell.labels, [])
+        self.assertIsNone(yrd._previous_cell)
+        self.assertEqual(yrd.state, yrd.NEW_ROW)
 
     def test_valid_last_scanned_row_key_on_start(self):
         client = _Client()
@@ -634,19 +615,27 @@ class TestPartialRowsData(unittest.TestCase):
             qualifier=self.QUALIFIER,
             timestamp_micros=self.TIMESTAMP_MICROS,
             value=self.VALUE,
+            value_size=2 * len(self.VALUE),
             labels=LABELS,
         )
-        yrd._update_cell(chunk)
-
-        more_cell_data = _ReadRowsResponseCellChunkPB(value=self.VALUE)
-        yrd._update_cell(more_cell_data)
+        self.assertEqual(list(yrd._process_chunks([chunk])), [])
 
+        self.assertEqual(yrd.state, yrd.CELL_IN_PROGRESS)
         self.assertEqual(yrd._cell.row_key, self.ROW_KEY)
         self.assertEqual(yrd._cell.family_name, self.FAMILY_NAME)
         self.assertEqual(yrd._cell.qualifier, self.QUALIFIER)
         self.assertEqual(yrd._cell.timestamp_micros, self.TIMESTAMP_MICROS)
         self.assertEqual(yrd._cell.labels, LABELS)
-        self.assertEqual(yrd._cell.value, self.VALUE + self.VALUE)
+        self.assertEqual(yrd._cell.value, self.VALUE)
+
+        more_cell_data = _ReadRowsResponseCellChunkPB(value=self.VALUE, commit_row=True)
+        (row,) = yrd._process_chunks([more_cell_data])
+
+        (cell,) = row.find_cells(self.FAMILY_NAME, self.QUALIFIER)
+        self.assertEqual(cell.value, self.VALUE + self.VALUE)
+        self.assertEqual(cell.timestamp_micros, self.TIMESTAMP_MICROS)
+        self.assertEqual(cell.labels, LABELS)
+        self.assertIsNone(yrd._cell)
 
     def test_yield_rows_data(self):
         client = _Client()
@@ -705,10 +694,274 @@ class TestPartialRowsData(unittest.TestCase):
 
         self.assertEqual(result, self.ROW_KEY)
 
+    def test_yield_retry_rows_data_all_rows_read(self):
+        from google.api_core import retry
+
+        client = _Client()
+
+        retry_read_rows = retry.Retry(predicate=_read_rows_retry_exception)
+
+        chunk = _ReadRowsResponseCellChunkPB(
+            row_key=self.ROW_KEY,
+            family_name=self.FAMILY_NAME,
+            qualifier=self.QUALIFIER,
+            timestamp_micros=self.TIMESTAMP_MICROS,
+            value=self.VALUE,
+            commit_row=True,
+        )
+        response = _ReadRowsResponseV2([chunk])
+        iterator = _MockFailureIterator_2([response])
+        client._data_stub = mock.MagicMock()
+        client._data_stub.ReadRows.side_effect = [iterator]
+
+        request = _ReadRowsRequestPB(table_name="table_name")
+        request.rows.row_keys.append(self.ROW_KEY)
+
+        yrd = self._make_one(client._data_stub.ReadRows, request, retry_read_rows)
+
+        result = self._consume_all(yrd)
+
+        self.assertEqual(result, [self.ROW_KEY])
+        self.assertEqual(client._data_stub.ReadRows.call_count, 1)
+
+    def test_yield_rows_data_metrics(self):
+        from google.api_core import retry
+        from google.cloud.bigtable import metrics
+
+        client = _Client()
+
+        retry_read_rows = retry.Retry(predicate=_read_rows_retry_exception)
+
+        chunk_1 = _ReadRowsResponseCellChunkPB(
+            row_key=self.ROW_KEY,
+            family_name=self.FAMILY_NAME,
+            qualifier=self.QUALIFIER,
+            timestamp_micros=self.TIMESTAMP_MICROS,
+            value=b"val",
+            value_size=5,
+        )
+        chunk_2 = _ReadRowsResponseCellChunkPB(value=b"ue", commit_row=True)
+        response = _ReadRowsResponseV2([chunk_1, chunk_2])
+        failure_iterator = _MockFailureIterator_1()
+        iterator = _MockCancellableIterator(response)
+        client._data_stub = mock.MagicMock()
+        client._data_stub.ReadRows.side_effect = [failure_iterator, iterator]
+
+        recorder = metrics.InMemoryMetrics()
+        yrd = self._make_one(
+            client._data_stub.ReadRows, object(), retry_read_rows, metrics=recorder
+        )
+
+        result = self._consume_all(yrd)
+
+        self.assertEqual(result, [self.ROW_KEY])
+        snapshot = recorder.snapshot()
+        self.assertEqual(
+            snapshot["counters"],
+            {
+                metrics.READ_ROWS_RETRIES: 1,
+                metrics.READ_ROWS_ROWS: 1,
+                metrics.READ_ROWS_CELLS: 1,
+                metrics.READ_ROWS_BYTES: 5,
+            },
+        )
+        latencies = snapshot["latencies"]
+        self.assertEqual(latencies[metrics.READ_ROWS_LATENCY]["count"], 1)
+        self.assertEqual(
+            latencies[metrics.READ_ROWS_FIRST_RESPONSE_LATENCY]["count"], 1
+        )
+
     def _consume_all(self, yrd):
         return [row.row_key for row in yrd]
 
 
+class TestPartialRowsData_to_arrow(unittest.TestCase):
+    FAMILY_NAME = u"family"
+
+    @staticmethod
+    def _make_rows_data(rows):
+        from google.cloud.bigtable.row_data import PartialRowsData
+
+        chunks = []
+        for row_key, cells in rows:
+            for index, (qualifier, timestamp_micros, value) in enumerate(cells):
+                kwargs = {}
+                if index == 0:
+                    kwargs = {"row_key": row_key, "family_name": u"family"}
+                chunks.append(
+                    _ReadRowsResponseCellChunkPB(
+                        qualifier=qualifier,
+                        timestamp_micros=timestamp_micros,
+                        value=value,
+                        commit_row=index == len(cells) - 1,
+                        **kwargs
+                    )
+                )
+        iterator = _MockCancellableIterator(_ReadRowsResponseV2(chunks))
+        return PartialRowsData(mock.Mock(return_value=iterator), object())
+
+    def _rows(self):
+        return [
+            (b"row-1", [(b"a", 200, b"\x00\x01"), (b"a", 100, b"\x00\x00")]),
+            (b"row-2", [(b"a", 100, b"\x00\x02"), (b"b", 100, b"bee")]),
+        ]
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_latest(self):
+        import struct
+
+        rows_data = self._make_rows_data(self._rows())
+        columns = [(self.FAMILY_NAME, b"a"), (self.FAMILY_NAME, "b")]
+        decoders = {(self.FAMILY_NAME, b"a"): lambda v: struct.unpack(">h", v)[0]}
+
+        table = rows_data.to_arrow(columns=columns, decoders=decoders)
+
+        self.assertEqual(table.column_names, [u"row_key", u"family:a", u"family:b"])
+        self.assertEqual(
+            table.to_pydict(),
+            {
+                u"row_key": [b"row-1", b"row-2"],
+                u"family:a": [1, 2],
+                u"family:b": [None, b"bee"],
+            },
+        )
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_batches(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        batches = list(
+            rows_data.to_arrow_batches(columns=[(self.FAMILY_NAME, b"b")], batch_size=1)
+        )
+
+        self.assertEqual([batch.num_rows for batch in batches], [1, 1])
+        # The type of a column only made of nulls is not inferred.
+        self.assertEqual(batches[0].schema, batches[1].schema)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_inferred_type_kept_across_batches(self):
+        rows_data = self._make_rows_data(self._rows())
+        column = (self.FAMILY_NAME, b"b")
+
+        batches = list(
+            rows_data.to_arrow_batches(
+                columns=[column], decoders={column: len}, batch_size=1
+            )
+        )
+
+        self.assertEqual(batches[0].column(1).type, pyarrow.null())
+        self.assertEqual(batches[1].column(1).type, pyarrow.int64())
+
+    def _to_arrow_in_batches_of_one(self, rows_data, **kwargs):
+        import functools
+
+        to_arrow_batches = functools.partial(rows_data.to_arrow_batches, batch_size=1)
+        with mock.patch.object(rows_data, "to_arrow_batches", new=to_arrow_batches):
+            return rows_data.to_arrow(**kwargs)
+
+    def _sparse_rows(self):
+        return [
+            (b"row-1", [(b"a", 100, b"")]),
+            (b"row-2", [(b"b", 100, b"bee")]),
+            (b"row-3", [(b"a", 100, b"ay")]),
+        ]
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_sparse_column_across_batches(self):
+        rows_data = self._make_rows_data(self._sparse_rows())
+        column = (self.FAMILY_NAME, b"a")
+
+        table = self._to_arrow_in_batches_of_one(
+            rows_data, columns=[column], decoders={column: lambda v: len(v) or None}
+        )
+
+        self.assertEqual(table.schema.field(u"family:a").type, pyarrow.int64())
+        self.assertEqual(table.column(u"family:a").to_pylist(), [None, None, 2])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_versions_sparse_values_across_batches(self):
+        rows_data = self._make_rows_data(self._sparse_rows())
+        column = (self.FAMILY_NAME, b"a")
+
+        table = self._to_arrow_in_batches_of_one(
+            rows_data,
+            columns=[column],
+            decoders={column: lambda v: len(v) or None},
+            versions=True,
+        )
+
+        self.assertEqual(table.schema.field(u"value").type, pyarrow.int64())
+        self.assertEqual(table.column(u"value").to_pylist(), [None, 2])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_versions(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        table = rows_data.to_arrow(versions=True)
+
+        self.assertEqual(
+            table.column_names,
+            [u"row_key", u"family", u"qualifier", u"timestamp", u"value"],
+        )
+        self.assertEqual(table.num_rows, 4)
+        self.assertEqual(
+            table.column(u"value").to_pylist(),
+            [b"\x00\x01", b"\x00\x00", b"\x00\x02", b"bee"],
+        )
+        self.assertEqual(
+            table.schema.field(u"timestamp").type, pyarrow.timestamp("us", tz="UTC")
+        )
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_versions_with_columns(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        table = rows_data.to_arrow(columns=[(self.FAMILY_NAME, b"b")], versions=True)
+
+        self.assertEqual(table.column(u"value").to_pylist(), [b"bee"])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_empty(self):
+        rows_data = self._make_rows_data([])
+
+        table = rows_data.to_arrow(columns=[(self.FAMILY_NAME, b"a")])
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.column_names, [u"row_key", u"family:a"])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_without_columns(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        with self.assertRaises(ValueError):
+            rows_data.to_arrow()
+
+    @mock.patch("google.cloud.bigtable.row_data.pyarrow", new=None)
+    def test_to_arrow_without_pyarrow(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        with self.assertRaises(ValueError):
+            rows_data.to_arrow(versions=True)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_dataframe(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        df = rows_data.to_dataframe(columns=[(self.FAMILY_NAME, b"b")])
+
+        self.assertIsInstance(df, pandas.DataFrame)
+        self.assertEqual(list(df.columns), [u"row_key", u"family:b"])
+        self.assertEqual(list(df[u"row_key"]), [b"row-1", b"row-2"])
+
+    @mock.patch("google.cloud.bigtable.row_data.pandas", new=None)
+    def test_to_dataframe_without_pandas(self):
+        rows_data = self._make_rows_data(self._rows())
+
+        with self.assertRaises(ValueError):
+            rows_data.to_dataframe(versions=True)
+
+
 class Test_ReadRowsRequestManager(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -938,6 +1191,66 @@ class Test_ReadRowsRequestManager(unittest.TestCase):
         expected_result.rows.row_ranges.add(start_key_open=last_scanned_key)
         self.assertEqual(expected_result, result)
 
+    def test__filter_row_key_unsorted(self):
+        request = _ReadRowsRequestPB(table_name=self.table_name)
+        request.rows.row_keys.extend(
+            [b"row_key4", b"row_key1", b"row_key3", b"row_key2", b"row_key4"]
+        )
+
+        request_manager = self._make_one(request, b"row_key2", 2)
+        row_keys = request_manager._filter_rows_keys()
+
+        self.assertEqual(row_keys, [b"row_key3", b"row_key4"])
+
+    def test__filter_row_ranges_merged(self):
+        request = _ReadRowsRequestPB(table_name=self.table_name)
+        request.rows.row_ranges.add(
+            start_key_closed=b"row_key31", end_key_open=b"row_key39"
+        )
+        request.rows.row_ranges.add(
+            start_key_closed=b"row_key21", end_key_open=b"row_key29"
+        )
+        request.rows.row_ranges.add(
+            start_key_closed=b"row_key25", end_key_closed=b"row_key33"
+        )
+
+        request_manager = self._make_one(request, b"row_key22", 2)
+        row_ranges = request_manager._filter_row_ranges()
+
+        exp_row_range = data_v2_pb2.RowRange(
+            start_key_open=b"row_key22", end_key_open=b"row_key39"
+        )
+        self.assertEqual(row_ranges, [exp_row_range])
+
+    def test__filter_row_ranges_reused(self):
+        request_manager = self._make_one(self.request, b"row_key22", 2)
+        request_manager._filter_row_ranges()
+        merged = request_manager._row_ranges
+
+        request_manager.last_scanned_key = b"row_key35"
+        row_ranges = request_manager._filter_row_ranges()
+
+        exp_row_range2 = data_v2_pb2.RowRange(
+            start_key_open=b"row_key35", end_key_open=b"row_key39"
+        )
+        exp_row_range3 = data_v2_pb2.RowRange(
+            start_key_closed=b"row_key41", end_key_open=b"row_key49"
+        )
+        self.assertIs(request_manager._row_ranges, merged)
+        self.assertEqual(row_ranges, [exp_row_range2, exp_row_range3])
+
+    def test_build_updated_request_all_rows_read(self):
+        from google.cloud.bigtable.row_data import InvalidRetryRequest
+
+        request = _ReadRowsRequestPB(table_name=self.table_name)
+        request.rows.row_keys.extend([b"row_key1", b"row_key2"])
+        request.rows.row_ranges.add(**self.row_range1.get_range_kwargs())
+
+        request_manager = self._make_one(request, b"row_key29", 3)
+
+        with self.assertRaises(InvalidRetryRequest):
+            request_manager.build_updated_request()
+
     def test__key_already_read(self):
         last_scanned_key = b"row_key14"
         request = _ReadRowsRequestPB(table_name=self.table_name)
@@ -1225,16 +1538,19 @@ class _MockFailureIterator_1(object):
     __next__ = next
 
 
-class _PartialCellData(object):
+class _MockFailureIterator_2(object):
+    def __init__(self, *values):
+        self.iter_values = values[0]
+        self.calls = 0
 
-    row_key = b""
-    family_name = u""
-    qualifier = None
-    timestamp_micros = 0
+    def next(self):
+        self.calls += 1
+        if self.calls == 1:
+            return self.iter_values[0]
+        else:
+            raise DeadlineExceeded("Failed to read from server")
 
-    def __init__(self, **kw):
-        self.labels = kw.pop("labels", [])
-        self.__dict__.update(kw)
+    __next__ = next
 
 
 class _ReadRowsResponseV2(object):
@@ -0,0 +1,217 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import unittest
+
+import mock
+
+
+class Test_RowCache(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.row_lookup import _RowCache
+
+        return _RowCache
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_get_miss(self):
+        cache = self._make_one(2)
+        self.assertEqual(cache.get(b"row_key"), (False, None))
+
+    def test_put_get(self):
+        cache = self._make_one(2)
+        row = object()
+        cache.put(b"row_key", row)
+        cache.put(b"missing", None)
+
+        self.assertEqual(cache.get(b"row_key"), (True, row))
+        self.assertEqual(cache.get(b"missing"), (True, None))
+
+    def test_evicts_least_recently_used(self):
+        cache = self._make_one(2)
+        cache.put(b"row_key_1", 1)
+        cache.put(b"row_key_2", 2)
+        cache.get(b"row_key_1")
+        cache.put(b"row_key_3", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(b"row_key_1"), (True, 1))
+        self.assertEqual(cache.get(b"row_key_2"), (False, None))
+        self.assertEqual(cache.get(b"row_key_3"), (True, 3))
+
+    def test_ttl(self):
+        cache = self._make_one(2, ttl=10)
+        with mock.patch("time.time", return_value=100.0):
+            cache.put(b"row_key", 1)
+        with mock.patch("time.time", return_value=105.0):
+            self.assertEqual(cache.get(b"row_key"), (True, 1))
+        with mock.patch("time.time", return_value=110.0):
+            self.assertEqual(cache.get(b"row_key"), (False, None))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_and_clear(self):
+        cache = self._make_one(3)
+        cache.put(b"row_key_1", 1)
+        cache.put(b"row_key_2", 2)
+
+        cache.invalidate(b"row_key_1")
+        self.assertEqual(cache.get(b"row_key_1"), (False, None))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestRowLookupBatcher(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.row_lookup import RowLookupBatcher
+
+        return RowLookupBatcher
+
+    def _make_one(self, *args, **kwargs):
+        batcher = self._get_target_class()(*args, **kwargs)
+        self.addCleanup(batcher.close)
+        return batcher
+
+    def test_constructor_defaults(self):
+        from google.cloud.bigtable.row_data import DEFAULT_RETRY_READ_ROWS
+        from google.cloud.bigtable.row_lookup import MAX_BATCH_LATENCY
+        from google.cloud.bigtable.row_lookup import MAX_BATCH_SIZE
+
+        table = _Table()
+        batcher = self._make_one(table)
+
+        self.assertIs(batcher.table, table)
+        self.assertIsNone(batcher.filter_)
+        self.assertEqual(batcher.max_batch_size, MAX_BATCH_SIZE)
+        self.assertEqual(batcher.max_latency, MAX_BATCH_LATENCY)
+        self.assertIs(batcher.retry, DEFAULT_RETRY_READ_ROWS)
+        self.assertIsNone(batcher._cache)
+
+    def test_read_row(self):
+        table = _Table(b"row_key_1")
+        filter_ = object()
+        batcher = self._make_one(table, filter_=filter_)
+
+        self.assertEqual(batcher.read_row(b"row_key_1"), b"row_key_1")
+        self.assertIsNone(batcher.read_row(u"row_key_2"))
+        self.assertEqual(table.filters, [filter_, filter_])
+
+    def test_coalesces_lookups(self):
+        table = _Table(b"row_key_1", b"row_key_2", b"row_key_3")
+        batcher = self._make_one(table, max_latency=60)
+
+        lookups = [
+            batcher.lookup(row_key)
+            for row_key in [b"row_key_1", b"row_key_2", b"row_key_1", b"row_key_4"]
+        ]
+        batcher.close()
+
+        self.assertIs(lookups[0], lookups[2])
+        self.assertEqual(
+            [lookup.result() for lookup in lookups],
+            [b"row_key_1", b"row_key_2", b"row_key_1", None],
+        )
+        self.assertEqual(table.batches, [[b"row_key_1", b"row_key_2", b"row_key_4"]])
+
+    def test_max_batch_size(self):
+        table = _Table(b"row_key_1", b"row_key_2", b"row_key_3")
+        batcher = self._make_one(table, max_batch_size=2, max_latency=60)
+
+        first = batcher.lookup(b"row_key_1")
+        batcher.lookup(b"row_key_2")
+        # The full batch is sent without waiting for ``max_latency``.
+        self.assertEqual(first.result(timeout=10), b"row_key_1")
+        third = batcher.lookup(b"row_key_3")
+        batcher.close()
+
+        self.assertEqual(third.result(), b"row_key_3")
+        self.assertEqual(table.batches, [[b"row_key_1", b"row_key_2"], [b"row_key_3"]])
+
+    def test_concurrent_lookups(self):
+        row_keys = [("row_key_%d" % (index,)).encode("ascii") for index in range(50)]
+        table = _Table(*row_keys)
+        batcher = self._make_one(table, max_batch_size=10, max_in_flight=2)
+        results = {}
+
+        def read(row_key):
+            results[row_key] = batcher.read_row(row_key, timeout=10)
+
+        threads = [threading.Thread(target=read, args=(key,)) for key in row_keys]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, {row_key: row_key for row_key in row_keys})
+        self.assertTrue(all(len(batch) <= 10 for batch in table.batches))
+        self.assertEqual(sorted(sum(table.batches, [])), sorted(row_keys))
+
+    def test_error(self):
+        table = _Table()
+        table.error = RuntimeError("Failed")
+        batcher = self._make_one(table, max_latency=60)
+
+        lookups = [batcher.lookup(b"row_key_1"), batcher.lookup(b"row_key_2")]
+        batcher.close()
+
+        for lookup in lookups:
+            with self.assertRaises(RuntimeError):
+                lookup.result()
+
+    def test_cache(self):
+        table = _Table(b"row_key_1")
+        batcher = self._make_one(table, cache_size=10)
+
+        self.assertEqual(batcher.read_row(b"row_key_1"), b"row_key_1")
+        self.assertIsNone(batcher.read_row(b"row_key_2"))
+        self.assertEqual(batcher.read_row(b"row_key_1"), b"row_key_1")
+        self.assertIsNone(batcher.read_row(b"row_key_2"))
+        self.assertEqual(table.batches, [[b"row_key_1"], [b"row_key_2"]])
+
+        batcher.invalidate(u"row_key_1")
+        self.assertEqual(batcher.read_row(b"row_key_1"), b"row_key_1")
+        self.assertEqual(len(table.batches), 3)
+
+    def test_lookup_after_close(self):
+        batcher = self._make_one(_Table())
+        batcher.close()
+
+        with self.assertRaises(ValueError):
+            batcher.lookup(b"row_key")
+
+    def test_context_manager(self):
+        table = _Table(b"row_key_1")
+        with self._make_one(table, max_latency=60) as batcher:
+            lookup = batcher.lookup(b"row_key_1")
+
+        self.assertEqual(lookup.result(), b"row_key_1")
+
+
+class _Table(object):
+    def __init__(self, *row_keys):
+        self.row_keys = set(row_keys)
+        self.batches = []
+        self.filters = []
+        self.error = None
+
+    def read_rows_bulk(self, row_keys, filter_=None, retry=None):
+        self.batches.append(list(row_keys))
+        self.filters.append(filter_)
+        if self.error is not None:
+            raise self.error
+        return [key if key in self.row_keys else None for key in row_keys]
@@ -184,6 +184,97 @@ class TestRowSet(unittest.TestCase):
 
         self.assertEqual(request, expected_request)
 
+    def test__update_message_request_sorts_and_merges(self):
+        row_set = self._make_one()
+        table_name = "table_name"
+        row_set.add_row_key("row_key3")
+        row_set.add_row_key("row_key1")
+        row_set.add_row_key(b"row_key3")
+        row_set.add_row_range(RowRange(b"row_key41", b"row_key49"))
+        row_set.add_row_range(RowRange(b"row_key21", b"row_key29"))
+        row_set.add_row_range(RowRange(b"row_key25", b"row_key35"))
+
+        request = _ReadRowsRequestPB(table_name=table_name)
+        row_set._update_message_request(request)
+
+        expected_request = _ReadRowsRequestPB(table_name=table_name)
+        expected_request.rows.row_keys.extend([b"row_key1", b"row_key3"])
+        expected_request.rows.row_ranges.add(
+            start_key_closed=b"row_key21", end_key_open=b"row_key35"
+        )
+        expected_request.rows.row_ranges.add(
+            start_key_closed=b"row_key41", end_key_open=b"row_key49"
+        )
+
+        self.assertEqual(request, expected_request)
+
+    def test__update_message_request_only_empty_ranges(self):
+        row_set = self._make_one()
+        table_name = "table_name"
+        row_range = RowRange(b"row_key9", b"row_key1")
+        row_set.add_row_range(row_range)
+
+        request = _ReadRowsRequestPB(table_name=table_name)
+        row_set._update_message_request(request)
+
+        expected_request = _ReadRowsRequestPB(table_name=table_name)
+        expected_request.rows.row_ranges.add(**row_range.get_range_kwargs())
+
+        self.assertEqual(request, expected_request)
+
+
+class Test__merge_row_ranges(unittest.TestCase):
+    @staticmethod
+    def _call_fut(row_ranges):
+        from google.cloud.bigtable.row_set import _merge_row_ranges
+
+        return _merge_row_ranges(row_ranges)
+
+    @staticmethod
+    def _make_row_range(**kwargs):
+        from google.cloud.bigtable_v2.proto import data_pb2
+
+        return data_pb2.RowRange(**kwargs)
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut([]), [])
+
+    def test_disjoint(self):
+        range1 = self._make_row_range(start_key_closed=b"a", end_key_open=b"b")
+        range2 = self._make_row_range(start_key_closed=b"c", end_key_open=b"d")
+        self.assertEqual(self._call_fut([range2, range1]), [range1, range2])
+
+    def test_overlapping(self):
+        range1 = self._make_row_range(start_key_closed=b"a", end_key_open=b"c")
+        range2 = self._make_row_range(start_key_open=b"b", end_key_closed=b"d")
+        range3 = self._make_row_range(start_key_closed=b"b", end_key_open=b"bb")
+        expected = self._make_row_range(start_key_closed=b"a", end_key_closed=b"d")
+        self.assertEqual(self._call_fut([range1, range2, range3]), [expected])
+
+    def test_adjacent(self):
+        range1 = self._make_row_range(start_key_closed=b"a", end_key_open=b"b")
+        range2 = self._make_row_range(start_key_closed=b"b", end_key_open=b"c")
+        expected = self._make_row_range(start_key_closed=b"a", end_key_open=b"c")
+        self.assertEqual(self._call_fut([range1, range2]), [expected])
+
+    def test_gap_on_excluded_key(self):
+        range1 = self._make_row_range(start_key_closed=b"a", end_key_open=b"b")
+        range2 = self._make_row_range(start_key_open=b"b", end_key_open=b"c")
+        self.assertEqual(self._call_fut([range1, range2]), [range1, range2])
+
+    def test_unbounded(self):
+        range1 = self._make_row_range(end_key_open=b"b")
+        range2 = self._make_row_range(start_key_closed=b"a")
+        range3 = self._make_row_range(start_key_closed=b"x", end_key_open=b"y")
+        expected = self._make_row_range()
+        self.assertEqual(self._call_fut([range1, range2, range3]), [expected])
+
+    def test_drops_empty_ranges(self):
+        range1 = self._make_row_range(start_key_closed=b"b", end_key_open=b"a")
+        range2 = self._make_row_range(start_key_open=b"c", end_key_closed=b"c")
+        range3 = self._make_row_range(start_key_closed=b"d", end_key_closed=b"d")
+        self.assertEqual(self._call_fut([range1, range2, range3]), [range3])
+
 
 class TestRowRange(unittest.TestCase):
     @staticmethod
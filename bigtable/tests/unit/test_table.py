@@ -76,6 +76,140 @@ class Test___mutate_rows_request(unittest.TestCase):
         self.assertEqual(result, expected_result)
 
 
+class Test__mutate_columns_requests(unittest.TestCase):
+    def _call_fut(self, *args, **kwargs):
+        from google.cloud.bigtable.table import _mutate_columns_requests
+
+        return list(_mutate_columns_requests(*args, **kwargs))
+
+    @staticmethod
+    def _direct_rows(row_keys, columns, timestamp=None):
+        from google.cloud.bigtable.row import DirectRow
+
+        rows = []
+        for index, row_key in enumerate(row_keys):
+            row = DirectRow(row_key)
+            for (column_family_id, column), values in columns.items():
+                row.set_cell(column_family_id, column, values[index], timestamp)
+            rows.append(row)
+        return rows
+
+    def test_same_as_direct_rows(self):
+        import collections
+        from google.cloud.bigtable.table import _mutate_rows_request
+
+        row_keys = [b"row_key_1", u"row_key_2", b"row_key_3"]
+        columns = collections.OrderedDict(
+            [
+                (("cf1", b"c1"), [b"a", b"", b"c" * 200]),
+                (("cf2", u"c2"), [1, -2, 3]),
+                (("cf2", b""), [b"x", b"y", b"z"]),
+            ]
+        )
+        rows = self._direct_rows(row_keys, columns)
+
+        requests = self._call_fut("table", row_keys, columns, app_profile_id="app")
+
+        self.assertEqual(len(requests), 1)
+        request_pb, num_bytes = requests[0]
+        expected = _mutate_rows_request("table", rows, app_profile_id="app")
+        self.assertEqual(request_pb, expected)
+        self.assertEqual(num_bytes, sum(row.get_mutations_size() for row in rows))
+
+    def test_w_timestamp(self):
+        import datetime
+        from google.cloud._helpers import UTC
+        from google.cloud.bigtable.table import _mutate_rows_request
+
+        timestamp = datetime.datetime(2019, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+        row_keys = [b"row_key_1", b"row_key_2"]
+        columns = {("cf1", b"c1"): [b"a", b"b"]}
+        rows = self._direct_rows(row_keys, columns, timestamp=timestamp)
+
+        ((request_pb, num_bytes),) = self._call_fut(
+            "table", row_keys, columns, timestamp=timestamp
+        )
+
+        self.assertEqual(request_pb, _mutate_rows_request("table", rows))
+        self.assertEqual(num_bytes, sum(row.get_mutations_size() for row in rows))
+
+    def test_split_on_bytes(self):
+        row_keys = [b"row_key_1", b"row_key_2", b"row_key_3"]
+        columns = {("cf1", b"c1"): [b"a" * 10, b"b" * 10, b"c" * 10]}
+        row_bytes = self._direct_rows(row_keys[:1], columns)[0].get_mutations_size()
+
+        requests = self._call_fut(
+            "table", row_keys, columns, max_request_bytes=2 * row_bytes
+        )
+
+        self.assertEqual(
+            [
+                [entry.row_key for entry in request_pb.entries]
+                for request_pb, _ in requests
+            ],
+            [[b"row_key_1", b"row_key_2"], [b"row_key_3"]],
+        )
+        self.assertEqual(
+            [num_bytes for _, num_bytes in requests], [2 * row_bytes, row_bytes]
+        )
+
+    def test_row_over_max_request_bytes(self):
+        row_keys = [b"row_key_1", b"row_key_2"]
+        columns = {("cf1", b"c1"): [b"a" * 10, b"b" * 10]}
+
+        requests = self._call_fut("table", row_keys, columns, max_request_bytes=1)
+
+        self.assertEqual(
+            [len(request_pb.entries) for request_pb, _ in requests], [1, 1]
+        )
+
+    @mock.patch("google.cloud.bigtable.table._MAX_BULK_MUTATIONS", new=4)
+    def test_split_on_mutations(self):
+        row_keys = [b"row_key_1", b"row_key_2", b"row_key_3"]
+        columns = {("cf1", b"c1"): [1, 2, 3], ("cf1", b"c2"): [4, 5, 6]}
+
+        requests = self._call_fut("table", row_keys, columns)
+
+        self.assertEqual(
+            [len(request_pb.entries) for request_pb, _ in requests], [2, 1]
+        )
+
+    @mock.patch("google.cloud.bigtable.table._MAX_BULK_MUTATIONS", new=1)
+    def test_too_many_mutations(self):
+        from google.cloud.bigtable.table import TooManyMutationsError
+
+        columns = {("cf1", b"c1"): [1], ("cf1", b"c2"): [2]}
+
+        with self.assertRaises(TooManyMutationsError):
+            self._call_fut("table", [b"row_key"], columns)
+
+    def test_wrong_number_of_values(self):
+        columns = {("cf1", b"c1"): [1, 2]}
+
+        with self.assertRaises(ValueError):
+            self._call_fut("table", [b"row_key"], columns)
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut("table", [], {("cf1", b"c1"): []}), [])
+        self.assertEqual(self._call_fut("table", [b"row_key"], {}), [])
+
+
+class Test__varint_size(unittest.TestCase):
+    def _call_fut(self, value):
+        from google.cloud.bigtable.table import _varint_size
+
+        return _varint_size(value)
+
+    def test_sizes(self):
+        self.assertEqual(self._call_fut(0), 1)
+        self.assertEqual(self._call_fut(127), 1)
+        self.assertEqual(self._call_fut(128), 2)
+        self.assertEqual(self._call_fut(16383), 2)
+        self.assertEqual(self._call_fut(16384), 3)
+        self.assertEqual(self._call_fut(2 ** 63 - 1), 9)
+        self.assertEqual(self._call_fut(-1), 10)
+
+
 class Test__check_row_table_name(unittest.TestCase):
     def _call_fut(self, table_name, row):
         from google.cloud.bigtable.table import _check_row_table_name
@@ -599,6 +733,35 @@ class TestTable(unittest.TestCase):
         with self.assertRaises(ValueError):
             self._read_row_helper(chunks, None)
 
+    def test_read_rows_bulk(self):
+        from google.cloud.bigtable.row_data import PartialRowData
+        from google.cloud.bigtable.row_set import RowSet
+
+        table = self._make_one(self.TABLE_ID, None)
+        row_1 = PartialRowData(b"row_key_1")
+        row_3 = PartialRowData(b"row_key_3")
+        table.read_rows = mock.Mock(return_value=iter([row_1, row_3]))
+        retry = mock.Mock()
+
+        rows = table.read_rows_bulk(
+            [b"row_key_3", u"row_key_2", b"row_key_1", b"row_key_3"], retry=retry
+        )
+
+        self.assertEqual(rows, [row_3, None, row_1, row_3])
+        expected_row_set = RowSet()
+        for row_key in [b"row_key_3", b"row_key_2", b"row_key_1"]:
+            expected_row_set.add_row_key(row_key)
+        table.read_rows.assert_called_once_with(
+            filter_=None, row_set=expected_row_set, retry=retry
+        )
+
+    def test_read_rows_bulk_empty(self):
+        table = self._make_one(self.TABLE_ID, None)
+        table.read_rows = mock.Mock()
+
+        self.assertEqual(table.read_rows_bulk([]), [])
+        table.read_rows.assert_not_called()
+
     def test_mutate_rows(self):
         from google.rpc.status_pb2 import Status
         from google.cloud.bigtable_admin_v2.gapic import bigtable_table_admin_client
@@ -627,6 +790,81 @@ class TestTable(unittest.TestCase):
 
         self.assertEqual(result, expected_result)
 
+    def test_mutate_columns(self):
+        from google.rpc.status_pb2 import Status
+        from google.cloud.bigtable_admin_v2.gapic import bigtable_table_admin_client
+
+        table_api = mock.create_autospec(
+            bigtable_table_admin_client.BigtableTableAdminClient
+        )
+        credentials = _make_credentials()
+        client = self._make_client(
+            project="project-id", credentials=credentials, admin=True
+        )
+        instance = client.instance(instance_id=self.INSTANCE_ID)
+        client._table_admin_client = table_api
+        table = self._make_one(self.TABLE_ID, instance, app_profile_id="app")
+
+        worker_class = mock.Mock(
+            side_effect=[
+                mock.Mock(return_value=[Status(code=0)]),
+                mock.Mock(return_value=[Status(code=1)]),
+            ]
+        )
+        with mock.patch(
+            "google.cloud.bigtable.table._RetryableMutateEntriesWorker",
+            new=worker_class,
+        ):
+            statuses = table.mutate_columns(
+                [b"row_key_1", b"row_key_2"],
+                {("cf1", b"c1"): [b"a", b"b"]},
+                max_request_bytes=1,
+            )
+
+        self.assertEqual([status.code for status in statuses], [0, 1])
+        self.assertEqual(worker_class.call_count, 2)
+        for call, row_key in zip(
+            worker_class.call_args_list, [b"row_key_1", b"row_key_2"]
+        ):
+            request_pb = call[0][1]
+            self.assertEqual(request_pb.table_name, table.name)
+            self.assertEqual(request_pb.app_profile_id, "app")
+            self.assertEqual([entry.row_key for entry in request_pb.entries], [row_key])
+
+    def test_mutate_columns_metrics(self):
+        from google.rpc.status_pb2 import Status
+        from google.cloud.bigtable import metrics
+        from google.cloud.bigtable.row import DirectRow
+
+        recorder = metrics.InMemoryMetrics()
+        client = self._make_client(
+            project="project-id", credentials=_make_credentials(), admin=True
+        )
+        instance = client.instance(instance_id=self.INSTANCE_ID)
+        table = self._make_one(self.TABLE_ID, instance, metrics=recorder)
+        row = DirectRow(b"row_key_1")
+        row.set_cell("cf1", b"c1", b"a")
+
+        worker = mock.Mock(return_value=[Status(code=0), Status(code=1)])
+        with mock.patch(
+            "google.cloud.bigtable.table._RetryableMutateEntriesWorker",
+            new=mock.Mock(return_value=worker),
+        ):
+            table.mutate_columns(
+                [b"row_key_1", b"row_key_2"], {("cf1", b"c1"): [b"a", b"b"]}
+            )
+
+        snapshot = recorder.snapshot()
+        self.assertEqual(
+            snapshot["counters"],
+            {
+                metrics.MUTATE_ROWS_ROWS: 2,
+                metrics.MUTATE_ROWS_BYTES: 2 * row.get_mutations_size(),
+                metrics.MUTATE_ROWS_FAILED_ROWS: 1,
+            },
+        )
+        self.assertEqual(snapshot["latencies"][metrics.MUTATE_ROWS_LATENCY]["count"], 1)
+
     def test_read_rows(self):
         from google.cloud._testing import _Monkey
         from google.cloud.bigtable.row_data import PartialRowsData
@@ -873,6 +1111,115 @@ class TestTable(unittest.TestCase):
         self.assertEqual(rows[1].row_key, self.ROW_KEY_2)
         self.assertEqual(rows[2].row_key, self.ROW_KEY_3)
 
+    def _make_parallel_table(self, row_keys, sample_keys, failing_shard=None):
+        from google.cloud.bigtable.row_data import PartialRowData
+
+        credentials = _make_credentials()
+        client = self._make_client(
+            project="project-id", credentials=credentials, admin=True
+        )
+        instance = client.instance(instance_id=self.INSTANCE_ID)
+        table = self._make_one(self.TABLE_ID, instance)
+
+        samples = [mock.Mock(row_key=key, spec=["row_key"]) for key in sample_keys]
+        table.sample_row_keys = mock.Mock(return_value=samples)
+
+        def read_rows(filter_=None, row_set=None, retry=None):
+            if failing_shard is not None and failing_shard in row_set.row_keys:
+                raise DeadlineExceeded("Failed to read from server")
+            stream = _ShardRows(
+                PartialRowData(key) for key in row_keys if _in_row_set(key, row_set)
+            )
+            table.read_rows.streams.append(stream)
+            return stream
+
+        table.read_rows = mock.Mock(side_effect=read_rows)
+        table.read_rows.streams = []
+        return table
+
+    def test_read_rows_parallel(self):
+        row_keys = [b"a", b"b", b"c", b"d", b"e", b"f"]
+        table = self._make_parallel_table(row_keys, [b"b", b"d", b""])
+
+        rows = list(table.read_rows_parallel(max_workers=2))
+
+        self.assertEqual(sorted(row.row_key for row in rows), row_keys)
+        self.assertEqual(table.read_rows.call_count, 3)
+
+    def test_read_rows_parallel_ordered(self):
+        row_keys = [b"a", b"b", b"c", b"d", b"e", b"f"]
+        table = self._make_parallel_table(row_keys, [b"b", b"c", b"e"])
+
+        rows = table.read_rows_parallel(ordered=True, max_workers=4, buffer_size=1)
+
+        self.assertEqual([row.row_key for row in rows], row_keys)
+        self.assertEqual(table.read_rows.call_count, 4)
+
+    def test_read_rows_parallel_with_row_set(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_keys = [b"a", b"b", b"c", b"d", b"e", b"f"]
+        table = self._make_parallel_table(row_keys, [b"b", b"d"])
+        row_set = RowSet()
+        row_set.add_row_key(b"a")
+        row_set.add_row_range_from_keys(start_key=b"c", end_key=b"e")
+
+        rows = table.read_rows_parallel(row_set=row_set, ordered=True)
+
+        self.assertEqual([row.row_key for row in rows], [b"a", b"c", b"d"])
+        self.assertEqual(table.read_rows.call_count, 3)
+
+    def test_read_rows_parallel_splits_row_keys(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        patch = mock.patch("google.cloud.bigtable.table._MAX_SHARD_ROW_KEYS", new=2)
+        patch.start()
+        self.addCleanup(patch.stop)
+        row_keys = [b"a", b"b", b"c", b"d", b"e", b"f"]
+        table = self._make_parallel_table(row_keys, [b"c"])
+        row_set = RowSet()
+        for row_key in [b"e", b"a", b"b", b"d", b"c"]:
+            row_set.add_row_key(row_key)
+
+        rows = table.read_rows_parallel(row_set=row_set, ordered=True)
+
+        self.assertEqual([row.row_key for row in rows], row_keys[:5])
+        self.assertEqual(table.read_rows.call_count, 3)
+
+    def test_read_rows_parallel_error(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        table = self._make_parallel_table([b"a", b"c"], [b"b"], failing_shard=b"c")
+        row_set = RowSet()
+        row_set.add_row_key(b"a")
+        row_set.add_row_key(b"c")
+
+        with self.assertRaises(DeadlineExceeded):
+            list(table.read_rows_parallel(row_set=row_set, ordered=True))
+
+    def test_read_rows_parallel_stops_readers(self):
+        from concurrent import futures
+
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        patch = mock.patch(
+            "google.cloud.bigtable.table.futures.ThreadPoolExecutor",
+            return_value=executor,
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+        row_keys = [b"a", b"b", b"c", b"d"]
+        table = self._make_parallel_table(row_keys, [])
+
+        rows = table.read_rows_parallel(buffer_size=1)
+        self.assertEqual(next(rows).row_key, b"a")
+        # Closing the generator releases the reader blocked on the buffer,
+        # which cancels its stream.
+        rows.close()
+
+        executor.shutdown(wait=True)
+        (stream,) = table.read_rows.streams
+        self.assertTrue(stream.cancelled)
+
     def test_sample_row_keys(self):
         from google.cloud.bigtable_v2.gapic import bigtable_client
         from google.cloud.bigtable_admin_v2.gapic import bigtable_table_admin_client
@@ -1018,6 +1365,13 @@ class TestTable(unittest.TestCase):
         self.assertEqual(mutation_batcher.flush_count, flush_count)
         self.assertEqual(mutation_batcher.max_row_bytes, max_row_bytes)
 
+    def test_row_lookup_batcher_factory(self):
+        table = self._make_one(self.TABLE_ID, None)
+        with table.row_lookup_batcher(max_batch_size=10, cache_size=5) as batcher:
+            self.assertIs(batcher.table, table)
+            self.assertEqual(batcher.max_batch_size, 10)
+            self.assertEqual(batcher._cache.max_size, 5)
+
 
 class Test__RetryableMutateRowsWorker(unittest.TestCase):
     from grpc import StatusCode
@@ -1205,6 +1559,99 @@ class Test__RetryableMutateRowsWorker(unittest.TestCase):
         )
         self.assertEqual(result, expected_result)
 
+    def test_callable_retry_entries(self):
+        from google.cloud.bigtable.table import DEFAULT_RETRY
+        from google.cloud.bigtable.table import _mutate_columns_requests
+        from google.cloud.bigtable.table import _RetryableMutateEntriesWorker
+        from google.cloud.bigtable_v2.gapic import bigtable_client
+        from google.cloud.bigtable_admin_v2.gapic import bigtable_table_admin_client
+
+        data_api = bigtable_client.BigtableClient(mock.Mock())
+        table_api = bigtable_table_admin_client.BigtableTableAdminClient(mock.Mock())
+        credentials = _make_credentials()
+        client = self._make_client(
+            project="project-id", credentials=credentials, admin=True
+        )
+        client._table_data_client = data_api
+        client._table_admin_client = table_api
+        instance = client.instance(instance_id=self.INSTANCE_ID)
+        table = self._make_table(self.TABLE_ID, instance, app_profile_id="app")
+
+        ((request_pb, _),) = _mutate_columns_requests(
+            table.name,
+            [b"row_key", b"row_key_2", b"row_key_3"],
+            {("cf", b"col"): [b"value1", b"value2", b"value3"]},
+            app_profile_id="app",
+        )
+
+        response_1 = self._make_responses(
+            [self.SUCCESS, self.RETRYABLE_1, self.NON_RETRYABLE]
+        )
+        response_2 = self._make_responses([self.SUCCESS])
+        mutate_rows = mock.Mock(side_effect=[[response_1], [response_2]])
+        client._table_data_client._inner_api_calls["mutate_rows"] = mutate_rows
+
+        retry = DEFAULT_RETRY.with_delay(initial=0.1)
+        worker = _RetryableMutateEntriesWorker(client, request_pb)
+        statuses = worker(retry=retry)
+
+        result = [status.code for status in statuses]
+        expected_result = [self.SUCCESS, self.SUCCESS, self.NON_RETRYABLE]
+        self.assertEqual(result, expected_result)
+
+        self.assertEqual(mutate_rows.call_count, 2)
+        self.assertIs(mutate_rows.call_args_list[0][0][0], request_pb)
+        retry_request_pb = mutate_rows.call_args_list[1][0][0]
+        self.assertEqual(retry_request_pb.table_name, table.name)
+        self.assertEqual(retry_request_pb.app_profile_id, "app")
+        self.assertEqual(list(retry_request_pb.entries), [request_pb.entries[1]])
+
+    def test_callable_retry_metrics(self):
+        from google.cloud.bigtable import metrics
+        from google.cloud.bigtable.row import DirectRow
+        from google.cloud.bigtable.table import DEFAULT_RETRY
+        from google.cloud.bigtable_v2.gapic import bigtable_client
+        from google.cloud.bigtable_admin_v2.gapic import bigtable_table_admin_client
+
+        data_api = bigtable_client.BigtableClient(mock.Mock())
+        table_api = bigtable_table_admin_client.BigtableTableAdminClient(mock.Mock())
+        credentials = _make_credentials()
+        client = self._make_client(
+            project="project-id", credentials=credentials, admin=True
+        )
+        client._table_data_client = data_api
+        client._table_admin_client = table_api
+        instance = client.instance(instance_id=self.INSTANCE_ID)
+        recorder = metrics.InMemoryMetrics()
+        table = self._make_table(self.TABLE_ID, instance, metrics=recorder)
+
+        row_1 = DirectRow(row_key=b"row_key", table=table)
+        row_1.set_cell("cf", b"col", b"value1")
+        row_2 = DirectRow(row_key=b"row_key_2", table=table)
+        row_2.set_cell("cf", b"col", b"value2")
+        num_bytes = row_1.get_mutations_size() + row_2.get_mutations_size()
+
+        response_1 = self._make_responses([self.SUCCESS, self.RETRYABLE_1])
+        response_2 = self._make_responses([self.NON_RETRYABLE])
+        client._table_data_client._inner_api_calls["mutate_rows"] = mock.Mock(
+            side_effect=[[response_1], [response_2]]
+        )
+
+        retry = DEFAULT_RETRY.with_delay(initial=0.1)
+        table.mutate_rows([row_1, row_2], retry=retry)
+
+        snapshot = recorder.snapshot()
+        self.assertEqual(
+            snapshot["counters"],
+            {
+                metrics.MUTATE_ROWS_ROWS: 2,
+                metrics.MUTATE_ROWS_BYTES: num_bytes,
+                metrics.MUTATE_ROWS_FAILED_ROWS: 1,
+                metrics.MUTATE_ROWS_RETRIES: 1,
+            },
+        )
+        self.assertEqual(snapshot["latencies"][metrics.MUTATE_ROWS_LATENCY]["count"], 1)
+
     def test_do_mutate_retryable_rows_empty_rows(self):
         from google.cloud.bigtable_admin_v2.gapic import bigtable_table_admin_client
 
@@ -1513,6 +1960,89 @@ class Test__RetryableMutateRowsWorker(unittest.TestCase):
             worker._do_mutate_retryable_rows()
 
 
+class Test__shard_row_set(unittest.TestCase):
+    def _call_fut(self, row_set, boundaries):
+        from google.cloud.bigtable.table import _shard_row_set
+
+        return _shard_row_set(row_set, boundaries)
+
+    @staticmethod
+    def _ranges(shard):
+        return [row_range.get_range_kwargs() for row_range in shard.row_ranges]
+
+    def test_whole_table(self):
+        shards = self._call_fut(None, [b"b", b"d"])
+
+        self.assertEqual(
+            [self._ranges(shard) for shard in shards],
+            [
+                [{"end_key_open": b"b"}],
+                [{"start_key_closed": b"b", "end_key_open": b"d"}],
+                [{"start_key_closed": b"d"}],
+            ],
+        )
+
+    def test_no_boundaries(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        row_set.add_row_key(b"a")
+
+        shards = self._call_fut(row_set, [])
+
+        self.assertEqual(shards, [row_set])
+
+    def test_row_keys(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        for key in (b"a", b"b", b"c", "e"):
+            row_set.add_row_key(key)
+
+        shards = self._call_fut(row_set, [b"b", b"d"])
+
+        self.assertEqual(
+            [shard.row_keys for shard in shards], [[b"a"], [b"b", b"c"], [b"e"]]
+        )
+
+    def test_row_ranges(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        row_set.add_row_range_from_keys(
+            start_key=b"a", end_key=b"d", start_inclusive=False, end_inclusive=True
+        )
+        row_set.add_row_range_from_keys(start_key=b"e")
+
+        shards = self._call_fut(row_set, [b"b", b"d", b"f"])
+
+        self.assertEqual(
+            [self._ranges(shard) for shard in shards],
+            [
+                [{"start_key_open": b"a", "end_key_open": b"b"}],
+                [{"start_key_closed": b"b", "end_key_open": b"d"}],
+                [
+                    {"start_key_closed": b"d", "end_key_closed": b"d"},
+                    {"start_key_closed": b"e", "end_key_open": b"f"},
+                ],
+                [{"start_key_closed": b"f"}],
+            ],
+        )
+
+    def test_row_range_ending_at_boundary(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        row_set = RowSet()
+        row_set.add_row_range_from_keys(start_key=b"a", end_key=b"b")
+
+        shards = self._call_fut(row_set, [b"b"])
+
+        self.assertEqual(
+            [self._ranges(shard) for shard in shards],
+            [[{"start_key_closed": b"a", "end_key_open": b"b"}]],
+        )
+
+
 class Test__create_row_request(unittest.TestCase):
     def _call_fut(
         self,
@@ -1627,6 +2157,30 @@ class Test__create_row_request(unittest.TestCase):
         self.assertEqual(result, expected_result)
 
 
+class _ShardRows(list):
+    cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def _in_row_set(row_key, row_set):
+    if row_key in row_set.row_keys:
+        return True
+    for row_range in row_set.row_ranges:
+        start, end = row_range.start_key, row_range.end_key
+        if start is not None and (
+            row_key < start or (row_key == start and not row_range.start_inclusive)
+        ):
+            continue
+        if end is not None and (
+            row_key > end or (row_key == end and not row_range.end_inclusive)
+        ):
+            continue
+        return True
+    return False
+
+
 def _ReadRowsRequestPB(*args, **kw):
     from google.cloud.bigtable_v2.proto import bigtable_pb2 as messages_v2_pb2
 
@@ -16,6 +16,7 @@
 
 
 from google.cloud.firestore_v1beta1 import __version__
+from google.cloud.firestore_v1beta1 import BulkWriter
 from google.cloud.firestore_v1beta1 import Client
 from google.cloud.firestore_v1beta1 import CollectionReference
 from google.cloud.firestore_v1beta1 import DELETE_FIELD
@@ -38,6 +39,7 @@ from google.cloud.firestore_v1beta1 import WriteOption
 
 __all__ = [
     "__version__",
+    "BulkWriter",
     "Client",
     "CollectionReference",
     "DELETE_FIELD",
@@ -25,6 +25,7 @@ from google.cloud.firestore_v1beta1._helpers import LastUpdateOption
 from google.cloud.firestore_v1beta1._helpers import ReadAfterWriteError
 from google.cloud.firestore_v1beta1._helpers import WriteOption
 from google.cloud.firestore_v1beta1.batch import WriteBatch
+from google.cloud.firestore_v1beta1.bulk_writer import BulkWriter
 from google.cloud.firestore_v1beta1.client import Client
 from google.cloud.firestore_v1beta1.collection import CollectionReference
 from google.cloud.firestore_v1beta1.transforms import ArrayRemove
@@ -44,6 +45,7 @@ __all__ = [
     "__version__",
     "ArrayRemove",
     "ArrayUnion",
+    "BulkWriter",
     "Client",
     "CollectionReference",
     "DELETE_FIELD",
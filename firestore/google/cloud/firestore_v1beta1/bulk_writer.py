@@ -0,0 +1,461 @@
+# Copyright 2019 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent bulk writes of documents to the Google Cloud Firestore API."""
+
+import collections
+import logging
+import threading
+import time
+
+from concurrent import futures
+
+from google.api_core import exceptions
+from google.cloud.firestore_v1beta1.batch import WriteBatch
+from google.cloud.firestore_v1beta1.document import _first_write_result
+from google.cloud.firestore_v1beta1.transaction import _INITIAL_SLEEP
+from google.cloud.firestore_v1beta1.transaction import _MAX_SLEEP
+from google.cloud.firestore_v1beta1.transaction import _sleep
+
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 500
+"""int: The max number of writes in a single commit."""
+MAX_IN_FLIGHT_COMMITS = 10
+"""int: The default max number of concurrent commits."""
+MAX_RETRIES = 10
+"""int: The default max number of retries of a failed write."""
+INITIAL_OPS_PER_SECOND = 500
+"""int: The default rate of writes at which a writer starts."""
+RAMP_UP_MULTIPLIER = 1.5
+"""float: The factor by which the rate of writes grows every period."""
+RAMP_UP_PERIOD = 300.0
+"""float: The seconds between two increases of the rate of writes."""
+
+_RETRYABLE_ERRORS = (
+    exceptions.Aborted,
+    exceptions.DeadlineExceeded,
+    exceptions.InternalServerError,
+    exceptions.ResourceExhausted,
+    exceptions.ServiceUnavailable,
+    exceptions.Unknown,
+)
+
+_BulkWriteOperation = collections.namedtuple(
+    "_BulkWriteOperation", ["write_pbs", "future"]
+)
+
+
+class _RateLimiter(object):
+    """Token bucket limiting the rate of writes, ramping it up over time.
+
+    The rate starts at ``initial_rate`` writes per second and is multiplied
+    by ``multiplier`` every ``period`` seconds (the "500/50/5" rule), up to
+    ``max_rate``. Up to one second's worth of writes may be sent at once.
+
+    Args:
+        initial_rate (int): The initial number of writes per second.
+        max_rate (Optional[int]): The max number of writes per second.
+            Defaults to no limit.
+        multiplier (Optional[float]): The factor by which the rate grows.
+        period (Optional[float]): The seconds between two rate increases.
+    """
+
+    def __init__(
+        self,
+        initial_rate,
+        max_rate=None,
+        multiplier=RAMP_UP_MULTIPLIER,
+        period=RAMP_UP_PERIOD,
+    ):
+        self._initial_rate = initial_rate
+        self._max_rate = max_rate
+        self._multiplier = multiplier
+        self._period = period
+        self._lock = threading.Lock()
+        self._start = None
+        self._last = None
+        self._available = float(initial_rate)
+
+    def rate(self, now):
+        """Return the number of writes allowed per second at a given time.
+
+        Args:
+            now (float): The current time, in seconds since the epoch.
+
+        Returns:
+            float: The number of writes per second.
+        """
+        if self._start is None:
+            return float(self._initial_rate)
+        periods = int((now - self._start) // self._period)
+        rate = self._initial_rate * self._multiplier ** periods
+        if self._max_rate is not None:
+            rate = min(rate, self._max_rate)
+        return float(rate)
+
+    def acquire(self, count, now):
+        """Try to take the tokens for a number of writes.
+
+        Args:
+            count (int): The number of writes to send.
+            now (float): The current time, in seconds since the epoch.
+
+        Returns:
+            float: Zero if the writes may be sent, otherwise the seconds to
+            wait before trying again.
+        """
+        with self._lock:
+            if self._start is None:
+                self._start = self._last = now
+            rate = self.rate(now)
+            self._available = min(rate, self._available + (now - self._last) * rate)
+            self._last = now
+
+            # Batches larger than the rate are sent once the bucket is full.
+            needed = min(count, rate)
+            if self._available >= needed:
+                self._available -= count
+                return 0.0
+            return (needed - self._available) / rate
+
+
+class BulkWriter(object):
+    """Write many documents, with concurrent commits.
+
+    Writes are accumulated in memory and split into batches of up to
+    ``max_batch_size`` writes, each committed by a pool of up to
+    ``max_in_flight`` threads. The rate of writes sent starts at
+    ``initial_ops_per_second`` and grows by 50% every five minutes, so that
+    Firestore has time to scale up for the traffic.
+
+    Each write returns a :class:`~concurrent.futures.Future` resolved with
+    its :class:`~google.cloud.firestore_v1beta1.types.WriteResult`. Since a
+    commit is atomic, a single failing write fails its whole batch: the
+    writes of a failed batch are then retried individually, with
+    exponential backoff when the error is transient, so that only the
+    futures of the writes which cannot be applied fail.
+
+    Writes may be added from several threads. :meth:`create` and the other
+    write methods only block when ``max_in_flight`` commits are already in
+    progress or the rate limit is reached, while :meth:`flush` and
+    :meth:`close` wait for every write sent so far. Since batches are
+    committed concurrently, writes to the same document in different
+    batches may be applied out of order; use ``max_in_flight=1`` if the
+    order matters.
+
+    Args:
+        client (~.firestore_v1beta1.client.Client): The client that
+            created this writer.
+        max_batch_size (Optional[int]): The max number of writes per
+            commit. Defaults to :data:`MAX_BATCH_SIZE` (500).
+        max_in_flight (Optional[int]): The max number of concurrent
+            commits. Defaults to :data:`MAX_IN_FLIGHT_COMMITS` (10).
+        max_retries (Optional[int]): The max number of retries of a write
+            after transient errors. Defaults to :data:`MAX_RETRIES` (10).
+        initial_ops_per_second (Optional[int]): The initial rate of writes.
+            Defaults to :data:`INITIAL_OPS_PER_SECOND` (500).
+        max_ops_per_second (Optional[int]): The max rate of writes.
+            Defaults to no limit.
+
+    Raises:
+        ValueError: If ``max_batch_size`` is not between 1 and 500.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_batch_size=MAX_BATCH_SIZE,
+        max_in_flight=MAX_IN_FLIGHT_COMMITS,
+        max_retries=MAX_RETRIES,
+        initial_ops_per_second=INITIAL_OPS_PER_SECOND,
+        max_ops_per_second=None,
+    ):
+        if not 0 < max_batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(
+                "max_batch_size must be between 1 and %d." % (MAX_BATCH_SIZE,)
+            )
+
+        self._client = client
+        self.max_batch_size = max_batch_size
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self._rate_limiter = _RateLimiter(initial_ops_per_second, max_ops_per_second)
+
+        self._operations = []
+        self._batch_size = 0
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_in_flight)
+
+        self._start_time = None
+        self._writes_succeeded = 0
+        self._writes_failed = 0
+        self._commits = 0
+        self._retries = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def create(self, reference, document_data):
+        """Add a write creating a document.
+
+        See :meth:`~.firestore_v1beta1.batch.WriteBatch.create` for more
+        information on the arguments.
+
+        Returns:
+            concurrent.futures.Future: Resolved with the write result.
+        """
+        batch = WriteBatch(self._client)
+        batch.create(reference, document_data)
+        return self._add(batch._write_pbs)
+
+    def set(self, reference, document_data, merge=False):
+        """Add a write replacing a document.
+
+        See :meth:`~.firestore_v1beta1.batch.WriteBatch.set` for more
+        information on the arguments.
+
+        Returns:
+            concurrent.futures.Future: Resolved with the write result.
+        """
+        batch = WriteBatch(self._client)
+        batch.set(reference, document_data, merge=merge)
+        return self._add(batch._write_pbs)
+
+    def update(self, reference, field_updates, option=None):
+        """Add a write updating a document.
+
+        See :meth:`~.firestore_v1beta1.batch.WriteBatch.update` for more
+        information on the arguments.
+
+        Returns:
+            concurrent.futures.Future: Resolved with the write result.
+        """
+        batch = WriteBatch(self._client)
+        batch.update(reference, field_updates, option=option)
+        return self._add(batch._write_pbs)
+
+    def delete(self, reference, option=None):
+        """Add a write deleting a document.
+
+        See :meth:`~.firestore_v1beta1.batch.WriteBatch.delete` for more
+        information on the arguments.
+
+        Returns:
+            concurrent.futures.Future: Resolved with the write result.
+        """
+        batch = WriteBatch(self._client)
+        batch.delete(reference, option=option)
+        return self._add(batch._write_pbs)
+
+    def _add(self, write_pbs):
+        """Add the protobufs of a write to the current batch.
+
+        The protobufs of a write (e.g. an update and its transform) are
+        always committed together.
+        """
+        operation = _BulkWriteOperation(write_pbs, futures.Future())
+        with self._condition:
+            if self._start_time is None:
+                self._start_time = time.time()
+            if self._batch_size + len(write_pbs) > self.max_batch_size:
+                self._send_batch()
+            self._operations.append(operation)
+            self._batch_size += len(write_pbs)
+            if self._batch_size >= self.max_batch_size:
+                self._send_batch()
+        return operation.future
+
+    def _send_batch(self):
+        """Send the current batch in the background.
+
+        Must be called with ``_condition`` held. Blocks while
+        ``max_in_flight`` batches are being committed, or while the rate
+        limit is reached.
+        """
+        if not self._operations:
+            return
+
+        operations, count = self._operations, self._batch_size
+        self._operations = []
+        self._batch_size = 0
+
+        while self._in_flight >= self.max_in_flight:
+            self._condition.wait()
+        delay = self._rate_limiter.acquire(count, time.time())
+        while delay:
+            self._condition.wait(delay)
+            delay = self._rate_limiter.acquire(count, time.time())
+        self._in_flight += 1
+        self._executor.submit(self._commit_batch, operations)
+
+    def _commit(self, write_pbs):
+        """Commit write protobufs, returning their write results."""
+        commit_response = self._client._firestore_api.commit(
+            self._client._database_string,
+            write_pbs,
+            transaction=None,
+            metadata=self._client._rpc_metadata,
+        )
+        return list(commit_response.write_results)
+
+    def _commit_batch(self, operations):
+        """Commit a batch of writes, retrying them one by one on failure."""
+        try:
+            operations = [
+                operation
+                for operation in operations
+                if operation.future.set_running_or_notify_cancel()
+            ]
+            if not operations:
+                return
+            write_pbs = [
+                write_pb for operation in operations for write_pb in operation.write_pbs
+            ]
+            try:
+                write_results = self._commit(write_pbs)
+            except exceptions.GoogleAPICallError as exc:
+                _LOGGER.debug(
+                    "Error while committing %d writes: %s", len(write_pbs), exc
+                )
+                if len(operations) == 1:
+                    self._retry(operations[0], exc)
+                else:
+                    for operation in operations:
+                        self._retry(operation)
+            else:
+                with self._condition:
+                    self._commits += 1
+                offset = 0
+                for operation in operations:
+                    end = offset + len(operation.write_pbs)
+                    self._succeed(operation, write_results[offset:end])
+                    offset = end
+        except Exception as exc:
+            for operation in operations:
+                if not operation.future.done():
+                    self._fail(operation, exc)
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _retry(self, operation, exc=None):
+        """Commit a write on its own, until it succeeds or fails for good.
+
+        Args:
+            operation (_BulkWriteOperation): The write to commit.
+            exc (Optional[google.api_core.exceptions.GoogleAPICallError]):
+                The error of the write's last commit, if it was committed
+                on its own. Writes of failed batches are committed once
+                more without waiting, to find out whether they failed.
+        """
+        attempts = 0
+        current_sleep = _INITIAL_SLEEP
+        while True:
+            if exc is not None:
+                if attempts >= self.max_retries or not isinstance(
+                    exc, _RETRYABLE_ERRORS
+                ):
+                    self._fail(operation, exc)
+                    return
+                if isinstance(exc, exceptions.ResourceExhausted):
+                    current_sleep = _MAX_SLEEP
+                current_sleep = _sleep(current_sleep)
+                attempts += 1
+
+            with self._condition:
+                self._retries += 1
+            delay = self._rate_limiter.acquire(len(operation.write_pbs), time.time())
+            while delay:
+                time.sleep(delay)
+                delay = self._rate_limiter.acquire(
+                    len(operation.write_pbs), time.time()
+                )
+
+            try:
+                write_results = self._commit(operation.write_pbs)
+            except exceptions.GoogleAPICallError as retry_exc:
+                exc = retry_exc
+            else:
+                with self._condition:
+                    self._commits += 1
+                self._succeed(operation, write_results)
+                return
+
+    def _succeed(self, operation, write_results):
+        with self._condition:
+            self._writes_succeeded += 1
+        operation.future.set_result(_first_write_result(write_results))
+
+    def _fail(self, operation, exc):
+        with self._condition:
+            self._writes_failed += 1
+        operation.future.set_exception(exc)
+
+    def flush(self):
+        """Send the current batch and wait for all the batches in flight.
+
+        Errors are reported by the futures of the failed writes.
+        """
+        with self._condition:
+            self._send_batch()
+            while self._in_flight:
+                self._condition.wait()
+
+    def close(self):
+        """Flush the remaining writes and release the background threads.
+
+        The writer must not be used after it is closed.
+        """
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+
+    def stats(self):
+        """Return the throughput of the writer so far.
+
+        The rates are computed from the first write.
+
+        Returns:
+            dict: The numbers of writes succeeded, failed and not yet sent,
+            of commits, of retried writes and of commits in flight, the
+            current limit on writes per second, and the writes per second
+            succeeded so far.
+        """
+        with self._condition:
+            now = time.time()
+            if self._start_time is None:
+                seconds = 0.0
+            else:
+                seconds = now - self._start_time
+            return {
+                "writes_succeeded": self._writes_succeeded,
+                "writes_failed": self._writes_failed,
+                "writes_pending": len(self._operations),
+                "commits": self._commits,
+                "retries": self._retries,
+                "in_flight": self._in_flight,
+                "ops_per_second_limit": self._rate_limiter.rate(now),
+                "seconds": seconds,
+                "writes_per_second": (
+                    self._writes_succeeded / seconds if seconds else 0.0
+                ),
+            }
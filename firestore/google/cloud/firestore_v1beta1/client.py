@@ -28,6 +28,7 @@ from google.cloud.client import ClientWithProject
 from google.cloud.firestore_v1beta1 import _helpers
 from google.cloud.firestore_v1beta1 import types
 from google.cloud.firestore_v1beta1.batch import WriteBatch
+from google.cloud.firestore_v1beta1.bulk_writer import BulkWriter
 from google.cloud.firestore_v1beta1.collection import CollectionReference
 from google.cloud.firestore_v1beta1.document import DocumentReference
 from google.cloud.firestore_v1beta1.document import DocumentSnapshot
@@ -363,6 +364,24 @@ class Client(ClientWithProject):
         """
         return WriteBatch(self)
 
+    def bulk_writer(self, **kwargs):
+        """Get a bulk writer that uses this client.
+
+        See :class:`~.firestore_v1beta1.bulk_writer.BulkWriter` for
+        more information on bulk writes and the constructor arguments.
+
+        Args:
+            kwargs (Dict[str, Any]): The keyword arguments (other than
+                ``client``) to pass along to the
+                :class:`~.firestore_v1beta1.bulk_writer.BulkWriter`
+                constructor.
+
+        Returns:
+            ~.firestore_v1beta1.bulk_writer.BulkWriter: A writer sending
+            many document changes in concurrent batches.
+        """
+        return BulkWriter(self, **kwargs)
+
     def transaction(self, **kwargs):
         """Get a transaction that uses this client.
 
@@ -68,47 +68,178 @@ _RETRYABLE_STREAM_ERRORS = (
 DocTreeEntry = collections.namedtuple("DocTreeEntry", ["value", "index"])
 
 
+def _natural_order(key1, key2):
+    return (key1 > key2) - (key1 < key2)
+
+
+class _DocTreeNode(object):
+    """An immutable node of a :class:`WatchDocTree`."""
+
+    __slots__ = ("key", "value", "left", "right", "height", "size")
+
+    def __init__(self, key, value, left, right):
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+        self.height = 1 + max(_height(left), _height(right))
+        self.size = 1 + _size(left) + _size(right)
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _rotate_left(key, value, left, right):
+    return _DocTreeNode(
+        right.key, right.value, _DocTreeNode(key, value, left, right.left), right.right
+    )
+
+
+def _rotate_right(key, value, left, right):
+    return _DocTreeNode(
+        left.key, left.value, left.left, _DocTreeNode(key, value, left.right, right)
+    )
+
+
+def _balance(key, value, left, right):
+    """Build a node, rotating it if its subtrees' heights differ by two."""
+    if _height(left) > _height(right) + 1:
+        if _height(left.left) < _height(left.right):
+            left = _rotate_left(left.key, left.value, left.left, left.right)
+        return _rotate_right(key, value, left, right)
+    if _height(right) > _height(left) + 1:
+        if _height(right.right) < _height(right.left):
+            right = _rotate_right(right.key, right.value, right.left, right.right)
+        return _rotate_left(key, value, left, right)
+    return _DocTreeNode(key, value, left, right)
+
+
+def _insert(node, key, value, comparator):
+    if node is None:
+        return _DocTreeNode(key, value, None, None)
+    comp = comparator(key, node.key)
+    if comp < 0:
+        left = _insert(node.left, key, value, comparator)
+        return _balance(node.key, node.value, left, node.right)
+    if comp > 0:
+        right = _insert(node.right, key, value, comparator)
+        return _balance(node.key, node.value, node.left, right)
+    return _DocTreeNode(key, value, node.left, node.right)
+
+
+def _remove_min(node):
+    """Return the leftmost node of a tree, and the tree without it."""
+    if node.left is None:
+        return node, node.right
+    minimum, left = _remove_min(node.left)
+    return minimum, _balance(node.key, node.value, left, node.right)
+
+
+def _remove(node, key, comparator):
+    if node is None:
+        raise KeyError(key)
+    comp = comparator(key, node.key)
+    if comp < 0:
+        left = _remove(node.left, key, comparator)
+        return _balance(node.key, node.value, left, node.right)
+    if comp > 0:
+        right = _remove(node.right, key, comparator)
+        return _balance(node.key, node.value, node.left, right)
+    if node.left is None:
+        return node.right
+    if node.right is None:
+        return node.left
+    successor, right = _remove_min(node.right)
+    return _balance(successor.key, successor.value, node.left, right)
+
+
 class WatchDocTree(object):
-    # TODO: Currently this uses a dict. Other implementations us an rbtree.
-    # The performance of this implementation should be investigated and may
-    # require modifying the underlying datastructure to a rbtree.
-    def __init__(self):
-        self._dict = {}
-        self._index = 0
+    """A persistent sorted map of the documents of a watch.
+
+    The tree is an AVL tree ordered by ``comparator``. It is never modified:
+    :meth:`insert` and :meth:`remove` return a new tree sharing all but
+    ``O(log n)`` of its nodes with the original one, so that the documents
+    of the last snapshot stay available while computing the next one.
+    Each node tracks the size of its subtree, so that :meth:`find` also
+    returns the index of a document in the snapshot in ``O(log n)``.
+
+    Args:
+        comparator (Optional[Callable[[Any, Any], int]]): Orders the keys
+            of the tree, ``cmp``-style. Defaults to the natural ordering.
+    """
+
+    def __init__(self, comparator=None):
+        if comparator is None:
+            comparator = _natural_order
+        self._comparator = comparator
+        self._root = None
 
-    def keys(self):
-        return list(self._dict.keys())
+    def _with_root(self, root):
+        tree = WatchDocTree(self._comparator)
+        tree._root = root
+        return tree
 
-    def _copy(self):
-        wdt = WatchDocTree()
-        wdt._dict = self._dict.copy()
-        wdt._index = self._index
-        self = wdt
-        return self
+    def keys(self):
+        return list(self)
 
     def insert(self, key, value):
-        self = self._copy()
-        self._dict[key] = DocTreeEntry(value, self._index)
-        self._index += 1
-        return self
+        return self._with_root(_insert(self._root, key, value, self._comparator))
 
     def find(self, key):
-        return self._dict[key]
+        """Find a key in the tree.
+
+        Args:
+            key (Any): The key to look for.
+
+        Returns:
+            DocTreeEntry: The value stored with the key, and the index of
+            the key in the tree.
+
+        Raises:
+            KeyError: If the key is not in the tree.
+        """
+        node = self._root
+        index = 0
+        while node is not None:
+            comp = self._comparator(key, node.key)
+            if comp < 0:
+                node = node.left
+            elif comp > 0:
+                index += _size(node.left) + 1
+                node = node.right
+            else:
+                return DocTreeEntry(node.value, index + _size(node.left))
+        raise KeyError(key)
 
     def remove(self, key):
-        self = self._copy()
-        del self._dict[key]
-        return self
+        return self._with_root(_remove(self._root, key, self._comparator))
 
     def __iter__(self):
-        for k in self._dict:
-            yield k
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.key
+                node = node.right
 
     def __len__(self):
-        return len(self._dict)
+        return _size(self._root)
 
     def __contains__(self, k):
-        return k in self._dict
+        try:
+            self.find(k)
+        except KeyError:
+            return False
+        return True
 
 
 class ChangeType(Enum):
@@ -223,7 +354,7 @@ class Watch(object):
         # Initialize state for on_snapshot
         # The sorted tree of QueryDocumentSnapshots as sent in the last
         # snapshot. We only look at the keys.
-        self.doc_tree = WatchDocTree()
+        self.doc_tree = WatchDocTree(comparator)
 
         # A map of document names to QueryDocumentSnapshots for the last sent
         # snapshot.
@@ -539,13 +670,8 @@ class Watch(object):
         )
 
         if not self.has_pushed or len(appliedChanges):
-            # TODO: It is possible in the future we will have the tree order
-            # on insert. For now, we sort here.
-            key = functools.cmp_to_key(self._comparator)
-            keys = sorted(updated_tree.keys(), key=key)
-
             self._snapshot_callback(
-                keys,
+                updated_tree.keys(),
                 appliedChanges,
                 datetime.datetime.fromtimestamp(read_time.seconds, pytz.utc),
             )
@@ -595,7 +721,7 @@ class Watch(object):
             """
             assert name in updated_map, "Document to delete does not exist"
             old_document = updated_map.get(name)
-            # TODO: If a document doesn't exist this raises IndexError. Handle?
+            # TODO: If a document doesn't exist this raises KeyError. Handle?
             existing = updated_tree.find(old_document)
             old_index = existing.index
             updated_tree = updated_tree.remove(old_document)
@@ -660,7 +786,7 @@ class Watch(object):
         key = functools.cmp_to_key(self._comparator)
 
         # Deletes are sorted based on the order of the existing document.
-        delete_changes = sorted(delete_changes, key=key)
+        delete_changes = sorted(delete_changes, key=lambda name: key(updated_map[name]))
         for name in delete_changes:
             change, updated_tree, updated_map = delete_doc(
                 name, updated_tree, updated_map
@@ -0,0 +1,331 @@
+# Copyright 2019 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class Test_RateLimiter(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1beta1.bulk_writer import _RateLimiter
+
+        return _RateLimiter
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_acquire_within_rate(self):
+        limiter = self._make_one(500)
+        self.assertEqual(limiter.acquire(300, 1000.0), 0.0)
+        self.assertEqual(limiter.acquire(200, 1000.0), 0.0)
+
+    def test_acquire_over_rate(self):
+        limiter = self._make_one(500)
+        self.assertEqual(limiter.acquire(500, 1000.0), 0.0)
+        self.assertEqual(limiter.acquire(250, 1000.0), 0.5)
+        self.assertEqual(limiter.acquire(250, 1000.25), 0.25)
+        self.assertEqual(limiter.acquire(250, 1000.5), 0.0)
+
+    def test_acquire_larger_than_rate(self):
+        limiter = self._make_one(10)
+        self.assertEqual(limiter.acquire(5, 1000.0), 0.0)
+        self.assertEqual(limiter.acquire(20, 1000.0), 0.5)
+        self.assertEqual(limiter.acquire(20, 1000.5), 0.0)
+        self.assertEqual(limiter.acquire(1, 1000.5), 1.1)
+
+    def test_rate_ramp_up(self):
+        limiter = self._make_one(500)
+        self.assertEqual(limiter.rate(1000.0), 500.0)
+        limiter.acquire(1, 1000.0)
+        self.assertEqual(limiter.rate(1299.0), 500.0)
+        self.assertEqual(limiter.rate(1300.0), 750.0)
+        self.assertEqual(limiter.rate(1600.0), 1125.0)
+
+    def test_rate_w_max_rate(self):
+        limiter = self._make_one(500, max_rate=600)
+        limiter.acquire(1, 1000.0)
+        self.assertEqual(limiter.rate(1300.0), 600.0)
+
+
+class TestBulkWriter(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1beta1.bulk_writer import BulkWriter
+
+        return BulkWriter
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _make_client(self, errors=None):
+        """Make a client whose commits fail when writing some documents.
+
+        ``errors`` maps the ID of a document to the errors raised by the
+        successive commits writing it.
+        """
+        from google.protobuf import timestamp_pb2
+        from google.cloud.firestore_v1beta1.proto import firestore_pb2
+        from google.cloud.firestore_v1beta1.proto import write_pb2
+
+        errors = errors or {}
+
+        def commit(database, write_pbs, transaction=None, metadata=None):
+            for write_pb in write_pbs:
+                document_errors = errors.get(_document_id(write_pb))
+                if document_errors:
+                    raise document_errors.pop(0)
+            return firestore_pb2.CommitResponse(
+                write_results=[
+                    write_pb2.WriteResult(
+                        update_time=timestamp_pb2.Timestamp(seconds=index)
+                    )
+                    for index, _ in enumerate(write_pbs)
+                ]
+            )
+
+        firestore_api = mock.Mock(spec=["commit"])
+        firestore_api.commit.side_effect = commit
+        client = _make_client()
+        client._firestore_api_internal = firestore_api
+        return client
+
+    def _committed_ids(self, client):
+        return [
+            [_document_id(write_pb) for write_pb in call[0][1]]
+            for call in client._firestore_api.commit.call_args_list
+        ]
+
+    def test_constructor_defaults(self):
+        from google.cloud.firestore_v1beta1.bulk_writer import MAX_BATCH_SIZE
+        from google.cloud.firestore_v1beta1.bulk_writer import MAX_IN_FLIGHT_COMMITS
+        from google.cloud.firestore_v1beta1.bulk_writer import MAX_RETRIES
+
+        with self._make_one(mock.sentinel.client) as writer:
+            self.assertIs(writer._client, mock.sentinel.client)
+            self.assertEqual(writer.max_batch_size, MAX_BATCH_SIZE)
+            self.assertEqual(writer.max_in_flight, MAX_IN_FLIGHT_COMMITS)
+            self.assertEqual(writer.max_retries, MAX_RETRIES)
+            self.assertEqual(writer.stats()["ops_per_second_limit"], 500.0)
+
+    def test_constructor_w_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(mock.sentinel.client, max_batch_size=501)
+        with self.assertRaises(ValueError):
+            self._make_one(mock.sentinel.client, max_batch_size=0)
+
+    def test_writes_in_batches(self):
+        client = self._make_client()
+        collection = client.collection("c")
+
+        with self._make_one(client, max_batch_size=2, max_in_flight=1) as writer:
+            create = writer.create(collection.document("a"), {"x": 1})
+            set_ = writer.set(collection.document("b"), {"x": 2}, merge=True)
+            update = writer.update(collection.document("c"), {"x": 3})
+            delete = writer.delete(collection.document("d"))
+            writer.flush()
+            self.assertEqual(writer._in_flight, 0)
+            last = writer.delete(collection.document("e"))
+
+        self.assertEqual(self._committed_ids(client), [["a", "b"], ["c", "d"], ["e"]])
+        results = [create, set_, update, delete, last]
+        self.assertEqual(
+            [future.result().update_time.seconds for future in results],
+            [0, 1, 0, 1, 0],
+        )
+        stats = writer.stats()
+        self.assertEqual(stats["writes_succeeded"], 5)
+        self.assertEqual(stats["writes_failed"], 0)
+        self.assertEqual(stats["writes_pending"], 0)
+        self.assertEqual(stats["commits"], 3)
+        self.assertEqual(stats["retries"], 0)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_write_w_transform_kept_together(self):
+        from google.cloud.firestore_v1beta1.transforms import SERVER_TIMESTAMP
+
+        client = self._make_client()
+        collection = client.collection("c")
+
+        with self._make_one(client, max_batch_size=2, max_in_flight=1) as writer:
+            first = writer.delete(collection.document("a"))
+            second = writer.set(
+                collection.document("b"), {"x": 1, "when": SERVER_TIMESTAMP}
+            )
+
+        self.assertEqual(self._committed_ids(client), [["a"], ["b", "b"]])
+        self.assertEqual(first.result().update_time.seconds, 0)
+        self.assertEqual(second.result().update_time.seconds, 0)
+
+    def test_update_w_exists_option(self):
+        from google.cloud.firestore_v1beta1._helpers import ExistsOption
+
+        client = self._make_client()
+        with self._make_one(client) as writer:
+            with self.assertRaises(ValueError):
+                writer.update(
+                    client.document("c", "a"), {"x": 1}, option=ExistsOption(True)
+                )
+
+        client._firestore_api.commit.assert_not_called()
+
+    def test_failed_batch_retried_individually(self):
+        from google.api_core import exceptions
+
+        error = exceptions.AlreadyExists("exists")
+        client = self._make_client({"b": [error, error]})
+        collection = client.collection("c")
+
+        with self._make_one(client, max_in_flight=1) as writer:
+            futures = [
+                writer.create(collection.document(name), {"x": 1})
+                for name in ("a", "b", "c")
+            ]
+
+        self.assertEqual(
+            self._committed_ids(client), [["a", "b", "c"], ["a"], ["b"], ["c"]]
+        )
+        self.assertEqual(futures[0].result().update_time.seconds, 0)
+        self.assertIs(futures[1].exception(), error)
+        self.assertEqual(futures[2].result().update_time.seconds, 0)
+        stats = writer.stats()
+        self.assertEqual(stats["writes_succeeded"], 2)
+        self.assertEqual(stats["writes_failed"], 1)
+        self.assertEqual(stats["commits"], 2)
+        self.assertEqual(stats["retries"], 3)
+
+    def test_transient_error_retried_w_backoff(self):
+        from google.api_core import exceptions
+
+        client = self._make_client(
+            {
+                "a": [
+                    exceptions.ServiceUnavailable("unavailable"),
+                    exceptions.ResourceExhausted("exhausted"),
+                ]
+            }
+        )
+        patch = mock.patch(
+            "google.cloud.firestore_v1beta1.bulk_writer._sleep", return_value=2.0
+        )
+
+        with patch as _sleep:
+            with self._make_one(client) as writer:
+                future = writer.delete(client.document("c", "a"))
+
+        self.assertEqual(future.result().update_time.seconds, 0)
+        self.assertEqual(self._committed_ids(client), [["a"], ["a"], ["a"]])
+        self.assertEqual(_sleep.mock_calls, [mock.call(1.0), mock.call(30.0)])
+        self.assertEqual(writer.stats()["retries"], 2)
+
+    def test_transient_error_retries_exhausted(self):
+        from google.api_core import exceptions
+
+        errors = [exceptions.Aborted("aborted") for _ in range(3)]
+        client = self._make_client({"a": list(errors)})
+        patch = mock.patch(
+            "google.cloud.firestore_v1beta1.bulk_writer._sleep", return_value=2.0
+        )
+
+        with patch:
+            with self._make_one(client, max_retries=2) as writer:
+                future = writer.delete(client.document("c", "a"))
+
+        self.assertIs(future.exception(), errors[2])
+        self.assertEqual(client._firestore_api.commit.call_count, 3)
+
+    def test_unexpected_error_fails_batch(self):
+        client = self._make_client()
+        error = ValueError("unexpected")
+        client._firestore_api.commit.side_effect = error
+
+        with self._make_one(client) as writer:
+            futures = [writer.delete(client.document("c", name)) for name in "ab"]
+
+        self.assertIs(futures[0].exception(), error)
+        self.assertIs(futures[1].exception(), error)
+        self.assertEqual(writer.stats()["writes_failed"], 2)
+        self.assertEqual(writer.stats()["in_flight"], 0)
+
+    def test_cancelled_write_not_committed(self):
+        client = self._make_client()
+
+        with self._make_one(client) as writer:
+            cancelled = writer.delete(client.document("c", "a"))
+            self.assertTrue(cancelled.cancel())
+            future = writer.delete(client.document("c", "b"))
+
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(future.result().update_time.seconds, 0)
+        self.assertEqual(self._committed_ids(client), [["b"]])
+
+    def test_send_waits_for_rate_limit(self):
+        client = self._make_client()
+        writer = self._make_one(client, max_batch_size=1)
+        writer._rate_limiter = mock.Mock(spec=["acquire", "rate"])
+        writer._rate_limiter.acquire.side_effect = [0.0, 0.01, 0.0]
+
+        with writer:
+            writer.delete(client.document("c", "a"))
+            writer.delete(client.document("c", "b"))
+
+        self.assertEqual(writer._rate_limiter.acquire.call_count, 3)
+        self.assertEqual(client._firestore_api.commit.call_count, 2)
+
+    def test_concurrent_writes(self):
+        import threading
+
+        client = self._make_client()
+        collection = client.collection("c")
+        futures = []
+
+        def write(thread_index):
+            for index in range(50):
+                name = "%d-%d" % (thread_index, index)
+                futures.append(writer.delete(collection.document(name)))
+
+        with self._make_one(client, max_batch_size=7, max_in_flight=3) as writer:
+            threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(futures), 200)
+        self.assertTrue(all(future.done() for future in futures))
+        committed = self._committed_ids(client)
+        self.assertEqual(sum(len(ids) for ids in committed), 200)
+        self.assertTrue(all(len(ids) <= 7 for ids in committed))
+        self.assertEqual(writer.stats()["writes_succeeded"], 200)
+
+
+def _document_id(write_pb):
+    name = write_pb.update.name or write_pb.delete or write_pb.transform.document
+    return name.rsplit("/", 1)[-1]
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+def _make_client(project="seventy-nine"):
+    from google.cloud.firestore_v1beta1.client import Client
+
+    credentials = _make_credentials()
+    return Client(project=project, credentials=credentials)
@@ -432,6 +432,15 @@ class TestClient(unittest.TestCase):
         self.assertIs(batch._client, client)
         self.assertEqual(batch._write_pbs, [])
 
+    def test_bulk_writer(self):
+        from google.cloud.firestore_v1beta1.bulk_writer import BulkWriter
+
+        client = self._make_default_one()
+        with client.bulk_writer(max_in_flight=3) as writer:
+            self.assertIsInstance(writer, BulkWriter)
+            self.assertIs(writer._client, client)
+            self.assertEqual(writer.max_in_flight, 3)
+
     def test_transaction(self):
         from google.cloud.firestore_v1beta1.transaction import Transaction
 
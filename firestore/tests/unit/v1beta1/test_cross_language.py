@@ -278,6 +278,19 @@ def test_listen_testprotos(test_proto):  # pragma: NO COVER
                                     "change type mismatch in %s (snapshot #%s, change #%s')"
                                     % (testname, i, y)
                                 )
+                            expected_indexes = (
+                                expected_change.old_index,
+                                expected_change.new_index,
+                            )
+                            actual_indexes = (
+                                actual_change.old_index,
+                                actual_change.new_index,
+                            )
+                            if expected_indexes != actual_indexes:
+                                raise AssertionError(
+                                    "change index mismatch in %s (snapshot #%s, change #%s')"
+                                    % (testname, i, y)
+                                )
 
 
 @pytest.mark.parametrize("test_proto", _QUERY_TESTPROTOS)
@@ -376,7 +389,8 @@ class DummyBackgroundConsumer(object):  # pragma: NO COVER
 class DummyQuery(object):  # pragma: NO COVER
     def __init__(self, **kw):
         self._client = kw["client"]
-        self._comparator = lambda x, y: 1
+        # Conformance data orders documents by the "a" field, then by path.
+        self._comparator = self._client.collection("C").order_by("a")._comparator
 
     def _to_protobuf(self):
         from google.cloud.firestore_v1beta1.proto import query_pb2
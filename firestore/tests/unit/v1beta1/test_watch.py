@@ -48,6 +48,70 @@ class TestWatchDocTree(unittest.TestCase):
         self.assertTrue("b" in inst)
         self.assertFalse("a" in inst)
 
+    def test_keys_in_comparator_order(self):
+        from google.cloud.firestore_v1beta1.watch import WatchDocTree
+
+        inst = WatchDocTree(lambda x, y: (y > x) - (y < x))
+        for key in ("b", "a", "c"):
+            inst = inst.insert(key, None)
+        self.assertEqual(inst.keys(), ["c", "b", "a"])
+
+    def test_insert_existing_replaces(self):
+        inst = self._makeOne()
+        inst = inst.insert("a", 1)
+        inst = inst.insert("a", 2)
+        self.assertEqual(len(inst), 1)
+        self.assertEqual(inst.find("a").value, 2)
+
+    def test_find_index(self):
+        inst = self._makeOne()
+        for key in ("d", "b", "a", "c"):
+            inst = inst.insert(key, None)
+        self.assertEqual(
+            [inst.find(key).index for key in ("a", "b", "c", "d")], [0, 1, 2, 3]
+        )
+
+    def test_find_missing(self):
+        inst = self._makeOne()
+        inst = inst.insert("b", 1)
+        with self.assertRaises(KeyError):
+            inst.find("a")
+
+    def test_remove_missing(self):
+        inst = self._makeOne()
+        inst = inst.insert("b", 1)
+        with self.assertRaises(KeyError):
+            inst.remove("a")
+
+    def test_persistent(self):
+        inst = self._makeOne()
+        inst = inst.insert("b", 1)
+        inserted = inst.insert("a", 2)
+        removed = inst.remove("b")
+        self.assertEqual(inst.keys(), ["b"])
+        self.assertEqual(inserted.keys(), ["a", "b"])
+        self.assertEqual(removed.keys(), [])
+
+    def test_balanced(self):
+        import random
+
+        rng = random.Random(1234)
+        keys = list(range(1000))
+        rng.shuffle(keys)
+        inst = self._makeOne()
+        for key in keys:
+            inst = inst.insert(key, None)
+        for key in keys[::2]:
+            inst = inst.remove(key)
+
+        expected = sorted(keys[1::2])
+        self.assertEqual(inst.keys(), expected)
+        self.assertEqual(
+            [inst.find(key).index for key in expected], list(range(len(expected)))
+        )
+        # An AVL tree of n nodes is at most 1.44 * log2(n) high.
+        self.assertLessEqual(inst._root.height, 13)
+
 
 class TestDocumentChange(unittest.TestCase):
     def _makeOne(self, type, document, old_index, new_index):
@@ -591,38 +655,71 @@ class TestWatch(unittest.TestCase):
         )
 
     def test__compute_snapshot_operation_relative_ordering(self):
+        from google.cloud.firestore_v1beta1.watch import ChangeType
         from google.cloud.firestore_v1beta1.watch import WatchDocTree
 
-        doc_tree = WatchDocTree()
+        def comparator(doc1, doc2):
+            path1 = doc1.reference._document_path
+            path2 = doc2.reference._document_path
+            return (path1 > path2) - (path1 < path2)
 
-        class DummyDoc(object):
-            update_time = mock.sentinel
-
-        deleted_doc = DummyDoc()
-        added_doc = DummyDoc()
-        added_doc._document_path = "/added"
-        updated_doc = DummyDoc()
-        updated_doc._document_path = "/updated"
-        doc_tree = doc_tree.insert(deleted_doc, None)
-        doc_tree = doc_tree.insert(updated_doc, None)
-        doc_map = {"/deleted": deleted_doc, "/updated": updated_doc}
-        added_snapshot = DummyDocumentSnapshot(added_doc, None, True, None, None, None)
-        added_snapshot.reference = added_doc
-        updated_snapshot = DummyDocumentSnapshot(
-            updated_doc, None, True, None, None, None
-        )
-        updated_snapshot.reference = updated_doc
+        doc_tree = WatchDocTree(comparator)
+
+        def make_snapshot(name, update_time=None):
+            reference = DummyDocumentReference(name)
+            return DummyDocumentSnapshot(reference, None, True, None, None, update_time)
+
+        deleted_snapshot = make_snapshot("deleted", 1)
+        updated_snapshot_v1 = make_snapshot("updated", 1)
+        doc_tree = doc_tree.insert(deleted_snapshot, None)
+        doc_tree = doc_tree.insert(updated_snapshot_v1, None)
+        doc_map = {"/deleted": deleted_snapshot, "/updated": updated_snapshot_v1}
+        added_snapshot = make_snapshot("added", 2)
+        updated_snapshot = make_snapshot("updated", 2)
         delete_changes = ["/deleted"]
         add_changes = [added_snapshot]
         update_changes = [updated_snapshot]
-        inst = self._makeOne()
+        inst = self._makeOne(comparator=comparator)
         updated_tree, updated_map, applied_changes = inst._compute_snapshot(
             doc_tree, doc_map, delete_changes, add_changes, update_changes
         )
-        # TODO: Verify that the assertion here is correct.
         self.assertEqual(
             updated_map, {"/updated": updated_snapshot, "/added": added_snapshot}
         )
+        self.assertEqual(updated_tree.keys(), [added_snapshot, updated_snapshot])
+        self.assertEqual(
+            [
+                (change.type, change.document, change.old_index, change.new_index)
+                for change in applied_changes
+            ],
+            [
+                (ChangeType.REMOVED, deleted_snapshot, 0, -1),
+                (ChangeType.ADDED, added_snapshot, -1, 0),
+                (ChangeType.MODIFIED, updated_snapshot, 1, 1),
+            ],
+        )
+        # The tree of the last snapshot is left untouched.
+        self.assertEqual(doc_tree.keys(), [deleted_snapshot, updated_snapshot_v1])
+
+    def test__compute_snapshot_deletes_in_document_order(self):
+        from google.cloud.firestore_v1beta1.watch import WatchDocTree
+
+        doc_tree = WatchDocTree()
+        doc_map = {}
+        for name in ("a", "b", "c", "d"):
+            doc_tree = doc_tree.insert(name, None)
+            doc_map["/" + name] = name
+        inst = self._makeOne(comparator=lambda x, y: (x > y) - (x < y))
+
+        updated_tree, updated_map, applied_changes = inst._compute_snapshot(
+            doc_tree, doc_map, ["/d", "/b"], [], []
+        )
+
+        self.assertEqual(updated_tree.keys(), ["a", "c"])
+        self.assertEqual(
+            [(change.document, change.old_index) for change in applied_changes],
+            [("b", 1), ("d", 2)],
+        )
 
     def test__compute_snapshot_modify_docs_updated_doc_no_timechange(self):
         from google.cloud.firestore_v1beta1.watch import WatchDocTree
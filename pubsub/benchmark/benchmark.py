@@ -0,0 +1,233 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Throughput benchmark for the Pub/Sub publisher and subscriber clients.
+
+Every scenario publishes ``--messages`` messages through a
+``publisher.Client`` and receives them with ``subscriber.Client.subscribe``,
+both talking to the in-process fake server in ``fake_server.py``. One
+scenario is run for each combination of the ``--batch-*`` and
+``--flow-control-*`` values, and one JSON report is printed per scenario.
+
+Usage:
+
+  $ python pubsub/benchmark/benchmark.py --messages 20000 \
+    --batch-max-messages 100 1000 --flow-control-max-messages 100 1000 \
+    --publish-latency 0.01 --pull-error-rate 0.001
+"""
+
+from __future__ import division
+
+import argparse
+import itertools
+import json
+import sys
+import threading
+import time
+
+import grpc
+
+from google.cloud import pubsub_v1
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import histogram
+
+import fake_server
+
+try:
+    import resource
+except ImportError:  # pragma: NO COVER
+    resource = None
+
+
+TOPIC = "projects/benchmark/topics/benchmark"
+SUBSCRIPTION = "projects/benchmark/subscriptions/benchmark"
+PERCENTILES = (50, 90, 99)
+
+
+def parse_options():
+    """Parses options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--message-size", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--batch-max-messages", type=int, nargs="+", default=[1000])
+    parser.add_argument(
+        "--batch-max-bytes",
+        type=int,
+        nargs="+",
+        default=[types.BatchSettings().max_bytes],
+    )
+    parser.add_argument("--batch-max-latency", type=float, nargs="+", default=[0.05])
+    parser.add_argument(
+        "--flow-control-max-messages", type=int, nargs="+", default=[100]
+    )
+    parser.add_argument(
+        "--flow-control-max-bytes",
+        type=int,
+        nargs="+",
+        default=[types.FlowControl().max_bytes],
+    )
+    parser.add_argument("--publish-latency", type=float, default=0.0)
+    parser.add_argument("--publish-error-rate", type=float, default=0.0)
+    parser.add_argument("--pull-latency", type=float, default=0.0)
+    parser.add_argument("--pull-error-rate", type=float, default=0.0)
+    return parser.parse_args()
+
+
+class ThreadSampler(object):
+    """Samples the number of live threads in the background."""
+
+    def __init__(self, period=0.05):
+        self._period = period
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._sample)
+        self._thread.daemon = True
+        self.max_threads = threading.active_count()
+
+    def _sample(self):
+        while not self._stop_event.wait(self._period):
+            self.max_threads = max(self.max_threads, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop_event.set()
+        self._thread.join()
+
+
+def max_rss_kb():
+    """Returns the peak resident set size of the process, if available."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def summarize(latencies):
+    """Summarizes a latency histogram (in milliseconds).
+
+    Note that :class:`~.histogram.Histogram` stores integers between 10 and
+    600, so latencies outside of that range are reported at the bounds.
+    """
+    summary = {"count": len(latencies)}
+    for percent in PERCENTILES:
+        summary["p{}".format(percent)] = latencies.percentile(percent)
+    return summary
+
+
+def run_scenario(options, batch_settings, flow_control):
+    """Publishes and receives ``options.messages`` messages.
+
+    Returns:
+        dict: The report for the scenario.
+    """
+    server = fake_server.FakeServer(
+        publish_latency=options.publish_latency,
+        publish_error_rate=options.publish_error_rate,
+        pull_latency=options.pull_latency,
+        pull_error_rate=options.pull_error_rate,
+    )
+    server.start()
+
+    publisher = pubsub_v1.PublisherClient(
+        batch_settings, channel=grpc.insecure_channel(server.address)
+    )
+    subscriber = pubsub_v1.SubscriberClient(
+        channel=grpc.insecure_channel(server.address)
+    )
+
+    latencies = histogram.Histogram()
+    received = itertools.count(1)
+    all_received = threading.Event()
+    lock = threading.Lock()
+
+    def callback(message):
+        latency_ms = (time.time() - float(message.attributes["sent_at"])) * 1000
+        with lock:
+            latencies.add(latency_ms)
+        message.ack()
+        if next(received) >= options.messages:
+            all_received.set()
+
+    payload = b"x" * options.message_size
+    report = {
+        "batch_settings": dict(batch_settings._asdict()),
+        "flow_control": {
+            "max_messages": flow_control.max_messages,
+            "max_bytes": flow_control.max_bytes,
+        },
+        "messages": options.messages,
+        "message_size": options.message_size,
+    }
+
+    with ThreadSampler() as sampler:
+        future = subscriber.subscribe(SUBSCRIPTION, callback, flow_control=flow_control)
+
+        start = time.time()
+        publish_futures = [
+            publisher.publish(TOPIC, payload, sent_at=repr(time.time()))
+            for _ in range(options.messages)
+        ]
+        for publish_future in publish_futures:
+            publish_future.result()
+        publish_duration = time.time() - start
+
+        completed = all_received.wait(options.timeout)
+        receive_duration = time.time() - start
+        future.cancel()
+
+    report.update(
+        {
+            "publish_msgs_per_sec": options.messages / publish_duration,
+            "receive_msgs_per_sec": (
+                len(latencies) / receive_duration if receive_duration else None
+            ),
+            "completed": completed,
+            "end_to_end_latency_ms": summarize(latencies),
+            "max_threads": sampler.max_threads,
+            "max_rss_kb": max_rss_kb(),
+            "server": server.stats,
+        }
+    )
+
+    server.stop(grace=None)
+    return report
+
+
+def main():
+    options = parse_options()
+
+    for batch_values, flow_values in itertools.product(
+        itertools.product(
+            options.batch_max_bytes,
+            options.batch_max_latency,
+            options.batch_max_messages,
+        ),
+        itertools.product(
+            options.flow_control_max_bytes, options.flow_control_max_messages
+        ),
+    ):
+        batch_settings = types.BatchSettings(*batch_values)
+        flow_control = types.FlowControl(
+            max_bytes=flow_values[0], max_messages=flow_values[1]
+        )
+        report = run_scenario(options, batch_settings, flow_control)
+        json.dump(report, sys.stdout, sort_keys=True)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-process fake Pub/Sub server for benchmarks.
+
+The fake implements ``Publish``, ``StreamingPull``, ``Acknowledge`` and
+``ModifyAckDeadline``. Every published message is delivered exactly once to
+whichever streaming pull is open (redelivery of nacked or expired messages
+is not simulated). Latency and errors can be injected into both ``Publish``
+and ``StreamingPull``.
+"""
+
+from concurrent import futures
+import itertools
+import random
+import threading
+import time
+
+import grpc
+from six.moves import queue
+
+from google.protobuf import empty_pb2
+from google.cloud.pubsub_v1.proto import pubsub_pb2
+from google.cloud.pubsub_v1.proto import pubsub_pb2_grpc
+
+
+# The maximum number of messages sent in a single StreamingPullResponse.
+_MAX_MESSAGES_PER_RESPONSE = 1000
+
+
+class _Stats(object):
+    """Counters for the RPCs handled by the fake server."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {
+            "publish_rpcs": 0,
+            "published_messages": 0,
+            "publish_errors": 0,
+            "streaming_pulls": 0,
+            "streaming_pull_errors": 0,
+            "delivered_messages": 0,
+            "ack_requests": 0,
+            "acked_messages": 0,
+            "modack_requests": 0,
+            "modacked_messages": 0,
+        }
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self.counts[name] += value
+
+
+class FakePublisher(pubsub_pb2_grpc.PublisherServicer):
+    """Fake of the Publisher service.
+
+    Args:
+        backlog (queue.Queue): The queue published messages are put in.
+        stats (_Stats): The RPC counters.
+        latency (float): Seconds to sleep in each ``Publish`` call.
+        error_rate (float): The probability of a ``Publish`` call failing with
+            ``UNAVAILABLE``.
+    """
+
+    def __init__(self, backlog, stats, latency=0.0, error_rate=0.0):
+        self._backlog = backlog
+        self._stats = stats
+        self._latency = latency
+        self._error_rate = error_rate
+        self._message_ids = itertools.count()
+        self._id_lock = threading.Lock()
+
+    def Publish(self, request, context):
+        if self._latency:
+            time.sleep(self._latency)
+        if random.random() < self._error_rate:
+            self._stats.increment("publish_errors")
+            context.abort(grpc.StatusCode.UNAVAILABLE, "Injected publish error.")
+
+        with self._id_lock:
+            message_ids = [str(next(self._message_ids)) for _ in request.messages]
+
+        publish_time = time.time()
+        for message_id, message in zip(message_ids, request.messages):
+            message.message_id = message_id
+            message.publish_time.FromNanoseconds(int(publish_time * 1e9))
+            self._backlog.put(message)
+
+        self._stats.increment("publish_rpcs")
+        self._stats.increment("published_messages", len(message_ids))
+        return pubsub_pb2.PublishResponse(message_ids=message_ids)
+
+
+class FakeSubscriber(pubsub_pb2_grpc.SubscriberServicer):
+    """Fake of the Subscriber service.
+
+    Args:
+        backlog (queue.Queue): The queue messages are delivered from.
+        stats (_Stats): The RPC counters.
+        latency (float): Seconds to sleep before each StreamingPullResponse.
+        error_rate (float): The probability of a streaming pull being
+            terminated with ``UNAVAILABLE`` before each response.
+    """
+
+    def __init__(self, backlog, stats, latency=0.0, error_rate=0.0):
+        self._backlog = backlog
+        self._stats = stats
+        self._latency = latency
+        self._error_rate = error_rate
+        self._ack_ids = itertools.count()
+        self._id_lock = threading.Lock()
+
+    def _consume_requests(self, request_iterator, done):
+        """Drain the requests sent on a stream, counting acks and modacks."""
+        try:
+            for request in request_iterator:
+                self._count_acks(request.ack_ids)
+                self._count_modacks(request.modify_deadline_ack_ids)
+        except grpc.RpcError:
+            pass
+        finally:
+            done.set()
+
+    def _count_acks(self, ack_ids):
+        if ack_ids:
+            self._stats.increment("ack_requests")
+            self._stats.increment("acked_messages", len(ack_ids))
+
+    def _count_modacks(self, ack_ids):
+        if ack_ids:
+            self._stats.increment("modack_requests")
+            self._stats.increment("modacked_messages", len(ack_ids))
+
+    def _next_response(self):
+        """Build a response from the messages currently in the backlog."""
+        try:
+            messages = [self._backlog.get(timeout=0.1)]
+        except queue.Empty:
+            return None
+
+        while len(messages) < _MAX_MESSAGES_PER_RESPONSE:
+            try:
+                messages.append(self._backlog.get_nowait())
+            except queue.Empty:
+                break
+
+        with self._id_lock:
+            received = [
+                pubsub_pb2.ReceivedMessage(
+                    ack_id=str(next(self._ack_ids)), message=message
+                )
+                for message in messages
+            ]
+        return pubsub_pb2.StreamingPullResponse(received_messages=received)
+
+    def StreamingPull(self, request_iterator, context):
+        self._stats.increment("streaming_pulls")
+
+        # The first request only opens the stream, the following ones carry
+        # acks and modacks and are consumed in the background.
+        next(request_iterator)
+        done = threading.Event()
+        consumer = threading.Thread(
+            target=self._consume_requests, args=(request_iterator, done)
+        )
+        consumer.daemon = True
+        consumer.start()
+
+        while context.is_active() and not done.is_set():
+            response = self._next_response()
+            if response is None:
+                continue
+            if self._latency:
+                time.sleep(self._latency)
+            if random.random() < self._error_rate:
+                self._stats.increment("streaming_pull_errors")
+                # Put the messages back, so that they are delivered on the
+                # next stream.
+                for received in response.received_messages:
+                    self._backlog.put(received.message)
+                context.abort(
+                    grpc.StatusCode.UNAVAILABLE, "Injected streaming pull error."
+                )
+            self._stats.increment("delivered_messages", len(response.received_messages))
+            yield response
+
+    def Acknowledge(self, request, context):
+        self._count_acks(request.ack_ids)
+        return empty_pb2.Empty()
+
+    def ModifyAckDeadline(self, request, context):
+        self._count_modacks(request.ack_ids)
+        return empty_pb2.Empty()
+
+
+class FakeServer(object):
+    """A local gRPC server hosting the fake Publisher and Subscriber.
+
+    Args:
+        publish_latency (float): Seconds to sleep in each ``Publish`` call.
+        publish_error_rate (float): The probability of a ``Publish`` call
+            failing with ``UNAVAILABLE``.
+        pull_latency (float): Seconds to sleep before each
+            StreamingPullResponse.
+        pull_error_rate (float): The probability of a streaming pull being
+            terminated with ``UNAVAILABLE`` before each response.
+        max_workers (int): The number of threads serving RPCs.
+    """
+
+    def __init__(
+        self,
+        publish_latency=0.0,
+        publish_error_rate=0.0,
+        pull_latency=0.0,
+        pull_error_rate=0.0,
+        max_workers=16,
+    ):
+        self._backlog = queue.Queue()
+        self._stats = _Stats()
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=max_workers),
+            options=[
+                ("grpc.max_send_message_length", -1),
+                ("grpc.max_receive_message_length", -1),
+            ],
+        )
+        pubsub_pb2_grpc.add_PublisherServicer_to_server(
+            FakePublisher(
+                self._backlog,
+                self._stats,
+                latency=publish_latency,
+                error_rate=publish_error_rate,
+            ),
+            self._server,
+        )
+        pubsub_pb2_grpc.add_SubscriberServicer_to_server(
+            FakeSubscriber(
+                self._backlog,
+                self._stats,
+                latency=pull_latency,
+                error_rate=pull_error_rate,
+            ),
+            self._server,
+        )
+        self._port = self._server.add_insecure_port("localhost:0")
+
+    @property
+    def address(self):
+        """str: The ``host:port`` the server listens on."""
+        return "localhost:{}".format(self._port)
+
+    @property
+    def stats(self):
+        """Dict[str, int]: A copy of the RPC counters."""
+        return dict(self._stats.counts)
+
+    def start(self):
+        self._server.start()
+
+    def stop(self, grace=None):
+        self._server.stop(grace)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,254 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Codecs compressing the data of Pub/Sub messages.
+
+A publisher configured with a codec compresses the data of each message and
+records the codec name in the :data:`ENCODING_ATTRIBUTE` attribute. The
+subscriber uses that attribute to decompress
+:attr:`~.pubsub_v1.subscriber.message.Message.data` transparently.
+
+The ``zlib`` codec is always available. The ``zstd`` and ``snappy`` codecs
+require the ``zstandard`` and ``python-snappy`` packages respectively.
+"""
+
+from __future__ import absolute_import
+
+import abc
+import functools
+import threading
+import zlib
+
+import six
+
+try:
+    import zstandard
+except ImportError:  # pragma: NO COVER
+    zstandard = None
+
+try:
+    import snappy
+except ImportError:  # pragma: NO COVER
+    snappy = None
+
+
+ENCODING_ATTRIBUTE = "googclient_encoding"
+"""str: The attribute holding the name of the codec used to compress the
+data of a message."""
+
+
+@six.add_metaclass(abc.ABCMeta)
+class Codec(object):
+    """Abstract base class for codecs.
+
+    Args:
+        min_size (int): Messages with less data than this (in bytes) are
+            published uncompressed.
+    """
+
+    def __init__(self, min_size=0):
+        self.min_size = min_size
+
+    @property
+    @abc.abstractmethod
+    def name(self):
+        """str: The name recorded in the :data:`ENCODING_ATTRIBUTE` of the
+        messages compressed with this codec."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def encode(self, data):
+        """Compress message data.
+
+        Args:
+            data (bytes): The data to compress.
+
+        Returns:
+            bytes: The compressed data.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def decode(self, data):
+        """Decompress message data.
+
+        Args:
+            data (bytes): The data to decompress.
+
+        Returns:
+            bytes: The decompressed data.
+        """
+        raise NotImplementedError
+
+
+class ZlibCodec(Codec):
+    """A codec using :mod:`zlib` (DEFLATE).
+
+    Args:
+        level (int): The compression level, from 0 to 9.
+        dictionary (bytes): An optional preset dictionary. Small messages
+            compress much better with a dictionary made of byte sequences
+            commonly found in the messages. Subscribers must be configured
+            with a codec using the same dictionary.
+        min_size (int): Messages with less data than this (in bytes) are
+            published uncompressed.
+    """
+
+    def __init__(self, level=6, dictionary=None, min_size=0):
+        if dictionary is not None and six.PY2:
+            raise ValueError("zlib dictionaries require Python 3.")
+        super(ZlibCodec, self).__init__(min_size=min_size)
+        self._level = level
+        self._dictionary = dictionary
+
+    @property
+    def name(self):
+        if self._dictionary is None:
+            return "zlib"
+        return "zlib:{:08x}".format(zlib.crc32(self._dictionary) & 0xFFFFFFFF)
+
+    def encode(self, data):
+        if self._dictionary is None:
+            return zlib.compress(data, self._level)
+        compressor = zlib.compressobj(self._level, zdict=self._dictionary)
+        return compressor.compress(data) + compressor.flush()
+
+    def decode(self, data):
+        if self._dictionary is None:
+            return zlib.decompress(data)
+        decompressor = zlib.decompressobj(zdict=self._dictionary)
+        return decompressor.decompress(data) + decompressor.flush()
+
+
+class ZstdCodec(Codec):
+    """A codec using Zstandard.
+
+    Requires the ``zstandard`` package.
+
+    Args:
+        level (int): The compression level.
+        dictionary (bytes): An optional dictionary, for instance one created
+            by :meth:`train_dictionary`. Subscribers must be configured with
+            a codec using the same dictionary.
+        min_size (int): Messages with less data than this (in bytes) are
+            published uncompressed.
+    """
+
+    def __init__(self, level=3, dictionary=None, min_size=0):
+        if zstandard is None:
+            raise ImportError("The zstd codec requires the 'zstandard' package.")
+        super(ZstdCodec, self).__init__(min_size=min_size)
+        if dictionary is None:
+            self._dictionary = None
+        else:
+            self._dictionary = zstandard.ZstdCompressionDict(dictionary)
+        self._level = level
+        # Compressors and decompressors are not thread-safe: publisher and
+        # subscriber threads each get their own, sharing the dictionary.
+        self._make_compressor = functools.partial(
+            zstandard.ZstdCompressor, level=level, dict_data=self._dictionary
+        )
+        self._make_decompressor = functools.partial(
+            zstandard.ZstdDecompressor, dict_data=self._dictionary
+        )
+        self._local = threading.local()
+
+    @staticmethod
+    def train_dictionary(samples, size=16 * 1024):
+        """Train a dictionary from sample messages.
+
+        Args:
+            samples (Sequence[bytes]): The data of representative messages.
+                Training needs at least a few hundred samples.
+            size (int): The maximum size of the dictionary, in bytes.
+
+        Returns:
+            bytes: The dictionary, to be passed as ``dictionary`` to the
+            codecs of both publishers and subscribers.
+        """
+        if zstandard is None:
+            raise ImportError("The zstd codec requires the 'zstandard' package.")
+        return zstandard.train_dictionary(size, list(samples)).as_bytes()
+
+    @property
+    def name(self):
+        if self._dictionary is None:
+            return "zstd"
+        return "zstd:{}".format(self._dictionary.dict_id())
+
+    def encode(self, data):
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = self._local.compressor = self._make_compressor()
+        return compressor.compress(data)
+
+    def decode(self, data):
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = self._make_decompressor()
+        return decompressor.decompress(data)
+
+
+class SnappyCodec(Codec):
+    """A codec using Snappy.
+
+    Requires the ``python-snappy`` package.
+
+    Args:
+        min_size (int): Messages with less data than this (in bytes) are
+            published uncompressed.
+    """
+
+    def __init__(self, min_size=0):
+        if snappy is None:
+            raise ImportError("The snappy codec requires the 'python-snappy' package.")
+        super(SnappyCodec, self).__init__(min_size=min_size)
+
+    @property
+    def name(self):
+        return "snappy"
+
+    def encode(self, data):
+        return snappy.compress(data)
+
+    def decode(self, data):
+        return snappy.decompress(data)
+
+
+_DEFAULT_CODECS = {"zlib": ZlibCodec, "zstd": ZstdCodec, "snappy": SnappyCodec}
+_default_codec_instances = {}
+
+
+def get_codec(name, codecs=None):
+    """Find the codec able to decompress messages encoded with ``name``.
+
+    Args:
+        name (str): The value of the :data:`ENCODING_ATTRIBUTE` of a message.
+        codecs (Mapping[str, Codec]): Codecs by name, searched before the
+            default codecs. Needed for codecs using a dictionary.
+
+    Returns:
+        Codec: The codec.
+
+    Raises:
+        ValueError: If no codec is known for ``name``.
+    """
+    if codecs and name in codecs:
+        return codecs[name]
+    if name in _DEFAULT_CODECS:
+        codec = _default_codec_instances.get(name)
+        if codec is None:
+            codec = _default_codec_instances[name] = _DEFAULT_CODECS[name]()
+        return codec
+    raise ValueError("No codec available to decode {!r} data.".format(name))
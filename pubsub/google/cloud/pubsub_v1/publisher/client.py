@@ -25,6 +25,7 @@ from google.api_core import grpc_helpers
 from google.oauth2 import service_account
 
 from google.cloud.pubsub_v1 import _gapic
+from google.cloud.pubsub_v1 import compression
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import publisher_client
 from google.cloud.pubsub_v1.gapic.transports import publisher_grpc_transport
@@ -51,6 +52,11 @@ class Client(object):
     Args:
         batch_settings (~google.cloud.pubsub_v1.types.BatchSettings): The
             settings for batch publishing.
+        codec (~google.cloud.pubsub_v1.compression.Codec): An optional codec
+            used to compress the data of published messages. Compressed
+            messages carry the codec name in their
+            :data:`~google.cloud.pubsub_v1.compression.ENCODING_ATTRIBUTE`
+            attribute, and are decompressed transparently by the subscriber.
         kwargs (dict): Any additional arguments provided are sent as keyword
             arguments to the underlying
             :class:`~.gapic.pubsub.v1.publisher_client.PublisherClient`.
@@ -62,7 +68,7 @@ class Client(object):
 
     _batch_class = thread.Batch
 
-    def __init__(self, batch_settings=(), **kwargs):
+    def __init__(self, batch_settings=(), codec=None, **kwargs):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -95,6 +101,7 @@ class Client(object):
         # client.
         self.api = publisher_client.PublisherClient(**kwargs)
         self.batch_settings = types.BatchSettings(*batch_settings)
+        self.codec = codec
 
         # The batches on the publisher client are responsible for holding
         # messages. One batch exists for each topic.
@@ -226,6 +233,14 @@ class Client(object):
                 "be sent as text strings."
             )
 
+        # Compress the data, unless that does not make it any smaller.
+        codec = self.codec
+        if codec is not None and len(data) >= codec.min_size:
+            encoded = codec.encode(data)
+            if len(encoded) < len(data):
+                data = encoded
+                attrs[compression.ENCODING_ATTRIBUTE] = codec.name
+
         # Create the Pub/Sub message object.
         message = types.PubsubMessage(data=data, attributes=attrs)
 
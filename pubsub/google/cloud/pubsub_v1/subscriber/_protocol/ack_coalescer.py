@@ -0,0 +1,222 @@
+# Copyright 2019, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+
+import six
+
+from google.cloud.pubsub_v1 import types
+
+
+_LOGGER = logging.getLogger(__name__)
+_COALESCER_WORKER_NAME = "Thread-AckCoalescer"
+
+_MAX_REQUEST_BYTES = 500 * 1024
+"""The maximum estimated size of a single request. Streaming pull requests
+are limited to 512KB; the difference is left as headroom for the fields that
+are not accounted for."""
+
+# Estimated protobuf overhead per ack ID (field tag and length prefix) and per
+# deadline (packed varint of at most 600 seconds).
+_ACK_ID_OVERHEAD = 3
+_DEADLINE_OVERHEAD = 2
+
+
+def _ack_id_size(ack_id):
+    return len(ack_id) + _ACK_ID_OVERHEAD
+
+
+def _make_requests(ack_ids, modacks):
+    """Pack acks and modacks into requests under the maximum request size.
+
+    Args:
+        ack_ids (Sequence[str]): The ack IDs to acknowledge.
+        modacks (Sequence[Tuple[str, int]]): Pairs of ack ID and new deadline
+            in seconds.
+
+    Yields:
+        google.cloud.pubsub_v1.types.StreamingPullRequest: The requests.
+    """
+    request = types.StreamingPullRequest()
+    size = 0
+
+    for ack_id in ack_ids:
+        item_size = _ack_id_size(ack_id)
+        if size and size + item_size > _MAX_REQUEST_BYTES:
+            yield request
+            request = types.StreamingPullRequest()
+            size = 0
+        request.ack_ids.append(ack_id)
+        size += item_size
+
+    for ack_id, seconds in modacks:
+        item_size = _ack_id_size(ack_id) + _DEADLINE_OVERHEAD
+        if size and size + item_size > _MAX_REQUEST_BYTES:
+            yield request
+            request = types.StreamingPullRequest()
+            size = 0
+        request.modify_deadline_ack_ids.append(ack_id)
+        request.modify_deadline_seconds.append(seconds)
+        size += item_size
+
+    if size:
+        yield request
+
+
+class AckCoalescer(object):
+    """Merges acks and modacks into size-bounded requests.
+
+    Acks and modacks are buffered and sent every ``flush_interval`` seconds,
+    or as soon as the buffered requests reach the maximum request size.
+    A pending modack is discarded when the same ack ID is acked, since the
+    ack supersedes it, and only the latest deadline is kept when an ack ID
+    is modacked several times.
+
+    Args:
+        manager (~.streaming_pull_manager.StreamingPullManager): The manager
+            used to send the requests.
+        flush_interval (float): The maximum number of seconds an ack or
+            modack is buffered before being sent.
+    """
+
+    def __init__(self, manager, flush_interval):
+        self._thread = None
+        self._operational_lock = threading.Lock()
+        self._manager = manager
+        self._stop_event = threading.Event()
+        self._flush_interval = flush_interval
+
+        self._pending_lock = threading.Lock()
+        self._acks = collections.OrderedDict()
+        """OrderedDict[str, None]: The ack IDs waiting to be acked."""
+        self._modacks = collections.OrderedDict()
+        """OrderedDict[str, int]: The ack IDs waiting to be modacked, mapped
+            to their new deadline in seconds."""
+        self._bytes = 0
+        """int: The estimated size of all pending acks and modacks."""
+
+    @property
+    def pending_count(self):
+        """int: The number of acks and modacks waiting to be sent."""
+        return len(self._acks) + len(self._modacks)
+
+    def ack(self, ack_ids):
+        """Buffer acks for the given ack IDs.
+
+        Args:
+            ack_ids (Iterable[str]): The ack IDs to acknowledge.
+        """
+        with self._pending_lock:
+            for ack_id in ack_ids:
+                if ack_id in self._acks:
+                    continue
+                if self._modacks.pop(ack_id, None) is not None:
+                    self._bytes -= _ack_id_size(ack_id) + _DEADLINE_OVERHEAD
+                self._acks[ack_id] = None
+                self._bytes += _ack_id_size(ack_id)
+            full = self._bytes >= _MAX_REQUEST_BYTES
+
+        if full:
+            self.flush()
+
+    def modify_ack_deadline(self, items):
+        """Buffer modacks for the given ack IDs.
+
+        Args:
+            items (Iterable[Tuple[str, int]]): Pairs of ack ID and new
+                deadline in seconds.
+        """
+        with self._pending_lock:
+            for ack_id, seconds in items:
+                if ack_id in self._acks:
+                    # The message is already being acked, there is no point
+                    # in extending (or shortening) its lease.
+                    continue
+                if ack_id not in self._modacks:
+                    self._bytes += _ack_id_size(ack_id) + _DEADLINE_OVERHEAD
+                self._modacks[ack_id] = seconds
+            full = self._bytes >= _MAX_REQUEST_BYTES
+
+        if full:
+            self.flush()
+
+    def _take_pending(self):
+        """Atomically take all pending acks and modacks.
+
+        Returns:
+            Tuple[List[str], List[Tuple[str, int]]]: The pending ack IDs and
+            the pending (ack ID, seconds) modacks.
+        """
+        with self._pending_lock:
+            ack_ids = list(self._acks)
+            modacks = list(six.iteritems(self._modacks))
+            self._acks.clear()
+            self._modacks.clear()
+            self._bytes = 0
+        return ack_ids, modacks
+
+    def flush(self):
+        """Send all pending acks and modacks.
+
+        Pending items are packed into as few requests as possible, each of
+        them staying under the maximum request size.
+        """
+        ack_ids, modacks = self._take_pending()
+        if not ack_ids and not modacks:
+            return
+
+        for request in _make_requests(ack_ids, modacks):
+            self._manager.send(request)
+
+        _LOGGER.debug("Flushed %d acks and %d modacks.", len(ack_ids), len(modacks))
+
+    def coalesce(self):
+        """Periodically flush the pending acks and modacks."""
+        while not self._stop_event.is_set():
+            self._stop_event.wait(timeout=self._flush_interval)
+            try:
+                self.flush()
+            except Exception as exc:
+                _LOGGER.exception("Error while flushing acks: %s", exc)
+
+        _LOGGER.info("%s exiting.", _COALESCER_WORKER_NAME)
+
+    def start(self):
+        with self._operational_lock:
+            if self._thread is not None:
+                raise ValueError("Ack coalescer is already running.")
+
+            # Create and start the helper thread.
+            self._stop_event.clear()
+            thread = threading.Thread(name=_COALESCER_WORKER_NAME, target=self.coalesce)
+            thread.daemon = True
+            thread.start()
+            _LOGGER.debug("Started helper thread %s", thread.name)
+            self._thread = thread
+
+    def stop(self):
+        with self._operational_lock:
+            self._stop_event.set()
+
+            if self._thread is not None:
+                self._thread.join()
+
+            self._thread = None
+
+            # Send whatever was buffered since the last flush.
+            self.flush()
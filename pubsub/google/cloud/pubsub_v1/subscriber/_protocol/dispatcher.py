@@ -18,7 +18,10 @@ import collections
 import logging
 import threading
 
+from six.moves import range
+
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import ack_coalescer
 from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 
@@ -26,12 +29,16 @@ from google.cloud.pubsub_v1.subscriber._protocol import requests
 _LOGGER = logging.getLogger(__name__)
 _CALLBACK_WORKER_NAME = "Thread-CallbackRequestDispatcher"
 
+_ACK_IDS_BATCH_SIZE = 2500
+"""The maximum number of ACK IDs to send in a single request."""
+
 
 class Dispatcher(object):
     def __init__(self, manager, queue):
         self._manager = manager
         self._queue = queue
         self._thread = None
+        self._coalescer = None
         self._operational_lock = threading.Lock()
 
     def start(self):
@@ -43,6 +50,15 @@ class Dispatcher(object):
                 raise ValueError("Dispatcher is already running.")
 
             flow_control = self._manager.flow_control
+
+            # Acks and modacks are merged into fewer, larger requests unless
+            # the flush interval is disabled.
+            if flow_control.ack_flush_interval > 0:
+                self._coalescer = ack_coalescer.AckCoalescer(
+                    self._manager, flow_control.ack_flush_interval
+                )
+                self._coalescer.start()
+
             worker = helper_threads.QueueCallbackWorker(
                 self._queue,
                 self.dispatch_callback,
@@ -65,6 +81,10 @@ class Dispatcher(object):
 
             self._thread = None
 
+            if self._coalescer is not None:
+                self._coalescer.stop()
+            self._coalescer = None
+
     def dispatch_callback(self, items):
         """Map the callback request to the appropriate gRPC request.
 
@@ -113,12 +133,28 @@ class Dispatcher(object):
                 self._manager.ack_histogram.add(time_to_ack)
 
         ack_ids = [item.ack_id for item in items]
-        request = types.StreamingPullRequest(ack_ids=ack_ids)
-        self._manager.send(request)
+        if self._coalescer is not None:
+            self._coalescer.ack(ack_ids)
+        else:
+            self._send_acks(ack_ids)
 
         # Remove the message from lease management.
         self.drop(items)
 
+    def _send_acks(self, ack_ids):
+        """Send acks immediately, without coalescing them.
+
+        Args:
+            ack_ids (Sequence[str]): The ack IDs to acknowledge.
+        """
+        # We must potentially split the request into multiple smaller requests
+        # to avoid exceeding the maximum request size.
+        for start in range(0, len(ack_ids), _ACK_IDS_BATCH_SIZE):
+            request = types.StreamingPullRequest(
+                ack_ids=ack_ids[start : start + _ACK_IDS_BATCH_SIZE]
+            )
+            self._manager.send(request)
+
     def drop(self, items):
         """Remove the given messages from lease management.
 
@@ -143,13 +179,33 @@ class Dispatcher(object):
         Args:
             items(Sequence[ModAckRequest]): The items to modify.
         """
-        ack_ids = [item.ack_id for item in items]
-        seconds = [item.seconds for item in items]
+        if self._coalescer is not None:
+            self._coalescer.modify_ack_deadline(
+                (item.ack_id, item.seconds) for item in items
+            )
+            return
 
-        request = types.StreamingPullRequest(
-            modify_deadline_ack_ids=ack_ids, modify_deadline_seconds=seconds
-        )
-        self._manager.send(request)
+        # Group the ack IDs by deadline, so that each request (and each
+        # unary RPC it is mapped to) carries as many ack IDs as possible.
+        deadline_to_ack_ids = collections.OrderedDict()
+        for item in items:
+            deadline_to_ack_ids.setdefault(item.seconds, []).append(item.ack_id)
+
+        ack_ids = []
+        seconds = []
+        for deadline, deadline_ack_ids in deadline_to_ack_ids.items():
+            ack_ids.extend(deadline_ack_ids)
+            seconds.extend([deadline] * len(deadline_ack_ids))
+
+        # We must potentially split the request into multiple smaller requests
+        # to avoid exceeding the maximum request size.
+        for start in range(0, len(ack_ids), _ACK_IDS_BATCH_SIZE):
+            stop = start + _ACK_IDS_BATCH_SIZE
+            request = types.StreamingPullRequest(
+                modify_deadline_ack_ids=ack_ids[start:stop],
+                modify_deadline_seconds=seconds[start:stop],
+            )
+            self._manager.send(request)
 
     def nack(self, items):
         """Explicitly deny receipt of messages.
@@ -52,9 +52,18 @@ def _get_many(queue_, max_items=None, max_latency=0):
     # Always return at least one item.
     items = [queue_.get()]
     while max_items is None or len(items) < max_items:
+        # Drain whatever is already available without consulting the clock;
+        # only fall back to a timed wait once the queue runs dry.
+        try:
+            items.append(queue_.get_nowait())
+            continue
+        except queue.Empty:
+            pass
+
+        timeout = max_latency - (time.time() - start)
+        if timeout <= 0:
+            break
         try:
-            elapsed = time.time() - start
-            timeout = max(0, max_latency - elapsed)
             items.append(queue_.get(timeout=timeout))
         except queue.Empty:
             break
@@ -15,7 +15,7 @@
 from __future__ import absolute_import
 
 import collections
-import copy
+import heapq
 import logging
 import random
 import threading
@@ -30,7 +30,25 @@ _LOGGER = logging.getLogger(__name__)
 _LEASE_WORKER_NAME = "Thread-LeaseMaintainer"
 
 
-_LeasedMessage = collections.namedtuple("_LeasedMessage", ["added_time", "size"])
+_LeasedMessage = collections.namedtuple(
+    "_LeasedMessage", ["added_time", "size", "expiry"]
+)
+
+LeaserMetrics = collections.namedtuple(
+    "LeaserMetrics",
+    [
+        "iterations",
+        "last_iteration_duration",
+        "total_iteration_duration",
+        "last_renewed_count",
+        "last_dropped_count",
+    ],
+)
+LeaserMetrics.__new__.__defaults__ = (0, 0.0, 0.0, 0, 0)
+
+# When the number of (possibly stale) heap entries grows past this multiple
+# of the number of leased messages, the heaps are rebuilt from scratch.
+_HEAP_COMPACTION_FACTOR = 4
 
 
 class Leaser(object):
@@ -39,11 +57,22 @@ class Leaser(object):
         self._operational_lock = threading.Lock()
         self._manager = manager
 
+        self._add_remove_lock = threading.Lock()
         self._leased_messages = {}
-        """dict[str, float]: A mapping of ack IDs to the local time when the
-            ack ID was initially leased in seconds since the epoch."""
+        """dict[str, _LeasedMessage]: A mapping of ack IDs to the local time
+            when the ack ID was initially leased, its size and the local time
+            at which its current lease expires."""
+        self._added_times = []
+        """list[tuple[float, str]]: A heap of ``(added_time, ack_id)``
+            entries, used to find messages leased for too long."""
+        self._expiries = []
+        """list[tuple[float, str]]: A heap of ``(expiry, ack_id)`` entries,
+            used to find leases that need to be renewed. Entries for messages
+            which are no longer leased (or whose lease was already renewed)
+            are discarded lazily."""
         self._bytes = 0
         """int: The total number of bytes consumed by leased messages."""
+        self._metrics = LeaserMetrics()
 
         self._stop_event = threading.Event()
 
@@ -62,61 +91,142 @@ class Leaser(object):
         """int: The total size, in bytes, of all leased messages."""
         return self._bytes
 
+    @property
+    def metrics(self):
+        """LeaserMetrics: Timing information about the lease maintenance
+        loop: the number of iterations, the duration of the last iteration
+        and of all iterations combined (in seconds), and how many leases were
+        renewed and dropped in the last iteration."""
+        return self._metrics
+
     def add(self, items):
         """Add messages to be managed by the leaser."""
-        for item in items:
-            # Add the ack ID to the set of managed ack IDs, and increment
-            # the size counter.
-            if item.ack_id not in self._leased_messages:
-                self._leased_messages[item.ack_id] = _LeasedMessage(
-                    added_time=time.time(), size=item.byte_size
-                )
-                self._bytes += item.byte_size
-            else:
-                _LOGGER.debug("Message %s is already lease managed", item.ack_id)
+        with self._add_remove_lock:
+            for item in items:
+                # Add the ack ID to the set of managed ack IDs, and increment
+                # the size counter.
+                if item.ack_id not in self._leased_messages:
+                    now = time.time()
+                    # New leases are due for renewal on the next iteration of
+                    # the maintenance loop.
+                    self._leased_messages[item.ack_id] = _LeasedMessage(
+                        added_time=now, size=item.byte_size, expiry=now
+                    )
+                    heapq.heappush(self._added_times, (now, item.ack_id))
+                    heapq.heappush(self._expiries, (now, item.ack_id))
+                    self._bytes += item.byte_size
+                else:
+                    _LOGGER.debug("Message %s is already lease managed", item.ack_id)
 
     def remove(self, items):
         """Remove messages from lease management."""
-        # Remove the ack ID from lease management, and decrement the
-        # byte counter.
-        for item in items:
-            if self._leased_messages.pop(item.ack_id, None) is not None:
-                self._bytes -= item.byte_size
-            else:
-                _LOGGER.debug("Item %s was not managed.", item.ack_id)
-
-        if self._bytes < 0:
-            _LOGGER.debug("Bytes was unexpectedly negative: %d", self._bytes)
-            self._bytes = 0
+        with self._add_remove_lock:
+            # Remove the ack ID from lease management, and decrement the
+            # byte counter. The heap entries are discarded lazily.
+            for item in items:
+                if self._leased_messages.pop(item.ack_id, None) is not None:
+                    self._bytes -= item.byte_size
+                else:
+                    _LOGGER.debug("Item %s was not managed.", item.ack_id)
+
+            if self._bytes < 0:
+                _LOGGER.debug("Bytes was unexpectedly negative: %d", self._bytes)
+                self._bytes = 0
+
+            self._maybe_compact()
+
+    def _maybe_compact(self):
+        """Rebuild the heaps if they are mostly made of stale entries.
+
+        Must be called with ``_add_remove_lock`` held.
+        """
+        limit = _HEAP_COMPACTION_FACTOR * max(len(self._leased_messages), 100)
+        if len(self._expiries) + len(self._added_times) <= limit:
+            return
+
+        self._added_times = [
+            (item.added_time, ack_id)
+            for ack_id, item in six.iteritems(self._leased_messages)
+        ]
+        heapq.heapify(self._added_times)
+        self._expiries = [
+            (item.expiry, ack_id)
+            for ack_id, item in six.iteritems(self._leased_messages)
+        ]
+        heapq.heapify(self._expiries)
+
+    def _pop_outdated(self, cutoff):
+        """Find the leases which were added before ``cutoff``.
+
+        Only the heap entries older than ``cutoff`` are visited.
+
+        Args:
+            cutoff (float): The local time before which leases are outdated.
+
+        Returns:
+            List[~.DropRequest]: The leases to drop.
+        """
+        to_drop = []
+        with self._add_remove_lock:
+            added_times = self._added_times
+            while added_times and added_times[0][0] < cutoff:
+                added_time, ack_id = heapq.heappop(added_times)
+                item = self._leased_messages.get(ack_id)
+                if item is not None and item.added_time == added_time:
+                    to_drop.append(requests.DropRequest(ack_id, item.size))
+        return to_drop
+
+    def _pop_expiring(self, horizon, deadline, skip):
+        """Find the leases which expire before ``horizon`` and extend them.
+
+        Only the heap entries expiring before ``horizon`` are visited.
+
+        Args:
+            horizon (float): The local time before which leases need to be
+                renewed.
+            deadline (int): The new lease duration, in seconds.
+            skip (Container[str]): Ack IDs that must not be renewed.
+
+        Returns:
+            List[str]: The ack IDs whose lease needs to be renewed.
+        """
+        ack_ids = []
+        new_expiry = time.time() + deadline
+        with self._add_remove_lock:
+            expiries = self._expiries
+            while expiries and expiries[0][0] <= horizon:
+                expiry, ack_id = heapq.heappop(expiries)
+                item = self._leased_messages.get(ack_id)
+                if item is None or item.expiry != expiry or ack_id in skip:
+                    continue
+                self._leased_messages[ack_id] = item._replace(expiry=new_expiry)
+                ack_ids.append(ack_id)
+
+            for ack_id in ack_ids:
+                heapq.heappush(expiries, (new_expiry, ack_id))
+        return ack_ids
 
     def maintain_leases(self):
         """Maintain all of the leases being managed.
 
-        This method modifies the ack deadline for all of the managed
-        ack IDs, then waits for most of that time (but with jitter), and
-        repeats.
+        This method modifies the ack deadline for the managed ack IDs whose
+        lease is about to expire, then waits for most of that time (but with
+        jitter), and repeats.
         """
         while self._manager.is_active and not self._stop_event.is_set():
+            iteration_start = time.time()
+
             # Determine the appropriate duration for the lease. This is
             # based off of how long previous messages have taken to ack, with
             # a sensible default and within the ranges allowed by Pub/Sub.
             p99 = self._manager.ack_histogram.percentile(99)
             _LOGGER.debug("The current p99 value is %d seconds.", p99)
 
-            # Make a copy of the leased messages. This is needed because it's
-            # possible for another thread to modify the dictionary while
-            # we're iterating over it.
-            leased_messages = copy.copy(self._leased_messages)
-
             # Drop any leases that are well beyond max lease time. This
             # ensures that in the event of a badly behaving actor, we can
             # drop messages and allow Pub/Sub to resend them.
             cutoff = time.time() - self._manager.flow_control.max_lease_duration
-            to_drop = [
-                requests.DropRequest(ack_id, item.size)
-                for ack_id, item in six.iteritems(leased_messages)
-                if item.added_time < cutoff
-            ]
+            to_drop = self._pop_outdated(cutoff)
 
             if to_drop:
                 _LOGGER.warning(
@@ -124,16 +234,23 @@ class Leaser(object):
                 )
                 self._manager.dispatcher.drop(to_drop)
 
-            # Remove dropped items from our copy of the leased messages (they
-            # have already been removed from the real one by
-            # self._manager.drop(), which calls self.remove()).
-            for item in to_drop:
-                leased_messages.pop(item.ack_id)
+            # Determine the appropriate period of time to wait before the
+            # next iteration, based on a random period between 0 seconds and
+            # 90% of the lease. This use of jitter (http://bit.ly/2s2ekL7)
+            # helps decrease contention in cases where there are many clients.
+            snooze = random.uniform(0.0, p99 * 0.9)
+
+            # Renew the leases that would otherwise expire before the next
+            # iteration, keeping 10% of the lease as a safety margin. Dropped
+            # items are skipped (they have already been removed from lease
+            # management by self._manager.drop(), which calls self.remove()).
+            horizon = time.time() + snooze + p99 * 0.1
+            dropped = set(item.ack_id for item in to_drop)
+            ack_ids = self._pop_expiring(horizon, p99, dropped)
 
             # Create a streaming pull request.
             # We do not actually call `modify_ack_deadline` over and over
             # because it is more efficient to make a single request.
-            ack_ids = leased_messages.keys()
             if ack_ids:
                 _LOGGER.debug("Renewing lease for %d ack IDs.", len(ack_ids))
 
@@ -146,13 +263,18 @@ class Leaser(object):
                     [requests.ModAckRequest(ack_id, p99) for ack_id in ack_ids]
                 )
 
+            duration = time.time() - iteration_start
+            self._metrics = LeaserMetrics(
+                iterations=self._metrics.iterations + 1,
+                last_iteration_duration=duration,
+                total_iteration_duration=(
+                    self._metrics.total_iteration_duration + duration
+                ),
+                last_renewed_count=len(ack_ids),
+                last_dropped_count=len(to_drop),
+            )
+
             # Now wait an appropriate period of time and do this again.
-            #
-            # We determine the appropriate period of time based on a random
-            # period between 0 seconds and 90% of the lease. This use of
-            # jitter (http://bit.ly/2s2ekL7) helps decrease contention in cases
-            # where there are many clients.
-            snooze = random.uniform(0.0, p99 * 0.9)
             _LOGGER.debug("Snoozing lease management for %f seconds.", snooze)
             self._stop_event.wait(timeout=snooze)
 
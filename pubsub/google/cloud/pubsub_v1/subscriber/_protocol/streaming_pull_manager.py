@@ -21,12 +21,14 @@ import threading
 
 import grpc
 import six
+from six.moves import queue
 
 from google.api_core import bidi
 from google.api_core import exceptions
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
+from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
 from google.cloud.pubsub_v1.subscriber._protocol import histogram
 from google.cloud.pubsub_v1.subscriber._protocol import leaser
 from google.cloud.pubsub_v1.subscriber._protocol import requests
@@ -35,6 +37,7 @@ import google.cloud.pubsub_v1.subscriber.scheduler
 
 _LOGGER = logging.getLogger(__name__)
 _RPC_ERROR_THREAD_NAME = "Thread-OnRpcTerminated"
+_BATCH_WORKER_NAME = "Thread-MessageBatcher"
 _RETRYABLE_STREAM_ERRORS = (
     exceptions.DeadlineExceeded,
     exceptions.ServiceUnavailable,
@@ -71,6 +74,26 @@ def _wrap_callback_errors(callback, message):
         message.nack()
 
 
+def _wrap_batch_callback_errors(callback, messages):
+    """Wraps a user batch callback so that if an exception occurs all of the
+    messages in the batch are nacked.
+
+    Args:
+        callback (Callable[None, Sequence[Message]]): The user callback.
+        messages (Sequence[~Message]): The Pub/Sub messages.
+    """
+    try:
+        callback(messages)
+    except Exception:
+        _LOGGER.exception(
+            "Top-level exception occurred in callback while processing a "
+            "batch of %d messages",
+            len(messages),
+        )
+        for message in messages:
+            message.nack()
+
+
 class StreamingPullManager(object):
     """The streaming pull manager coordinates pulling messages from Pub/Sub,
     leasing them, and scheduling them to be processed.
@@ -103,6 +126,7 @@ class StreamingPullManager(object):
         self._ack_deadline = 10
         self._rpc = None
         self._callback = None
+        self._batch_queue = None
         self._closing = threading.Lock()
         self._closed = False
         self._close_callbacks = []
@@ -119,6 +143,7 @@ class StreamingPullManager(object):
         self._leaser = None
         self._consumer = None
         self._heartbeater = None
+        self._batcher = None
 
     @property
     def is_active(self):
@@ -283,13 +308,21 @@ class StreamingPullManager(object):
         if self._rpc is not None and self._rpc.is_active:
             self._rpc.send(types.StreamingPullRequest())
 
-    def open(self, callback):
+    def open(self, callback, max_batch_size=None, max_batch_latency=0):
         """Begin consuming messages.
 
         Args:
             callback (Callable[None, google.cloud.pubsub_v1.message.Messages]):
                 A callback that will be called for each message received on the
-                stream.
+                stream. If ``max_batch_size`` is set, the callback is called
+                with a list of messages instead.
+            max_batch_size (int): If set, messages are grouped into lists of
+                at most this many messages, and the callback is scheduled once
+                per list rather than once per message.
+            max_batch_latency (float): The maximum amount of time in seconds
+                to wait for additional messages before scheduling the callback
+                with an incomplete batch. Only used if ``max_batch_size`` is
+                set.
         """
         if self.is_active:
             raise ValueError("This manager is already open.")
@@ -297,7 +330,21 @@ class StreamingPullManager(object):
         if self._closed:
             raise ValueError("This manager has been closed and can not be re-used.")
 
-        self._callback = functools.partial(_wrap_callback_errors, callback)
+        if max_batch_size is None:
+            self._callback = functools.partial(_wrap_callback_errors, callback)
+        else:
+            self._callback = functools.partial(_wrap_batch_callback_errors, callback)
+            self._batch_queue = queue.Queue()
+            batch_worker = helper_threads.QueueCallbackWorker(
+                self._batch_queue,
+                self._schedule_batch,
+                max_items=max_batch_size,
+                max_latency=max_batch_latency,
+            )
+            self._batcher = threading.Thread(
+                name=_BATCH_WORKER_NAME, target=batch_worker
+            )
+            self._batcher.daemon = True
 
         # Create the RPC
         self._rpc = bidi.ResumableBidiRpc(
@@ -316,6 +363,10 @@ class StreamingPullManager(object):
         # Start the thread to pass the requests.
         self._dispatcher.start()
 
+        # Start the thread grouping messages into batches, if any.
+        if self._batcher is not None:
+            self._batcher.start()
+
         # Start consuming messages.
         self._consumer.start()
 
@@ -346,6 +397,11 @@ class StreamingPullManager(object):
             self._consumer = None
 
             # Shutdown all helper threads
+            if self._batcher is not None:
+                _LOGGER.debug("Stopping message batcher.")
+                self._batch_queue.put(helper_threads.STOP)
+                self._batcher.join()
+                self._batcher = None
             _LOGGER.debug("Stopping scheduler.")
             self._scheduler.shutdown()
             self._scheduler = None
@@ -416,17 +472,39 @@ class StreamingPullManager(object):
 
         # Immediately modack the messages we received, as this tells the server
         # that we've received them.
+        p99 = self._ack_histogram.percentile(99)
         items = [
-            requests.ModAckRequest(message.ack_id, self._ack_histogram.percentile(99))
+            requests.ModAckRequest(message.ack_id, p99)
             for message in response.received_messages
         ]
         self._dispatcher.modify_ack_deadline(items)
+        codecs = self._client.codecs
         for received_message in response.received_messages:
             message = google.cloud.pubsub_v1.subscriber.message.Message(
-                received_message.message, received_message.ack_id, self._scheduler.queue
+                received_message.message,
+                received_message.ack_id,
+                self._scheduler.queue,
+                codecs=codecs,
             )
             # TODO: Immediately lease instead of using the callback queue.
-            self._scheduler.schedule(self._callback, message)
+            if self._batch_queue is not None:
+                self._batch_queue.put(message)
+            else:
+                self._scheduler.schedule(self._callback, message)
+
+    def _schedule_batch(self, messages):
+        """Schedule the callback for a batch of messages.
+
+        Args:
+            messages (Sequence[~Message]): The Pub/Sub messages.
+        """
+        if not messages:
+            # The batcher was stopped with no messages pending.
+            return
+        if self._scheduler is None:
+            # The manager is shutting down.
+            return
+        self._scheduler.schedule(self._callback, messages)
 
     def _should_recover(self, exception):
         """Determine if an error on the RPC stream should be recovered.
@@ -48,6 +48,10 @@ class Client(object):
     get sensible defaults.
 
     Args:
+        codecs (Sequence[~google.cloud.pubsub_v1.compression.Codec]): Codecs
+            used to decompress the data of received messages, in addition to
+            the default ``zlib``, ``zstd`` and ``snappy`` codecs. Codecs using
+            a dictionary must be provided here.
         kwargs (dict): Any additional arguments provided are sent as keyword
             keyword arguments to the underlying
             :class:`~.gapic.pubsub.v1.subscriber_client.SubscriberClient`.
@@ -55,7 +59,7 @@ class Client(object):
             arguments.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, codecs=(), **kwargs):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -90,6 +94,7 @@ class Client(object):
         # Add the metrics headers, and instantiate the underlying GAPIC
         # client.
         self._api = subscriber_client.SubscriberClient(**kwargs)
+        self._codecs = {codec.name: codec for codec in codecs}
 
     @classmethod
     def from_service_account_file(cls, filename, **kwargs):
@@ -124,6 +129,12 @@ class Client(object):
         """The underlying gapic API client."""
         return self._api
 
+    @property
+    def codecs(self):
+        """Mapping[str, ~google.cloud.pubsub_v1.compression.Codec]: The
+        additional codecs used to decompress messages, by name."""
+        return self._codecs
+
     def subscribe(self, subscription, callback, flow_control=(), scheduler=None):
         """Asynchronously start receiving messages on a given subscription.
 
@@ -212,3 +223,90 @@ class Client(object):
         manager.open(callback)
 
         return future
+
+    def subscribe_batch(
+        self,
+        subscription,
+        callback,
+        max_batch_size=100,
+        max_latency=0.01,
+        flow_control=(),
+        scheduler=None,
+    ):
+        """Asynchronously start receiving batches of messages on a given
+        subscription.
+
+        This is like :meth:`subscribe`, except that the ``callback`` is called
+        with a list of up to ``max_batch_size``
+        :class:`google.cloud.pubsub_v1.subscriber.message.Message` instances
+        rather than with an individual message. This amortizes the cost of
+        scheduling the callback over many messages, which helps high-rate
+        subscriptions of small messages.
+
+        It is the responsibility of the callback to either call ``ack()`` or
+        ``nack()`` on each message when it finished processing. If an
+        exception occurs in the callback during processing, the exception is
+        logged and all of the messages in the batch are ``nack()`` ed.
+
+        Example:
+
+        .. code-block:: python
+
+            from google.cloud import pubsub_v1
+
+            subscriber_client = pubsub_v1.SubscriberClient()
+
+            # existing subscription
+            subscription = subscriber_client.subscription_path(
+                'my-project-id', 'my-subscription')
+
+            def callback(messages):
+                for message in messages:
+                    print(message)
+                    message.ack()
+
+            future = subscriber.subscribe_batch(
+                subscription, callback, max_batch_size=500)
+
+            try:
+                future.result()
+            except KeyboardInterrupt:
+                future.cancel()
+
+        Args:
+            subscription (str): The name of the subscription. The
+                subscription should have already been created (for example,
+                by using :meth:`create_subscription`).
+            callback (Callable[Sequence[~google.cloud.pubsub_v1.subscriber.message.Message]]):
+                The callback function. This function receives a list of
+                messages as its only argument and will be called from a
+                different thread/process depending on the scheduling strategy.
+            max_batch_size (int): The maximum number of messages passed to
+                a single invocation of the callback.
+            max_latency (float): The maximum amount of time in seconds to wait
+                for additional messages before calling the callback with a
+                batch smaller than ``max_batch_size``.
+            flow_control (~google.cloud.pubsub_v1.types.FlowControl): The flow control
+                settings. Use this to prevent situations where you are
+                inundated with too many messages at once.
+            scheduler (~google.cloud.pubsub_v1.subscriber.scheduler.Scheduler): An optional
+                *scheduler* to use when executing the callback. This controls
+                how callbacks are executed concurrently.
+
+        Returns:
+            google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture: A
+                Future object that can be used to manage the background stream.
+        """
+        flow_control = types.FlowControl(*flow_control)
+
+        manager = streaming_pull_manager.StreamingPullManager(
+            self, subscription, flow_control=flow_control, scheduler=scheduler
+        )
+
+        future = futures.StreamingPullFuture(manager)
+
+        manager.open(
+            callback, max_batch_size=max_batch_size, max_batch_latency=max_latency
+        )
+
+        return future
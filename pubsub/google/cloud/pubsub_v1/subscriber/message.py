@@ -20,6 +20,7 @@ import math
 import time
 
 from google.api_core import datetime_helpers
+from google.cloud.pubsub_v1 import compression
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 
 
@@ -70,7 +71,17 @@ class Message(object):
             published.
     """
 
-    def __init__(self, message, ack_id, request_queue):
+    __slots__ = (
+        "_message",
+        "_ack_id",
+        "_request_queue",
+        "_received_timestamp",
+        "_size",
+        "_codecs",
+        "_data",
+    )
+
+    def __init__(self, message, ack_id, request_queue, codecs=None):
         """Construct the Message.
 
         .. note::
@@ -85,11 +96,16 @@ class Message(object):
             request_queue (queue.Queue): A queue provided by the policy that
                 can accept requests; the policy is responsible for handling
                 those requests.
+            codecs (Mapping[str, ~.pubsub_v1.compression.Codec]): Codecs by
+                name, used to decompress the message data in addition to the
+                default codecs.
         """
         self._message = message
         self._ack_id = ack_id
         self._request_queue = request_queue
-        self.message_id = message.message_id
+        self._size = None
+        self._codecs = codecs
+        self._data = None
 
         # The instantiation time is the time that this message
         # was received. Tracking this provides us a way to be smart about
@@ -102,7 +118,7 @@ class Message(object):
 
     def __repr__(self):
         # Get an abbreviated version of the data.
-        abbv_data = self._message.data
+        abbv_data = self.data
         if len(abbv_data) > 50:
             abbv_data = abbv_data[:50] + b"..."
 
@@ -114,6 +130,12 @@ class Message(object):
         pretty_attrs = pretty_attrs.lstrip()
         return _MESSAGE_REPR.format(abbv_data, pretty_attrs)
 
+    @property
+    def message_id(self):
+        """str: The message ID. In general, you should not need to use this
+        directly."""
+        return self._message.message_id
+
     @property
     def attributes(self):
         """Return the attributes of the underlying Pub/Sub Message.
@@ -137,11 +159,22 @@ class Message(object):
     def data(self):
         """Return the data for the underlying Pub/Sub Message.
 
+        If the data was compressed by the publisher, it is decompressed
+        (once) using the codec named by the
+        :data:`~.pubsub_v1.compression.ENCODING_ATTRIBUTE` attribute.
+
         Returns:
             bytes: The message data. This is always a bytestring; if you
                 want a text string, call :meth:`bytes.decode`.
         """
-        return self._message.data
+        if self._data is None:
+            data = self._message.data
+            encoding = self._message.attributes.get(compression.ENCODING_ATTRIBUTE)
+            if encoding:
+                codec = compression.get_codec(encoding, self._codecs)
+                data = codec.decode(data)
+            self._data = data
+        return self._data
 
     @property
     def publish_time(self):
@@ -159,7 +192,10 @@ class Message(object):
     @property
     def size(self):
         """Return the size of the underlying message, in bytes."""
-        return self._message.ByteSize()
+        # The message is never modified, so its size is only computed once.
+        if self._size is None:
+            self._size = self._message.ByteSize()
+        return self._size
 
     @property
     def ack_id(self):
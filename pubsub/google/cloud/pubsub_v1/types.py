@@ -59,6 +59,7 @@ FlowControl = collections.namedtuple(
         "max_request_batch_size",
         "max_request_batch_latency",
         "max_lease_duration",
+        "ack_flush_interval",
     ],
 )
 FlowControl.__new__.__defaults__ = (
@@ -69,6 +70,7 @@ FlowControl.__new__.__defaults__ = (
     100,  # max_request_batch_size: 100
     0.01,  # max_request_batch_latency: 0.01s
     2 * 60 * 60,  # max_lease_duration: 2 hours.
+    0.1,  # ack_flush_interval: 0.1s
 )
 
 
@@ -14,12 +14,15 @@
 
 from __future__ import absolute_import
 
+import zlib
+
 from google.auth import credentials
 
 import mock
 import pytest
 
 from google.cloud.pubsub_v1.gapic import publisher_client
+from google.cloud.pubsub_v1 import compression
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
 
@@ -128,6 +131,60 @@ def test_publish():
     )
 
 
+def test_publish_with_codec():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds, codec=compression.ZlibCodec())
+
+    batch = mock.Mock(spec=client._batch_class)
+    batch.will_accept.return_value = True
+
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    data = b"spam" * 100
+    client.publish(topic, data, bar="baz")
+
+    batch.publish.assert_called_once_with(
+        types.PubsubMessage(
+            data=zlib.compress(data, 6),
+            attributes={"bar": "baz", compression.ENCODING_ATTRIBUTE: "zlib"},
+        )
+    )
+
+
+def test_publish_with_codec_not_smaller():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds, codec=compression.ZlibCodec())
+
+    batch = mock.Mock(spec=client._batch_class)
+    batch.will_accept.return_value = True
+
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    client.publish(topic, b"spam")
+
+    batch.publish.assert_called_once_with(types.PubsubMessage(data=b"spam"))
+
+
+def test_publish_with_codec_below_min_size():
+    creds = mock.Mock(spec=credentials.Credentials)
+    codec = mock.create_autospec(compression.Codec, instance=True)
+    codec.min_size = 1000
+    client = publisher.Client(credentials=creds, codec=codec)
+
+    batch = mock.Mock(spec=client._batch_class)
+    batch.will_accept.return_value = True
+
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    client.publish(topic, b"spam" * 100)
+
+    codec.encode.assert_not_called()
+    batch.publish.assert_called_once_with(types.PubsubMessage(data=b"spam" * 100))
+
+
 def test_publish_data_not_bytestring_error():
     creds = mock.Mock(spec=credentials.Credentials)
     client = publisher.Client(credentials=creds)
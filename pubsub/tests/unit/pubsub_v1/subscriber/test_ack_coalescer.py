@@ -0,0 +1,215 @@
+# Copyright 2019, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import ack_coalescer
+from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
+
+import mock
+import pytest
+
+
+def create_coalescer():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    return ack_coalescer.AckCoalescer(manager, 0.1)
+
+
+def test_flush_merges_acks_and_modacks():
+    coalescer = create_coalescer()
+
+    coalescer.ack(["ack1"])
+    coalescer.modify_ack_deadline([("ack2", 10)])
+    coalescer.ack(["ack3"])
+    assert coalescer.pending_count == 3
+
+    coalescer.flush()
+
+    coalescer._manager.send.assert_called_once_with(
+        types.StreamingPullRequest(
+            ack_ids=["ack1", "ack3"],
+            modify_deadline_ack_ids=["ack2"],
+            modify_deadline_seconds=[10],
+        )
+    )
+    assert coalescer.pending_count == 0
+    assert coalescer._bytes == 0
+
+
+def test_flush_empty():
+    coalescer = create_coalescer()
+
+    coalescer.flush()
+
+    coalescer._manager.send.assert_not_called()
+
+
+def test_ack_supersedes_modack():
+    coalescer = create_coalescer()
+
+    coalescer.modify_ack_deadline([("ack1", 10), ("ack2", 0)])
+    coalescer.ack(["ack1", "ack2"])
+    coalescer.modify_ack_deadline([("ack1", 20)])
+    coalescer.flush()
+
+    coalescer._manager.send.assert_called_once_with(
+        types.StreamingPullRequest(ack_ids=["ack1", "ack2"])
+    )
+
+
+def test_modack_keeps_latest_deadline():
+    coalescer = create_coalescer()
+
+    coalescer.modify_ack_deadline([("ack1", 10)])
+    coalescer.modify_ack_deadline([("ack1", 30)])
+    coalescer.ack(["ack2", "ack2"])
+    coalescer.flush()
+
+    coalescer._manager.send.assert_called_once_with(
+        types.StreamingPullRequest(
+            ack_ids=["ack2"],
+            modify_deadline_ack_ids=["ack1"],
+            modify_deadline_seconds=[30],
+        )
+    )
+
+
+def test_flush_splits_large_requests():
+    coalescer = create_coalescer()
+    # Realistic lengths for ACK IDs (max 176 bytes).
+    ack_ids = [str(i).zfill(176) for i in range(2000)]
+    modack_ids = [str(i).zfill(176) for i in range(2000, 4000)]
+
+    with mock.patch.object(coalescer, "flush"):
+        coalescer.ack(ack_ids)
+        coalescer.modify_ack_deadline([(ack_id, 60) for ack_id in modack_ids])
+    coalescer.flush()
+
+    sent_ack_ids = []
+    sent_modack_ids = []
+    for call in coalescer._manager.send.call_args_list:
+        request = call[0][0]
+        assert request.ByteSize() <= 512 * 1024
+        sent_ack_ids.extend(request.ack_ids)
+        sent_modack_ids.extend(request.modify_deadline_ack_ids)
+
+    assert coalescer._manager.send.call_count == 2
+    assert sent_ack_ids == ack_ids
+    assert sent_modack_ids == modack_ids
+
+
+def test_ack_flushes_when_full():
+    coalescer = create_coalescer()
+    ack_ids = [str(i).zfill(176) for i in range(3000)]
+
+    coalescer.ack(ack_ids)
+
+    assert coalescer._manager.send.call_count == 2
+    assert coalescer.pending_count == 0
+
+
+def test_coalesce_stopped(caplog):
+    caplog.set_level(logging.INFO)
+    coalescer = create_coalescer()
+    coalescer._stop_event.set()
+
+    coalescer.coalesce()
+
+    assert "exiting" in caplog.text
+
+
+def test_coalesce_flushes():
+    coalescer = create_coalescer()
+    coalescer.ack(["ack1"])
+
+    def stop_after_wait(timeout):
+        assert timeout == 0.1
+        coalescer._stop_event.set()
+
+    coalescer._stop_event.wait = stop_after_wait
+
+    coalescer.coalesce()
+
+    coalescer._manager.send.assert_called_once_with(
+        types.StreamingPullRequest(ack_ids=["ack1"])
+    )
+
+
+def test_coalesce_error(caplog):
+    coalescer = create_coalescer()
+    coalescer.ack(["ack1"])
+    coalescer._manager.send.side_effect = ValueError("meep")
+
+    def stop_after_wait(timeout):
+        coalescer._stop_event.set()
+
+    coalescer._stop_event.wait = stop_after_wait
+
+    coalescer.coalesce()
+
+    assert "Error while flushing acks" in caplog.text
+
+
+@mock.patch("threading.Thread", autospec=True)
+def test_start(thread):
+    coalescer = create_coalescer()
+
+    coalescer.start()
+
+    thread.assert_called_once_with(
+        name=ack_coalescer._COALESCER_WORKER_NAME, target=coalescer.coalesce
+    )
+
+    thread.return_value.start.assert_called_once()
+
+    assert coalescer._thread is not None
+
+
+@mock.patch("threading.Thread", autospec=True)
+def test_start_already_started(thread):
+    coalescer = create_coalescer()
+    coalescer._thread = mock.sentinel.thread
+
+    with pytest.raises(ValueError):
+        coalescer.start()
+
+    thread.assert_not_called()
+
+
+def test_stop():
+    coalescer = create_coalescer()
+    thread = mock.create_autospec(threading.Thread, instance=True)
+    coalescer._thread = thread
+    coalescer.ack(["ack1"])
+
+    coalescer.stop()
+
+    assert coalescer._stop_event.is_set()
+    thread.join.assert_called_once()
+    assert coalescer._thread is None
+    coalescer._manager.send.assert_called_once_with(
+        types.StreamingPullRequest(ack_ids=["ack1"])
+    )
+
+
+def test_stop_no_join():
+    coalescer = create_coalescer()
+
+    coalescer.stop()
+
+    coalescer._manager.send.assert_not_called()
@@ -15,6 +15,7 @@
 import threading
 
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import ack_coalescer
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
 from google.cloud.pubsub_v1.subscriber._protocol import requests
@@ -95,6 +96,33 @@ def test_ack_no_time():
     manager.ack_histogram.add.assert_not_called()
 
 
+def test_ack_splitting_large_payload():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    items = [
+        # use realistic lengths for ACK IDs (max 176 bytes)
+        requests.AckRequest(ack_id=str(i).zfill(176), byte_size=0, time_to_ack=20)
+        for i in range(5001)
+    ]
+    dispatcher_.ack(items)
+
+    calls = manager.send.call_args_list
+    assert len(calls) == 3
+
+    all_ack_ids = {item.ack_id for item in items}
+    sent_ack_ids = set()
+
+    for call in calls:
+        message = call[0][0]
+        assert len(message.ack_ids) <= dispatcher._ACK_IDS_BATCH_SIZE
+        sent_ack_ids.update(message.ack_ids)
+
+    assert sent_ack_ids == all_ack_ids  # all messages should have been ACK-ed
+
+
 def test_lease():
     manager = mock.create_autospec(
         streaming_pull_manager.StreamingPullManager, instance=True
@@ -153,11 +181,57 @@ def test_modify_ack_deadline():
     )
 
 
+def test_modify_ack_deadline_groups_by_deadline():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    items = [
+        requests.ModAckRequest(ack_id="ack1", seconds=60),
+        requests.ModAckRequest(ack_id="ack2", seconds=30),
+        requests.ModAckRequest(ack_id="ack3", seconds=60),
+    ]
+    dispatcher_.modify_ack_deadline(items)
+
+    manager.send.assert_called_once_with(
+        types.StreamingPullRequest(
+            modify_deadline_ack_ids=["ack1", "ack3", "ack2"],
+            modify_deadline_seconds=[60, 60, 30],
+        )
+    )
+
+
+def test_modify_ack_deadline_splitting_large_payload():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    items = [
+        requests.ModAckRequest(ack_id=str(i).zfill(176), seconds=60)
+        for i in range(5001)
+    ]
+    dispatcher_.modify_ack_deadline(items)
+
+    calls = manager.send.call_args_list
+    assert len(calls) == 3
+
+    sent_ack_ids = set()
+    for call in calls:
+        message = call[0][0]
+        assert len(message.modify_deadline_ack_ids) <= dispatcher._ACK_IDS_BATCH_SIZE
+        sent_ack_ids.update(message.modify_deadline_ack_ids)
+
+    assert sent_ack_ids == {item.ack_id for item in items}
+
+
 @mock.patch("threading.Thread", autospec=True)
 def test_start(thread):
     manager = mock.create_autospec(
         streaming_pull_manager.StreamingPullManager, instance=True
     )
+    manager.flow_control = types.FlowControl(ack_flush_interval=0)
     dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
 
     dispatcher_.start()
@@ -169,6 +243,61 @@ def test_start(thread):
     thread.return_value.start.assert_called_once()
 
     assert dispatcher_._thread is not None
+    assert dispatcher_._coalescer is None
+
+
+@mock.patch("threading.Thread", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.ack_coalescer.AckCoalescer",
+    autospec=True,
+)
+def test_start_with_coalescer(coalescer, thread):
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    manager.flow_control = types.FlowControl(ack_flush_interval=0.5)
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    dispatcher_.start()
+
+    coalescer.assert_called_once_with(manager, 0.5)
+    coalescer.return_value.start.assert_called_once()
+    assert dispatcher_._coalescer == coalescer.return_value
+
+
+def test_ack_coalesced():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+    dispatcher_._coalescer = mock.create_autospec(
+        ack_coalescer.AckCoalescer, instance=True
+    )
+
+    items = [requests.AckRequest(ack_id="ack_id_string", byte_size=0, time_to_ack=20)]
+    dispatcher_.ack(items)
+
+    dispatcher_._coalescer.ack.assert_called_once_with(["ack_id_string"])
+    manager.send.assert_not_called()
+    manager.leaser.remove.assert_called_once_with(items)
+
+
+def test_modify_ack_deadline_coalesced():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+    dispatcher_._coalescer = mock.create_autospec(
+        ack_coalescer.AckCoalescer, instance=True
+    )
+
+    dispatcher_.modify_ack_deadline(
+        [requests.ModAckRequest(ack_id="ack_id_string", seconds=60)]
+    )
+
+    (items,), _ = dispatcher_._coalescer.modify_ack_deadline.call_args
+    assert list(items) == [("ack_id_string", 60)]
+    manager.send.assert_not_called()
 
 
 @mock.patch("threading.Thread", autospec=True)
@@ -198,6 +327,18 @@ def test_stop():
     assert dispatcher_._thread is None
 
 
+def test_stop_coalescer():
+    queue_ = queue.Queue()
+    dispatcher_ = dispatcher.Dispatcher(mock.sentinel.manager, queue_)
+    coalescer = mock.create_autospec(ack_coalescer.AckCoalescer, instance=True)
+    dispatcher_._coalescer = coalescer
+
+    dispatcher_.stop()
+
+    coalescer.stop.assert_called_once()
+    assert dispatcher_._coalescer is None
+
+
 def test_stop_no_join():
     dispatcher_ = dispatcher.Dispatcher(mock.sentinel.manager, mock.sentinel.queue)
 
@@ -116,3 +116,32 @@ def test_queue_callback_worker_exception():
         # Assert that we got the expected calls.
         assert get.call_count == 3
         callback.assert_called_once_with([mock.sentinel.A])
+
+
+def test__get_many_drains_without_clock():
+    queue_ = queue.Queue()
+    for item in range(5):
+        queue_.put(item)
+
+    with mock.patch("time.time", autospec=True) as time_:
+        time_.return_value = 0
+        items = helper_threads._get_many(queue_, max_items=3, max_latency=10)
+
+    assert items == [0, 1, 2]
+    assert time_.call_count == 1
+
+
+def test__get_many_max_latency():
+    queue_ = queue.Queue()
+    queue_.put(mock.sentinel.A)
+
+    with mock.patch("time.time", autospec=True) as time_:
+        time_.side_effect = (0, 5)
+        with mock.patch.object(queue_, "get_nowait") as get_nowait:
+            get_nowait.side_effect = queue.Empty()
+            with mock.patch.object(queue_, "get") as get:
+                get.side_effect = (mock.sentinel.A, queue.Empty())
+                items = helper_threads._get_many(queue_, max_items=3, max_latency=10)
+
+    assert items == [mock.sentinel.A]
+    get.assert_called_with(timeout=5)
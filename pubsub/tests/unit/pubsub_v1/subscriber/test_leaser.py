@@ -170,6 +170,83 @@ def test_maintain_leases_outdated_items(time):
     manager.dispatcher.drop.assert_called_once_with(
         [requests.DropRequest(ack_id="ack1", byte_size=50)]
     )
+    assert leaser_.metrics.last_dropped_count == 1
+
+
+@mock.patch("random.uniform", autospec=True)
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_only_expiring_items(time, uniform):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    uniform.return_value = 5
+
+    time.return_value = 0
+    leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
+
+    # The first iteration renews the new lease for 10 seconds.
+    make_sleep_mark_manager_as_inactive(leaser_)
+    leaser_.maintain_leases()
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with(
+        [requests.ModAckRequest(ack_id="ack1", seconds=10)]
+    )
+    manager.dispatcher.modify_ack_deadline.reset_mock()
+
+    # A lease added later is due immediately, the first one is not.
+    time.return_value = 2
+    leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=50)])
+    manager.is_active = True
+    leaser_.maintain_leases()
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with(
+        [requests.ModAckRequest(ack_id="ack2", seconds=10)]
+    )
+    manager.dispatcher.modify_ack_deadline.reset_mock()
+
+    # Once the first lease is close to expiring, only it is renewed.
+    time.return_value = 5
+    manager.is_active = True
+    leaser_.maintain_leases()
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with(
+        [requests.ModAckRequest(ack_id="ack1", seconds=10)]
+    )
+
+    assert leaser_.metrics.iterations == 3
+    assert leaser_.metrics.last_renewed_count == 1
+    assert leaser_.metrics.last_dropped_count == 0
+
+
+def test_maintain_leases_removed_items():
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+    leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
+    leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=50)])
+    leaser_.remove([requests.DropRequest(ack_id="ack1", byte_size=50)])
+
+    leaser_.maintain_leases()
+
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with(
+        [requests.ModAckRequest(ack_id="ack2", seconds=10)]
+    )
+
+
+def test_remove_compacts_heaps():
+    leaser_ = leaser.Leaser(mock.sentinel.manager)
+    items = [
+        requests.LeaseRequest(ack_id="ack{}".format(i), byte_size=1)
+        for i in range(1000)
+    ]
+    leaser_.add(items)
+    leaser_.remove([requests.DropRequest(*item) for item in items[1:]])
+
+    assert leaser_.message_count == 1
+    assert leaser_._expiries == [(leaser_._leased_messages["ack0"].expiry, "ack0")]
+    assert len(leaser_._added_times) == 1
+
+
+def test_metrics_default():
+    leaser_ = leaser.Leaser(mock.sentinel.manager)
+
+    assert leaser_.metrics == leaser.LeaserMetrics(0, 0.0, 0.0, 0, 0)
 
 
 @mock.patch("threading.Thread", autospec=True)
@@ -14,13 +14,16 @@
 
 import datetime
 import time
+import zlib
 
 import mock
+import pytest
 import pytz
 from six.moves import queue
 from google.protobuf import timestamp_pb2
 
 from google.api_core import datetime_helpers
+from google.cloud.pubsub_v1 import compression
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber import message
 from google.cloud.pubsub_v1.subscriber._protocol import requests
@@ -68,6 +71,48 @@ def test_size():
     assert msg.size == 30  # payload + protobuf overhead
 
 
+def test_data_compressed():
+    msg = create_message(
+        zlib.compress(b"foo" * 100), **{compression.ENCODING_ATTRIBUTE: "zlib"}
+    )
+    assert msg.data == b"foo" * 100
+    assert msg.size == msg._message.ByteSize()
+
+
+def test_data_compressed_with_codecs():
+    codec = mock.create_autospec(compression.Codec, instance=True)
+    codec.decode.return_value = b"bar"
+    msg = create_message(b"foo", **{compression.ENCODING_ATTRIBUTE: "custom"})
+    msg._codecs = {"custom": codec}
+
+    assert msg.data == b"bar"
+    assert msg.data == b"bar"
+    codec.decode.assert_called_once_with(b"foo")
+
+
+def test_data_compressed_unknown_codec():
+    msg = create_message(b"foo", **{compression.ENCODING_ATTRIBUTE: "custom"})
+    with pytest.raises(ValueError):
+        msg.data
+
+
+def test_size_is_cached():
+    msg = create_message(b"foo")
+    assert msg.size == 30
+    msg._message.data = b"foobar"
+    assert msg.size == 30
+
+
+def test_message_id():
+    msg = create_message(b"foo")
+    assert msg.message_id == "message_id"
+
+
+def test_no_instance_dict():
+    msg = create_message(b"foo")
+    assert not hasattr(msg, "__dict__")
+
+
 def test_ack_id():
     ack_id = "MY-ACK-ID"
     msg = create_message(b"foo", ack_id=ack_id)
@@ -13,9 +13,11 @@
 # limitations under the License.
 
 import logging
+import threading
 
 import mock
 import pytest
+from six.moves import queue
 
 from google.api_core import bidi
 from google.api_core import exceptions
@@ -26,6 +28,7 @@ from google.cloud.pubsub_v1.subscriber import message
 from google.cloud.pubsub_v1.subscriber import scheduler
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
+from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
 from google.cloud.pubsub_v1.subscriber._protocol import leaser
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
@@ -67,6 +70,27 @@ def test__wrap_callback_errors_error():
     msg.nack.assert_called_once()
 
 
+def test__wrap_batch_callback_errors_no_error():
+    msgs = [mock.create_autospec(message.Message, instance=True) for _ in range(2)]
+    callback = mock.Mock()
+
+    streaming_pull_manager._wrap_batch_callback_errors(callback, msgs)
+
+    callback.assert_called_once_with(msgs)
+    for msg in msgs:
+        msg.nack.assert_not_called()
+
+
+def test__wrap_batch_callback_errors_error():
+    msgs = [mock.create_autospec(message.Message, instance=True) for _ in range(2)]
+    callback = mock.Mock(side_effect=ValueError("meep"))
+
+    streaming_pull_manager._wrap_batch_callback_errors(callback, msgs)
+
+    for msg in msgs:
+        msg.nack.assert_called_once()
+
+
 def test_constructor_and_default_state():
     manager = streaming_pull_manager.StreamingPullManager(
         mock.sentinel.client, mock.sentinel.subscription
@@ -333,6 +357,35 @@ def test_open(heartbeater, dispatcher, leaser, background_consumer, resumable_bi
     assert manager.is_active is True
 
 
+@mock.patch("threading.Thread", autospec=True)
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+def test_open_batch(
+    heartbeater, dispatcher, leaser, background_consumer, resumable_bidi_rpc, thread
+):
+    manager = make_manager()
+
+    manager.open(mock.sentinel.callback, max_batch_size=10, max_batch_latency=0.5)
+
+    thread.assert_called_once_with(
+        name=streaming_pull_manager._BATCH_WORKER_NAME, target=mock.ANY
+    )
+    thread.return_value.start.assert_called_once()
+    assert manager._batcher == thread.return_value
+
+    worker = thread.call_args[1]["target"]
+    assert worker.queue is manager._batch_queue
+    assert worker.max_items == 10
+    assert worker.max_latency == 0.5
+
+
 def test_open_already_active():
     manager = make_manager()
     manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
@@ -399,6 +452,35 @@ def test_close_inactive_consumer():
     scheduler.shutdown.assert_called_once()
 
 
+def test_close_batcher():
+    manager, _, _, _, _, scheduler = make_running_manager()
+    manager._batch_queue = queue.Queue()
+    batcher = mock.create_autospec(threading.Thread, instance=True)
+    manager._batcher = batcher
+
+    manager.close()
+
+    assert manager._batch_queue.get() is helper_threads.STOP
+    batcher.join.assert_called_once()
+    assert manager._batcher is None
+    scheduler.shutdown.assert_called_once()
+
+
+def test_close_batcher_no_pending_messages():
+    manager, _, _, _, _, scheduler = make_running_manager()
+    manager._batch_queue = queue.Queue()
+    batch_worker = helper_threads.QueueCallbackWorker(
+        manager._batch_queue, manager._schedule_batch, max_items=10
+    )
+    manager._batcher = threading.Thread(target=batch_worker)
+    manager._batcher.start()
+
+    manager.close()
+
+    scheduler.schedule.assert_not_called()
+    scheduler.shutdown.assert_called_once()
+
+
 def test_close_idempotent():
     manager, _, _, _, _, scheduler = make_running_manager()
 
@@ -477,6 +559,53 @@ def test_on_response():
         assert isinstance(call[1][1], message.Message)
 
 
+def test_on_response_batch():
+    manager, _, dispatcher, _, _, scheduler = make_running_manager()
+    manager._callback = mock.sentinel.callback
+    manager._batch_queue = queue.Queue()
+
+    response = types.StreamingPullResponse(
+        received_messages=[
+            types.ReceivedMessage(
+                ack_id="fack", message=types.PubsubMessage(data=b"foo", message_id="1")
+            ),
+            types.ReceivedMessage(
+                ack_id="back", message=types.PubsubMessage(data=b"bar", message_id="2")
+            ),
+        ]
+    )
+
+    manager._on_response(response)
+
+    dispatcher.modify_ack_deadline.assert_called_once_with(
+        [requests.ModAckRequest("fack", 10), requests.ModAckRequest("back", 10)]
+    )
+    scheduler.schedule.assert_not_called()
+
+    messages = [manager._batch_queue.get_nowait() for _ in range(2)]
+    assert [msg.ack_id for msg in messages] == ["fack", "back"]
+
+    manager._schedule_batch(messages)
+
+    scheduler.schedule.assert_called_once_with(mock.sentinel.callback, messages)
+
+
+def test__schedule_batch_after_close():
+    manager = make_manager()
+    manager._scheduler = None
+
+    # Should not raise.
+    manager._schedule_batch([mock.sentinel.message])
+
+
+def test__schedule_batch_empty():
+    manager = make_manager()
+
+    manager._schedule_batch([])
+
+    manager._scheduler.schedule.assert_not_called()
+
+
 def test_retryable_stream_errors():
     # Make sure the config matches our hard-coded tuple of exceptions.
     interfaces = subscriber_client_config.config["interfaces"]
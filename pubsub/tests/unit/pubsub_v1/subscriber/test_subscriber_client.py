@@ -15,6 +15,7 @@
 from google.auth import credentials
 import mock
 
+from google.cloud.pubsub_v1 import compression
 from google.cloud.pubsub_v1 import subscriber
 from google.cloud.pubsub_v1.gapic import subscriber_client
 from google.cloud.pubsub_v1 import types
@@ -59,6 +60,14 @@ def test_class_method_factory():
     assert isinstance(client, subscriber.Client)
 
 
+def test_init_codecs():
+    creds = mock.Mock(spec=credentials.Credentials)
+    codec = compression.ZlibCodec()
+    client = subscriber.Client(credentials=creds, codecs=[codec])
+
+    assert client.codecs == {"zlib": codec}
+
+
 @mock.patch(
     "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
     "StreamingPullManager.open",
@@ -98,3 +107,23 @@ def test_subscribe_options(manager_open):
     assert future._manager.flow_control == flow_control
     assert future._manager._scheduler == scheduler
     manager_open.assert_called_once_with(mock.ANY, mock.sentinel.callback)
+
+
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_subscribe_batch(manager_open):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+
+    future = client.subscribe_batch(
+        "sub_name_a", callback=mock.sentinel.callback, max_batch_size=50
+    )
+    assert isinstance(future, futures.StreamingPullFuture)
+
+    assert future._manager._subscription == "sub_name_a"
+    manager_open.assert_called_once_with(
+        mock.ANY, mock.sentinel.callback, max_batch_size=50, max_batch_latency=0.01
+    )
@@ -0,0 +1,172 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import zlib
+
+import mock
+import pytest
+import six
+
+from google.cloud.pubsub_v1 import compression
+
+
+DATA = b'{"user": "guido", "action": "login", "success": true}' * 20
+
+
+def test_zlib_round_trip():
+    codec = compression.ZlibCodec(level=9)
+
+    encoded = codec.encode(DATA)
+
+    assert codec.name == "zlib"
+    assert len(encoded) < len(DATA)
+    assert zlib.decompress(encoded) == DATA
+    assert codec.decode(encoded) == DATA
+
+
+@pytest.mark.skipif(six.PY2, reason="zlib dictionaries require Python 3")
+def test_zlib_dictionary_round_trip():
+    dictionary = b'{"user": "", "action": "login", "success": true}'
+    codec = compression.ZlibCodec(dictionary=dictionary)
+    plain = compression.ZlibCodec()
+    data = b'{"user": "guido", "action": "login", "success": true}'
+
+    encoded = codec.encode(data)
+
+    assert codec.name == "zlib:{:08x}".format(zlib.crc32(dictionary) & 0xFFFFFFFF)
+    assert len(encoded) < len(plain.encode(data))
+    assert codec.decode(encoded) == data
+
+
+@pytest.mark.skipif(not six.PY2, reason="zlib dictionaries require Python 3")
+def test_zlib_dictionary_py2():  # pragma: NO COVER
+    with pytest.raises(ValueError):
+        compression.ZlibCodec(dictionary=b"foo")
+
+
+def test_zstd_missing_dependency():
+    with mock.patch.object(compression, "zstandard", None):
+        with pytest.raises(ImportError):
+            compression.ZstdCodec()
+        with pytest.raises(ImportError):
+            compression.ZstdCodec.train_dictionary([DATA])
+
+
+def test_zstd_round_trip():
+    zstandard = mock.Mock(
+        spec=["ZstdCompressionDict", "ZstdCompressor", "ZstdDecompressor"]
+    )
+    zstandard.ZstdCompressor.return_value.compress.return_value = b"compressed"
+    zstandard.ZstdDecompressor.return_value.decompress.return_value = DATA
+
+    with mock.patch.object(compression, "zstandard", zstandard):
+        codec = compression.ZstdCodec(level=5)
+
+    assert codec.name == "zstd"
+    assert codec.encode(DATA) == b"compressed"
+    assert codec.decode(b"compressed") == DATA
+    zstandard.ZstdCompressor.assert_called_once_with(level=5, dict_data=None)
+    zstandard.ZstdDecompressor.assert_called_once_with(dict_data=None)
+
+
+def test_zstd_per_thread():
+    import threading
+
+    zstandard = mock.Mock(
+        spec=["ZstdCompressionDict", "ZstdCompressor", "ZstdDecompressor"]
+    )
+    zstandard.ZstdCompressor.side_effect = lambda **kwargs: mock.Mock()
+    zstandard.ZstdDecompressor.side_effect = lambda **kwargs: mock.Mock()
+
+    with mock.patch.object(compression, "zstandard", zstandard):
+        codec = compression.ZstdCodec()
+
+    def round_trips():
+        codec.encode(DATA)
+        codec.encode(DATA)
+        codec.decode(b"compressed")
+
+    threads = [threading.Thread(target=round_trips) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    round_trips()
+
+    assert zstandard.ZstdCompressor.call_count == 3
+    assert zstandard.ZstdDecompressor.call_count == 3
+    zstandard.ZstdCompressionDict.assert_not_called()
+
+
+def test_zstd_dictionary():
+    zstandard = mock.Mock(
+        spec=[
+            "ZstdCompressionDict",
+            "ZstdCompressor",
+            "ZstdDecompressor",
+            "train_dictionary",
+        ]
+    )
+    zstandard.ZstdCompressionDict.return_value.dict_id.return_value = 1234
+    zstandard.train_dictionary.return_value.as_bytes.return_value = b"dictionary"
+
+    with mock.patch.object(compression, "zstandard", zstandard):
+        dictionary = compression.ZstdCodec.train_dictionary(iter([DATA]), size=100)
+        codec = compression.ZstdCodec(dictionary=dictionary)
+
+    assert dictionary == b"dictionary"
+    zstandard.train_dictionary.assert_called_once_with(100, [DATA])
+    zstandard.ZstdCompressionDict.assert_called_once_with(b"dictionary")
+    assert codec.name == "zstd:1234"
+
+
+def test_snappy_missing_dependency():
+    with mock.patch.object(compression, "snappy", None):
+        with pytest.raises(ImportError):
+            compression.SnappyCodec()
+
+
+def test_snappy_round_trip():
+    snappy = mock.Mock(spec=["compress", "decompress"])
+    snappy.compress.return_value = b"compressed"
+    snappy.decompress.return_value = DATA
+
+    with mock.patch.object(compression, "snappy", snappy):
+        codec = compression.SnappyCodec(min_size=10)
+
+        assert codec.name == "snappy"
+        assert codec.min_size == 10
+        assert codec.encode(DATA) == b"compressed"
+        assert codec.decode(b"compressed") == DATA
+
+
+def test_get_codec_default():
+    codec = compression.get_codec("zlib")
+
+    assert isinstance(codec, compression.ZlibCodec)
+    assert compression.get_codec("zlib") is codec
+
+
+def test_get_codec_custom():
+    codec = compression.ZlibCodec()
+
+    assert compression.get_codec("zlib", {"zlib": codec}) is codec
+    assert compression.get_codec("custom", {"custom": codec}) is codec
+
+
+def test_get_codec_unknown():
+    with pytest.raises(ValueError):
+        compression.get_codec("custom", {})
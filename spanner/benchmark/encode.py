@@ -0,0 +1,137 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Throughput benchmark for encoding the rows of write mutations.
+
+Builds the ``Mutation.Write`` protobuf of an insert of ``--rows`` rows,
+without any network I/O:
+
+* ``legacy``: with a copy of the previous implementation, which built one
+  ``Value`` per cell with ``_make_value_pb`` and copied them into the
+  write,
+* ``rows``: from lists of values, as :meth:`Batch.insert` does now,
+* ``dataframe``: from a pandas ``DataFrame``, if pandas is installed.
+
+All must build the same protobuf.
+
+Usage:
+
+  $ python spanner/benchmark/encode.py --rows 20000
+"""
+
+from __future__ import division
+
+import argparse
+import datetime
+import json
+import sys
+import time
+
+from google.protobuf.struct_pb2 import ListValue
+
+from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1.batch import _make_write_pb
+from google.cloud.spanner_v1.proto.mutation_pb2 import Mutation
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+
+TABLE = "citizens"
+COLUMNS = ["email", "first_name", "last_name", "age", "score", "married", "updated"]
+
+
+def parse_options():
+    """Parses options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def legacy_write_pb(table, columns, values):
+    """The previous implementation of ``_make_write_pb``."""
+    return Mutation.Write(
+        table=table,
+        columns=columns,
+        values=[
+            ListValue(values=[_make_value_pb(value) for value in row])
+            for row in values
+        ],
+    )
+
+
+def make_rows(options):
+    """Builds the rows to insert."""
+    updated = datetime.datetime(2019, 3, 5, 12, 34, 56, 123456)
+    return [
+        [
+            u"citizen%d@example.com" % (index,),
+            u"Phred",
+            u"Phlyntstone",
+            index % 100,
+            index / 7.0,
+            index % 2 == 0,
+            updated,
+        ]
+        for index in range(options.rows)
+    ]
+
+
+def best_duration(build, values, options):
+    """Gets the best duration of ``options.repeat`` runs of ``build``."""
+    durations = []
+    for _ in range(options.repeat):
+        start = time.time()
+        build(TABLE, COLUMNS, values)
+        durations.append(time.time() - start)
+    return min(durations)
+
+
+def main():
+    options = parse_options()
+    rows = make_rows(options)
+    cases = [("legacy", legacy_write_pb, rows), ("rows", _make_write_pb, rows)]
+    if pandas is not None:
+        frame = pandas.DataFrame(rows, columns=COLUMNS)
+        frame["updated"] = frame["updated"].dt.tz_localize("UTC")
+        cases.append(("dataframe", _make_write_pb, frame))
+
+    expected = legacy_write_pb(TABLE, COLUMNS, rows)
+    for name, build, values in cases:
+        if build(TABLE, COLUMNS, values) != expected:
+            sys.stderr.write("The %s write differs from the legacy one.\n" % (name,))
+            sys.exit(1)
+
+    num_values = options.rows * len(COLUMNS)
+    report = {"rows": options.rows, "columns": len(COLUMNS)}
+    for name, build, values in cases:
+        best = best_duration(build, values, options)
+        report[name] = {
+            "best_seconds": best,
+            "rows_per_sec": options.rows / best,
+            "values_per_sec": num_values / best,
+        }
+    for name, _, _ in cases[1:]:
+        report[name]["speedup"] = (
+            report["legacy"]["best_seconds"] / report[name]["best_seconds"]
+        )
+    json.dump(report, sys.stdout, sort_keys=True)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-process fake of the Cloud Spanner gRPC service for benchmarks.
+
+The fake holds a single YCSB table in memory, and only understands the
+queries issued by ``ycsb.py``, which it recognizes by their parameters:
+
+* ``@id``: reads the row of a key,
+* ``@start`` and ``@count``: scans ``@count`` rows from a key,
+* no parameters: returns the key of every row (or ``1`` for ``SELECT 1``).
+
+Mutations of commits are applied to the table. Since requests never leave
+the process, the benchmark measures the client-side cost of each call.
+"""
+
+import bisect
+import threading
+import uuid
+
+from concurrent import futures
+
+import grpc
+from google.protobuf import empty_pb2
+from google.protobuf import timestamp_pb2
+from google.protobuf.struct_pb2 import Value
+
+from google.cloud.spanner_v1.proto import result_set_pb2
+from google.cloud.spanner_v1.proto import spanner_pb2
+from google.cloud.spanner_v1.proto import spanner_pb2_grpc
+from google.cloud.spanner_v1.proto import transaction_pb2
+from google.cloud.spanner_v1.proto import type_pb2
+
+
+ROWS_PER_RESPONSE = 100
+
+
+def _string_field(name):
+    return type_pb2.StructType.Field(
+        name=name, type=type_pb2.Type(code=type_pb2.STRING)
+    )
+
+
+class FakeSpanner(spanner_pb2_grpc.SpannerServicer):
+    """A Spanner servicer holding one table of string columns in memory.
+
+    :type columns: list of str
+    :param columns: The columns of the table, the first one being the key.
+    """
+
+    def __init__(self, columns):
+        self._columns = list(columns)
+        self._lock = threading.Lock()
+        self._rows = {}
+        self._keys = []  # sorted
+        self._sessions = set()
+
+        self._row_metadata = result_set_pb2.ResultSetMetadata(
+            row_type=type_pb2.StructType(
+                fields=[_string_field(column) for column in self._columns]
+            )
+        )
+        self._key_metadata = result_set_pb2.ResultSetMetadata(
+            row_type=type_pb2.StructType(fields=[_string_field(self._columns[0])])
+        )
+
+    def load(self, rows):
+        """Stores rows, given as lists of strings, in the table."""
+        with self._lock:
+            for row in rows:
+                self._put(list(row))
+
+    def _put(self, row):
+        """Stores a row, with ``_lock`` held."""
+        key = row[0]
+        if key not in self._rows:
+            bisect.insort(self._keys, key)
+        self._rows[key] = row
+
+    def CreateSession(self, request, context):
+        name = "%s/sessions/%s" % (request.database, uuid.uuid4().hex)
+        with self._lock:
+            self._sessions.add(name)
+        return spanner_pb2.Session(name=name)
+
+    def GetSession(self, request, context):
+        with self._lock:
+            found = request.name in self._sessions
+        if not found:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Session not found")
+        return spanner_pb2.Session(name=request.name)
+
+    def DeleteSession(self, request, context):
+        with self._lock:
+            self._sessions.discard(request.name)
+        return empty_pb2.Empty()
+
+    def BeginTransaction(self, request, context):
+        return transaction_pb2.Transaction(id=uuid.uuid4().bytes)
+
+    def Rollback(self, request, context):
+        return empty_pb2.Empty()
+
+    def Commit(self, request, context):
+        with self._lock:
+            for mutation in request.mutations:
+                operation = mutation.WhichOneof("operation")
+                if operation == "delete":
+                    continue
+                write = getattr(mutation, operation)
+                indexes = [self._columns.index(column) for column in write.columns]
+                for values in write.values:
+                    key = values.values[indexes.index(0)].string_value
+                    row = self._rows.get(key)
+                    row = list(row) if row else [u""] * len(self._columns)
+                    for index, value in zip(indexes, values.values):
+                        row[index] = value.string_value
+                    self._put(row)
+        commit_timestamp = timestamp_pb2.Timestamp()
+        commit_timestamp.GetCurrentTime()
+        return spanner_pb2.CommitResponse(commit_timestamp=commit_timestamp)
+
+    def ExecuteStreamingSql(self, request, context):
+        params = request.params.fields
+        with self._lock:
+            if "id" in params:
+                row = self._rows.get(params["id"].string_value)
+                rows = [row] if row is not None else []
+                metadata = self._row_metadata
+            elif "start" in params:
+                start = bisect.bisect_left(self._keys, params["start"].string_value)
+                count = int(params["count"].string_value)
+                keys = self._keys[start : start + count]
+                rows = [self._rows[key] for key in keys]
+                metadata = self._row_metadata
+            elif request.sql.strip().upper() == "SELECT 1":
+                rows = [[u"1"]]
+                metadata = self._key_metadata
+            else:
+                rows = [[key] for key in self._keys]
+                metadata = self._key_metadata
+
+        if not rows:
+            yield result_set_pb2.PartialResultSet(metadata=metadata)
+            return
+        for start in range(0, len(rows), ROWS_PER_RESPONSE):
+            response = result_set_pb2.PartialResultSet(
+                values=[
+                    Value(string_value=value)
+                    for row in rows[start : start + ROWS_PER_RESPONSE]
+                    for value in row
+                ]
+            )
+            if start == 0:
+                response.metadata.CopyFrom(metadata)
+            yield response
+
+
+def start_server(servicer, max_workers=32):
+    """Serves a servicer on a free local port.
+
+    :rtype: tuple
+    :returns: the started :class:`grpc.Server`, and its ``host:port``.
+    """
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    spanner_pb2_grpc.add_SpannerServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, "localhost:%d" % (port,)
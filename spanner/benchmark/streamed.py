@@ -0,0 +1,181 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Throughput benchmark for decoding streamed result sets.
+
+Iterates over a synthetic stream of ``PartialResultSet`` messages, without
+any network I/O, with
+:class:`~google.cloud.spanner_v1.streamed.StreamedResultSet` and with a
+copy of its previous implementation, which parsed each value with
+``_parse_value_pb`` and popped rows from the front of a list. Both must
+return the same rows.
+
+Usage:
+
+  $ python spanner/benchmark/streamed.py --rows 20000 --columns 50 \
+    --rows-per-response 1000
+"""
+
+from __future__ import division
+
+import argparse
+import json
+import sys
+import time
+
+from google.protobuf.struct_pb2 import ListValue
+from google.protobuf.struct_pb2 import Value
+
+from google.cloud.spanner_v1._helpers import _parse_value_pb
+from google.cloud.spanner_v1.proto import result_set_pb2
+from google.cloud.spanner_v1.proto import type_pb2
+from google.cloud.spanner_v1.streamed import StreamedResultSet
+
+
+def parse_options():
+    """Parses options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--columns", type=int, default=50)
+    parser.add_argument("--rows-per-response", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+class LegacyStreamedResultSet(StreamedResultSet):
+    """The previous row merging and iteration of ``StreamedResultSet``."""
+
+    def _merge_values(self, values):
+        width = len(self.fields)
+        for value in values:
+            index = len(self._current_row)
+            field = self.fields[index]
+            self._current_row.append(_parse_value_pb(value, field.type))
+            if len(self._current_row) == width:
+                self._rows.append(self._current_row)
+                self._current_row = []
+
+    def __iter__(self):
+        iter_rows, self._rows[:] = self._rows[:], ()
+        while True:
+            if not iter_rows:
+                try:
+                    self._consume_next()
+                except StopIteration:
+                    return
+                iter_rows, self._rows[:] = self._rows[:], ()
+            while iter_rows:
+                yield iter_rows.pop(0)
+
+
+def _column(index):
+    """Returns the type and a sample value of the column of ``index``.
+
+    Columns cycle through INT64, STRING, FLOAT64, BOOL, DATE and
+    ARRAY<INT64> values.
+    """
+    kind = index % 6
+    if kind == 0:
+        return type_pb2.Type(code=type_pb2.INT64), Value(string_value=u"1234567")
+    if kind == 1:
+        return (
+            type_pb2.Type(code=type_pb2.STRING),
+            Value(string_value=u"value-%d" % (index,)),
+        )
+    if kind == 2:
+        return type_pb2.Type(code=type_pb2.FLOAT64), Value(number_value=3.25)
+    if kind == 3:
+        return type_pb2.Type(code=type_pb2.BOOL), Value(bool_value=True)
+    if kind == 4:
+        return type_pb2.Type(code=type_pb2.DATE), Value(string_value=u"2019-03-05")
+    array_type = type_pb2.Type(
+        code=type_pb2.ARRAY, array_element_type=type_pb2.Type(code=type_pb2.INT64)
+    )
+    items = [Value(string_value=u"%d" % (item,)) for item in range(3)]
+    return array_type, Value(list_value=ListValue(values=items))
+
+
+def make_responses(options):
+    """Builds the synthetic stream of partial result sets."""
+    fields = []
+    row = []
+    for index in range(options.columns):
+        field_type, value = _column(index)
+        fields.append(type_pb2.StructType.Field(name="c%d" % (index,), type=field_type))
+        row.append(value)
+    metadata = result_set_pb2.ResultSetMetadata(
+        row_type=type_pb2.StructType(fields=fields)
+    )
+
+    responses = []
+    for start in range(0, options.rows, options.rows_per_response):
+        num_rows = min(options.rows_per_response, options.rows - start)
+        response = result_set_pb2.PartialResultSet(values=row * num_rows)
+        if not responses:
+            response.metadata.CopyFrom(metadata)
+        responses.append(response)
+    return responses
+
+
+def read_all(result_set_class, responses):
+    """Iterates over the rows of ``responses`` with ``result_set_class``."""
+    return list(result_set_class(iter(responses)))
+
+
+def best_duration(result_set_class, responses, options):
+    """Gets the best duration of ``options.repeat`` runs."""
+    durations = []
+    for _ in range(options.repeat):
+        start = time.time()
+        rows = read_all(result_set_class, responses)
+        durations.append(time.time() - start)
+        assert len(rows) == options.rows
+    return min(durations)
+
+
+def main():
+    options = parse_options()
+    responses = make_responses(options)
+
+    if read_all(StreamedResultSet, responses) != read_all(
+        LegacyStreamedResultSet, responses
+    ):
+        sys.stderr.write("The rows differ from the previous implementation's.\n")
+        sys.exit(1)
+
+    num_values = options.rows * options.columns
+    report = {
+        "rows": options.rows,
+        "columns": options.columns,
+        "rows_per_response": options.rows_per_response,
+    }
+    for name, result_set_class in (
+        ("legacy", LegacyStreamedResultSet),
+        ("compiled", StreamedResultSet),
+    ):
+        best = best_duration(result_set_class, responses, options)
+        report[name] = {
+            "best_seconds": best,
+            "rows_per_sec": options.rows / best,
+            "values_per_sec": num_values / best,
+        }
+    report["speedup"] = (
+        report["legacy"]["best_seconds"] / report["compiled"]["best_seconds"]
+    )
+    json.dump(report, sys.stdout, sort_keys=True)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,23 +22,64 @@ Usage:
   $ export GOOGLE_APPLICATION_CREDENTIALS=/path/to/credentials.json
   $ export GCLOUD_PROJECT=gcloud-project-name
 
+  # Load the table, whose columns are id and field0 to field9, all STRING.
+  $ python spanner/benchmark/ycsb.py load cloud_spanner -P pkb/workloada \
+    -p table=usertable -p cloudspanner.instance=ycsb-542756a4 \
+    -p recordcount=5000 -p cloudspanner.database=ycsb -p num_worker=8
+
   # Run the benchmark.
   $ python spanner/benchmark/ycsb.py run cloud_spanner -P pkb/workloada \
     -p table=usertable -p cloudspanner.instance=ycsb-542756a4 \
     -p recordcount=5000 -p operationcount=100 -p cloudspanner.database=ycsb \
     -p num_worker=1
 
+  # Run a scan-heavy workload against the in-process fake server, with a
+  # FixedSizePool, and profile the client.
+  $ python spanner/benchmark/ycsb.py run cloud_spanner \
+    -p cloudspanner.fake=true -p cloudspanner.pool=fixed \
+    -p readproportion=0.2 -p scanproportion=0.8 -p num_worker=8 \
+    -p operationcount=1000 -p profile=/tmp/ycsb.prof
+
   # To make a package so it can work with PerfKitBenchmarker.
   $ cd spanner; tar -cvzf ycsb-python.0.0.5.tar.gz benchmark/*
 
+Parameters, given with ``-p key=value`` or in the workload file (``-p``
+takes precedence):
+
+  table, recordcount, operationcount (per worker), num_worker,
+  readproportion, updateproportion, scanproportion, insertproportion,
+  maxscanlength, fieldlength: as in YCSB.
+
+  cloudspanner.pool: the session pool, one of bursty (the default), fixed,
+    pinging or maintained.
+  cloudspanner.poolsize: the size of the pool, num_worker by default.
+  cloudspanner.host: the host:port of a Spanner emulator, reached without
+    credentials; also read from the SPANNER_EMULATOR_HOST environment
+    variable. The instance, database and table must exist.
+  cloudspanner.fake: if true, runs against an in-process fake server
+    (see fake_spanner.py) holding recordcount rows. Requests never leave
+    the process, so latencies are those of the client library.
+  profile: a path where to write a cProfile of the worker threads, the
+    hottest Spanner functions of which are printed to stderr.
 """
 
+from __future__ import print_function
+
+from google.auth.credentials import AnonymousCredentials
 from google.cloud import spanner
+from google.cloud.spanner_v1.database import Database
+from google.cloud.spanner_v1.gapic.spanner_client import SpannerClient
 
 import argparse
+import cProfile
+import grpc
+import itertools
 import numpy
+import os
+import pstats
 import random
 import string
+import sys
 import threading
 import timeit
 
@@ -46,12 +87,34 @@ import timeit
 OPERATIONS = ['readproportion', 'updateproportion', 'scanproportion',
               'insertproportion']
 NUM_FIELD = 10
+FIELDS = ['field%d' % i for i in range(NUM_FIELD)]
+COLUMNS = ['id'] + FIELDS
+DEFAULTS = {
+    'table': 'usertable',
+    'recordcount': '1000',
+    'operationcount': '1000',
+    'num_worker': '1',
+    'readproportion': '0.95',
+    'updateproportion': '0.05',
+    'scanproportion': '0',
+    'insertproportion': '0',
+    'maxscanlength': '100',
+    'fieldlength': '100',
+    'cloudspanner.pool': 'bursty',
+}
+POOLS = {
+    'bursty': lambda size: spanner.BurstyPool(target_size=size),
+    'fixed': lambda size: spanner.FixedSizePool(size=size),
+    'pinging': lambda size: spanner.PingingPool(size=size),
+    'maintained': lambda size: spanner.MaintainedPool(size=size),
+}
+NUM_PROFILED_FUNCTIONS = 25
 
 
 def parse_options():
     """Parses options."""
     parser = argparse.ArgumentParser()
-    parser.add_argument('command', help='The YCSB command.')
+    parser.add_argument('command', help='The YCSB command, load or run.')
     parser.add_argument('benchmark', help='The YCSB benchmark.')
     parser.add_argument('-P', '--workload', action='store', dest='workload',
                         default='', help='The path to a YCSB workload file.')
@@ -63,34 +126,95 @@ def parse_options():
 
     args = parser.parse_args()
 
-    parameters = {}
+    parameters = dict(DEFAULTS)
     parameters['command'] = args.command
     parameters['num_bucket'] = args.num_bucket
 
-    for parameter in args.parameters:
-        parts = parameter.strip().split('=')
-        parameters[parts[0]] = parts[1]
+    if args.workload:
+        with open(args.workload, 'r') as f:
+            for line in f.readlines():
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                key, value = line.split('=', 1)
+                parameters[key.strip()] = value.strip()
 
-    with open(args.workload, 'r') as f:
-        for line in f.readlines():
-            parts = line.split('=')
-            key = parts[0].strip()
-            if key in OPERATIONS:
-                parameters[key] = parts[1].strip()
+    for parameter in args.parameters:
+        key, value = parameter.strip().split('=', 1)
+        parameters[key] = value
 
     return parameters
 
 
+def is_true(parameters, key):
+    """Whether a boolean parameter is set."""
+    return parameters.get(key, '').lower() in ('1', 'true', 'yes')
+
+
+def make_key(index):
+    """Builds the key of the record of an index."""
+    return 'user%d' % index
+
+
+def make_value(parameters):
+    """Builds a random field value."""
+    length = int(parameters['fieldlength'])
+    return ''.join(random.choice(string.printable) for i in range(length))
+
+
+class EmulatorDatabase(Database):
+    """A database reached through an insecure channel to ``host``.
+
+    The API client is set before the pool is bound, as binding some pools
+    creates sessions.
+    """
+
+    def __init__(self, database_id, instance, host, pool=None):
+        self._spanner_api = SpannerClient(channel=grpc.insecure_channel(host))
+        super(EmulatorDatabase, self).__init__(database_id, instance,
+                                               pool=pool)
+
+
+def start_fake_server(parameters):
+    """Starts an in-process fake server.
+
+    Before a run, the fake is filled with recordcount records.
+    """
+    import fake_spanner
+
+    servicer = fake_spanner.FakeSpanner(COLUMNS)
+    if parameters['command'] == 'run':
+        servicer.load(
+            [make_key(i)] + [make_value(parameters) for field in FIELDS]
+            for i in range(int(parameters['recordcount'])))
+    server, host = fake_spanner.start_server(servicer)
+    parameters['cloudspanner.host'] = host
+    parameters.setdefault('cloudspanner.instance', 'ycsb')
+    parameters.setdefault('cloudspanner.database', 'ycsb')
+    return server
+
+
 def open_database(parameters):
     """Opens a database specified by the parameters from parse_options()."""
-    spanner_client = spanner.Client()
+    pool_size = int(parameters.get('cloudspanner.poolsize',
+                                   parameters['num_worker']))
+    pool = POOLS[parameters['cloudspanner.pool']](pool_size)
     instance_id = parameters['cloudspanner.instance']
-    instance = spanner_client.instance(instance_id)
     database_id = parameters['cloudspanner.database']
-    pool = spanner.BurstyPool(int(parameters['num_worker']))
-    database = instance.database(database_id, pool=pool)
 
-    return database
+    host = parameters.get('cloudspanner.host',
+                          os.environ.get('SPANNER_EMULATOR_HOST'))
+    if host is None:
+        spanner_client = spanner.Client()
+        instance = spanner_client.instance(instance_id)
+        return instance.database(database_id, pool=pool)
+
+    project = parameters.get('cloudspanner.project',
+                             os.environ.get('GCLOUD_PROJECT', 'ycsb'))
+    spanner_client = spanner.Client(project=project,
+                                    credentials=AnonymousCredentials())
+    instance = spanner_client.instance(instance_id)
+    return EmulatorDatabase(database_id, instance, host, pool=pool)
 
 
 def load_keys(database, parameters):
@@ -106,79 +230,147 @@ def load_keys(database, parameters):
     return keys
 
 
-def read(database, table, key):
+def load(database, parameters):
+    """Writes recordcount records, from insertstart, with a BulkWriter."""
+    start = int(parameters.get('insertstart', '0'))
+    count = int(parameters['recordcount'])
+    writer = database.bulk_writer(parameters['table'], COLUMNS,
+                                  max_in_flight=int(parameters['num_worker']))
+    with writer:
+        for i in range(start, start + count):
+            writer.write([make_key(i)] +
+                         [make_value(parameters) for field in FIELDS])
+    stats = writer.stats()
+
+    print('[OVERALL], RunTime(ms), %f' % (stats['seconds'] * 1000.0))
+    print('[OVERALL], Throughput(ops/sec), %f' % stats['rows_per_sec'])
+    print('[INSERT], Operations, %d' % stats['rows_written'])
+    print('[INSERT], Commits, %d' % stats['commits'])
+    print('[INSERT], Retries, %d' % stats['retries'])
+    print('[INSERT], Bytes, %d' % stats['bytes_written'])
+
+
+def read(database, table, key, parameters):
     """Does a single read operation."""
     with database.snapshot() as snapshot:
-        result = snapshot.execute_sql('SELECT u.* FROM %s u WHERE u.id="%s"' %
-                                      (table, key))
+        result = snapshot.execute_sql(
+            'SELECT u.* FROM %s u WHERE u.id=@id' % table,
+            params={'id': key}, param_types={'id': spanner.param_types.STRING})
+        for row in result:
+            key = row[0]
+            for i in range(NUM_FIELD):
+                field = row[i + 1]
+
+
+def scan(database, table, key, parameters):
+    """Does a single scan operation, of up to maxscanlength records."""
+    count = random.randint(1, int(parameters['maxscanlength']))
+    with database.snapshot() as snapshot:
+        result = snapshot.execute_sql(
+            'SELECT u.* FROM %s u WHERE u.id>=@start ORDER BY u.id '
+            'LIMIT @count' % table,
+            params={'start': key, 'count': count},
+            param_types={'start': spanner.param_types.STRING,
+                         'count': spanner.param_types.INT64})
         for row in result:
             key = row[0]
-        for i in range(NUM_FIELD):
-            field = row[i + 1]
+            for i in range(NUM_FIELD):
+                field = row[i + 1]
 
 
-def update(database, table, key):
+def update(database, table, key, parameters):
     """Does a single update operation."""
-    field = random.randrange(10)
-    value = ''.join(random.choice(string.printable) for i in range(100))
+    field = random.randrange(NUM_FIELD)
+    value = make_value(parameters)
     with database.batch() as batch:
         batch.update(table=table, columns=('id', 'field%d' % field),
                      values=[(key, value)])
 
 
-def do_operation(database, keys, table, operation, latencies_ms):
+def insert(database, table, key, parameters):
+    """Does a single insert operation, of a new record."""
+    key = make_key(next(parameters['insert_keys']))
+    with database.batch() as batch:
+        batch.insert(table=table, columns=COLUMNS,
+                     values=[[key] + [make_value(parameters)
+                                      for field in FIELDS]])
+
+
+OPERATION_FUNCTIONS = {
+    'read': read,
+    'scan': scan,
+    'update': update,
+    'insert': insert,
+}
+
+
+def do_operation(database, keys, table, operation, latencies_ms, errors,
+                 parameters):
     """Does a single operation and records latency."""
     key = random.choice(keys)
-    start = timeit.default_timer()
-    if operation == 'read':
-        read(database, table, key)
-    elif operation == 'update':
-        update(database, table,  key)
-    else:
+    if operation not in OPERATION_FUNCTIONS:
         raise ValueError('Unknown operation: %s' % operation)
+    start = timeit.default_timer()
+    try:
+        OPERATION_FUNCTIONS[operation](database, table, key, parameters)
+    except Exception as exc:
+        errors[operation] += 1
+        print('[%s] failed: %s' % (operation.upper(), exc), file=sys.stderr)
+        return
     end = timeit.default_timer()
     latencies_ms[operation].append((end - start) * 1000)
 
 
-def aggregate_metrics(latencies_ms, duration_ms, num_bucket):
+def aggregate_metrics(latencies_ms, errors, duration_ms, num_bucket):
     """Aggregates metrics."""
-    overall_op_count = 0
-    op_counts = {operation : len(latency) for operation,
-                 latency in latencies_ms.iteritems()}
-    overall_op_count = sum([op_count for op_count in op_counts.itervalues()])
+    op_counts = {operation: len(latency) for operation,
+                 latency in latencies_ms.items()}
+    overall_op_count = sum(op_counts.values())
 
     print('[OVERALL], RunTime(ms), %f' % duration_ms)
     print('[OVERALL], Throughput(ops/sec), %f' % (float(overall_op_count) /
                                                 duration_ms * 1000.0))
 
-    for operation in op_counts.keys():
+    for operation in sorted(op_counts.keys()):
         operation_upper = operation.upper()
         print('[%s], Operations, %d' % (operation_upper, op_counts[operation]))
-        print('[%s], AverageLatency(us), %f' % (
-            operation_upper, numpy.average(latencies_ms[operation]) * 1000.0))
-        print('[%s], LatencyVariance(us), %f' % (
-            operation_upper, numpy.var(latencies_ms[operation]) * 1000.0))
-        print('[%s], MinLatency(us), %f' % (
-            operation_upper, min(latencies_ms[operation]) * 1000.0))
-        print('[%s], MaxLatency(us), %f' % (
-            operation_upper, max(latencies_ms[operation]) * 1000.0))
-        print('[%s], 95thPercentileLatency(us), %f' % (
-            operation_upper,
-            numpy.percentile(latencies_ms[operation], 95.0) * 1000.0))
-        print('[%s], 99thPercentileLatency(us), %f' % (
-            operation_upper,
-            numpy.percentile(latencies_ms[operation], 99.0) * 1000.0))
-        print('[%s], 99.9thPercentileLatency(us), %f' % (
-            operation_upper,
-            numpy.percentile(latencies_ms[operation], 99.9) * 1000.0))
+        if op_counts[operation]:
+            latency_array = numpy.array(latencies_ms[operation])
+            print('[%s], AverageLatency(us), %f' % (
+                operation_upper, numpy.average(latency_array) * 1000.0))
+            print('[%s], LatencyVariance(us), %f' % (
+                operation_upper, numpy.var(latency_array) * 1000.0))
+            print('[%s], MinLatency(us), %f' % (
+                operation_upper, latency_array.min() * 1000.0))
+            print('[%s], MaxLatency(us), %f' % (
+                operation_upper, latency_array.max() * 1000.0))
+            for percentile in ('50', '90', '95', '99', '99.9'):
+                print('[%s], %sthPercentileLatency(us), %f' % (
+                    operation_upper, percentile,
+                    numpy.percentile(latency_array, float(percentile)) *
+                    1000.0))
         print('[%s], Return=OK, %d' % (operation_upper, op_counts[operation]))
-        latency_array = numpy.array(latencies_ms[operation])
-        for j in range(num_bucket):
-            print('[%s], %d, %d' % (
-                operation_upper, j,
-                ((j <= latency_array) & (latency_array < (j + 1))).sum()))
-        print('[%s], >%d, %d' % (operation_upper, num_bucket,
-                                 (num_bucket <= latency_array).sum()))
+        if errors[operation]:
+            print('[%s], Return=ERROR, %d' % (operation_upper,
+                                              errors[operation]))
+        if op_counts[operation]:
+            counts = numpy.bincount(
+                numpy.minimum(latency_array, num_bucket).astype(int),
+                minlength=num_bucket + 1)
+            for j in range(num_bucket):
+                print('[%s], %d, %d' % (operation_upper, j, counts[j]))
+            print('[%s], >%d, %d' % (operation_upper, num_bucket,
+                                     counts[num_bucket]))
+
+
+def report_profiles(profiles, path):
+    """Merges the profiles of the workers, and writes them to ``path``."""
+    stats = pstats.Stats(profiles[0], stream=sys.stderr)
+    for profile in profiles[1:]:
+        stats.add(profile)
+    stats.dump_stats(path)
+    stats.sort_stats('tottime').print_stats('spanner_v1',
+                                            NUM_PROFILED_FUNCTIONS)
 
 
 class WorkloadThread(threading.Thread):
@@ -194,11 +386,22 @@ class WorkloadThread(threading.Thread):
         self._weights = weights
         self._operations = operations
         self._latencies_ms = {}
+        self._errors = {}
         for operation in self._operations:
             self._latencies_ms[operation] = []
+            self._errors[operation] = 0
+        self.profile = None
+        if 'profile' in parameters:
+            self.profile = cProfile.Profile()
 
     def run(self):
         """Run a single thread of the workload."""
+        if self.profile is not None:
+            self.profile.runcall(self._run)
+        else:
+            self._run()
+
+    def _run(self):
         i = 0
         operation_count = int(self._parameters['operationcount'])
         while i < operation_count:
@@ -208,13 +411,18 @@ class WorkloadThread(threading.Thread):
                 if weight <= self._weights[j]:
                     do_operation(self._database, self._keys,
                                  self._parameters['table'],
-                                 self._operations[j], self._latencies_ms)
+                                 self._operations[j], self._latencies_ms,
+                                 self._errors, self._parameters)
                     break
 
     def latencies_ms(self):
         """Returns the latencies."""
         return self._latencies_ms
 
+    def errors(self):
+        """Returns the number of failed operations."""
+        return self._errors
+
 
 def run_workload(database, keys, parameters):
     """Runs workload against the database."""
@@ -222,6 +430,7 @@ def run_workload(database, keys, parameters):
     weights = []
     operations = []
     latencies_ms = {}
+    errors = {}
     for operation in OPERATIONS:
         weight = float(parameters[operation])
         if weight <= 0.0:
@@ -231,6 +440,11 @@ def run_workload(database, keys, parameters):
         operations.append(op_code)
         weights.append(total_weight)
         latencies_ms[op_code] = []
+        errors[op_code] = 0
+
+    parameters['insert_keys'] = itertools.count(
+        int(parameters.get('insertstart', '0')) +
+        int(parameters['recordcount']))
 
     threads = []
     start = timeit.default_timer()
@@ -242,25 +456,41 @@ def run_workload(database, keys, parameters):
 
     for thread in threads:
         thread.join()
-        end = timeit.default_timer()
+    end = timeit.default_timer()
 
     for thread in threads:
         thread_latencies_ms = thread.latencies_ms()
+        thread_errors = thread.errors()
         for key in latencies_ms.keys():
             latencies_ms[key].extend(thread_latencies_ms[key])
+            errors[key] += thread_errors[key]
 
-    aggregate_metrics(latencies_ms, (end - start) * 1000.0,
+    aggregate_metrics(latencies_ms, errors, (end - start) * 1000.0,
                       parameters['num_bucket'])
 
+    if 'profile' in parameters:
+        report_profiles([thread.profile for thread in threads],
+                        parameters['profile'])
+
 
 if __name__ == '__main__':
     parameters = parse_options()
-    if parameters['command'] == 'run':
-        if 'cloudspanner.channels' in parameters:
-            assert parameters['cloudspanner.channels'] == 1, (
-                'Python doesn\'t support channels > 1.')
-        database = open_database(parameters)
-        keys = load_keys(database, parameters)
-        run_workload(database, keys, parameters)
-    else:
+    if parameters['command'] not in ('load', 'run'):
         raise ValueError('Unknown command %s.' % parameters['command'])
+    if 'cloudspanner.channels' in parameters:
+        assert int(parameters['cloudspanner.channels']) == 1, (
+            'Python doesn\'t support channels > 1.')
+
+    server = None
+    if is_true(parameters, 'cloudspanner.fake'):
+        server = start_fake_server(parameters)
+    try:
+        database = open_database(parameters)
+        if parameters['command'] == 'load':
+            load(database, parameters)
+        else:
+            keys = load_keys(database, parameters)
+            run_workload(database, keys, parameters)
+    finally:
+        if server is not None:
+            server.stop(None)
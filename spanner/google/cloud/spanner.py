@@ -25,8 +25,10 @@ from google.cloud.spanner_v1 import enums
 from google.cloud.spanner_v1 import FixedSizePool
 from google.cloud.spanner_v1 import KeyRange
 from google.cloud.spanner_v1 import KeySet
+from google.cloud.spanner_v1 import MaintainedPool
 from google.cloud.spanner_v1 import param_types
 from google.cloud.spanner_v1 import PingingPool
+from google.cloud.spanner_v1 import ReadCache
 from google.cloud.spanner_v1 import TransactionPingingPool
 from google.cloud.spanner_v1 import types
 
@@ -41,8 +43,10 @@ __all__ = (
     "FixedSizePool",
     "KeyRange",
     "KeySet",
+    "MaintainedPool",
     "param_types",
     "PingingPool",
+    "ReadCache",
     "TransactionPingingPool",
     "types",
 )
@@ -27,8 +27,10 @@ from google.cloud.spanner_v1.keyset import KeySet
 from google.cloud.spanner_v1.pool import AbstractSessionPool
 from google.cloud.spanner_v1.pool import BurstyPool
 from google.cloud.spanner_v1.pool import FixedSizePool
+from google.cloud.spanner_v1.pool import MaintainedPool
 from google.cloud.spanner_v1.pool import PingingPool
 from google.cloud.spanner_v1.pool import TransactionPingingPool
+from google.cloud.spanner_v1.read_cache import ReadCache
 
 
 COMMIT_TIMESTAMP = "spanner.commit_timestamp()"
@@ -53,8 +55,11 @@ __all__ = (
     "AbstractSessionPool",
     "BurstyPool",
     "FixedSizePool",
+    "MaintainedPool",
     "PingingPool",
     "TransactionPingingPool",
+    # google.cloud.spanner_v1.read_cache
+    "ReadCache",
     # google.cloud.spanner_v1.gapic
     "enums",
     # local
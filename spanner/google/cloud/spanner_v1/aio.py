@@ -0,0 +1,913 @@
+# Copyright 2019 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio API to Cloud Spanner databases.
+
+Requests are sent on a :mod:`grpc.aio` channel, so that a single event loop
+can keep many of them in flight. Requests are built, and results are parsed,
+by the same code as the synchronous API.
+
+Requires Python 3.6+ and ``grpcio >= 1.32.0``; install the ``asyncio``
+extra.
+"""
+
+import asyncio
+import random
+import time
+
+import google.api_core.gapic_v1.method
+import google.auth.credentials
+from google.api_core import exceptions
+from google.api_core import grpc_helpers_async
+from grpc import aio
+from six.moves import queue
+
+# pylint: disable=ungrouped-imports
+from google.cloud._helpers import _pb_timestamp_to_datetime
+from google.cloud.spanner_v1._helpers import _metadata_with_prefix
+from google.cloud.spanner_v1.batch import Batch
+from google.cloud.spanner_v1.database import _CLIENT_INFO
+from google.cloud.spanner_v1.database import SPANNER_DATA_SCOPE
+from google.cloud.spanner_v1.pool import AbstractSessionPool
+from google.cloud.spanner_v1.proto import spanner_pb2
+from google.cloud.spanner_v1.proto import spanner_pb2_grpc
+from google.cloud.spanner_v1.proto.transaction_pb2 import TransactionOptions
+from google.cloud.spanner_v1.session import _get_retry_delay
+from google.cloud.spanner_v1.session import DEFAULT_RETRY_TIMEOUT_SECS
+from google.cloud.spanner_v1.session import Session
+from google.cloud.spanner_v1.snapshot import Snapshot
+from google.cloud.spanner_v1.streamed import StreamedResultSet
+from google.cloud.spanner_v1.transaction import Transaction
+
+# pylint: enable=ungrouped-imports
+
+
+SPANNER_ADDRESS = "spanner.googleapis.com:443"
+_CHANNEL_OPTIONS = (
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+)
+_INITIAL_RETRY_DELAY = 0.01
+_MAX_RETRY_DELAY = 32.0
+
+
+def _timeout(timeout):
+    """Map the default timeout of the synchronous API to no timeout."""
+    if timeout is google.api_core.gapic_v1.method.DEFAULT:
+        return None
+    return timeout
+
+
+class AsyncSpannerApi(object):
+    """Spanner API calls, made on a :mod:`grpc.aio` channel.
+
+    The methods used by the synchronous request helpers take the same
+    arguments as those of
+    :class:`~google.cloud.spanner_v1.gapic.spanner_client.SpannerClient`,
+    and raise the same :mod:`google.api_core.exceptions`. Streaming methods
+    return asynchronous iterators, the others coroutines.
+
+    Calls are not retried: streams are resumed after
+    :exc:`~google.api_core.exceptions.ServiceUnavailable` by the result
+    sets, and transactions are retried by :meth:`AsyncDatabase.run_in_transaction`.
+
+    :type channel: :class:`grpc.aio.Channel`
+    :param channel: the channel on which to make calls.
+    """
+
+    def __init__(self, channel):
+        self.channel = channel
+        self._stub = spanner_pb2_grpc.SpannerStub(channel)
+        self._client_metadata = _CLIENT_INFO.to_grpc_metadata()
+
+    def _metadata(self, metadata):
+        return list(metadata or ()) + [self._client_metadata]
+
+    async def _unary(self, method, request, metadata, timeout=None):
+        try:
+            return await method(
+                request, metadata=self._metadata(metadata), timeout=timeout
+            )
+        except aio.AioRpcError as exc:
+            raise exceptions.from_grpc_error(exc) from exc
+
+    async def _streaming(self, method, request, metadata, timeout=None):
+        call = method(request, metadata=self._metadata(metadata), timeout=timeout)
+        try:
+            async for response in call:
+                yield response
+        except aio.AioRpcError as exc:
+            raise exceptions.from_grpc_error(exc) from exc
+
+    def create_session(self, database, session=None, metadata=None):
+        request = spanner_pb2.CreateSessionRequest(database=database, session=session)
+        return self._unary(self._stub.CreateSession, request, metadata)
+
+    def delete_session(self, name, metadata=None):
+        request = spanner_pb2.DeleteSessionRequest(name=name)
+        return self._unary(self._stub.DeleteSession, request, metadata)
+
+    def execute_sql(
+        self,
+        session,
+        sql,
+        transaction=None,
+        params=None,
+        param_types=None,
+        query_mode=None,
+        seqno=None,
+        metadata=None,
+    ):
+        request = spanner_pb2.ExecuteSqlRequest(
+            session=session,
+            sql=sql,
+            transaction=transaction,
+            params=params,
+            param_types=param_types,
+            query_mode=query_mode,
+            seqno=seqno,
+        )
+        return self._unary(self._stub.ExecuteSql, request, metadata)
+
+    def execute_streaming_sql(
+        self,
+        session,
+        sql,
+        transaction=None,
+        params=None,
+        param_types=None,
+        resume_token=None,
+        query_mode=None,
+        partition_token=None,
+        seqno=None,
+        retry=google.api_core.gapic_v1.method.DEFAULT,
+        timeout=google.api_core.gapic_v1.method.DEFAULT,
+        metadata=None,
+    ):
+        request = spanner_pb2.ExecuteSqlRequest(
+            session=session,
+            sql=sql,
+            transaction=transaction,
+            params=params,
+            param_types=param_types,
+            resume_token=resume_token,
+            query_mode=query_mode,
+            partition_token=partition_token,
+            seqno=seqno,
+        )
+        return self._streaming(
+            self._stub.ExecuteStreamingSql, request, metadata, _timeout(timeout)
+        )
+
+    def execute_batch_dml(self, session, transaction, statements, seqno, metadata=None):
+        request = spanner_pb2.ExecuteBatchDmlRequest(
+            session=session,
+            transaction=transaction,
+            statements=statements,
+            seqno=seqno,
+        )
+        return self._unary(self._stub.ExecuteBatchDml, request, metadata)
+
+    def streaming_read(
+        self,
+        session,
+        table,
+        columns,
+        key_set,
+        transaction=None,
+        index=None,
+        limit=None,
+        resume_token=None,
+        partition_token=None,
+        metadata=None,
+    ):
+        request = spanner_pb2.ReadRequest(
+            session=session,
+            table=table,
+            columns=columns,
+            key_set=key_set,
+            transaction=transaction,
+            index=index,
+            limit=limit,
+            resume_token=resume_token,
+            partition_token=partition_token,
+        )
+        return self._streaming(self._stub.StreamingRead, request, metadata)
+
+    def begin_transaction(self, session, options_, metadata=None):
+        request = spanner_pb2.BeginTransactionRequest(session=session, options=options_)
+        return self._unary(self._stub.BeginTransaction, request, metadata)
+
+    def commit(
+        self,
+        session,
+        mutations,
+        transaction_id=None,
+        single_use_transaction=None,
+        metadata=None,
+    ):
+        request = spanner_pb2.CommitRequest(
+            session=session,
+            mutations=mutations,
+            transaction_id=transaction_id,
+            single_use_transaction=single_use_transaction,
+        )
+        return self._unary(self._stub.Commit, request, metadata)
+
+    def rollback(self, session, transaction_id, metadata=None):
+        request = spanner_pb2.RollbackRequest(
+            session=session, transaction_id=transaction_id
+        )
+        return self._unary(self._stub.Rollback, request, metadata)
+
+
+async def _restart_on_unavailable(restart):
+    """Restart iteration after :exc:`.ServiceUnavailable`.
+
+    Asynchronous version of
+    :func:`google.cloud.spanner_v1.snapshot._restart_on_unavailable`.
+
+    :type restart: callable
+    :param restart: curried function returning an asynchronous iterator
+    """
+    resume_token = b""
+    item_buffer = []
+    iterator = restart()
+    while True:
+        try:
+            async for item in iterator:
+                item_buffer.append(item)
+                if item.resume_token:
+                    resume_token = item.resume_token
+                    break
+        except exceptions.ServiceUnavailable:
+            del item_buffer[:]
+            iterator = restart(resume_token=resume_token)
+            continue
+
+        if len(item_buffer) == 0:
+            break
+
+        for item in item_buffer:
+            yield item
+
+        del item_buffer[:]
+
+
+class AsyncStreamedResultSet(StreamedResultSet):
+    """Process a stream of partial result sets into rows, asynchronously.
+
+    Rows are read with ``async for``.
+
+    :type response_iterator:
+    :param response_iterator:
+        Asynchronous iterator yielding
+        :class:`google.cloud.spanner_v1.proto.result_set_pb2.PartialResultSet`
+        instances.
+
+    :type source: :class:`AsyncSnapshot`
+    :param source: Snapshot from which the result set was fetched.
+    """
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to read the rows of the result set.")
+
+    async def __aiter__(self):
+        while True:
+            iter_rows, self._rows = self._rows, []
+            for row in iter_rows:
+                yield row
+            try:
+                response = await self._response_iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            self._merge_values(self._response_values(response))
+
+    def to_arrow(self):
+        raise NotImplementedError("Not supported by asynchronous result sets.")
+
+    def to_dataframe(self):
+        raise NotImplementedError("Not supported by asynchronous result sets.")
+
+
+class _AsyncStreamMixin(object):
+    """Stream results from an asynchronous API."""
+
+    def _stream(self, restart):
+        iterator = _restart_on_unavailable(restart)
+
+        if self._multi_use:
+            return AsyncStreamedResultSet(iterator, source=self)
+        else:
+            return AsyncStreamedResultSet(iterator)
+
+    def partition_read(self, *args, **kwargs):
+        raise NotImplementedError("Partition reads with a BatchSnapshot.")
+
+    def partition_query(self, *args, **kwargs):
+        raise NotImplementedError("Partition queries with a BatchSnapshot.")
+
+
+class AsyncSnapshot(_AsyncStreamMixin, Snapshot):
+    """Allow a set of reads / SQL statements with shared staleness.
+
+    :meth:`read` and :meth:`execute_sql` return an
+    :class:`AsyncStreamedResultSet`, read with ``async for``. Other
+    arguments are those of :class:`~google.cloud.spanner_v1.snapshot.Snapshot`.
+    """
+
+    async def begin(self):
+        """Begin a read-only transaction on the database.
+
+        :rtype: bytes
+        :returns: the ID for the newly-begun transaction.
+
+        :raises ValueError:
+            if the transaction is already begun, committed, or rolled back.
+        """
+        if not self._multi_use:
+            raise ValueError("Cannot call 'begin' on single-use snapshots")
+
+        if self._transaction_id is not None:
+            raise ValueError("Read-only transaction already begun")
+
+        if self._read_request_count > 0:
+            raise ValueError("Read-only transaction already pending")
+
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        txn_selector = self._make_txn_selector()
+        response = await api.begin_transaction(
+            self._session.name, txn_selector.begin, metadata=metadata
+        )
+        self._transaction_id = response.id
+        return self._transaction_id
+
+
+class AsyncBatch(Batch):
+    """Accumulate mutations for transmission during :meth:`commit`."""
+
+    async def commit(self):
+        """Commit mutations to the database.
+
+        :rtype: datetime
+        :returns: timestamp of the committed changes.
+        """
+        self._check_state()
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        txn_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
+        response = await api.commit(
+            self._session.name,
+            self._mutations,
+            single_use_transaction=txn_options,
+            metadata=metadata,
+        )
+        self.committed = _pb_timestamp_to_datetime(response.commit_timestamp)
+        return self.committed
+
+
+class AsyncTransaction(_AsyncStreamMixin, Transaction):
+    """Implement read-write transaction semantics for a session.
+
+    Use :meth:`AsyncDatabase.run_in_transaction` to retry aborted
+    transactions.
+
+    :type session: :class:`~google.cloud.spanner_v1.session.Session`
+    :param session: the session used to perform the commit
+
+    :raises ValueError: if session has an existing transaction
+    """
+
+    async def begin(self):
+        """Begin a transaction on the database.
+
+        :rtype: bytes
+        :returns: the ID for the newly-begun transaction.
+        :raises ValueError:
+            if the transaction is already begun, committed, or rolled back.
+        """
+        if self._transaction_id is not None:
+            raise ValueError("Transaction already begun")
+
+        if self.committed is not None:
+            raise ValueError("Transaction already committed")
+
+        if self._rolled_back:
+            raise ValueError("Transaction is already rolled back")
+
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        txn_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
+        response = await api.begin_transaction(
+            self._session.name, txn_options, metadata=metadata
+        )
+        self._transaction_id = response.id
+        return self._transaction_id
+
+    async def rollback(self):
+        """Roll back a transaction on the database."""
+        self._check_state()
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        await api.rollback(self._session.name, self._transaction_id, metadata=metadata)
+        self._rolled_back = True
+        del self._session._transaction
+
+    async def commit(self):
+        """Commit mutations to the database.
+
+        :rtype: datetime
+        :returns: timestamp of the committed changes.
+        """
+        self._check_state()
+
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        response = await api.commit(
+            self._session.name,
+            self._mutations,
+            transaction_id=self._transaction_id,
+            metadata=metadata,
+        )
+        self.committed = _pb_timestamp_to_datetime(response.commit_timestamp)
+        del self._session._transaction
+        return self.committed
+
+    async def execute_update(self, dml, params=None, param_types=None, query_mode=None):
+        """Perform an ``ExecuteSql`` API request with DML.
+
+        Arguments are those of
+        :meth:`~google.cloud.spanner_v1.transaction.Transaction.execute_update`.
+
+        :rtype: int
+        :returns: Count of rows affected by the DML statement.
+        """
+        params_pb = self._make_params_pb(params, param_types)
+        database = self._session._database
+        metadata = _metadata_with_prefix(database.name)
+        transaction = self._make_txn_selector()
+        api = database.spanner_api
+
+        response = await api.execute_sql(
+            self._session.name,
+            dml,
+            transaction=transaction,
+            params=params_pb,
+            param_types=param_types,
+            query_mode=query_mode,
+            seqno=self._execute_sql_count,
+            metadata=metadata,
+        )
+
+        self._execute_sql_count += 1
+        return response.stats.row_count_exact
+
+    async def batch_update(self, statements):
+        """Perform a batch of DML statements via an ``ExecuteBatchDml`` request.
+
+        Arguments are those of
+        :meth:`~google.cloud.spanner_v1.transaction.Transaction.batch_update`.
+
+        :rtype:
+            Tuple(status, Sequence[int])
+        :returns:
+            Status code, plus counts of rows affected by each completed DML
+            statement.
+        """
+        parsed = []
+        for statement in statements:
+            if isinstance(statement, str):
+                parsed.append({"sql": statement})
+            else:
+                dml, params, param_types = statement
+                params_pb = self._make_params_pb(params, param_types)
+                parsed.append(
+                    {"sql": dml, "params": params_pb, "param_types": param_types}
+                )
+
+        database = self._session._database
+        metadata = _metadata_with_prefix(database.name)
+        transaction = self._make_txn_selector()
+        api = database.spanner_api
+
+        response = await api.execute_batch_dml(
+            session=self._session.name,
+            transaction=transaction,
+            statements=parsed,
+            seqno=self._execute_sql_count,
+            metadata=metadata,
+        )
+
+        self._execute_sql_count += 1
+        row_counts = [
+            result_set.stats.row_count_exact for result_set in response.result_sets
+        ]
+        return response.status, row_counts
+
+
+class AsyncSessionPool(AbstractSessionPool):
+    """Session pool for :class:`AsyncDatabase`.
+
+    - Creates sessions as they are needed, up to ``size``.
+
+    - Waits, with a timeout, when :meth:`get` is called on an exhausted
+      pool. Raises after timing out.
+
+    :type size: int
+    :param size: max number of sessions
+
+    :type default_timeout: int
+    :param default_timeout: default timeout, in seconds, to wait for
+                            a returned session.
+
+    :type labels: dict (str -> str) or None
+    :param labels: (Optional) user-assigned labels for sessions created
+                    by the pool.
+    """
+
+    DEFAULT_SIZE = 10
+    DEFAULT_TIMEOUT = 10
+
+    def __init__(self, size=DEFAULT_SIZE, default_timeout=DEFAULT_TIMEOUT, labels=None):
+        super(AsyncSessionPool, self).__init__(labels=labels)
+        self.size = size
+        self.default_timeout = default_timeout
+        self._queue = None  # Created in the event loop
+        self._created = 0
+
+    def bind(self, database):
+        """Associate the pool with a database.
+
+        :type database: :class:`AsyncDatabase`
+        :param database: database used by the pool:  used to create sessions
+                         when needed.
+        """
+        self._database = database
+
+    def _sessions(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.size)
+        return self._queue
+
+    async def _create_session(self):
+        """Create a new session on the back-end."""
+        session = self._new_session()
+        database = self._database
+        kw = {}
+        if session.labels:
+            kw = {"session": spanner_pb2.Session(labels=session.labels)}
+        session_pb = await database.spanner_api.create_session(
+            database.name, metadata=_metadata_with_prefix(database.name), **kw
+        )
+        session._session_id = session_pb.name.split("/")[-1]
+        return session
+
+    async def get(self, timeout=None):  # pylint: disable=arguments-differ
+        """Check a session out from the pool.
+
+        :type timeout: int
+        :param timeout: seconds to wait for a returned session, when
+                        ``size`` sessions are checked out.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: an existing session from the pool, or a newly-created
+                  session.
+        :raises: :exc:`six.moves.queue.Empty` if no session was returned in
+                 time.
+        """
+        sessions = self._sessions()
+        if sessions.empty() and self._created < self.size:
+            self._created += 1
+            try:
+                return await self._create_session()
+            except BaseException:
+                self._created -= 1
+                raise
+
+        if timeout is None:
+            timeout = self.default_timeout
+        try:
+            return await asyncio.wait_for(sessions.get(), timeout)
+        except asyncio.TimeoutError:
+            raise queue.Empty()
+
+    def put(self, session):
+        """Return a session to the pool.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session being returned.
+        """
+        self._sessions().put_nowait(session)
+
+    async def clear(self):
+        """Delete all sessions in the pool."""
+        sessions = self._sessions()
+        database = self._database
+        while not sessions.empty():
+            session = sessions.get_nowait()
+            self._created -= 1
+            try:
+                await database.spanner_api.delete_session(
+                    session.name, metadata=_metadata_with_prefix(database.name)
+                )
+            except exceptions.NotFound:
+                pass
+
+
+# pylint: disable=misplaced-bare-raise
+#
+# Rational:  this function factors out complex shared deadline / retry
+#            handling from two `except:` clauses.
+def _delay_until_retry(exc, deadline, backoff):
+    """Helper for :meth:`AsyncDatabase.run_in_transaction`.
+
+    Detect retryable abort, and compute the delay before the retry.
+
+    :type exc: :class:`google.api_core.exceptions.Aborted`
+    :param exc: exception for aborted transaction
+
+    :type deadline: float
+    :param deadline: maximum timestamp to continue retrying the transaction.
+
+    :type backoff: float
+    :param backoff: max delay, used if the server did not supply one.
+
+    :rtype: float
+    :returns: seconds to wait before retrying the transaction.
+    """
+    now = time.time()
+
+    if now >= deadline:
+        raise
+
+    delay = None
+    if exc.errors:
+        delay = _get_retry_delay(exc.errors[0])
+    if delay is None:
+        delay = random.uniform(0, backoff)
+
+    if now + delay > deadline:
+        raise
+
+    return delay
+
+
+# pylint: enable=misplaced-bare-raise
+
+
+class _SnapshotCheckout(object):
+    """Async context manager for using a snapshot from a database."""
+
+    def __init__(self, database, **kw):
+        self._database = database
+        self._session = None
+        self._kw = kw
+
+    async def __aenter__(self):
+        session = self._session = await self._database._pool.get()
+        return AsyncSnapshot(session, **self._kw)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._database._pool.put(self._session)
+
+
+class _BatchCheckout(object):
+    """Async context manager for using a batch from a database."""
+
+    def __init__(self, database):
+        self._database = database
+        self._session = self._batch = None
+
+    async def __aenter__(self):
+        session = self._session = await self._database._pool.get()
+        batch = self._batch = AsyncBatch(session)
+        return batch
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                await self._batch.commit()
+        finally:
+            self._database._pool.put(self._session)
+
+
+class AsyncDatabase(object):
+    """Asyncio API to a Cloud Spanner Database.
+
+    .. code:: python
+
+        database = AsyncDatabase.from_database(instance.database("my-db"))
+        async with database:
+            async with database.snapshot() as snapshot:
+                async for row in snapshot.execute_sql("SELECT 1"):
+                    ...
+
+    :type database_id: str
+    :param database_id: the ID of the database.
+
+    :type instance: :class:`~google.cloud.spanner_v1.instance.Instance`
+    :param instance: The instance that owns the database.
+
+    :type pool: :class:`AsyncSessionPool`
+    :param pool: (Optional) session pool to be used by database. If not
+                 passed, the database will construct an
+                 :class:`AsyncSessionPool`.
+
+    :type channel: :class:`grpc.aio.Channel`
+    :param channel: (Optional) channel on which to make requests, e.g. to
+                    an emulator. If not passed, a channel to Cloud Spanner is
+                    created with the credentials of the instance's client,
+                    on first use.
+    """
+
+    _spanner_api = None
+
+    def __init__(self, database_id, instance, pool=None, channel=None):
+        self.database_id = database_id
+        self._instance = instance
+        self._channel = channel
+
+        if pool is None:
+            pool = AsyncSessionPool()
+
+        self._pool = pool
+        pool.bind(self)
+
+    @classmethod
+    def from_database(cls, database, pool=None, channel=None):
+        """Create an asyncio API to a database.
+
+        :type database: :class:`~google.cloud.spanner_v1.database.Database`
+        :param database: the database.
+
+        :type pool: :class:`AsyncSessionPool`
+        :param pool: (Optional) session pool to be used by database.
+
+        :type channel: :class:`grpc.aio.Channel`
+        :param channel: (Optional) channel on which to make requests.
+
+        :rtype: :class:`AsyncDatabase`
+        :returns: the asyncio API to the same database.
+        """
+        return cls(database.database_id, database._instance, pool=pool, channel=channel)
+
+    @property
+    def name(self):
+        """Database name used in requests.
+
+        The database name is of the form
+
+            ``"projects/../instances/../databases/{database_id}"``
+
+        :rtype: str
+        :returns: The database name.
+        """
+        return self._instance.name + "/databases/" + self.database_id
+
+    @property
+    def spanner_api(self):
+        """Helper for session-related API calls."""
+        if self._spanner_api is None:
+            channel = self._channel
+            if channel is None:
+                credentials = self._instance._client.credentials
+                if isinstance(credentials, google.auth.credentials.Scoped):
+                    credentials = credentials.with_scopes((SPANNER_DATA_SCOPE,))
+                channel = grpc_helpers_async.create_channel(
+                    SPANNER_ADDRESS, credentials=credentials, options=_CHANNEL_OPTIONS
+                )
+            self._spanner_api = AsyncSpannerApi(channel)
+        return self._spanner_api
+
+    def session(self, labels=None):
+        """Factory to create a session for this database.
+
+        :type labels: dict (str -> str) or None
+        :param labels: (Optional) user-assigned labels for the session.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: a session bound to this database.
+        """
+        return Session(self, labels=labels)
+
+    def snapshot(self, **kw):
+        """Return an async context manager which wraps a snapshot.
+
+        :type kw: dict
+        :param kw:
+            Passed through to :class:`AsyncSnapshot` constructor.
+
+        :returns: new wrapper, to be used with ``async with``, whose value is
+                  an :class:`AsyncSnapshot`.
+        """
+        return _SnapshotCheckout(self, **kw)
+
+    def batch(self):
+        """Return an async context manager which wraps a batch.
+
+        The batch is committed when the context manager exits without
+        error.
+
+        :returns: new wrapper, to be used with ``async with``, whose value is
+                  an :class:`AsyncBatch`.
+        """
+        return _BatchCheckout(self)
+
+    async def run_in_transaction(self, func, *args, **kw):
+        """Perform a unit of work in a transaction, retrying on abort.
+
+        Aborted transactions are retried after the delay requested by the
+        server or, if there is none, after a random exponential backoff.
+
+        :type func: coroutine function
+        :param func: takes a required positional argument, the
+                     :class:`AsyncTransaction`, and additional positional /
+                     keyword arguments as supplied by the caller.
+
+        :type args: tuple
+        :param args: additional positional arguments to be passed to ``func``.
+
+        :type kw: dict
+        :param kw: optional keyword arguments to be passed to ``func``.
+                   If passed, "timeout_secs" will be removed and used to
+                   override the default timeout.
+
+        :rtype: Any
+        :returns: The return value of ``func``.
+
+        :raises Exception:
+            reraises any non-ABORT execptions raised by ``func``.
+        """
+        deadline = time.time() + kw.pop("timeout_secs", DEFAULT_RETRY_TIMEOUT_SECS)
+        backoff = _INITIAL_RETRY_DELAY
+
+        session = await self._pool.get()
+        try:
+            while True:
+                if session._transaction is not None:
+                    session._transaction._rolled_back = True
+                    del session._transaction
+                txn = session._transaction = AsyncTransaction(session)
+                await txn.begin()
+                try:
+                    return_value = await func(txn, *args, **kw)
+                except exceptions.Aborted as exc:
+                    del session._transaction
+                    delay = _delay_until_retry(exc, deadline, backoff)
+                    await asyncio.sleep(delay)
+                    backoff = min(backoff * 2, _MAX_RETRY_DELAY)
+                    continue
+                except exceptions.GoogleAPICallError:
+                    del session._transaction
+                    raise
+                except Exception:
+                    await txn.rollback()
+                    raise
+
+                try:
+                    await txn.commit()
+                except exceptions.Aborted as exc:
+                    del session._transaction
+                    delay = _delay_until_retry(exc, deadline, backoff)
+                    await asyncio.sleep(delay)
+                    backoff = min(backoff * 2, _MAX_RETRY_DELAY)
+                except exceptions.GoogleAPICallError:
+                    del session._transaction
+                    raise
+                else:
+                    return return_value
+        finally:
+            self._pool.put(session)
+
+    async def close(self):
+        """Delete the sessions of the pool.
+
+        The channel is closed too, unless it was passed to the constructor.
+        """
+        await self._pool.clear()
+        if self._spanner_api is not None and self._channel is None:
+            await self._spanner_api.channel.close()
+            self._spanner_api = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
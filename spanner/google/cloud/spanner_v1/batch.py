@@ -20,7 +20,7 @@ from google.cloud.spanner_v1.proto.transaction_pb2 import TransactionOptions
 # pylint: disable=ungrouped-imports
 from google.cloud._helpers import _pb_timestamp_to_datetime
 from google.cloud.spanner_v1._helpers import _SessionWrapper
-from google.cloud.spanner_v1._helpers import _make_list_value_pbs
+from google.cloud.spanner_v1._helpers import _add_list_value_pbs
 from google.cloud.spanner_v1._helpers import _metadata_with_prefix
 
 # pylint: enable=ungrouped-imports
@@ -56,8 +56,11 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
-        :param values: Values to be modified.
+        :type values: list of lists, :class:`pandas.DataFrame` or
+                      :class:`numpy.ndarray`
+        :param values: Values to be modified, one row per list. The columns
+                       of a data frame are selected by name, those of a
+                       two-dimensional array must be in ``columns`` order.
         """
         self._mutations.append(Mutation(insert=_make_write_pb(table, columns, values)))
 
@@ -70,8 +73,11 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
-        :param values: Values to be modified.
+        :type values: list of lists, :class:`pandas.DataFrame` or
+                      :class:`numpy.ndarray`
+        :param values: Values to be modified, one row per list. The columns
+                       of a data frame are selected by name, those of a
+                       two-dimensional array must be in ``columns`` order.
         """
         self._mutations.append(Mutation(update=_make_write_pb(table, columns, values)))
 
@@ -84,8 +90,11 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
-        :param values: Values to be modified.
+        :type values: list of lists, :class:`pandas.DataFrame` or
+                      :class:`numpy.ndarray`
+        :param values: Values to be modified, one row per list. The columns
+                       of a data frame are selected by name, those of a
+                       two-dimensional array must be in ``columns`` order.
         """
         self._mutations.append(
             Mutation(insert_or_update=_make_write_pb(table, columns, values))
@@ -100,8 +109,11 @@ class _BatchBase(_SessionWrapper):
         :type columns: list of str
         :param columns: Name of the table columns to be modified.
 
-        :type values: list of lists
-        :param values: Values to be modified.
+        :type values: list of lists, :class:`pandas.DataFrame` or
+                      :class:`numpy.ndarray`
+        :param values: Values to be modified, one row per list. The columns
+                       of a data frame are selected by name, those of a
+                       two-dimensional array must be in ``columns`` order.
         """
         self._mutations.append(Mutation(replace=_make_write_pb(table, columns, values)))
 
@@ -177,12 +189,13 @@ def _make_write_pb(table, columns, values):
     :type columns: list of str
     :param columns: Name of the table columns to be modified.
 
-    :type values: list of lists
+    :type values: list of lists, :class:`pandas.DataFrame` or
+                  :class:`numpy.ndarray`
     :param values: Values to be modified.
 
     :rtype: :class:`google.cloud.spanner_v1.proto.mutation_pb2.Mutation.Write`
     :returns: Write protobuf
     """
-    return Mutation.Write(
-        table=table, columns=columns, values=_make_list_value_pbs(values)
-    )
+    write_pb = Mutation.Write(table=table, columns=columns)
+    _add_list_value_pbs(write_pb.values, values, columns)
+    return write_pb
@@ -0,0 +1,277 @@
+# Copyright 2019 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent bulk writes of rows to a Cloud Spanner table."""
+
+import logging
+import threading
+import time
+
+from concurrent import futures
+
+from google.api_core.exceptions import Aborted
+from google.api_core.retry import Retry
+from google.api_core.retry import if_exception_type
+
+from google.cloud.spanner_v1._helpers import _make_list_value_pb
+from google.cloud.spanner_v1.pool import SessionCheckout
+from google.cloud.spanner_v1.proto.mutation_pb2 import Mutation
+
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_MUTATIONS = 20000
+MAX_COMMIT_BYTES = 5242880  # 5MB
+MAX_IN_FLIGHT_COMMITS = 10
+OPERATIONS = ("insert", "update", "insert_or_update", "replace")
+
+DEFAULT_RETRY = Retry(predicate=if_exception_type(Aborted), deadline=120.0)
+"""The default retry of commits, on ``ABORTED`` errors only."""
+
+
+class BulkWriter(object):
+    """Write many rows to a table, with concurrent commits.
+
+    Rows are accumulated in memory and split into commit groups which stay
+    under the limits on the number of mutations and on the size of a commit.
+    Each group is committed in its own single-use transaction, on a session
+    checked out from the database's pool, by a pool of up to
+    ``max_in_flight`` threads. :meth:`write` only blocks when
+    ``max_in_flight`` commits are already in progress, while :meth:`flush`
+    and :meth:`close` wait for every group sent so far to be committed.
+
+    Rows may be written from several threads. Since groups are committed
+    concurrently, writes to the same row sent in different groups may be
+    applied out of order; use ``max_in_flight=1`` if the order matters.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to write to
+
+    :type table: str
+    :param table: Name of the table to be modified.
+
+    :type columns: list of str
+    :param columns: Name of the table columns to be modified.
+
+    :type operation: str
+    :param operation: (Optional) The mutation used to write each row, one of
+                      ``insert``, ``update``, ``insert_or_update`` (the
+                      default, which can be safely retried) or ``replace``.
+
+    :type max_mutations: int
+    :param max_mutations: (Optional) Max number of mutations per commit, each
+                          column of each row counting as one mutation.
+                          Lower it when the table has secondary indexes,
+                          whose entries count as mutations too. Default is
+                          MAX_MUTATIONS (20000).
+
+    :type max_commit_bytes: int
+    :param max_commit_bytes: (Optional) Max size of the encoded rows of a
+                             commit. Default is MAX_COMMIT_BYTES (5 MB).
+
+    :type max_in_flight: int
+    :param max_in_flight: (Optional) Max number of concurrent commits.
+                          Default is MAX_IN_FLIGHT_COMMITS (10).
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: (Optional) Retry of each commit. Defaults to
+                  :attr:`DEFAULT_RETRY`, which retries ``ABORTED`` commits.
+
+    :raises ValueError: if ``operation`` is unknown, or if a single row has
+                        more than ``max_mutations`` mutations.
+    """
+
+    def __init__(
+        self,
+        database,
+        table,
+        columns,
+        operation="insert_or_update",
+        max_mutations=MAX_MUTATIONS,
+        max_commit_bytes=MAX_COMMIT_BYTES,
+        max_in_flight=MAX_IN_FLIGHT_COMMITS,
+        retry=DEFAULT_RETRY,
+    ):
+        if operation not in OPERATIONS:
+            raise ValueError("Unknown operation: %s" % (operation,))
+        if len(columns) > max_mutations:
+            raise ValueError(
+                "A row of %d columns exceeds %d mutations."
+                % (len(columns), max_mutations)
+            )
+
+        self._database = database
+        self.table = table
+        self.columns = list(columns)
+        self.operation = operation
+        self.max_mutations = max_mutations
+        self.max_commit_bytes = max_commit_bytes
+        self.max_in_flight = max_in_flight
+        self._retry = retry
+
+        self._rows_per_commit = max_mutations // len(self.columns)
+        self._values = []
+        self._size = 0
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._errors = []
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_in_flight)
+
+        self._start_time = None
+        self._rows_written = 0
+        self._bytes_written = 0
+        self._commits = 0
+        self._retries = 0
+        self._failed_commits = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, row):
+        """Add a row to the current group, sending it when it is full.
+
+        :type row: list
+        :param row: The values of the row, one per column.
+
+        :raises ValueError: if the row does not have one value per column.
+        """
+        if len(row) != len(self.columns):
+            raise ValueError(
+                "Expected %d values, got %d." % (len(self.columns), len(row))
+            )
+        value_pb = _make_list_value_pb(row)
+        size = value_pb.ByteSize()
+
+        with self._condition:
+            if self._start_time is None:
+                self._start_time = time.time()
+            if self._values and self._size + size > self.max_commit_bytes:
+                self._send_group()
+            self._values.append(value_pb)
+            self._size += size
+            if len(self._values) >= self._rows_per_commit:
+                self._send_group()
+
+    def write_rows(self, rows):
+        """Add rows to the current group, sending each group when it is full.
+
+        :type rows: list of lists
+        :param rows: The values of each row, one per column.
+
+        :raises ValueError: if a row does not have one value per column.
+        """
+        for row in rows:
+            self.write(row)
+
+    def _send_group(self):
+        """Send the current group in the background.
+
+        Must be called with ``_condition`` held. Blocks while
+        ``max_in_flight`` groups are being committed.
+        """
+        if not self._values:
+            return
+
+        values, size = self._values, self._size
+        self._values = []
+        self._size = 0
+
+        while self._in_flight >= self.max_in_flight:
+            self._condition.wait()
+        self._in_flight += 1
+        self._executor.submit(self._commit_group, values, size)
+
+    def _on_error(self, exc):
+        """Count the commits retried by ``_retry``."""
+        _LOGGER.debug("Retrying commit after error: %s", exc)
+        with self._condition:
+            self._retries += 1
+
+    def _commit_group(self, values, size):
+        """Commit a group of rows in a single-use transaction."""
+        write = Mutation.Write(table=self.table, columns=self.columns, values=values)
+        mutation = Mutation(**{self.operation: write})
+        try:
+            with SessionCheckout(self._database._pool) as session:
+                batch = session.batch()
+                batch._mutations.append(mutation)
+                self._retry(batch.commit, on_error=self._on_error)()
+        except Exception as exc:
+            _LOGGER.debug("Error while committing a group of %d rows.", len(values))
+            with self._condition:
+                self._failed_commits += 1
+                self._errors.append(exc)
+        else:
+            with self._condition:
+                self._commits += 1
+                self._rows_written += len(values)
+                self._bytes_written += size
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def flush(self):
+        """Send the current group and wait for all the groups in flight.
+
+        :raises: The first exception raised by a commit since the previous
+                 call to :meth:`flush`, once its retries are exhausted.
+        """
+        with self._condition:
+            self._send_group()
+            while self._in_flight:
+                self._condition.wait()
+            errors, self._errors = self._errors, []
+
+        if errors:
+            raise errors[0]
+
+    def close(self):
+        """Flush the remaining rows and release the background threads.
+
+        The writer must not be used after it is closed.
+        """
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+
+    def stats(self):
+        """Return the throughput of the writer so far.
+
+        The rates are computed from the first call to :meth:`write`.
+
+        :rtype: dict
+        :returns: the numbers of rows, bytes, commits, retried commits and
+                  failed commits, and the rows written per second.
+        """
+        with self._condition:
+            if self._start_time is None:
+                seconds = 0.0
+            else:
+                seconds = time.time() - self._start_time
+            return {
+                "rows_written": self._rows_written,
+                "rows_pending": len(self._values),
+                "bytes_written": self._bytes_written,
+                "commits": self._commits,
+                "retries": self._retries,
+                "failed_commits": self._failed_commits,
+                "in_flight": self._in_flight,
+                "seconds": seconds,
+                "rows_per_sec": self._rows_written / seconds if seconds else 0.0,
+            }
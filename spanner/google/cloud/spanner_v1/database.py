@@ -14,22 +14,27 @@
 
 """User friendly container for Cloud Spanner Database."""
 
+from concurrent import futures
 import copy
 import functools
 import re
 import threading
 
+from google.api_core.exceptions import DeadlineExceeded
+from google.api_core.exceptions import InternalServerError
+from google.api_core.exceptions import ServiceUnavailable
 from google.api_core.gapic_v1 import client_info
 import google.auth.credentials
-from google.protobuf.struct_pb2 import Struct
 from google.cloud.exceptions import NotFound
 import six
+from six.moves import queue
 
 # pylint: disable=ungrouped-imports
 from google.cloud.spanner_v1 import __version__
-from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1._helpers import _make_params_pb
 from google.cloud.spanner_v1._helpers import _metadata_with_prefix
 from google.cloud.spanner_v1.batch import Batch
+from google.cloud.spanner_v1.bulk_writer import BulkWriter
 from google.cloud.spanner_v1.gapic.spanner_client import SpannerClient
 from google.cloud.spanner_v1.keyset import KeySet
 from google.cloud.spanner_v1.pool import BurstyPool
@@ -50,6 +55,17 @@ _CLIENT_INFO = client_info.ClientInfo(client_library_version=__version__)
 SPANNER_DATA_SCOPE = "https://www.googleapis.com/auth/spanner.data"
 
 
+_MAX_PARTITION_WORKERS = 8
+_PARTITION_BUFFER_SIZE = 1000
+_MAX_PARTITION_ATTEMPTS = 3
+_PARTITION_RETRY_DELAY = 0.1
+_RETRYABLE_PARTITION_ERRORS = (
+    DeadlineExceeded,
+    InternalServerError,
+    ServiceUnavailable,
+)
+_PARTITION_DONE = object()
+
 _DATABASE_NAME_RE = re.compile(
     r"^projects/(?P<project>[^/]+)/"
     r"instances/(?P<instance_id>[a-z][-a-z0-9]*)/"
@@ -311,9 +327,7 @@ class Database(object):
         if params is not None:
             if param_types is None:
                 raise ValueError("Specify 'param_types' when passing 'params'.")
-            params_pb = Struct(
-                fields={key: _make_value_pb(value) for key, value in params.items()}
-            )
+            params_pb = _make_params_pb(params, param_types)
         else:
             params_pb = None
 
@@ -389,6 +403,25 @@ class Database(object):
         """
         return BatchCheckout(self)
 
+    def bulk_writer(self, table, columns, **kw):
+        """Return a writer of many rows to a table.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type kw: dict
+        :param kw: Passed through to
+                   :class:`~google.cloud.spanner_v1.bulk_writer.BulkWriter`
+                   constructor.
+
+        :rtype: :class:`~google.cloud.spanner_v1.bulk_writer.BulkWriter`
+        :returns: a writer bound to this database.
+        """
+        return BulkWriter(self, table, columns, **kw)
+
     def batch_snapshot(self, read_timestamp=None, exact_staleness=None):
         """Return an object which wraps a batch read / query.
 
@@ -773,6 +806,249 @@ class BatchSnapshot(object):
             return self.process_read_batch(batch)
         raise ValueError("Invalid batch")
 
+    def run_partitioned_query(
+        self,
+        sql,
+        params=None,
+        param_types=None,
+        partition_size_bytes=None,
+        max_partitions=None,
+        max_workers=_MAX_PARTITION_WORKERS,
+        buffer_size=_PARTITION_BUFFER_SIZE,
+        max_attempts=_MAX_PARTITION_ATTEMPTS,
+        partition_handler=None,
+    ):
+        """Run a partitioned query, processing its partitions concurrently.
+
+        Partitions the query with :meth:`generate_query_batches`, then
+        processes each partition in a thread pool. The results are handed
+        to the caller through a bounded queue, in no particular order.
+
+        For example:
+
+        .. code:: python
+
+            for row in batch_snapshot.run_partitioned_query(
+                "SELECT * FROM citizens", max_workers=16
+            ):
+                process(row)
+
+        :type sql: str
+        :param sql: SQL query statement
+
+        :type params: dict, {str -> column value}
+        :param params: values for parameter replacement.  Keys must match
+                       the names used in ``sql``.
+
+        :type param_types: dict[str -> Union[dict, .types.Type]]
+        :param param_types:
+            (Optional) maps explicit types for one or more param values;
+            required if parameters are passed.
+
+        :type partition_size_bytes: int
+        :param partition_size_bytes:
+            (Optional) desired size for each partition generated.  The service
+            uses this as a hint, the actual partition size may differ.
+
+        :type max_partitions: int
+        :param max_partitions:
+            (Optional) desired maximum number of partitions generated. The
+            service uses this as a hint, the actual number of partitions may
+            differ.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of partitions
+                            processed concurrently.
+
+        :type buffer_size: int
+        :param buffer_size: (Optional) The maximum number of results
+                            processed ahead of the consumer.
+
+        :type max_attempts: int
+        :param max_attempts:
+            (Optional) The maximum number of times a partition is processed
+            when it fails with a transient error. A partition is only
+            processed again if none of its rows were handed to the caller.
+
+        :type partition_handler: callable
+        :param partition_handler:
+            (Optional) Called, in a worker thread, with the
+            :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet` of
+            each partition; its return value is yielded instead of the rows
+            of the partition, e.g. to build one data frame per partition.
+
+        :rtype: iterator
+        :returns: An iterator of rows, or of the results of
+                  ``partition_handler``.
+        """
+        batches = list(
+            self.generate_query_batches(
+                sql,
+                params=params,
+                param_types=param_types,
+                partition_size_bytes=partition_size_bytes,
+                max_partitions=max_partitions,
+            )
+        )
+        return self._run_batches(
+            batches, max_workers, buffer_size, max_attempts, partition_handler
+        )
+
+    def run_partitioned_read(
+        self,
+        table,
+        columns,
+        keyset,
+        index="",
+        partition_size_bytes=None,
+        max_partitions=None,
+        max_workers=_MAX_PARTITION_WORKERS,
+        buffer_size=_PARTITION_BUFFER_SIZE,
+        max_attempts=_MAX_PARTITION_ATTEMPTS,
+        partition_handler=None,
+    ):
+        """Run a partitioned read, processing its partitions concurrently.
+
+        Partitions the read with :meth:`generate_read_batches`, then
+        processes the partitions as :meth:`run_partitioned_query` does.
+
+        :type table: str
+        :param table: name of the table from which to fetch data
+
+        :type columns: list of str
+        :param columns: names of columns to be retrieved
+
+        :type keyset: :class:`~google.cloud.spanner_v1.keyset.KeySet`
+        :param keyset: keys / ranges identifying rows to be retrieved
+
+        :type index: str
+        :param index: (Optional) name of index to use, rather than the
+                      table's primary key
+
+        :type partition_size_bytes: int
+        :param partition_size_bytes:
+            (Optional) desired size for each partition generated.  The service
+            uses this as a hint, the actual partition size may differ.
+
+        :type max_partitions: int
+        :param max_partitions:
+            (Optional) desired maximum number of partitions generated. The
+            service uses this as a hint, the actual number of partitions may
+            differ.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of partitions
+                            processed concurrently.
+
+        :type buffer_size: int
+        :param buffer_size: (Optional) The maximum number of results
+                            processed ahead of the consumer.
+
+        :type max_attempts: int
+        :param max_attempts:
+            (Optional) The maximum number of times a partition is processed
+            when it fails with a transient error.
+
+        :type partition_handler: callable
+        :param partition_handler:
+            (Optional) Called with the result set of each partition; its
+            return value is yielded instead of the rows of the partition.
+
+        :rtype: iterator
+        :returns: An iterator of rows, or of the results of
+                  ``partition_handler``.
+        """
+        batches = list(
+            self.generate_read_batches(
+                table,
+                columns,
+                keyset,
+                index=index,
+                partition_size_bytes=partition_size_bytes,
+                max_partitions=max_partitions,
+            )
+        )
+        return self._run_batches(
+            batches, max_workers, buffer_size, max_attempts, partition_handler
+        )
+
+    def _run_batches(
+        self, batches, max_workers, buffer_size, max_attempts, partition_handler
+    ):
+        """Helper for :meth:`run_partitioned_query` and
+        :meth:`run_partitioned_read`.
+
+        Yields the results of the batches as the workers put them in the
+        queue, and stops the workers when the caller stops iterating.
+        """
+        if not batches:
+            return
+
+        stop_event = threading.Event()
+        results = queue.Queue(maxsize=buffer_size)
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for batch in batches:
+                executor.submit(
+                    self._run_batch,
+                    batch,
+                    max_attempts,
+                    partition_handler,
+                    results,
+                    stop_event,
+                )
+
+            remaining = len(batches)
+            while remaining:
+                item = results.get()
+                if item is _PARTITION_DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=False)
+
+    def _run_batch(self, batch, max_attempts, partition_handler, results, stop_event):
+        """Helper for :meth:`_run_batches`.
+
+        Puts the results of one batch in ``results``, followed by either
+        ``_PARTITION_DONE`` or the exception which ended the batch.
+        """
+        delivered = False
+        attempt = 0
+        delay = _PARTITION_RETRY_DELAY
+        while True:
+            attempt += 1
+            try:
+                result_set = self.process(batch)
+                if partition_handler is not None:
+                    # The handler consumes the whole partition before any
+                    # of it is handed over, so it can always be retried.
+                    item = partition_handler(result_set)
+                    if not _put_until_stopped(results, item, stop_event):
+                        return
+                else:
+                    for row in result_set:
+                        delivered = True
+                        if not _put_until_stopped(results, row, stop_event):
+                            return
+                item = _PARTITION_DONE
+                break
+            except _RETRYABLE_PARTITION_ERRORS as exc:
+                if delivered or attempt >= max_attempts:
+                    item = exc
+                    break
+                if stop_event.wait(delay):
+                    return
+                delay *= 2
+            except Exception as exc:
+                item = exc
+                break
+        _put_until_stopped(results, item, stop_event)
+
     def close(self):
         """Clean up underlying session.
 
@@ -787,6 +1063,21 @@ class BatchSnapshot(object):
             self._session.delete()
 
 
+def _put_until_stopped(items_queue, item, stop_event):
+    """Put an item in a bounded queue unless ``stop_event`` is set first.
+
+    :rtype: bool
+    :returns: True if the item was put in the queue.
+    """
+    while not stop_event.is_set():
+        try:
+            items_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
 def _check_ddl_statements(value):
     """Validate DDL Statements used to define database schema.
 
@@ -14,14 +14,21 @@
 
 """Pools managing shared Session objects."""
 
+import collections
 import datetime
+import logging
+import threading
+import time
 
+from concurrent import futures
 from six.moves import queue
 from six.moves import xrange
 
 from google.cloud.exceptions import NotFound
 
 
+_LOGGER = logging.getLogger(__name__)
+_MAINTAINER_NAME = "Thread-SessionPoolMaintainer"
 _NOW = datetime.datetime.utcnow  # unit tests may replace
 
 
@@ -498,6 +505,320 @@ class TransactionPingingPool(PingingPool):
             super(TransactionPingingPool, self).put(session)
 
 
+class MaintainedPool(AbstractSessionPool):
+    """Concrete session pool implementation:
+
+    - Pre-allocates / creates a fixed number of sessions, sending up to
+      ``max_create_workers`` ``CreateSession`` requests concurrently.
+
+    - Tracks locally when each session was last used, and only checks
+      sessions idle for more than ``idle_threshold`` seconds via
+      :meth:`session.exists` before returning them, replacing expired
+      sessions.
+
+    - Returns the most recently used sessions first, so that the sessions
+      in use rarely need to be checked.
+
+    - "Pings" idle sessions via :meth:`maintain`, and replaces expired or
+      lost sessions, every ``maintenance_interval`` seconds from a background
+      thread started by :meth:`bind`.
+
+    - Blocks, with a timeout, when :meth:`get` is called on an empty pool.
+      Raises after timing out.
+
+    - Raises when :meth:`put` is called on a full pool.  That error is
+      never expected in normal practice, as users should be calling
+      :meth:`get` followed by :meth:`put` whenever in need of a session.
+
+    The wait-time and utilization metrics of the pool are returned by
+    :meth:`stats`.
+
+    :type size: int
+    :param size: fixed pool size
+
+    :type default_timeout: int
+    :param default_timeout: default timeout, in seconds, to wait for
+                            a returned session.
+
+    :type idle_threshold: int
+    :param idle_threshold: seconds after which an unused session is checked
+                           before being returned, or pinged by
+                           :meth:`maintain`.
+
+    :type maintenance_interval: float
+    :param maintenance_interval: (Optional) interval, in seconds, at which
+                                 the background thread calls :meth:`maintain`.
+                                 If :data:`None`, no background thread is
+                                 started, and the application is responsible
+                                 for calling :meth:`maintain`.
+
+    :type max_create_workers: int
+    :param max_create_workers: max number of sessions created concurrently.
+
+    :type labels: dict (str -> str) or None
+    :param labels: (Optional) user-assigned labels for sessions created
+                    by the pool.
+    """
+
+    DEFAULT_SIZE = 10
+    DEFAULT_TIMEOUT = 10
+    DEFAULT_IDLE_THRESHOLD = 3000
+    DEFAULT_MAINTENANCE_INTERVAL = 60
+    DEFAULT_CREATE_WORKERS = 10
+
+    def __init__(
+        self,
+        size=DEFAULT_SIZE,
+        default_timeout=DEFAULT_TIMEOUT,
+        idle_threshold=DEFAULT_IDLE_THRESHOLD,
+        maintenance_interval=DEFAULT_MAINTENANCE_INTERVAL,
+        max_create_workers=DEFAULT_CREATE_WORKERS,
+        labels=None,
+    ):
+        super(MaintainedPool, self).__init__(labels=labels)
+        self.size = size
+        self.default_timeout = default_timeout
+        self.maintenance_interval = maintenance_interval
+        self.max_create_workers = max_create_workers
+        self._delta = datetime.timedelta(seconds=idle_threshold)
+        # ``(last_used, session)`` pairs, the most recently used on the right.
+        self._sessions = collections.deque()
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._maintainer = None
+        # Sessions checked out with :meth:`get` and not returned yet.
+        self._in_use = 0
+        # Sessions lost because they could not be checked or replaced.
+        self._missing = 0
+        self._max_in_use = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._checks = 0
+        self._pings = 0
+        self._replacements = 0
+
+    def bind(self, database):
+        """Associate the pool with a database.
+
+        Creates the sessions of the pool, and starts the background thread
+        maintaining them.
+
+        :type database: :class:`~google.cloud.spanner_v1.database.Database`
+        :param database: database used by the pool:  used to create sessions
+                         when needed.
+        """
+        self._database = database
+
+        sessions = self._create_sessions(self.size - len(self._sessions))
+        now = _NOW()
+        with self._condition:
+            self._sessions.extend((now, session) for session in sessions)
+            self._condition.notify_all()
+
+        if self.maintenance_interval is not None and self._maintainer is None:
+            self._stop_event.clear()
+            self._maintainer = threading.Thread(
+                name=_MAINTAINER_NAME, target=self._maintain_periodically
+            )
+            self._maintainer.daemon = True
+            self._maintainer.start()
+
+    def get(self, timeout=None):  # pylint: disable=arguments-differ
+        """Check a session out from the pool.
+
+        :type timeout: int
+        :param timeout: seconds to block waiting for an available session
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: an existing session from the pool, or a newly-created
+                  session.
+        :raises: :exc:`six.moves.queue.Empty` if the queue is empty.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        start = time.time()
+        with self._condition:
+            while not self._sessions:
+                remaining = start + timeout - time.time()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise queue.Empty()
+                self._condition.wait(remaining)
+
+            last_used, session = self._sessions.pop()
+            waited = time.time() - start
+            self._checkouts += 1
+            self._wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+            self._in_use += 1
+            self._max_in_use = max(self._max_in_use, self._in_use)
+            idle = _NOW() - last_used > self._delta
+            if idle:
+                self._checks += 1
+
+        if idle:
+            try:
+                session = self._check(session)
+            except Exception:
+                with self._condition:
+                    self._in_use -= 1
+                    self._missing += 1
+                raise
+
+        return session
+
+    def put(self, session):
+        """Return a session to the pool.
+
+        Never blocks:  if the pool is full, raises.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session being returned.
+
+        :raises: :exc:`six.moves.queue.Full` if the queue is full.
+        """
+        with self._condition:
+            if len(self._sessions) >= self.size:
+                raise queue.Full()
+            self._sessions.append((_NOW(), session))
+            self._in_use = max(self._in_use - 1, 0)
+            self._condition.notify()
+
+    def clear(self):
+        """Delete all sessions in the pool.
+
+        Also stops the background thread maintaining the sessions.
+        """
+        self._stop_event.set()
+        maintainer, self._maintainer = self._maintainer, None
+        if maintainer is not None and maintainer is not threading.current_thread():
+            maintainer.join()
+
+        while True:
+            with self._condition:
+                if not self._sessions:
+                    break
+                _, session = self._sessions.popleft()
+            session.delete()
+
+    def maintain(self):
+        """Refresh idle sessions in the pool, and replace lost sessions.
+
+        Pings the sessions which have not been used for more than
+        ``idle_threshold`` seconds, replacing the expired ones, and creates
+        sessions to replace the ones which could not be checked out.
+
+        This method is called periodically from the background thread
+        started by :meth:`bind`, unless ``maintenance_interval`` is
+        :data:`None`.
+        """
+        now = _NOW()
+        idle = []
+        with self._condition:
+            # The deque is sorted by last use: idle sessions are on the left.
+            while self._sessions and now - self._sessions[0][0] > self._delta:
+                idle.append(self._sessions.popleft()[1])
+            missing, self._missing = self._missing, 0
+            self._pings += len(idle)
+
+        sessions = []
+        try:
+            for session in idle:
+                sessions.append(self._check(session))
+            sessions.extend(self._create_sessions(missing))
+        finally:
+            lost = len(idle) + missing - len(sessions)
+            now = _NOW()
+            with self._condition:
+                self._sessions.extend((now, session) for session in sessions)
+                self._missing += lost
+                self._condition.notify(len(sessions))
+
+    def stats(self):
+        """Return the wait-time and utilization metrics of the pool.
+
+        :rtype: dict
+        :returns: ``available`` and ``in_use`` give the current number of
+                  sessions in the pool and checked out, ``max_in_use`` the
+                  highest number of sessions checked out at once, and
+                  ``utilization`` the fraction of ``size`` checked out.
+                  ``checkouts`` and ``timeouts`` count the calls to
+                  :meth:`get`, and ``wait_seconds_total``,
+                  ``wait_seconds_max`` and ``wait_seconds_mean`` give the time
+                  they spent waiting for a session. ``checks``, ``pings``
+                  and ``replacements`` count the sessions checked by
+                  :meth:`get`, pinged by :meth:`maintain`, and replaced
+                  because they had expired.
+        """
+        with self._condition:
+            return {
+                "size": self.size,
+                "available": len(self._sessions),
+                "in_use": self._in_use,
+                "max_in_use": self._max_in_use,
+                "utilization": float(self._in_use) / self.size if self.size else 0.0,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "wait_seconds_total": self._wait_seconds,
+                "wait_seconds_max": self._max_wait_seconds,
+                "wait_seconds_mean": (
+                    self._wait_seconds / self._checkouts if self._checkouts else 0.0
+                ),
+                "checks": self._checks,
+                "pings": self._pings,
+                "replacements": self._replacements,
+            }
+
+    def _check(self, session):
+        """Replace a session if it does not exist anymore.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session to check.
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: ``session``, or a newly-created session if it had expired.
+        """
+        if session.exists():
+            return session
+        session = self._new_session()
+        session.create()
+        with self._condition:
+            self._replacements += 1
+        return session
+
+    def _create_sessions(self, count):
+        """Create sessions, up to ``max_create_workers`` at a time.
+
+        :type count: int
+        :param count: the number of sessions to create.
+
+        :rtype: list
+        :returns: the new :class:`~google.cloud.spanner_v1.session.Session`
+                  instances.
+        """
+        sessions = [self._new_session() for _ in xrange(count)]
+        workers = min(count, self.max_create_workers)
+        if workers > 1:
+            with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                for _ in executor.map(lambda session: session.create(), sessions):
+                    pass
+        else:
+            for session in sessions:
+                session.create()
+        return sessions
+
+    def _maintain_periodically(self):
+        """Call :meth:`maintain` until :meth:`clear` is called."""
+        while not self._stop_event.wait(self.maintenance_interval):
+            try:
+                self.maintain()
+            except Exception:
+                _LOGGER.exception("Failed to maintain the sessions of the pool.")
+
+
 class SessionCheckout(object):
     """Context manager: hold session checked out from a pool.
 
@@ -0,0 +1,204 @@
+# Copyright 2019 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side cache of the results of stale reads."""
+
+import collections
+import copy
+import threading
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64MB
+
+_Entry = collections.namedtuple("_Entry", ["responses", "read_timestamp", "size"])
+
+
+class ReadCache(object):
+    """LRU cache of the results of :meth:`Snapshot.read` calls.
+
+    Pass it to the snapshots whose reads may be served from the cache:
+
+    .. code:: python
+
+        cache = ReadCache()
+        with database.snapshot(
+                max_staleness=datetime.timedelta(seconds=10),
+                read_cache=cache) as snapshot:
+            rows = list(snapshot.read(table, columns, keyset))
+
+    Results are keyed on the database, table, columns, keyset, index and
+    limit of the read, so the cache may be shared by the snapshots of
+    several databases. They are stored with the timestamp at which the server read them.
+    A snapshot is only served a result read at a timestamp within its
+    bound: no older than ``max_staleness`` or ``exact_staleness`` ago, no
+    older than ``min_read_timestamp``, or exactly at ``read_timestamp``.
+    A snapshot with ``exact_staleness`` may thus be served data fresher
+    than it asked for, but never staler. Results too old for the snapshot
+    reading them are dropped and read again.
+
+    Results are stored as the partial result sets received from the server,
+    once a read is fully consumed. The least recently used ones are evicted
+    when the size of those partial result sets exceeds ``max_bytes``.
+
+    The cache may be shared by the snapshots of several threads.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) Max size of the cached partial result sets.
+                      Default is DEFAULT_MAX_BYTES (64 MB).
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()  # least recently used first
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _make_key(database, table, columns, keyset, index, limit):
+        """Build the key of the result of a read from a database."""
+        keyset_pb = keyset._to_pb().SerializeToString(deterministic=True)
+        return database, table, tuple(columns), keyset_pb, index, limit
+
+    def _get(self, key, min_read_timestamp=None, read_timestamp=None):
+        """Look up the result of a read.
+
+        :type key: tuple
+        :param key: the key of the read, from :meth:`_make_key`.
+
+        :type min_read_timestamp: int
+        :param min_read_timestamp: (Optional) oldest acceptable read
+                                   timestamp, in nanoseconds since the epoch.
+
+        :type read_timestamp: int
+        :param read_timestamp: (Optional) required read timestamp, in
+                               nanoseconds since the epoch.
+
+        :rtype: list of
+            :class:`~google.cloud.spanner_v1.proto.result_set_pb2.PartialResultSet`
+        :returns: the partial result sets of the read, or None if the result
+                  is not cached, or was not read at an acceptable timestamp.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if (
+                min_read_timestamp is not None
+                and entry.read_timestamp < min_read_timestamp
+            ) or (
+                read_timestamp is not None and entry.read_timestamp != read_timestamp
+            ):
+                self._misses += 1
+                self._expirations += 1
+                self._discard(key)
+                return None
+
+            self._hits += 1
+            self._entries[key] = self._entries.pop(key)  # most recently used
+            responses = entry.responses
+
+        # Merging chunked values modifies the partial result sets.
+        if any(response.chunked_value for response in responses):
+            responses = [copy.deepcopy(response) for response in responses]
+        return responses
+
+    def _put(self, key, responses, read_timestamp):
+        """Store the result of a read, evicting the least recently used ones.
+
+        Results larger than ``max_bytes`` are not stored.
+        """
+        size = sum(response.ByteSize() for response in responses)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = _Entry(responses, read_timestamp, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self._evictions += 1
+
+    def _discard(self, key):
+        """Remove an entry, with ``_lock`` held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def _record(self, key, response_iterator):
+        """Pass partial result sets through, storing them once exhausted.
+
+        :type key: tuple
+        :param key: the key of the read, from :meth:`_make_key`.
+
+        :type response_iterator: iterator
+        :param response_iterator: the partial result sets of the read.
+
+        :rtype: iterator
+        :returns: the partial result sets of the read.
+        """
+        responses = []
+        for response in response_iterator:
+            if response.chunked_value:
+                # Merging chunked values modifies the partial result sets
+                # yielded, so store a copy of them.
+                responses.append(copy.deepcopy(response))
+            else:
+                responses.append(response)
+            yield response
+
+        if responses:
+            transaction = responses[0].metadata.transaction
+            if transaction.HasField("read_timestamp"):
+                read_timestamp = transaction.read_timestamp.ToNanoseconds()
+                self._put(key, responses, read_timestamp)
+
+    def invalidate(self, table=None):
+        """Drop cached results, e.g. after writing to a table.
+
+        :type table: str
+        :param table: (Optional) drop only the results read from this table,
+                      in any database.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if table is None or key[1] == table:
+                    self._discard(key)
+
+    def stats(self):
+        """Return the usage of the cache so far.
+
+        :rtype: dict
+        :returns: the numbers of hits, misses, results dropped because they
+                  were too old (counted as misses) and results evicted, and
+                  the number and size of the cached results.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": float(self._hits) / lookups if lookups else 0.0,
+                "expirations": self._expirations,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
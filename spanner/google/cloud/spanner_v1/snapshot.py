@@ -15,8 +15,8 @@
 """Model a set of read-only queries to a database as a snapshot."""
 
 import functools
+import time
 
-from google.protobuf.struct_pb2 import Struct
 from google.cloud.spanner_v1.proto.transaction_pb2 import TransactionOptions
 from google.cloud.spanner_v1.proto.transaction_pb2 import TransactionSelector
 
@@ -24,13 +24,16 @@ from google.api_core.exceptions import ServiceUnavailable
 import google.api_core.gapic_v1.method
 from google.cloud._helpers import _datetime_to_pb_timestamp
 from google.cloud._helpers import _timedelta_to_duration_pb
-from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1._helpers import _make_params_pb
 from google.cloud.spanner_v1._helpers import _metadata_with_prefix
 from google.cloud.spanner_v1._helpers import _SessionWrapper
 from google.cloud.spanner_v1.streamed import StreamedResultSet
 from google.cloud.spanner_v1.types import PartitionOptions
 
 
+_NOW = time.time  # unit tests may replace
+
+
 def _restart_on_unavailable(restart):
     """Restart iteration after :exc:`.ServiceUnavailable`.
 
@@ -86,6 +89,23 @@ class _SnapshotBase(_SessionWrapper):
         """
         raise NotImplementedError
 
+    def _stream(self, restart):
+        """Helper for :meth:`read` / :meth:`execute_sql`.
+
+        :type restart: callable
+        :param restart: curried function returning the stream of partial
+                        result sets, resumed after :exc:`.ServiceUnavailable`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
+        :returns: a result set instance which can be used to consume rows.
+        """
+        iterator = _restart_on_unavailable(restart)
+
+        if self._multi_use:
+            return StreamedResultSet(iterator, source=self)
+        else:
+            return StreamedResultSet(iterator)
+
     def read(self, table, columns, keyset, index="", limit=0, partition=None):
         """Perform a ``StreamingRead`` API request for rows in a table.
 
@@ -142,14 +162,9 @@ class _SnapshotBase(_SessionWrapper):
             metadata=metadata,
         )
 
-        iterator = _restart_on_unavailable(restart)
-
         self._read_request_count += 1
 
-        if self._multi_use:
-            return StreamedResultSet(iterator, source=self)
-        else:
-            return StreamedResultSet(iterator)
+        return self._stream(restart)
 
     def execute_sql(
         self,
@@ -200,9 +215,7 @@ class _SnapshotBase(_SessionWrapper):
         if params is not None:
             if param_types is None:
                 raise ValueError("Specify 'param_types' when passing 'params'.")
-            params_pb = Struct(
-                fields={key: _make_value_pb(value) for key, value in params.items()}
-            )
+            params_pb = _make_params_pb(params, param_types)
         else:
             params_pb = None
 
@@ -226,15 +239,10 @@ class _SnapshotBase(_SessionWrapper):
             timeout=timeout,
         )
 
-        iterator = _restart_on_unavailable(restart)
-
         self._read_request_count += 1
         self._execute_sql_count += 1
 
-        if self._multi_use:
-            return StreamedResultSet(iterator, source=self)
-        else:
-            return StreamedResultSet(iterator)
+        return self._stream(restart)
 
     def partition_read(
         self,
@@ -354,9 +362,7 @@ class _SnapshotBase(_SessionWrapper):
         if params is not None:
             if param_types is None:
                 raise ValueError("Specify 'param_types' when passing 'params'.")
-            params_pb = Struct(
-                fields={key: _make_value_pb(value) for key, value in params.items()}
-            )
+            params_pb = _make_params_pb(params, param_types)
         else:
             params_pb = None
 
@@ -414,6 +420,11 @@ class Snapshot(_SnapshotBase):
                       context of a read-only transaction, used to ensure
                       isolation / consistency. Incompatible with
                       ``max_staleness`` and ``min_read_timestamp``.
+
+    :type read_cache: :class:`~google.cloud.spanner_v1.read_cache.ReadCache`
+    :param read_cache: (Optional) cache from which :meth:`read` may be
+                       served, and in which its results are stored.
+                       Incompatible with ``multi_use`` and strong reads.
     """
 
     def __init__(
@@ -424,6 +435,7 @@ class Snapshot(_SnapshotBase):
         max_staleness=None,
         exact_staleness=None,
         multi_use=False,
+        read_cache=None,
     ):
         super(Snapshot, self).__init__(session)
         opts = [read_timestamp, min_read_timestamp, max_staleness, exact_staleness]
@@ -440,11 +452,18 @@ class Snapshot(_SnapshotBase):
                 )
 
         self._strong = len(flagged) == 0
+
+        if read_cache is not None and (multi_use or self._strong):
+            raise ValueError(
+                "'read_cache' is incompatible with 'multi_use' and strong reads"
+            )
+
         self._read_timestamp = read_timestamp
         self._min_read_timestamp = min_read_timestamp
         self._max_staleness = max_staleness
         self._exact_staleness = exact_staleness
         self._multi_use = multi_use
+        self._read_cache = read_cache
 
     def _make_txn_selector(self):
         """Helper for :meth:`read`."""
@@ -467,15 +486,71 @@ class Snapshot(_SnapshotBase):
             key = "strong"
             value = True
 
-        options = TransactionOptions(
-            read_only=TransactionOptions.ReadOnly(**{key: value})
-        )
+        read_only = TransactionOptions.ReadOnly(**{key: value})
+        if self._read_cache is not None:
+            read_only.return_read_timestamp = True
+        options = TransactionOptions(read_only=read_only)
 
         if self._multi_use:
             return TransactionSelector(begin=options)
         else:
             return TransactionSelector(single_use=options)
 
+    def _cached_read_bounds(self):
+        """Helper for :meth:`read`.
+
+        :rtype: dict
+        :returns: the bounds of the read timestamps of the cached results
+                  which may be returned by this snapshot, in nanoseconds,
+                  as keyword arguments of :meth:`ReadCache._get`.
+        """
+        if self._read_timestamp:
+            timestamp_pb = _datetime_to_pb_timestamp(self._read_timestamp)
+            return {"read_timestamp": timestamp_pb.ToNanoseconds()}
+        if self._min_read_timestamp:
+            timestamp_pb = _datetime_to_pb_timestamp(self._min_read_timestamp)
+            return {"min_read_timestamp": timestamp_pb.ToNanoseconds()}
+        staleness = self._max_staleness or self._exact_staleness
+        oldest = _NOW() - staleness.total_seconds()
+        return {"min_read_timestamp": int(oldest * 1e9)}
+
+    def read(self, table, columns, keyset, index="", limit=0, partition=None):
+        """Perform a ``StreamingRead`` API request for rows in a table.
+
+        If the snapshot has a ``read_cache``, the rows may be returned from
+        it, and are stored in it once read; see
+        :class:`~google.cloud.spanner_v1.read_cache.ReadCache`.
+
+        Arguments are those of :meth:`_SnapshotBase.read`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
+        :returns: a result set instance which can be used to consume rows.
+        """
+        read_cache = self._read_cache
+        if read_cache is None or partition is not None:
+            return super(Snapshot, self).read(
+                table, columns, keyset, index=index, limit=limit, partition=partition
+            )
+
+        if self._read_request_count > 0:
+            raise ValueError("Cannot re-use single-use snapshot.")
+
+        key = read_cache._make_key(
+            self._session._database.name, table, columns, keyset, index, limit
+        )
+        responses = read_cache._get(key, **self._cached_read_bounds())
+        if responses is not None:
+            self._read_request_count += 1
+            return StreamedResultSet(iter(responses))
+
+        result_set = super(Snapshot, self).read(
+            table, columns, keyset, index=index, limit=limit
+        )
+        result_set._response_iterator = read_cache._record(
+            key, result_set._response_iterator
+        )
+        return result_set
+
     def begin(self):
         """Begin a read-only transaction on the database.
 
@@ -20,12 +20,34 @@ from google.cloud import exceptions
 from google.cloud.spanner_v1.proto import type_pb2
 import six
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 # pylint: disable=ungrouped-imports
-from google.cloud.spanner_v1._helpers import _parse_value_pb
+from google.cloud.spanner_v1._helpers import _arrow_fields
+from google.cloud.spanner_v1._helpers import _make_arrow_array
+from google.cloud.spanner_v1._helpers import _make_row_decoders
 
 # pylint: enable=ungrouped-imports
 
 
+_NO_PANDAS_ERROR = (
+    "The pandas library is not installed, please install "
+    "pandas to use the to_dataframe() function."
+)
+_NO_PYARROW_ERROR = (
+    "The pyarrow library is not installed, please install "
+    "pyarrow to use the to_arrow() and to_dataframe() functions."
+)
+
+
 class StreamedResultSet(object):
     """Process a sequence of partial result sets into a single set of row data.
 
@@ -48,6 +70,8 @@ class StreamedResultSet(object):
         self._current_row = []  # Accumulated values for incomplete row
         self._pending_chunk = None  # Incomplete value
         self._source = source  # Source snapshot
+        self._decoders = None  # Column decoders, built from the metadata
+        self._decoders_metadata = None  # Metadata of the decoders
 
     @property
     def fields(self):
@@ -93,27 +117,81 @@ class StreamedResultSet(object):
         self._pending_chunk = None
         return merged
 
+    def _row_decoders(self):
+        """Column decoders, built once from the result set metadata.
+
+        :rtype: list of callable
+        :returns: the decoder of each column of the rows.
+        """
+        if self._decoders_metadata is not self._metadata:
+            self._decoders = _make_row_decoders(self.fields)
+            self._decoders_metadata = self._metadata
+        return self._decoders
+
     def _merge_values(self, values):
         """Merge values into rows.
 
         :type values: list of :class:`~google.protobuf.struct_pb2.Value`
         :param values: non-chunked values from partial result set.
         """
-        width = len(self.fields)
+        decoders = self._row_decoders()
+        width = len(decoders)
+        rows = self._rows
+        current_row = self._current_row
+        index = len(current_row)
         for value in values:
-            index = len(self._current_row)
-            field = self.fields[index]
-            self._current_row.append(_parse_value_pb(value, field.type))
-            if len(self._current_row) == width:
-                self._rows.append(self._current_row)
-                self._current_row = []
+            current_row.append(decoders[index](value))
+            index += 1
+            if index == width:
+                rows.append(current_row)
+                current_row = self._current_row = []
+                index = 0
+
+    def _merge_columns(self, values, columns):
+        """Merge values into columns, without decoding them.
+
+        :type values: list of :class:`~google.protobuf.struct_pb2.Value`
+        :param values: non-chunked values from partial result set.
+
+        :type columns: list of list
+        :param columns: the values of each column of the complete rows.
+        """
+        if not columns:
+            return
+        values = self._current_row + values
+        width = len(columns)
+        complete = len(values) - len(values) % width
+        for index, column in enumerate(columns):
+            column.extend(values[index:complete:width])
+        self._current_row = values[complete:]
 
     def _consume_next(self):
         """Consume the next partial result set from the stream.
 
         Parse the result set into new/existing rows in :attr:`_rows`
         """
-        response = six.next(self._response_iterator)
+        self._merge_values(self._next_values())
+
+    def _next_values(self):
+        """Read the next partial result set from the stream.
+
+        :rtype: list of :class:`~google.protobuf.struct_pb2.Value`
+        :returns: its values, the pending chunk of the previous partial
+                  result set being merged into the first one, and its
+                  own trailing chunk being held back.
+        """
+        return self._response_values(six.next(self._response_iterator))
+
+    def _response_values(self, response):
+        """Process a partial result set read from the stream.
+
+        :type response:
+            :class:`~google.cloud.spanner_v1.proto.result_set_pb2.PartialResultSet`
+        :param response: the next partial result set of the stream.
+
+        :rtype: list of :class:`~google.protobuf.struct_pb2.Value`
+        :returns: its values, as returned by :meth:`_next_values`.
+        """
         self._counter += 1
 
         if self._metadata is None:  # first response
@@ -133,19 +211,80 @@ class StreamedResultSet(object):
         if response.chunked_value:
             self._pending_chunk = values.pop()
 
-        self._merge_values(values)
+        return values
 
     def __iter__(self):
-        iter_rows, self._rows[:] = self._rows[:], ()
         while True:
-            if not iter_rows:
-                try:
-                    self._consume_next()
-                except StopIteration:
-                    return
-                iter_rows, self._rows[:] = self._rows[:], ()
-            while iter_rows:
-                yield iter_rows.pop(0)
+            iter_rows, self._rows = self._rows, []
+            for row in iter_rows:
+                yield row
+            try:
+                self._consume_next()
+            except StopIteration:
+                return
+
+    def to_arrow(self):
+        """Read all the rows into an Arrow table.
+
+        Values are collected column by column and converted by
+        :mod:`pyarrow`, without creating one Python object per cell.
+        ``TIMESTAMP`` columns have microsecond precision, so as to hold any
+        Spanner timestamp: the digits past the microsecond are dropped.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: a table with one column per field of the result set.
+        :raises: :exc:`ValueError`: If the :mod:`pyarrow` library cannot be
+            imported.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+        if self._metadata is not None:
+            raise RuntimeError(
+                "Can not call `.to_arrow` or `.to_dataframe` after "
+                "stream consumption has already started."
+            )
+
+        columns = None
+        while True:
+            try:
+                values = self._next_values()
+            except StopIteration:
+                break
+            if columns is None:
+                columns = [[] for _ in self.fields]
+            self._merge_columns(values, columns)
+
+        if self._metadata is None:  # empty stream
+            return pyarrow.Table.from_arrays([], schema=pyarrow.schema([]))
+
+        fields = self.fields
+        arrays = [
+            _make_arrow_array(column, field.type)
+            for column, field in zip(columns, fields)
+        ]
+        schema = pyarrow.schema(_arrow_fields(fields))
+        return pyarrow.Table.from_arrays(arrays, schema=schema)
+
+    def to_dataframe(self):
+        """Read all the rows into a pandas DataFrame.
+
+        The rows are read with :meth:`to_arrow`, then converted to pandas.
+        ``TIMESTAMP`` columns become ``datetime64[us, UTC]`` columns, or
+        ``datetime64[ns, UTC]`` ones with pandas versions before 2.0, which
+        cannot hold timestamps before 1677 or after 2262.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: a data frame with one column per field of the result set.
+        :raises: :exc:`ValueError`: If the :mod:`pandas` or :mod:`pyarrow`
+            libraries cannot be imported.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+        return self.to_arrow().to_pandas()
 
     def one(self):
         """Return exactly one result, or raise an exception.
@@ -14,10 +14,9 @@
 
 """Spanner read-write transaction support."""
 
-from google.protobuf.struct_pb2 import Struct
 
 from google.cloud._helpers import _pb_timestamp_to_datetime
-from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1._helpers import _make_params_pb
 from google.cloud.spanner_v1._helpers import _metadata_with_prefix
 from google.cloud.spanner_v1.proto.transaction_pb2 import TransactionSelector
 from google.cloud.spanner_v1.proto.transaction_pb2 import TransactionOptions
@@ -153,9 +152,7 @@ class Transaction(_SnapshotBase, _BatchBase):
         if params is not None:
             if param_types is None:
                 raise ValueError("Specify 'param_types' when passing 'params'.")
-            return Struct(
-                fields={key: _make_value_pb(value) for key, value in params.items()}
-            )
+            return _make_params_pb(params, param_types)
         else:
             if param_types is not None:
                 raise ValueError("Specify 'params' when passing 'param_types'.")
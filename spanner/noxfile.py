@@ -71,7 +71,14 @@ def default(session):
     session.install("mock", "pytest", "pytest-cov")
     for local_dep in LOCAL_DEPS:
         session.install("-e", local_dep)
-    session.install("-e", ".")
+
+    # Recent PyArrow releases do not support Python 2.7 and 3.5, and the
+    # asyncio API requires Python 3.6+.
+    if session.python in ("2.7", "3.5"):
+        dev_install = "."
+    else:
+        dev_install = ".[asyncio, pandas, pyarrow]"
+    session.install("-e", dev_install)
 
     # Run py.test against the unit tests.
     session.run(
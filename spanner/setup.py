@@ -34,6 +34,12 @@ dependencies = [
     'grpc-google-iam-v1 >= 0.11.4, < 0.12dev',
 ]
 extras = {
+    'asyncio': [
+        'google-api-core[grpc] >= 1.22.2, < 2.0.0dev',
+        'grpcio >= 1.32.0',
+    ],
+    'pandas': 'pandas >= 0.23.0',
+    'pyarrow': 'pyarrow >= 5.0.0',
 }
 
 
@@ -15,6 +15,21 @@
 
 import unittest
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 
 class Test_make_value_pb(unittest.TestCase):
     def _callFUT(self, *args, **kw):
@@ -226,6 +241,294 @@ class Test_make_list_value_pbs(unittest.TestCase):
             self.assertEqual(found.values[1].string_value, expected[1])
 
 
+def _encoder_test_values():
+    import datetime
+    from google.api_core import datetime_helpers
+    from google.protobuf.struct_pb2 import ListValue, Value
+
+    return [
+        None,
+        u"Phred",
+        b"UGhyZWQ=",
+        True,
+        False,
+        -12345,
+        2 ** 70,
+        3.5,
+        float("nan"),
+        float("inf"),
+        float("-inf"),
+        datetime.date(2016, 12, 20),
+        datetime.datetime(2016, 12, 20, 21, 13, 47, 123456),
+        datetime_helpers.DatetimeWithNanoseconds(
+            2016, 12, 20, 21, 13, 47, nanosecond=123456789
+        ),
+        [1, u"two", [3.5, None]],
+        (1, u"two"),
+        ListValue(values=[Value(string_value=u"1")]),
+    ]
+
+
+class Test_encode_value(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _encode_value
+
+        return _encode_value(*args, **kw)
+
+    def test_same_as_make_value_pb(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        for value in _encoder_test_values():
+            value_pb = Value()
+            self._callFUT(value_pb, value)
+            self.assertEqual(value_pb, _make_value_pb(value))
+
+    def test_w_unknown_type(self):
+        from google.protobuf.struct_pb2 import Value
+
+        with self.assertRaises(ValueError):
+            self._callFUT(Value(), object())
+
+
+class Test_make_value_encoder(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _make_value_encoder
+
+        return _make_value_encoder(*args, **kw)
+
+    def test_same_as_make_value_pb(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1 import param_types
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        field_types = [
+            param_types.STRING,
+            param_types.BYTES,
+            param_types.BOOL,
+            param_types.INT64,
+            param_types.FLOAT64,
+            param_types.DATE,
+            param_types.TIMESTAMP,
+            param_types.Array(param_types.INT64),
+            param_types.Struct(
+                [
+                    param_types.StructField("id", param_types.INT64),
+                    param_types.StructField("name", param_types.STRING),
+                ]
+            ),
+        ]
+        # Values of other types than a field's are encoded by _make_value_pb.
+        for field_type in field_types:
+            encoder = self._callFUT(field_type)
+            for value in _encoder_test_values():
+                value_pb = Value()
+                encoder(value_pb, value)
+                self.assertEqual(value_pb, _make_value_pb(value))
+
+    def test_empty_array_and_struct(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1 import param_types
+
+        field_types = [
+            param_types.Array(param_types.STRING),
+            param_types.Struct([]),
+        ]
+        for field_type in field_types:
+            value_pb = Value()
+            self._callFUT(field_type)(value_pb, [])
+            self.assertEqual(value_pb.WhichOneof("kind"), "list_value")
+
+    def test_composite_encoders_cached(self):
+        from google.cloud.spanner_v1 import param_types
+
+        array_type = param_types.Array(param_types.INT64)
+        struct_type = param_types.Struct(
+            [param_types.StructField("id", param_types.INT64)]
+        )
+
+        self.assertIs(
+            self._callFUT(array_type),
+            self._callFUT(param_types.Array(param_types.INT64)),
+        )
+        self.assertIs(self._callFUT(struct_type), self._callFUT(struct_type))
+        self.assertIsNot(
+            self._callFUT(array_type),
+            self._callFUT(param_types.Array(param_types.STRING)),
+        )
+
+    def test_unknown_type_code(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1.proto import type_pb2
+
+        encoder = self._callFUT(type_pb2.Type(code=type_pb2.TYPE_CODE_UNSPECIFIED))
+        value_pb = Value()
+        encoder(value_pb, 42)
+        self.assertEqual(value_pb, Value(string_value=u"42"))
+
+
+class Test_make_params_pb(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _make_params_pb
+
+        return _make_params_pb(*args, **kw)
+
+    def test_it(self):
+        from google.protobuf.struct_pb2 import Struct
+        from google.cloud.spanner_v1 import param_types
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        params = {"ids": [1, 2], "name": u"Phred", "age": None, "legacy": 3}
+        types = {
+            "ids": param_types.Array(param_types.INT64),
+            "name": param_types.STRING,
+            "age": param_types.INT64,
+            "legacy": "INT64",
+        }
+
+        params_pb = self._callFUT(params, types)
+
+        expected = Struct(
+            fields={key: _make_value_pb(value) for key, value in params.items()}
+        )
+        self.assertEqual(params_pb, expected)
+
+    def test_w_empty_arrays(self):
+        from google.protobuf.struct_pb2 import ListValue, Value
+        from google.cloud.spanner_v1 import param_types
+
+        params = {"typed": [], "untyped": [], "tuple": ()}
+        types = {"typed": param_types.Array(param_types.INT64)}
+
+        params_pb = self._callFUT(params, types)
+
+        for key in params:
+            self.assertEqual(params_pb.fields[key].WhichOneof("kind"), "list_value")
+            self.assertEqual(params_pb.fields[key], Value(list_value=ListValue()))
+
+
+class Test_add_list_value_pbs(unittest.TestCase):
+    COLUMNS = ["id", "name", "score"]
+
+    def _callFUT(self, values, columns):
+        from google.cloud.spanner_v1._helpers import _add_list_value_pbs
+        from google.cloud.spanner_v1.proto.mutation_pb2 import Mutation
+
+        write_pb = Mutation.Write()
+        _add_list_value_pbs(write_pb.values, values, columns)
+        return list(write_pb.values)
+
+    def test_w_rows(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pbs
+
+        rows = [[1, u"Phred", 3.5], [2, None, float("nan")]]
+
+        self.assertEqual(self._callFUT(rows, self.COLUMNS), _make_list_value_pbs(rows))
+
+    def test_w_rows_w_mixed_types(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pbs
+
+        rows = [
+            [1, None, 3.5],
+            [u"2", u"Phred", 4],
+            [True, b"Bharney", float("inf")],
+            [3, u"Wylma"],
+        ]
+
+        self.assertEqual(self._callFUT(rows, self.COLUMNS), _make_list_value_pbs(rows))
+
+    def test_w_rows_w_null_after_array(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pbs
+
+        rows = [[1, [1, 2], (u"a",)], [2, None, u"b"], [3, [], None]]
+
+        self.assertEqual(self._callFUT(rows, self.COLUMNS), _make_list_value_pbs(rows))
+
+    def test_w_rows_w_empty_array(self):
+        from google.protobuf.struct_pb2 import ListValue, Value
+
+        list_value_pbs = self._callFUT([[1, [], ()]], self.COLUMNS)
+
+        self.assertEqual(
+            [value_pb.WhichOneof("kind") for value_pb in list_value_pbs[0].values],
+            ["string_value", "list_value", "list_value"],
+        )
+        self.assertEqual(list_value_pbs[0].values[1], Value(list_value=ListValue()))
+
+    @unittest.skipIf(numpy is None, "Requires `numpy`")
+    def test_w_array(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pbs
+
+        array = numpy.array([[1, 2, 3], [4, 5, 6]], dtype="int64")
+
+        self.assertEqual(
+            self._callFUT(array, self.COLUMNS),
+            _make_list_value_pbs([[1, 2, 3], [4, 5, 6]]),
+        )
+
+    @unittest.skipIf(numpy is None, "Requires `numpy`")
+    def test_w_array_of_dates(self):
+        from google.protobuf.struct_pb2 import ListValue, Value, NULL_VALUE
+
+        array = numpy.array([["2019-03-05"], ["NaT"]], dtype="datetime64[D]")
+
+        self.assertEqual(
+            self._callFUT(array, ["birthday"]),
+            [
+                ListValue(values=[Value(string_value=u"2019-03-05")]),
+                ListValue(values=[Value(null_value=NULL_VALUE)]),
+            ],
+        )
+
+    @unittest.skipIf(numpy is None, "Requires `numpy`")
+    def test_w_array_of_wrong_shape(self):
+        with self.assertRaises(ValueError):
+            self._callFUT(numpy.array([1, 2, 3]), self.COLUMNS)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_w_dataframe(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pbs
+
+        frame = pandas.DataFrame(
+            {
+                "score": [3.5, float("nan")],
+                "name": [u"Phred", None],
+                "id": [1, 2],
+                "age": pandas.Series([32, None], dtype="Int64"),
+                "married": [True, False],
+                "updated": pandas.to_datetime(
+                    ["2019-03-05T12:34:56.123456789Z", None], utc=True
+                ),
+                "extra": [u"ignored", u"ignored"],
+            }
+        )
+
+        found = self._callFUT(
+            frame, ["id", "name", "score", "married", "updated", "age"]
+        )
+
+        expected = _make_list_value_pbs(
+            [
+                [1, u"Phred", 3.5, True, u"2019-03-05T12:34:56.123456789Z", 32],
+                [2, None, None, False, None, None],
+            ]
+        )
+        self.assertEqual(found, expected)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_w_dataframe_w_missing_floats(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pbs
+
+        frame = pandas.DataFrame(
+            {"id": [1, 2, 3], "score": [float("nan"), float("inf"), None]}
+        )
+
+        self.assertEqual(
+            self._callFUT(frame, ["id", "score"]),
+            _make_list_value_pbs([[1, None], [2, float("inf")], [3, None]]),
+        )
+
+
 class Test_parse_value_pb(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from google.cloud.spanner_v1._helpers import _parse_value_pb
@@ -388,6 +691,225 @@ class Test_parse_value_pb(unittest.TestCase):
             self._callFUT(value_pb, field_type)
 
 
+class Test_make_value_decoder(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _make_value_decoder
+
+        return _make_value_decoder(*args, **kw)
+
+    def _assert_same_as_parse(self, field_type, value_pbs):
+        from google.cloud.spanner_v1._helpers import _parse_value_pb
+
+        decoder = self._callFUT(field_type)
+        for value_pb in value_pbs:
+            self.assertEqual(decoder(value_pb), _parse_value_pb(value_pb, field_type))
+
+    def test_scalars(self):
+        from google.protobuf.struct_pb2 import Value, NULL_VALUE
+        from google.cloud.spanner_v1.proto import type_pb2
+
+        null_pb = Value(null_value=NULL_VALUE)
+        cases = [
+            (type_pb2.STRING, [Value(string_value=u"Value")]),
+            (type_pb2.BYTES, [Value(string_value=u"VmFsdWU=")]),
+            (type_pb2.BOOL, [Value(bool_value=True), Value(bool_value=False)]),
+            (type_pb2.INT64, [Value(string_value=u"-12345")]),
+            (
+                type_pb2.FLOAT64,
+                [
+                    Value(number_value=3.5),
+                    Value(string_value=u"Infinity"),
+                    Value(string_value=u"-Infinity"),
+                    Value(),
+                ],
+            ),
+            (type_pb2.DATE, [Value(string_value=u"2016-12-20")]),
+            (type_pb2.TIMESTAMP, [Value(string_value=u"2016-12-20T21:13:47.123Z")]),
+        ]
+        for code, value_pbs in cases:
+            self._assert_same_as_parse(type_pb2.Type(code=code), value_pbs + [null_pb])
+
+    def test_float_nan(self):
+        import math
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, FLOAT64
+
+        decoder = self._callFUT(Type(code=FLOAT64))
+
+        self.assertTrue(math.isnan(decoder(Value(string_value=u"NaN"))))
+
+    def test_array(self):
+        from google.protobuf.struct_pb2 import ListValue, Value, NULL_VALUE
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, ARRAY, INT64
+
+        field_type = Type(code=ARRAY, array_element_type=Type(code=INT64))
+        values = [Value(string_value=u"1"), Value(null_value=NULL_VALUE)]
+        value_pbs = [
+            Value(),
+            Value(null_value=NULL_VALUE),
+            Value(list_value=ListValue(values=values)),
+        ]
+
+        self._assert_same_as_parse(field_type, value_pbs)
+        self.assertEqual(self._callFUT(field_type)(value_pbs[2]), [1, None])
+
+    def test_struct(self):
+        from google.protobuf.struct_pb2 import ListValue, Value, NULL_VALUE
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, StructType
+        from google.cloud.spanner_v1.proto.type_pb2 import ARRAY, INT64, STRING
+        from google.cloud.spanner_v1.proto.type_pb2 import STRUCT
+
+        struct_type = StructType(
+            fields=[
+                StructType.Field(name="name", type=Type(code=STRING)),
+                StructType.Field(
+                    name="scores",
+                    type=Type(code=ARRAY, array_element_type=Type(code=INT64)),
+                ),
+            ]
+        )
+        field_type = Type(code=STRUCT, struct_type=struct_type)
+        scores_pb = Value(list_value=ListValue(values=[Value(string_value=u"7")]))
+        value_pbs = [
+            Value(null_value=NULL_VALUE),
+            Value(
+                list_value=ListValue(values=[Value(string_value=u"Phred"), scores_pb])
+            ),
+        ]
+
+        self._assert_same_as_parse(field_type, value_pbs)
+        self.assertEqual(self._callFUT(field_type)(value_pbs[1]), [u"Phred", [7]])
+
+    def test_unknown_type(self):
+        from google.protobuf.struct_pb2 import Value, NULL_VALUE
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import TYPE_CODE_UNSPECIFIED
+
+        decoder = self._callFUT(Type(code=TYPE_CODE_UNSPECIFIED))
+
+        self.assertIsNone(decoder(Value(null_value=NULL_VALUE)))
+        with self.assertRaises(ValueError):
+            decoder(Value(string_value=u"Value"))
+
+
+@unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+class Test_make_arrow_array(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _make_arrow_array
+
+        return _make_arrow_array(*args, **kw)
+
+    def test_scalars_same_as_parse(self):
+        from google.protobuf.struct_pb2 import Value, NULL_VALUE
+        from google.cloud.spanner_v1._helpers import _parse_value_pb
+        from google.cloud.spanner_v1.proto import type_pb2
+
+        null_pb = Value(null_value=NULL_VALUE)
+        cases = [
+            (type_pb2.STRING, [Value(string_value=u"Value")]),
+            (type_pb2.BYTES, [Value(string_value=u"VmFsdWU=")]),
+            (type_pb2.BOOL, [Value(bool_value=True), Value(bool_value=False)]),
+            (type_pb2.INT64, [Value(string_value=u"-12345")]),
+            (
+                type_pb2.FLOAT64,
+                [Value(number_value=3.5), Value(string_value=u"-Infinity")],
+            ),
+            (type_pb2.DATE, [Value(string_value=u"2016-12-20")]),
+        ]
+        for code, value_pbs in cases:
+            field_type = type_pb2.Type(code=code)
+            value_pbs = value_pbs + [null_pb]
+            self.assertEqual(
+                self._callFUT(value_pbs, field_type).to_pylist(),
+                [_parse_value_pb(value_pb, field_type) for value_pb in value_pbs],
+            )
+
+    def test_timestamps(self):
+        import datetime
+        from google.protobuf.struct_pb2 import ListValue, Value, NULL_VALUE
+        from google.cloud.spanner_v1.proto import type_pb2
+
+        field_type = type_pb2.Type(
+            code=type_pb2.ARRAY,
+            array_element_type=type_pb2.Type(code=type_pb2.TIMESTAMP),
+        )
+        timestamps = [
+            u"0001-01-01T00:00:00Z",
+            u"2019-03-05T12:34:56.123456789Z",
+            u"2019-03-05T12:34:56.5Z",
+            u"9999-12-31T23:59:59.999999999Z",
+        ]
+        value_pbs = [
+            Value(
+                list_value=ListValue(
+                    values=[Value(string_value=value) for value in timestamps]
+                    + [Value(null_value=NULL_VALUE)]
+                )
+            )
+        ]
+
+        array = self._callFUT(value_pbs, field_type)
+
+        self.assertEqual(array.type.value_type, pyarrow.timestamp("us", tz="UTC"))
+        self.assertEqual(
+            [
+                value.replace(tzinfo=None) if value is not None else None
+                for value in array.to_pylist()[0]
+            ],
+            [
+                datetime.datetime(1, 1, 1),
+                datetime.datetime(2019, 3, 5, 12, 34, 56, 123456),
+                datetime.datetime(2019, 3, 5, 12, 34, 56, 500000),
+                datetime.datetime(9999, 12, 31, 23, 59, 59, 999999),
+                None,
+            ],
+        )
+
+    def test_array_of_struct_w_nulls(self):
+        from google.protobuf.struct_pb2 import ListValue, Value, NULL_VALUE
+        from google.cloud.spanner_v1.proto import type_pb2
+
+        struct_type = type_pb2.Type(
+            code=type_pb2.STRUCT,
+            struct_type=type_pb2.StructType(
+                fields=[
+                    type_pb2.StructType.Field(
+                        name="name", type=type_pb2.Type(code=type_pb2.STRING)
+                    ),
+                    type_pb2.StructType.Field(
+                        name="age", type=type_pb2.Type(code=type_pb2.INT64)
+                    ),
+                ]
+            ),
+        )
+        field_type = type_pb2.Type(code=type_pb2.ARRAY, array_element_type=struct_type)
+        null_pb = Value(null_value=NULL_VALUE)
+        struct_pb = Value(
+            list_value=ListValue(
+                values=[Value(string_value=u"Phred"), Value(string_value=u"32")]
+            )
+        )
+        value_pbs = [
+            null_pb,
+            Value(list_value=ListValue(values=[struct_pb, null_pb])),
+            Value(list_value=ListValue()),
+        ]
+
+        array = self._callFUT(value_pbs, field_type)
+
+        self.assertEqual(
+            array.to_pylist(), [None, [{"name": u"Phred", "age": 32}, None], []]
+        )
+
+    def test_unknown_type(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1.proto import type_pb2
+
+        field_type = type_pb2.Type(code=type_pb2.TYPE_CODE_UNSPECIFIED)
+        with self.assertRaises(ValueError):
+            self._callFUT([Value(string_value=u"value")], field_type)
+
+
 class Test_parse_list_value_pbs(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from google.cloud.spanner_v1._helpers import _parse_list_value_pbs
@@ -0,0 +1,748 @@
+# Copyright 2019 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import unittest
+
+import mock
+
+
+PROJECT_ID = "project-id"
+INSTANCE_ID = "instance-id"
+INSTANCE_NAME = "projects/" + PROJECT_ID + "/instances/" + INSTANCE_ID
+DATABASE_ID = "database-id"
+DATABASE_NAME = INSTANCE_NAME + "/databases/" + DATABASE_ID
+SESSION_ID = "session-id"
+SESSION_NAME = DATABASE_NAME + "/sessions/" + SESSION_ID
+TRANSACTION_ID = b"DEADBEEF"
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def _collect(iterable):
+    return [item async for item in iterable]
+
+
+async def _stream(items):
+    for item in items:
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def _make_result_set_pbs(rows, resume_token=b""):
+    from google.protobuf.struct_pb2 import Value
+    from google.cloud.spanner_v1.proto.result_set_pb2 import PartialResultSet
+    from google.cloud.spanner_v1.proto.result_set_pb2 import ResultSetMetadata
+    from google.cloud.spanner_v1.proto.type_pb2 import INT64
+    from google.cloud.spanner_v1.proto.type_pb2 import STRING
+    from google.cloud.spanner_v1.proto.type_pb2 import StructType
+    from google.cloud.spanner_v1.proto.type_pb2 import Type
+
+    metadata = ResultSetMetadata(
+        row_type=StructType(
+            fields=[
+                StructType.Field(name="name", type=Type(code=STRING)),
+                StructType.Field(name="age", type=Type(code=INT64)),
+            ]
+        )
+    )
+    metadata.transaction.id = TRANSACTION_ID
+    result_set_pbs = []
+    for name, age in rows:
+        result_set_pbs.append(
+            PartialResultSet(
+                values=[Value(string_value=name), Value(string_value=str(age))],
+                resume_token=resume_token,
+            )
+        )
+    result_set_pbs[0].metadata.CopyFrom(metadata)
+    return result_set_pbs
+
+
+def _make_timestamp_pb():
+    from google.protobuf.timestamp_pb2 import Timestamp
+
+    return Timestamp(seconds=1234567890)
+
+
+class Test_restart_on_unavailable(unittest.TestCase):
+    def _call_fut(self, restart):
+        from google.cloud.spanner_v1.aio import _restart_on_unavailable
+
+        return _restart_on_unavailable(restart)
+
+    def test_resumes_after_unavailable(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        first = [mock.Mock(resume_token=b"a"), ServiceUnavailable("testing")]
+        second = [mock.Mock(resume_token=b"b"), mock.Mock(resume_token=b"")]
+        calls = []
+
+        def restart(resume_token=b""):
+            calls.append(resume_token)
+            return _stream(first if len(calls) == 1 else second)
+
+        items = _run(_collect(self._call_fut(restart)))
+
+        self.assertEqual(items, [first[0]] + second)
+        self.assertEqual(calls, [b"", b"a"])
+
+
+class TestAsyncStreamedResultSet(unittest.TestCase):
+    def _make_one(self, *args, **kwargs):
+        from google.cloud.spanner_v1.aio import AsyncStreamedResultSet
+
+        return AsyncStreamedResultSet(*args, **kwargs)
+
+    def test_async_iteration(self):
+        result_set = self._make_one(
+            _stream(_make_result_set_pbs([("phred", 32), ("bharney", 31)]))
+        )
+
+        rows = _run(_collect(result_set))
+
+        self.assertEqual(rows, [["phred", 32], ["bharney", 31]])
+        self.assertEqual(result_set.fields[0].name, "name")
+
+    def test_sync_iteration(self):
+        result_set = self._make_one(_stream([]))
+
+        with self.assertRaises(TypeError):
+            list(result_set)
+
+
+class TestAsyncSnapshot(unittest.TestCase):
+    def _make_one(self, *args, **kwargs):
+        from google.cloud.spanner_v1.aio import AsyncSnapshot
+
+        return AsyncSnapshot(*args, **kwargs)
+
+    def test_execute_sql(self):
+        from google.cloud.spanner_v1.param_types import INT64
+
+        api = _FauxSpannerAPI(
+            _streaming_responses=[_make_result_set_pbs([("phred", 32)])]
+        )
+        snapshot = self._make_one(_Session(_Database(api)))
+
+        result_set = snapshot.execute_sql(
+            "SELECT * FROM citizens WHERE age > @age",
+            params={"age": 30},
+            param_types={"age": INT64},
+        )
+        rows = _run(_collect(result_set))
+
+        self.assertEqual(rows, [["phred", 32]])
+        (session, sql), kwargs = api._streamed[0]
+        self.assertEqual(session, SESSION_NAME)
+        self.assertEqual(sql, "SELECT * FROM citizens WHERE age > @age")
+        self.assertTrue(kwargs["transaction"].single_use.read_only.strong)
+        self.assertEqual(kwargs["params"].fields["age"].string_value, "30")
+        self.assertEqual(
+            kwargs["metadata"], [("google-cloud-resource-prefix", "testing")]
+        )
+
+    def test_read_multi_use(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        api = _FauxSpannerAPI(
+            _streaming_responses=[_make_result_set_pbs([("phred", 32)])]
+        )
+        snapshot = self._make_one(_Session(_Database(api)), multi_use=True)
+
+        result_set = snapshot.read("citizens", ["name", "age"], KeySet(all_=True))
+        rows = _run(_collect(result_set))
+
+        self.assertEqual(rows, [["phred", 32]])
+        self.assertEqual(snapshot._transaction_id, TRANSACTION_ID)
+        (session, table, columns, key_set), kwargs = api._streamed[0]
+        self.assertEqual(table, "citizens")
+        self.assertTrue(key_set.all)
+        self.assertTrue(kwargs["transaction"].begin.read_only.strong)
+
+    def test_begin(self):
+        from google.cloud.spanner_v1.proto.transaction_pb2 import Transaction
+
+        api = _FauxSpannerAPI(
+            _begin_transaction_response=Transaction(id=TRANSACTION_ID)
+        )
+        snapshot = self._make_one(_Session(_Database(api)), multi_use=True)
+
+        self.assertEqual(_run(snapshot.begin()), TRANSACTION_ID)
+
+        session, options, _ = api._begun
+        self.assertEqual(session, SESSION_NAME)
+        self.assertTrue(options.read_only.strong)
+
+    def test_begin_single_use(self):
+        snapshot = self._make_one(_Session(_Database(_FauxSpannerAPI())))
+
+        with self.assertRaises(ValueError):
+            _run(snapshot.begin())
+
+    def test_partition_query(self):
+        snapshot = self._make_one(_Session(_Database(_FauxSpannerAPI())))
+
+        with self.assertRaises(NotImplementedError):
+            snapshot.partition_query("SELECT 1")
+
+
+class TestAsyncTransaction(unittest.TestCase):
+    def _make_one(self, session):
+        from google.cloud.spanner_v1.aio import AsyncTransaction
+
+        transaction = session._transaction = AsyncTransaction(session)
+        return transaction
+
+    def _make_api(self, **kwargs):
+        from google.cloud.spanner_v1.proto.spanner_pb2 import CommitResponse
+        from google.cloud.spanner_v1.proto.transaction_pb2 import Transaction
+
+        kwargs.setdefault("_begin_transaction_response", Transaction(id=TRANSACTION_ID))
+        kwargs.setdefault(
+            "_commit_response", CommitResponse(commit_timestamp=_make_timestamp_pb())
+        )
+        return _FauxSpannerAPI(**kwargs)
+
+    def test_begin_commit(self):
+        from google.cloud._helpers import _pb_timestamp_to_datetime
+
+        api = self._make_api()
+        session = _Session(_Database(api))
+        transaction = self._make_one(session)
+
+        _run(transaction.begin())
+        transaction.insert("citizens", ["name", "age"], [["phred", 32]])
+        committed = _run(transaction.commit())
+
+        self.assertEqual(committed, _pb_timestamp_to_datetime(_make_timestamp_pb()))
+        self.assertIsNone(session._transaction)
+        session_name, mutations, kwargs = api._committed
+        self.assertEqual(session_name, SESSION_NAME)
+        self.assertEqual(len(mutations), 1)
+        self.assertEqual(kwargs["transaction_id"], TRANSACTION_ID)
+
+    def test_rollback(self):
+        api = self._make_api()
+        session = _Session(_Database(api))
+        transaction = self._make_one(session)
+        _run(transaction.begin())
+
+        _run(transaction.rollback())
+
+        self.assertTrue(transaction._rolled_back)
+        self.assertEqual(api._rolled_back[:2], (SESSION_NAME, TRANSACTION_ID))
+
+    def test_execute_update(self):
+        from google.cloud.spanner_v1.proto.result_set_pb2 import ResultSet
+        from google.cloud.spanner_v1.proto.result_set_pb2 import ResultSetStats
+
+        api = self._make_api(
+            _execute_sql_response=ResultSet(stats=ResultSetStats(row_count_exact=3))
+        )
+        transaction = self._make_one(_Session(_Database(api)))
+        _run(transaction.begin())
+
+        count = _run(transaction.execute_update("DELETE FROM citizens WHERE true"))
+
+        self.assertEqual(count, 3)
+        self.assertEqual(transaction._execute_sql_count, 1)
+        (session, dml), kwargs = api._executed
+        self.assertEqual(dml, "DELETE FROM citizens WHERE true")
+        self.assertEqual(kwargs["transaction"].id, TRANSACTION_ID)
+        self.assertEqual(kwargs["seqno"], 0)
+
+    def test_commit_not_begun(self):
+        transaction = self._make_one(_Session(_Database(self._make_api())))
+
+        with self.assertRaises(ValueError):
+            _run(transaction.commit())
+
+
+class TestAsyncSessionPool(unittest.TestCase):
+    def _make_one(self, *args, **kwargs):
+        from google.cloud.spanner_v1.aio import AsyncSessionPool
+
+        return AsyncSessionPool(*args, **kwargs)
+
+    def test_get_creates_up_to_size(self):
+        from six.moves import queue
+
+        api = _FauxSpannerAPI()
+        pool = self._make_one(size=2, default_timeout=0.01, labels={"a": "b"})
+        pool.bind(_Database(api))
+
+        async def scenario():
+            first = await pool.get()
+            second = await pool.get()
+            with self.assertRaises(queue.Empty):
+                await pool.get()
+            pool.put(first)
+            third = await pool.get()
+            return first, second, third
+
+        first, second, third = _run(scenario())
+
+        self.assertIs(third, first)
+        self.assertNotEqual(first.session_id, second.session_id)
+        self.assertEqual(len(api._created), 2)
+        database, kwargs = api._created[0]
+        self.assertEqual(database, "testing")
+        self.assertEqual(dict(kwargs["session"].labels), {"a": "b"})
+
+    def test_get_create_failure(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        api = _FauxSpannerAPI(_create_session_error=ServiceUnavailable("testing"))
+        pool = self._make_one(size=1)
+        pool.bind(_Database(api))
+
+        with self.assertRaises(ServiceUnavailable):
+            _run(pool.get())
+
+        self.assertEqual(pool._created, 0)
+
+    def test_clear(self):
+        api = _FauxSpannerAPI()
+        pool = self._make_one(size=2)
+        pool.bind(_Database(api))
+
+        async def scenario():
+            sessions = [await pool.get(), await pool.get()]
+            for session in sessions:
+                pool.put(session)
+            await pool.clear()
+            return sessions
+
+        sessions = _run(scenario())
+
+        self.assertEqual(
+            sorted(api._deleted), sorted(session.name for session in sessions)
+        )
+        self.assertEqual(pool._created, 0)
+
+
+class TestAsyncDatabase(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.aio import AsyncDatabase
+
+        return AsyncDatabase
+
+    def _make_one(self, api, **kwargs):
+        from google.cloud.spanner_v1.aio import AsyncSessionPool
+
+        kwargs.setdefault("pool", AsyncSessionPool(size=1))
+        database = self._getTargetClass()(DATABASE_ID, _Instance(), **kwargs)
+        database._spanner_api = api
+        return database
+
+    @staticmethod
+    def _make_api(**kwargs):
+        from google.cloud.spanner_v1.proto.spanner_pb2 import CommitResponse
+        from google.cloud.spanner_v1.proto.transaction_pb2 import Transaction
+
+        kwargs.setdefault("_begin_transaction_response", Transaction(id=TRANSACTION_ID))
+        kwargs.setdefault(
+            "_commit_response", CommitResponse(commit_timestamp=_make_timestamp_pb())
+        )
+        return _FauxSpannerAPI(**kwargs)
+
+    @staticmethod
+    def _make_aborted(retry_delay=None):
+        import grpc
+        from grpc import aio
+        from google.api_core.exceptions import Aborted
+        from google.protobuf.duration_pb2 import Duration
+        from google.rpc.error_details_pb2 import RetryInfo
+
+        trailing_metadata = aio.Metadata()
+        if retry_delay is not None:
+            retry_info = RetryInfo(retry_delay=Duration(nanos=retry_delay))
+            trailing_metadata.add(
+                "google.rpc.retryinfo-bin", retry_info.SerializeToString()
+            )
+        error = aio.AioRpcError(
+            grpc.StatusCode.ABORTED, aio.Metadata(), trailing_metadata, "testing"
+        )
+        return Aborted("testing", errors=(error,))
+
+    def test_ctor_defaults(self):
+        from google.cloud.spanner_v1.aio import AsyncSessionPool
+
+        database = self._getTargetClass()(DATABASE_ID, _Instance())
+
+        self.assertEqual(database.name, DATABASE_NAME)
+        self.assertIsInstance(database._pool, AsyncSessionPool)
+        self.assertIs(database._pool._database, database)
+
+    def test_from_database(self):
+        from google.cloud.spanner_v1.database import Database
+        from google.cloud.spanner_v1.pool import BurstyPool
+
+        instance = _Instance()
+        database = Database(DATABASE_ID, instance, pool=BurstyPool())
+        channel = object()
+
+        async_database = self._getTargetClass().from_database(database, channel=channel)
+
+        self.assertEqual(async_database.name, DATABASE_NAME)
+        self.assertIs(async_database._instance, instance)
+        self.assertIs(async_database._channel, channel)
+
+    def test_spanner_api_w_channel(self):
+        from google.cloud.spanner_v1.aio import AsyncSpannerApi
+
+        channel = mock.Mock()
+        database = self._getTargetClass()(DATABASE_ID, _Instance(), channel=channel)
+
+        api = database.spanner_api
+
+        self.assertIsInstance(api, AsyncSpannerApi)
+        self.assertIs(api.channel, channel)
+        self.assertIs(database.spanner_api, api)
+
+    def test_spanner_api_wo_channel(self):
+        credentials = mock.Mock(spec=["with_scopes"])
+        database = self._getTargetClass()(DATABASE_ID, _Instance(credentials))
+        patch = mock.patch(
+            "google.api_core.grpc_helpers_async.create_channel",
+            return_value=mock.Mock(),
+        )
+
+        with patch as create_channel:
+            api = database.spanner_api
+
+        self.assertIs(api.channel, create_channel.return_value)
+        create_channel.assert_called_once_with(
+            "spanner.googleapis.com:443", credentials=credentials, options=mock.ANY
+        )
+
+    def test_snapshot(self):
+        api = self._make_api(
+            _streaming_responses=[_make_result_set_pbs([("phred", 32)])]
+        )
+        database = self._make_one(api)
+
+        async def scenario():
+            async with database.snapshot() as snapshot:
+                return await _collect(snapshot.execute_sql("SELECT * FROM citizens"))
+
+        self.assertEqual(_run(scenario()), [["phred", 32]])
+        self.assertEqual(database._pool._sessions().qsize(), 1)
+
+    def test_batch(self):
+        api = self._make_api()
+        database = self._make_one(api)
+
+        async def scenario():
+            async with database.batch() as batch:
+                batch.delete("citizens", _KeySet())
+
+        _run(scenario())
+
+        session, mutations, kwargs = api._committed
+        self.assertEqual(len(mutations), 1)
+        self.assertTrue(kwargs["single_use_transaction"].HasField("read_write"))
+        self.assertEqual(database._pool._sessions().qsize(), 1)
+
+    def test_run_in_transaction(self):
+        api = self._make_api()
+        database = self._make_one(api)
+        calls = []
+
+        async def unit_of_work(transaction, *args, **kwargs):
+            calls.append((transaction, args, kwargs))
+            transaction.delete("citizens", _KeySet())
+            return 42
+
+        result = _run(database.run_in_transaction(unit_of_work, "a", b="c"))
+
+        self.assertEqual(result, 42)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][1:], (("a",), {"b": "c"}))
+        self.assertEqual(api._committed[2]["transaction_id"], TRANSACTION_ID)
+        self.assertEqual(database._pool._sessions().qsize(), 1)
+
+    def test_run_in_transaction_retries_aborted(self):
+        api = self._make_api(
+            _commit_errors=[self._make_aborted(), self._make_aborted(retry_delay=1000)]
+        )
+        database = self._make_one(api)
+        calls = []
+        delays = []
+
+        async def unit_of_work(transaction):
+            calls.append(transaction)
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        with mock.patch("asyncio.sleep", new=sleep):
+            _run(database.run_in_transaction(unit_of_work))
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(len(api._commits), 3)
+        self.assertLessEqual(delays[0], 0.01)
+        self.assertEqual(delays[1], 1e-06)
+
+    def test_run_in_transaction_aborted_past_deadline(self):
+        from google.api_core.exceptions import Aborted
+
+        api = self._make_api(_commit_errors=[self._make_aborted()])
+        database = self._make_one(api)
+
+        async def unit_of_work(transaction):
+            pass
+
+        with self.assertRaises(Aborted):
+            _run(database.run_in_transaction(unit_of_work, timeout_secs=0))
+
+        self.assertEqual(database._pool._sessions().qsize(), 1)
+
+    def test_run_in_transaction_rolls_back_on_error(self):
+        api = self._make_api()
+        database = self._make_one(api)
+
+        async def unit_of_work(transaction):
+            raise ValueError("testing")
+
+        with self.assertRaises(ValueError):
+            _run(database.run_in_transaction(unit_of_work))
+
+        self.assertEqual(api._rolled_back[1], TRANSACTION_ID)
+        self.assertIsNone(api._committed)
+
+    def test_close(self):
+        async def close():
+            pass
+
+        api = self._make_api()
+        api.channel = mock.Mock(spec=["close"])
+        api.channel.close.side_effect = close
+        database = self._make_one(api)
+
+        async def scenario():
+            async with database:
+                async with database.snapshot():
+                    pass
+
+        _run(scenario())
+
+        self.assertEqual(len(api._deleted), 1)
+        api.channel.close.assert_called_once_with()
+        self.assertIsNone(database._spanner_api)
+
+
+class TestAsyncSpannerApi(unittest.TestCase):
+    def _make_one(self, channel):
+        from google.cloud.spanner_v1.aio import AsyncSpannerApi
+
+        return AsyncSpannerApi(channel)
+
+    def test_unary_call(self):
+        from google.cloud.spanner_v1.proto.spanner_pb2 import Session
+
+        channel = _Channel(result=Session(name=SESSION_NAME))
+        api = self._make_one(channel)
+
+        session_pb = _run(
+            api.create_session(DATABASE_NAME, metadata=[("prefix", DATABASE_NAME)])
+        )
+
+        self.assertEqual(session_pb.name, SESSION_NAME)
+        path, request, kwargs = channel.calls[0]
+        self.assertEqual(path, "/google.spanner.v1.Spanner/CreateSession")
+        self.assertEqual(request.database, DATABASE_NAME)
+        self.assertEqual(kwargs["metadata"][0], ("prefix", DATABASE_NAME))
+        self.assertEqual(kwargs["metadata"][1][0], "x-goog-api-client")
+
+    def test_unary_call_error(self):
+        import grpc
+        from grpc import aio
+        from google.api_core.exceptions import Aborted
+
+        error = aio.AioRpcError(
+            grpc.StatusCode.ABORTED, aio.Metadata(), aio.Metadata(), "testing"
+        )
+        api = self._make_one(_Channel(error=error))
+
+        with self.assertRaises(Aborted) as raised:
+            _run(api.rollback(SESSION_NAME, TRANSACTION_ID))
+
+        self.assertIs(raised.exception.errors[0], error)
+
+    def test_streaming_call(self):
+        import grpc
+        from grpc import aio
+        from google.api_core.exceptions import ServiceUnavailable
+
+        responses = _make_result_set_pbs([("phred", 32)])
+        error = aio.AioRpcError(
+            grpc.StatusCode.UNAVAILABLE, aio.Metadata(), aio.Metadata(), "testing"
+        )
+        channel = _Channel(result=responses + [error])
+        api = self._make_one(channel)
+
+        stream = api.execute_streaming_sql(SESSION_NAME, "SELECT 1", timeout=5)
+        received = []
+
+        async def scenario():
+            async for response in stream:
+                received.append(response)
+
+        with self.assertRaises(ServiceUnavailable):
+            _run(scenario())
+
+        self.assertEqual(received, responses)
+        path, request, kwargs = channel.calls[0]
+        self.assertEqual(path, "/google.spanner.v1.Spanner/ExecuteStreamingSql")
+        self.assertEqual(request.sql, "SELECT 1")
+        self.assertEqual(kwargs["timeout"], 5)
+
+
+class _Channel(object):
+    """Fake :class:`grpc.aio.Channel`, recording calls."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = []
+
+    def _unary(self, path):
+        async def call(request, **kwargs):
+            self.calls.append((path, request, kwargs))
+            if self.error is not None:
+                raise self.error
+            return self.result
+
+        return call
+
+    def _streaming(self, path):
+        def call(request, **kwargs):
+            self.calls.append((path, request, kwargs))
+            return _stream(self.result)
+
+        return call
+
+    def unary_unary(self, path, **kwargs):
+        return self._unary(path)
+
+    def unary_stream(self, path, **kwargs):
+        return self._streaming(path)
+
+    def stream_unary(self, path, **kwargs):
+        return self._unary(path)
+
+    def stream_stream(self, path, **kwargs):
+        return self._streaming(path)
+
+
+class _FauxSpannerAPI(object):
+
+    _committed = None
+    _create_session_error = None
+
+    def __init__(self, **kwargs):
+        self._created = []
+        self._deleted = []
+        self._streamed = []
+        self._commits = []
+        self._commit_errors = []
+        self._streaming_responses = []
+        self.__dict__.update(**kwargs)
+
+    async def create_session(self, database, **kwargs):
+        from google.cloud.spanner_v1.proto.spanner_pb2 import Session
+
+        if self._create_session_error is not None:
+            raise self._create_session_error
+        self._created.append((database, kwargs))
+        return Session(name="%s/sessions/%d" % (database, len(self._created)))
+
+    async def delete_session(self, name, metadata=None):
+        self._deleted.append(name)
+
+    def execute_streaming_sql(self, *args, **kwargs):
+        self._streamed.append((args, kwargs))
+        return _stream(self._streaming_responses.pop(0))
+
+    def streaming_read(self, *args, **kwargs):
+        self._streamed.append((args, kwargs))
+        return _stream(self._streaming_responses.pop(0))
+
+    async def execute_sql(self, *args, **kwargs):
+        self._executed = (args, kwargs)
+        return self._execute_sql_response
+
+    async def begin_transaction(self, session, options_, metadata=None):
+        self._begun = (session, options_, metadata)
+        return self._begin_transaction_response
+
+    async def rollback(self, session, transaction_id, metadata=None):
+        self._rolled_back = (session, transaction_id, metadata)
+
+    async def commit(self, session, mutations, **kwargs):
+        self._commits.append((session, mutations, kwargs))
+        if self._commit_errors:
+            raise self._commit_errors.pop(0)
+        self._committed = (session, mutations, kwargs)
+        return self._commit_response
+
+
+class _Client(object):
+    def __init__(self, credentials=None):
+        self.credentials = credentials
+
+
+class _Instance(object):
+    name = INSTANCE_NAME
+
+    def __init__(self, credentials=None):
+        self._client = _Client(credentials)
+
+
+class _Database(object):
+    name = "testing"
+
+    def __init__(self, api):
+        self.spanner_api = api
+
+    def session(self, labels=None):
+        from google.cloud.spanner_v1.session import Session
+
+        return Session(self, labels=labels)
+
+
+class _Session(object):
+
+    _transaction = None
+
+    def __init__(self, database, name=SESSION_NAME):
+        self._database = database
+        self.name = name
+
+
+class _KeySet(object):
+    def _to_pb(self):
+        from google.cloud.spanner_v1.proto.keys_pb2 import KeySet
+
+        return KeySet(all=True)
@@ -0,0 +1,269 @@
+# Copyright 2019 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import unittest
+
+
+class TestBulkWriter(unittest.TestCase):
+    TABLE = "citizens"
+    COLUMNS = ["email", "first_name", "last_name", "age"]
+
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.bulk_writer import BulkWriter
+
+        return BulkWriter
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    @staticmethod
+    def _make_database(commit_side_effect=None):
+        database = _Database()
+        database._pool.commit_side_effect = commit_side_effect
+        return database
+
+    @staticmethod
+    def _make_retry():
+        from google.api_core.exceptions import Aborted
+        from google.api_core.retry import Retry
+        from google.api_core.retry import if_exception_type
+
+        return Retry(
+            predicate=if_exception_type(Aborted), initial=0.001, maximum=0.001
+        )
+
+    @staticmethod
+    def _make_row(index):
+        return [u"%d@example.com" % (index,), u"Phred", u"Phlyntstone", index]
+
+    def test_ctor_defaults(self):
+        from google.cloud.spanner_v1.bulk_writer import DEFAULT_RETRY
+        from google.cloud.spanner_v1.bulk_writer import MAX_COMMIT_BYTES
+        from google.cloud.spanner_v1.bulk_writer import MAX_IN_FLIGHT_COMMITS
+        from google.cloud.spanner_v1.bulk_writer import MAX_MUTATIONS
+
+        database = self._make_database()
+
+        writer = self._make_one(database, self.TABLE, self.COLUMNS)
+
+        self.assertIs(writer._database, database)
+        self.assertEqual(writer.table, self.TABLE)
+        self.assertEqual(writer.columns, self.COLUMNS)
+        self.assertEqual(writer.operation, "insert_or_update")
+        self.assertEqual(writer.max_mutations, MAX_MUTATIONS)
+        self.assertEqual(writer.max_commit_bytes, MAX_COMMIT_BYTES)
+        self.assertEqual(writer.max_in_flight, MAX_IN_FLIGHT_COMMITS)
+        self.assertIs(writer._retry, DEFAULT_RETRY)
+        self.assertEqual(writer._rows_per_commit, MAX_MUTATIONS // 4)
+        writer.close()
+
+    def test_ctor_w_unknown_operation(self):
+        with self.assertRaises(ValueError):
+            self._make_one(
+                self._make_database(), self.TABLE, self.COLUMNS, operation="upsert"
+            )
+
+    def test_ctor_w_too_many_columns(self):
+        with self.assertRaises(ValueError):
+            self._make_one(
+                self._make_database(), self.TABLE, self.COLUMNS, max_mutations=3
+            )
+
+    def test_write_w_wrong_number_of_values(self):
+        writer = self._make_one(self._make_database(), self.TABLE, self.COLUMNS)
+
+        with self.assertRaises(ValueError):
+            writer.write([u"phred@example.com"])
+
+        writer.close()
+
+    def test_write_rows_splits_on_mutations(self):
+        from google.cloud.spanner_v1.proto.mutation_pb2 import Mutation
+
+        database = self._make_database()
+        rows = [self._make_row(index) for index in range(5)]
+
+        with self._make_one(
+            database, self.TABLE, self.COLUMNS, operation="insert", max_mutations=8
+        ) as writer:
+            writer.write_rows(rows)
+
+        commits = database._pool.commits
+        self.assertEqual(len(commits), 3)
+        written = []
+        for mutations in commits:
+            self.assertEqual(len(mutations), 1)
+            mutation = mutations[0]
+            self.assertEqual(mutation.WhichOneof("operation"), "insert")
+            self.assertIsInstance(mutation.insert, Mutation.Write)
+            self.assertEqual(mutation.insert.table, self.TABLE)
+            self.assertEqual(list(mutation.insert.columns), self.COLUMNS)
+            self.assertLessEqual(len(mutation.insert.values), 2)
+            written.extend(
+                int(value_pb.values[3].string_value)
+                for value_pb in mutation.insert.values
+            )
+        self.assertEqual(sorted(written), list(range(5)))
+
+        stats = writer.stats()
+        self.assertEqual(stats["rows_written"], 5)
+        self.assertEqual(stats["rows_pending"], 0)
+        self.assertEqual(stats["commits"], 3)
+        self.assertEqual(stats["retries"], 0)
+        self.assertEqual(stats["failed_commits"], 0)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertGreater(stats["bytes_written"], 0)
+
+    def test_write_splits_on_bytes(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        database = self._make_database()
+        rows = [self._make_row(index) for index in range(10, 15)]
+        row_bytes = _make_list_value_pb(rows[0]).ByteSize()
+
+        writer = self._make_one(
+            database, self.TABLE, self.COLUMNS, max_commit_bytes=2 * row_bytes
+        )
+        for row in rows:
+            writer.write(row)
+        self.assertEqual(writer.stats()["rows_pending"], 1)
+        writer.close()
+
+        sizes = sorted(
+            len(mutations[0].insert_or_update.values)
+            for mutations in database._pool.commits
+        )
+        self.assertEqual(sizes, [1, 2, 2])
+
+    def test_write_from_several_threads(self):
+        database = self._make_database()
+        writer = self._make_one(
+            database, self.TABLE, self.COLUMNS, max_mutations=40, max_in_flight=2
+        )
+
+        def write(start):
+            for index in range(start, start + 100):
+                writer.write(self._make_row(index))
+
+        threads = [
+            threading.Thread(target=write, args=(start,)) for start in (0, 100, 200)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+
+        written = [
+            int(value_pb.values[3].string_value)
+            for mutations in database._pool.commits
+            for value_pb in mutations[0].insert_or_update.values
+        ]
+        self.assertEqual(sorted(written), list(range(300)))
+        self.assertEqual(writer.stats()["commits"], 30)
+
+    def test_flush_retries_aborted(self):
+        from google.api_core.exceptions import Aborted
+
+        database = self._make_database(
+            commit_side_effect=[Aborted("testing"), Aborted("testing"), None]
+        )
+        writer = self._make_one(
+            database, self.TABLE, self.COLUMNS, retry=self._make_retry()
+        )
+        writer.write(self._make_row(1))
+
+        writer.flush()
+
+        self.assertEqual(len(database._pool.commits), 1)
+        stats = writer.stats()
+        self.assertEqual(stats["rows_written"], 1)
+        self.assertEqual(stats["retries"], 2)
+        writer.close()
+
+    def test_flush_raises_commit_error(self):
+        from google.api_core.exceptions import BadRequest
+
+        database = self._make_database(commit_side_effect=[BadRequest("testing")])
+        writer = self._make_one(
+            database, self.TABLE, self.COLUMNS, retry=self._make_retry()
+        )
+        writer.write(self._make_row(1))
+
+        with self.assertRaises(BadRequest):
+            writer.flush()
+
+        stats = writer.stats()
+        self.assertEqual(stats["rows_written"], 0)
+        self.assertEqual(stats["failed_commits"], 1)
+        self.assertEqual(database._pool.sessions_out, 0)
+
+        writer.flush()  # errors are only raised once
+        writer.close()
+
+    def test_stats_wo_writes(self):
+        writer = self._make_one(self._make_database(), self.TABLE, self.COLUMNS)
+
+        stats = writer.stats()
+
+        self.assertEqual(stats["seconds"], 0.0)
+        self.assertEqual(stats["rows_per_sec"], 0.0)
+        writer.close()
+
+
+class _Batch(object):
+    def __init__(self, pool):
+        self._pool = pool
+        self._mutations = []
+
+    def commit(self):
+        with self._pool.lock:
+            side_effect = self._pool.commit_side_effect
+            if side_effect:
+                error = side_effect.pop(0)
+                if error is not None:
+                    raise error
+            self._pool.commits.append(list(self._mutations))
+
+
+class _Session(object):
+    def __init__(self, pool):
+        self._pool = pool
+
+    def batch(self):
+        return _Batch(self._pool)
+
+
+class _Pool(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.commits = []
+        self.commit_side_effect = None
+        self.sessions_out = 0
+
+    def get(self):
+        with self.lock:
+            self.sessions_out += 1
+        return _Session(self)
+
+    def put(self, session):
+        with self.lock:
+            self.sessions_out -= 1
+
+
+class _Database(object):
+    def __init__(self):
+        self._pool = _Pool()
@@ -815,6 +815,25 @@ class TestDatabase(_BaseTest):
         self.assertIsInstance(checkout, BatchCheckout)
         self.assertIs(checkout._database, database)
 
+    def test_bulk_writer(self):
+        from google.cloud.spanner_v1.bulk_writer import BulkWriter
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        writer = database.bulk_writer(
+            "citizens", ["email", "age"], operation="insert", max_in_flight=2
+        )
+        self.assertIsInstance(writer, BulkWriter)
+        self.assertIs(writer._database, database)
+        self.assertEqual(writer.table, "citizens")
+        self.assertEqual(writer.columns, ["email", "age"])
+        self.assertEqual(writer.operation, "insert")
+        self.assertEqual(writer.max_in_flight, 2)
+        writer.close()
+
     def test_batch_snapshot(self):
         from google.cloud.spanner_v1.database import BatchSnapshot
 
@@ -1510,6 +1529,148 @@ class TestBatchSnapshot(_BaseTest):
             sql=sql, params=params, param_types=param_types, partition=token
         )
 
+    def _run_partitioned_query_helper(self, responses, **kw):
+        sql = "SELECT first_name, last_name FROM citizens"
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        snapshot.partition_query.return_value = list(responses)
+
+        def execute_sql(partition=None, **kwargs):
+            response = responses[partition].pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return iter(response)
+
+        snapshot.execute_sql.side_effect = execute_sql
+
+        with mock.patch(
+            "google.cloud.spanner_v1.database._PARTITION_RETRY_DELAY", new=0.01
+        ):
+            found = list(batch_txn.run_partitioned_query(sql, max_workers=2, **kw))
+
+        snapshot.partition_query.assert_called_once_with(
+            sql=sql,
+            params=None,
+            param_types=None,
+            partition_size_bytes=None,
+            max_partitions=None,
+        )
+        return found, snapshot
+
+    def test_run_partitioned_query_wo_partitions(self):
+        found, snapshot = self._run_partitioned_query_helper({})
+
+        self.assertEqual(found, [])
+        snapshot.execute_sql.assert_not_called()
+
+    def test_run_partitioned_query(self):
+        responses = {
+            self.TOKENS[0]: [[["Phred", "Phlyntstone"], ["Bharney", "Rhubble"]]],
+            self.TOKENS[1]: [[["Wylma", "Phlyntstone"]]],
+        }
+
+        found, snapshot = self._run_partitioned_query_helper(responses)
+
+        self.assertEqual(
+            sorted(found),
+            [
+                ["Bharney", "Rhubble"],
+                ["Phred", "Phlyntstone"],
+                ["Wylma", "Phlyntstone"],
+            ],
+        )
+        self.assertEqual(snapshot.execute_sql.call_count, 2)
+
+    def test_run_partitioned_query_w_partition_handler(self):
+        responses = {
+            self.TOKENS[0]: [[["Phred"], ["Bharney"]]],
+            self.TOKENS[1]: [[["Wylma"]]],
+        }
+
+        found, _ = self._run_partitioned_query_helper(
+            responses, partition_handler=lambda result_set: len(list(result_set))
+        )
+
+        self.assertEqual(sorted(found), [1, 2])
+
+    def test_run_partitioned_query_retries_partition(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        responses = {
+            self.TOKENS[0]: [ServiceUnavailable("testing"), [["Phred"]]],
+            self.TOKENS[1]: [[["Wylma"]]],
+        }
+
+        found, snapshot = self._run_partitioned_query_helper(responses)
+
+        self.assertEqual(sorted(found), [["Phred"], ["Wylma"]])
+        self.assertEqual(snapshot.execute_sql.call_count, 3)
+
+    def test_run_partitioned_query_w_too_many_failures(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        responses = {
+            self.TOKENS[0]: [ServiceUnavailable("testing")] * 2,
+            self.TOKENS[1]: [[["Wylma"]]],
+        }
+
+        with self.assertRaises(ServiceUnavailable):
+            self._run_partitioned_query_helper(responses, max_attempts=2)
+
+    def test_run_partitioned_query_wo_retry_after_rows(self):
+        from google.api_core.exceptions import InternalServerError
+
+        def failing():
+            yield ["Phred"]
+            raise InternalServerError("testing")
+
+        responses = {self.TOKENS[0]: [failing(), [["Phred"]]]}
+
+        with self.assertRaises(InternalServerError):
+            self._run_partitioned_query_helper(responses)
+
+    def test_run_partitioned_query_w_non_retryable_error(self):
+        from google.api_core.exceptions import BadRequest
+
+        responses = {self.TOKENS[0]: [BadRequest("testing"), [["Phred"]]]}
+
+        with self.assertRaises(BadRequest):
+            self._run_partitioned_query_helper(responses)
+
+    def test_run_partitioned_query_stops_workers_on_close(self):
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        snapshot.partition_query.return_value = [self.TOKENS[0]]
+        snapshot.execute_sql.return_value = iter([[index] for index in range(100)])
+
+        rows = batch_txn.run_partitioned_query("SELECT 1", buffer_size=1)
+        self.assertEqual(next(rows), [0])
+        rows.close()
+
+    def test_run_partitioned_read(self):
+        keyset = self._make_keyset()
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        snapshot.partition_read.return_value = self.TOKENS
+        snapshot.read.side_effect = lambda partition=None, **kwargs: iter(
+            [[partition]]
+        )
+
+        found = list(batch_txn.run_partitioned_read(self.TABLE, self.COLUMNS, keyset))
+
+        self.assertEqual(sorted(found), [[token] for token in self.TOKENS])
+        snapshot.partition_read.assert_called_once_with(
+            table=self.TABLE,
+            columns=self.COLUMNS,
+            keyset=keyset,
+            index="",
+            partition_size_bytes=None,
+            max_partitions=None,
+        )
+
 
 class _Client(object):
     def __init__(self, project=TestDatabase.PROJECT_ID):
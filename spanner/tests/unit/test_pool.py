@@ -765,6 +765,274 @@ class TestTransactionPingingPool(unittest.TestCase):
         self.assertTrue(pending.empty())
 
 
+class TestMaintainedPool(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.pool import MaintainedPool
+
+        return MaintainedPool
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def _make_bound(self, size=4, extra=0, **kwargs):
+        kwargs.setdefault("maintenance_interval", None)
+        pool = self._make_one(size=size, **kwargs)
+        database = _Database("name")
+        sessions = [_Session(database) for _ in range(size + extra)]
+        database._sessions.extend(reversed(sessions))
+        pool.bind(database)
+        return pool, sessions
+
+    def test_ctor_defaults(self):
+        pool = self._make_one()
+        self.assertIsNone(pool._database)
+        self.assertEqual(pool.size, 10)
+        self.assertEqual(pool.default_timeout, 10)
+        self.assertEqual(pool._delta.seconds, 3000)
+        self.assertEqual(pool.maintenance_interval, 60)
+        self.assertEqual(pool.max_create_workers, 10)
+        self.assertEqual(len(pool._sessions), 0)
+        self.assertEqual(pool.labels, {})
+
+    def test_ctor_explicit(self):
+        labels = {"foo": "bar"}
+        pool = self._make_one(
+            size=4,
+            default_timeout=30,
+            idle_threshold=1800,
+            maintenance_interval=None,
+            max_create_workers=2,
+            labels=labels,
+        )
+        self.assertEqual(pool.size, 4)
+        self.assertEqual(pool.default_timeout, 30)
+        self.assertEqual(pool._delta.seconds, 1800)
+        self.assertIsNone(pool.maintenance_interval)
+        self.assertEqual(pool.max_create_workers, 2)
+        self.assertEqual(pool.labels, labels)
+
+    def test_bind(self):
+        pool, sessions = self._make_bound(size=10, max_create_workers=3)
+
+        self.assertEqual(len(pool._sessions), 10)
+        self.assertIsNone(pool._maintainer)
+        for session in sessions:
+            self.assertTrue(session._created)
+            self.assertFalse(session._exists_checked)
+
+    def test_bind_single_worker(self):
+        pool, sessions = self._make_bound(size=2, max_create_workers=1)
+
+        self.assertEqual(len(pool._sessions), 2)
+        for session in sessions:
+            self.assertTrue(session._created)
+
+    def test_bind_starts_maintainer(self):
+        pool, _ = self._make_bound(size=1, maintenance_interval=3600)
+
+        maintainer = pool._maintainer
+        self.assertTrue(maintainer.is_alive())
+        self.assertTrue(maintainer.daemon)
+
+        pool.clear()
+
+        self.assertIsNone(pool._maintainer)
+        self.assertFalse(maintainer.is_alive())
+
+    def test_get_hit_no_check(self):
+        pool, sessions = self._make_bound()
+
+        session = pool.get()
+
+        self.assertIs(session, sessions[-1])
+        self.assertFalse(session._exists_checked)
+        self.assertEqual(len(pool._sessions), 3)
+
+    def test_get_most_recently_used(self):
+        pool, sessions = self._make_bound()
+        first = pool.get()
+        second = pool.get()
+
+        pool.put(first)
+        pool.put(second)
+
+        self.assertIs(pool.get(), second)
+        self.assertIs(pool.get(), first)
+
+    def test_get_idle_checked(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=4000)
+        pool, sessions = self._make_bound()
+
+        with _Monkey(MUT, _NOW=lambda: later):
+            session = pool.get()
+
+        self.assertIs(session, sessions[-1])
+        self.assertTrue(session._exists_checked)
+        self.assertEqual(pool.stats()["checks"], 1)
+        self.assertEqual(pool.stats()["replacements"], 0)
+
+    def test_get_idle_expired(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=4000)
+        pool, sessions = self._make_bound(extra=1)
+        sessions[-2]._exists = False
+
+        with _Monkey(MUT, _NOW=lambda: later):
+            session = pool.get()
+
+        self.assertIs(session, sessions[-1])
+        self.assertTrue(session._created)
+        self.assertTrue(sessions[-2]._exists_checked)
+        self.assertEqual(pool.stats()["replacements"], 1)
+
+    def test_get_idle_check_fails(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=4000)
+        pool, sessions = self._make_bound(size=1)
+        sessions[0].exists = mock.Mock(side_effect=ValueError)
+
+        with _Monkey(MUT, _NOW=lambda: later):
+            with self.assertRaises(ValueError):
+                pool.get()
+
+        self.assertEqual(pool._missing, 1)
+        self.assertEqual(pool.stats()["in_use"], 0)
+
+    def test_get_empty_timeout(self):
+        from six.moves.queue import Empty
+
+        pool, _ = self._make_bound(size=1)
+        pool.get()
+
+        with self.assertRaises(Empty):
+            pool.get(timeout=0.01)
+
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    def test_get_waits_for_put(self):
+        import threading
+
+        pool, _ = self._make_bound(size=1)
+        session = pool.get()
+        timer = threading.Timer(0.05, pool.put, (session,))
+        timer.start()
+
+        self.assertIs(pool.get(timeout=5), session)
+
+        timer.join()
+        stats = pool.stats()
+        self.assertGreater(stats["wait_seconds_max"], 0.0)
+        self.assertEqual(stats["checkouts"], 2)
+
+    def test_put_full(self):
+        from six.moves.queue import Full
+
+        pool, _ = self._make_bound(size=1)
+
+        with self.assertRaises(Full):
+            pool.put(_Session(pool._database))
+
+    def test_stats(self):
+        pool, _ = self._make_bound()
+        session = pool.get()
+        pool.get()
+        pool.put(session)
+
+        stats = pool.stats()
+
+        self.assertEqual(stats["size"], 4)
+        self.assertEqual(stats["available"], 3)
+        self.assertEqual(stats["in_use"], 1)
+        self.assertEqual(stats["max_in_use"], 2)
+        self.assertEqual(stats["utilization"], 0.25)
+        self.assertEqual(stats["checkouts"], 2)
+        self.assertEqual(stats["timeouts"], 0)
+        self.assertEqual(stats["wait_seconds_mean"], stats["wait_seconds_total"] / 2)
+
+    def test_clear(self):
+        pool, sessions = self._make_bound()
+
+        pool.clear()
+
+        self.assertEqual(len(pool._sessions), 0)
+        for session in sessions:
+            self.assertTrue(session._deleted)
+
+    def test_maintain_fresh(self):
+        pool, sessions = self._make_bound()
+
+        pool.maintain()
+
+        self.assertEqual(len(pool._sessions), 4)
+        for session in sessions:
+            self.assertFalse(session._exists_checked)
+
+    def test_maintain_idle(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        earlier = datetime.datetime.utcnow() - datetime.timedelta(seconds=4000)
+        with _Monkey(MUT, _NOW=lambda: earlier):
+            pool, sessions = self._make_bound(extra=1)
+        sessions[1]._exists = False
+        fresh = pool.get()
+        pool.put(fresh)
+        fresh._exists_checked = False
+
+        pool.maintain()
+
+        available = [session for _, session in pool._sessions]
+        self.assertEqual(len(available), 4)
+        self.assertNotIn(sessions[1], available)
+        self.assertIn(sessions[-1], available)
+        self.assertTrue(sessions[-1]._created)
+        self.assertFalse(fresh._exists_checked)
+        for session in sessions[:3]:
+            self.assertTrue(session._exists_checked)
+        stats = pool.stats()
+        self.assertEqual(stats["checks"], 1)
+        self.assertEqual(stats["pings"], 3)
+        self.assertEqual(stats["replacements"], 1)
+
+    def test_maintain_replaces_missing(self):
+        pool, sessions = self._make_bound(extra=1)
+        pool._missing = 1
+        pool.get()
+
+        pool.maintain()
+
+        self.assertEqual(pool._missing, 0)
+        self.assertEqual(len(pool._sessions), 4)
+        self.assertTrue(sessions[-1]._created)
+
+    def test_maintain_failure(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=4000)
+        pool, sessions = self._make_bound(size=2)
+        sessions[1].exists = mock.Mock(side_effect=ValueError)
+
+        with _Monkey(MUT, _NOW=lambda: later):
+            with self.assertRaises(ValueError):
+                pool.maintain()
+
+        self.assertEqual(len(pool._sessions), 1)
+        self.assertEqual(pool._missing, 1)
+
+
 class TestSessionCheckout(unittest.TestCase):
     def _getTargetClass(self):
         from google.cloud.spanner_v1.pool import SessionCheckout
@@ -0,0 +1,226 @@
+# Copyright 2019 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+
+DATABASE_NAME = "projects/project/instances/instance/databases/database"
+TABLE_NAME = "citizens"
+COLUMNS = ["email", "first_name", "last_name", "age"]
+
+
+def _make_responses(*values, **kwargs):
+    from google.cloud.spanner_v1.proto.result_set_pb2 import PartialResultSet
+    from google.cloud.spanner_v1._helpers import _make_value_pb
+
+    responses = [PartialResultSet(values=[_make_value_pb(value)]) for value in values]
+    read_timestamp = kwargs.pop("read_timestamp", None)
+    if read_timestamp is not None:
+        responses[0].metadata.transaction.read_timestamp.FromNanoseconds(
+            read_timestamp
+        )
+    return responses
+
+
+class TestReadCache(unittest.TestCase):
+    def _get_target_class(self):
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        return ReadCache
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def _make_key(self, *keys, **kwargs):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        keyset = KeySet(keys=[[key] for key in keys])
+        database = kwargs.pop("database", DATABASE_NAME)
+        table = kwargs.pop("table", TABLE_NAME)
+        return self._get_target_class()._make_key(
+            database, table, COLUMNS, keyset, "", 0
+        )
+
+    def test_ctor_defaults(self):
+        from google.cloud.spanner_v1.read_cache import DEFAULT_MAX_BYTES
+
+        cache = self._make_one()
+
+        self.assertEqual(cache.max_bytes, DEFAULT_MAX_BYTES)
+        self.assertEqual(
+            cache.stats(),
+            {
+                "hits": 0,
+                "misses": 0,
+                "hit_ratio": 0.0,
+                "expirations": 0,
+                "evictions": 0,
+                "entries": 0,
+                "bytes": 0,
+            },
+        )
+
+    def test__make_key(self):
+        self.assertEqual(self._make_key(u"a", u"b"), self._make_key(u"a", u"b"))
+        self.assertNotEqual(self._make_key(u"a", u"b"), self._make_key(u"b", u"a"))
+        self.assertNotEqual(self._make_key(u"a"), self._make_key(u"a", table="other"))
+        self.assertNotEqual(
+            self._make_key(u"a"), self._make_key(u"a", database="other")
+        )
+
+    def test__get_miss(self):
+        cache = self._make_one()
+
+        self.assertIsNone(cache._get(self._make_key(u"a")))
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test__put_then__get(self):
+        cache = self._make_one()
+        key = self._make_key(u"a")
+        responses = _make_responses(u"a", u"b")
+
+        cache._put(key, responses, 100)
+
+        self.assertEqual(cache._get(key, min_read_timestamp=100), responses)
+        self.assertEqual(cache._get(key, read_timestamp=100), responses)
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["hit_ratio"], 1.0)
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(
+            stats["bytes"], sum(response.ByteSize() for response in responses)
+        )
+
+    def test__get_too_old(self):
+        cache = self._make_one()
+        key = self._make_key(u"a")
+        cache._put(key, _make_responses(u"a"), 100)
+
+        self.assertIsNone(cache._get(key, min_read_timestamp=101))
+        self.assertIsNone(cache._get(key))
+
+        stats = cache.stats()
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["expirations"], 1)
+        self.assertEqual(stats["entries"], 0)
+        self.assertEqual(stats["bytes"], 0)
+
+    def test__get_other_read_timestamp(self):
+        cache = self._make_one()
+        key = self._make_key(u"a")
+        cache._put(key, _make_responses(u"a"), 100)
+
+        self.assertIsNone(cache._get(key, read_timestamp=101))
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test__get_w_chunked_value_copies(self):
+        cache = self._make_one()
+        key = self._make_key(u"a")
+        responses = _make_responses(u"a", u"b")
+        responses[0].chunked_value = True
+        cache._put(key, responses, 100)
+
+        found = cache._get(key)
+
+        self.assertEqual(found, responses)
+        self.assertIsNot(found[0], responses[0])
+
+    def test__put_evicts_least_recently_used(self):
+        key_a = self._make_key(u"a")
+        key_b = self._make_key(u"b")
+        key_c = self._make_key(u"c")
+        responses = _make_responses(u"a")
+        cache = self._make_one(max_bytes=2 * responses[0].ByteSize())
+
+        cache._put(key_a, _make_responses(u"a"), 100)
+        cache._put(key_b, _make_responses(u"b"), 100)
+        cache._get(key_a)
+        cache._put(key_c, _make_responses(u"c"), 100)
+
+        self.assertIsNotNone(cache._get(key_a))
+        self.assertIsNone(cache._get(key_b))
+        self.assertIsNotNone(cache._get(key_c))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test__put_replaces(self):
+        cache = self._make_one()
+        key = self._make_key(u"a")
+        cache._put(key, _make_responses(u"a"), 100)
+        responses = _make_responses(u"b")
+
+        cache._put(key, responses, 200)
+
+        self.assertEqual(cache._get(key, read_timestamp=200), responses)
+        self.assertEqual(cache.stats()["bytes"], responses[0].ByteSize())
+
+    def test__put_too_large(self):
+        cache = self._make_one(max_bytes=1)
+
+        cache._put(self._make_key(u"a"), _make_responses(u"abc"), 100)
+
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test__record_exhausted(self):
+        cache = self._make_one()
+        key = self._make_key(u"a")
+        responses = _make_responses(u"a", u"b", read_timestamp=100)
+
+        self.assertEqual(list(cache._record(key, iter(responses))), responses)
+
+        self.assertEqual(cache._get(key, read_timestamp=100), responses)
+
+    def test__record_not_exhausted(self):
+        cache = self._make_one()
+        key = self._make_key(u"a")
+        responses = _make_responses(u"a", u"b", read_timestamp=100)
+
+        recorded = cache._record(key, iter(responses))
+        next(recorded)
+
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test__record_wo_read_timestamp(self):
+        cache = self._make_one()
+        key = self._make_key(u"a")
+
+        list(cache._record(key, iter(_make_responses(u"a"))))
+        list(cache._record(key, iter([])))
+
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_invalidate_table(self):
+        cache = self._make_one()
+        key = self._make_key(u"a")
+        other_database_key = self._make_key(u"a", database="other")
+        other_key = self._make_key(u"a", table="other")
+        cache._put(key, _make_responses(u"a"), 100)
+        cache._put(other_database_key, _make_responses(u"a"), 100)
+        cache._put(other_key, _make_responses(u"a"), 100)
+
+        cache.invalidate(TABLE_NAME)
+
+        self.assertIsNone(cache._get(key))
+        self.assertIsNone(cache._get(other_database_key))
+        self.assertIsNotNone(cache._get(other_key))
+
+    def test_invalidate_all(self):
+        cache = self._make_one()
+        cache._put(self._make_key(u"a"), _make_responses(u"a"), 100)
+        cache._put(self._make_key(u"a", table="other"), _make_responses(u"a"), 100)
+
+        cache.invalidate()
+
+        self.assertEqual(cache.stats()["entries"], 0)
+        self.assertEqual(cache.stats()["bytes"], 0)
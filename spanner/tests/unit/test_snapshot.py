@@ -970,6 +970,242 @@ class TestSnapshot(unittest.TestCase):
             metadata=[("google-cloud-resource-prefix", database.name)],
         )
 
+    def test_ctor_w_read_cache_and_multi_use(self):
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        with self.assertRaises(ValueError):
+            self._make_one(
+                _Session(),
+                read_timestamp=self._makeTimestamp(),
+                multi_use=True,
+                read_cache=ReadCache(),
+            )
+
+    def test_ctor_w_read_cache_and_strong(self):
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        with self.assertRaises(ValueError):
+            self._make_one(_Session(), read_cache=ReadCache())
+
+    def test__make_txn_selector_w_read_cache(self):
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        snapshot = self._make_one(
+            _Session(), max_staleness=self._makeDuration(), read_cache=ReadCache()
+        )
+
+        selector = snapshot._make_txn_selector()
+
+        self.assertTrue(selector.single_use.read_only.return_read_timestamp)
+        self.assertEqual(selector.single_use.read_only.max_staleness.seconds, 1)
+
+    def _make_cached_result_sets(self, read_timestamp):
+        from google.cloud._helpers import _datetime_to_pb_timestamp
+        from google.cloud.spanner_v1.proto.result_set_pb2 import PartialResultSet
+        from google.cloud.spanner_v1.proto.result_set_pb2 import ResultSetMetadata
+        from google.cloud.spanner_v1.proto.type_pb2 import StructType
+        from google.cloud.spanner_v1.proto.type_pb2 import STRING, INT64
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        metadata_pb = ResultSetMetadata(
+            row_type=StructType(
+                fields=[
+                    StructType.Field(name="name", type=Type(code=STRING)),
+                    StructType.Field(name="age", type=Type(code=INT64)),
+                ]
+            )
+        )
+        metadata_pb.transaction.read_timestamp.CopyFrom(
+            _datetime_to_pb_timestamp(read_timestamp)
+        )
+        return [
+            PartialResultSet(
+                values=[_make_value_pb(u"phred"), _make_value_pb(32)],
+                metadata=metadata_pb,
+            )
+        ]
+
+    def _read_w_read_cache(self, read_cache, database, **kwargs):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        snapshot = self._make_one(_Session(database), read_cache=read_cache, **kwargs)
+        return list(snapshot.read(TABLE_NAME, COLUMNS, KeySet(all_=True)))
+
+    def test_read_w_read_cache(self):
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        read_cache = ReadCache()
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.streaming_read.return_value = _MockIterator(
+            *self._make_cached_result_sets(self._makeTimestamp())
+        )
+        staleness = self._makeDuration(seconds=10)
+
+        first = self._read_w_read_cache(read_cache, database, max_staleness=staleness)
+        second = self._read_w_read_cache(
+            read_cache, database, exact_staleness=staleness
+        )
+
+        self.assertEqual(first, [[u"phred", 32]])
+        self.assertEqual(second, first)
+        api.streaming_read.assert_called_once()
+        selector = api.streaming_read.call_args[1]["transaction"]
+        self.assertTrue(selector.single_use.read_only.return_read_timestamp)
+        stats = read_cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_read_w_read_cache_chunked_array(self):
+        from google.cloud._helpers import _datetime_to_pb_timestamp
+        from google.cloud.spanner_v1.proto.result_set_pb2 import PartialResultSet
+        from google.cloud.spanner_v1.proto.result_set_pb2 import ResultSetMetadata
+        from google.cloud.spanner_v1.proto.type_pb2 import StructType
+        from google.cloud.spanner_v1.proto.type_pb2 import ARRAY, BOOL
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.read_cache import ReadCache
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        metadata_pb = ResultSetMetadata(
+            row_type=StructType(
+                fields=[
+                    StructType.Field(
+                        name="flags",
+                        type=Type(code=ARRAY, array_element_type=Type(code=BOOL)),
+                    )
+                ]
+            )
+        )
+        metadata_pb.transaction.read_timestamp.CopyFrom(
+            _datetime_to_pb_timestamp(self._makeTimestamp())
+        )
+        read_cache = ReadCache()
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.streaming_read.return_value = _MockIterator(
+            PartialResultSet(
+                values=[_make_value_pb([True, False])],
+                chunked_value=True,
+                metadata=metadata_pb,
+            ),
+            PartialResultSet(values=[_make_value_pb([True])]),
+        )
+        staleness = self._makeDuration(seconds=10)
+
+        first = self._read_w_read_cache(read_cache, database, max_staleness=staleness)
+        second = self._read_w_read_cache(read_cache, database, max_staleness=staleness)
+
+        self.assertEqual(first, [[[True, False, True]]])
+        self.assertEqual(second, first)
+        api.streaming_read.assert_called_once()
+        self.assertEqual(read_cache.stats()["hits"], 1)
+
+    def test_read_w_read_cache_other_database(self):
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        read_cache = ReadCache()
+        database = _Database()
+        other_database = _Database()
+        other_database.name = "other"
+        staleness = self._makeDuration(seconds=10)
+        for db in (database, other_database):
+            api = db.spanner_api = self._make_spanner_api()
+            api.streaming_read.return_value = _MockIterator(
+                *self._make_cached_result_sets(self._makeTimestamp())
+            )
+
+        self._read_w_read_cache(read_cache, database, max_staleness=staleness)
+        self._read_w_read_cache(read_cache, other_database, max_staleness=staleness)
+
+        database.spanner_api.streaming_read.assert_called_once()
+        other_database.spanner_api.streaming_read.assert_called_once()
+        stats = read_cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 2))
+        self.assertEqual(stats["entries"], 2)
+
+    def test_read_w_read_cache_too_old(self):
+        import datetime
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        read_cache = ReadCache()
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        read_timestamp = self._makeTimestamp() - datetime.timedelta(seconds=5)
+        api.streaming_read.side_effect = [
+            _MockIterator(*self._make_cached_result_sets(read_timestamp)),
+            _MockIterator(*self._make_cached_result_sets(self._makeTimestamp())),
+        ]
+
+        self._read_w_read_cache(
+            read_cache, database, max_staleness=self._makeDuration(seconds=10)
+        )
+        self._read_w_read_cache(
+            read_cache, database, max_staleness=self._makeDuration(seconds=2)
+        )
+        self._read_w_read_cache(
+            read_cache, database, min_read_timestamp=read_timestamp
+        )
+
+        self.assertEqual(api.streaming_read.call_count, 2)
+        stats = read_cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+        self.assertEqual(stats["expirations"], 1)
+
+    def test_read_w_read_cache_and_read_timestamp(self):
+        import datetime
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        read_cache = ReadCache()
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        read_timestamp = self._makeTimestamp()
+        other_timestamp = read_timestamp - datetime.timedelta(seconds=1)
+        api.streaming_read.side_effect = [
+            _MockIterator(*self._make_cached_result_sets(read_timestamp)),
+            _MockIterator(*self._make_cached_result_sets(other_timestamp)),
+        ]
+
+        for timestamp in (read_timestamp, read_timestamp, other_timestamp):
+            self._read_w_read_cache(read_cache, database, read_timestamp=timestamp)
+
+        self.assertEqual(api.streaming_read.call_count, 2)
+        self.assertEqual(read_cache.stats()["hits"], 1)
+
+    def test_read_w_read_cache_and_partition(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        read_cache = ReadCache()
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.streaming_read.return_value = _MockIterator(
+            *self._make_cached_result_sets(self._makeTimestamp())
+        )
+        snapshot = self._make_one(
+            _Session(database),
+            exact_staleness=self._makeDuration(),
+            read_cache=read_cache,
+        )
+
+        list(snapshot.read(TABLE_NAME, COLUMNS, KeySet(all_=True), partition=b"p"))
+
+        self.assertEqual(read_cache.stats()["entries"], 0)
+        self.assertEqual(read_cache.stats()["misses"], 0)
+
+    def test_read_w_read_cache_twice(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        snapshot = self._make_one(
+            _Session(_Database()),
+            exact_staleness=self._makeDuration(),
+            read_cache=ReadCache(),
+        )
+        snapshot._read_request_count = 1
+
+        with self.assertRaises(ValueError):
+            snapshot.read(TABLE_NAME, COLUMNS, KeySet(all_=True))
+
 
 class _Session(object):
     def __init__(self, database=None, name=TestSnapshot.SESSION_NAME):
@@ -17,6 +17,16 @@ import unittest
 
 import mock
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 
 class TestStreamedResultSet(unittest.TestCase):
     def _getTargetClass(self):
@@ -610,6 +620,137 @@ class TestStreamedResultSet(unittest.TestCase):
             with self.assertRaises(exceptions.NotFound):
                 streamed.one()
 
+    def _make_to_arrow_result_set(self):
+        import datetime
+
+        FIELDS = [
+            self._make_scalar_field("full_name", "STRING"),
+            self._make_scalar_field("age", "INT64"),
+            self._make_scalar_field("score", "FLOAT64"),
+            self._make_scalar_field("married", "BOOL"),
+            self._make_scalar_field("birthday", "DATE"),
+            self._make_scalar_field("updated", "TIMESTAMP"),
+            self._make_array_field("scores", element_type_code="INT64"),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        ROW_1 = [
+            u"Phred Phlyntstone",
+            42,
+            1.5,
+            True,
+            datetime.date(1977, 3, 5),
+            u"2019-03-05T12:34:56.123456789Z",
+            [1, None, 3],
+        ]
+        ROW_2 = [u"Wylma Phlyntstone", None, None, None, None, None, None]
+        values = [self._make_value(value) for value in ROW_1 + ROW_2]
+        # The timestamp is chunked across partial result sets.
+        first = self._make_partial_result_set(
+            values[:5] + [self._make_value(u"2019-03-05T12:34")],
+            metadata=metadata,
+            chunked_value=True,
+        )
+        second = self._make_partial_result_set(
+            [self._make_value(u":56.123456789Z")] + values[6:]
+        )
+        return self._make_one(_MockCancellableIterator(first, second))
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow(self):
+        import datetime
+
+        streamed = self._make_to_arrow_result_set()
+
+        table = streamed.to_arrow()
+
+        self.assertEqual(
+            table.schema,
+            pyarrow.schema(
+                [
+                    ("full_name", pyarrow.string()),
+                    ("age", pyarrow.int64()),
+                    ("score", pyarrow.float64()),
+                    ("married", pyarrow.bool_()),
+                    ("birthday", pyarrow.date32()),
+                    ("updated", pyarrow.timestamp("us", tz="UTC")),
+                    ("scores", pyarrow.list_(pyarrow.int64())),
+                ]
+            ),
+        )
+        self.assertEqual(
+            table.column("full_name").to_pylist(),
+            [u"Phred Phlyntstone", u"Wylma Phlyntstone"],
+        )
+        self.assertEqual(table.column("age").to_pylist(), [42, None])
+        self.assertEqual(table.column("score").to_pylist(), [1.5, None])
+        self.assertEqual(table.column("married").to_pylist(), [True, None])
+        self.assertEqual(
+            table.column("birthday").to_pylist(), [datetime.date(1977, 3, 5), None]
+        )
+        self.assertEqual(
+            table.column("updated").cast(pyarrow.int64()).to_pylist(),
+            [1551789296123456, None],
+        )
+        self.assertEqual(table.column("scores").to_pylist(), [[1, None, 3], None])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_empty(self):
+        streamed = self._make_one(_MockCancellableIterator())
+
+        table = streamed.to_arrow()
+
+        self.assertEqual(table.num_columns, 0)
+        self.assertEqual(table.num_rows, 0)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_wo_rows(self):
+        FIELDS = [self._make_scalar_field("age", "INT64")]
+        metadata = self._make_result_set_metadata(FIELDS)
+        result_set = self._make_partial_result_set([], metadata=metadata)
+        streamed = self._make_one(_MockCancellableIterator(result_set))
+
+        table = streamed.to_arrow()
+
+        self.assertEqual(table.schema, pyarrow.schema([("age", pyarrow.int64())]))
+        self.assertEqual(table.num_rows, 0)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_consumed_stream(self):
+        streamed = self._make_one(_MockCancellableIterator())
+        streamed._metadata = object()
+        with self.assertRaises(RuntimeError):
+            streamed.to_arrow()
+
+    @mock.patch("google.cloud.spanner_v1.streamed.pyarrow", new=None)
+    def test_to_arrow_error_if_pyarrow_is_none(self):
+        streamed = self._make_one(_MockCancellableIterator())
+        with self.assertRaises(ValueError):
+            streamed.to_arrow()
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_dataframe(self):
+        streamed = self._make_to_arrow_result_set()
+
+        df = streamed.to_dataframe()
+
+        self.assertIsInstance(df, pandas.DataFrame)
+        self.assertEqual(
+            list(df.columns),
+            ["full_name", "age", "score", "married", "birthday", "updated", "scores"],
+        )
+        self.assertEqual(len(df), 2)
+        self.assertEqual(str(df["updated"].dt.tz), "UTC")
+        self.assertEqual(
+            df["updated"][0], pandas.Timestamp("2019-03-05T12:34:56.123456Z")
+        )
+
+    @mock.patch("google.cloud.spanner_v1.streamed.pandas", new=None)
+    def test_to_dataframe_error_if_pandas_is_none(self):
+        streamed = self._make_one(_MockCancellableIterator())
+        with self.assertRaises(ValueError):
+            streamed.to_dataframe()
+
     def test_consume_next_empty(self):
         iterator = _MockCancellableIterator()
         streamed = self._make_one(iterator)
@@ -940,6 +1081,32 @@ class TestStreamedResultSet_JSON_acceptance_tests(unittest.TestCase):
     def test_multiple_row_chunks_non_chunks_interleaved(self):
         self._match_results("Multiple Row Chunks/Non Chunks Interleaved")
 
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_matches_rows(self):
+        import copy
+        import math
+
+        def normalize(value):
+            if isinstance(value, dict):
+                value = list(value.values())
+            if isinstance(value, list):
+                return [normalize(item) for item in value]
+            if isinstance(value, float) and math.isnan(value):
+                return "NaN"
+            return value
+
+        self._load_json_test("Basic Test")
+        for name, (partial_result_sets, _) in sorted(self._json_tests.items()):
+            # Merging chunks may modify the partial result sets.
+            iterator = _MockCancellableIterator(*copy.deepcopy(partial_result_sets))
+            rows = list(self._make_one(iterator))
+            iterator = _MockCancellableIterator(*copy.deepcopy(partial_result_sets))
+            table = self._make_one(iterator).to_arrow()
+            columns = [column.to_pylist() for column in table.columns]
+            self.assertEqual(
+                normalize([list(row) for row in zip(*columns)]), normalize(rows), name
+            )
+
 
 def _generate_partial_result_sets(prs_text_pbs):
     from google.protobuf.json_format import Parse